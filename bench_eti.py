@@ -1,76 +1,406 @@
 
-
 # SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from eti.v9_0 import *
+import importlib
+import itertools
+import socket
+import sys
+import tracemalloc
 
+import pytest
 
-def modify_ioc(x, bs):
-    x.RequestHeader.MsgSeqNum += 1
-    x.OrderQty = (x.OrderQty + 1) % (2**64 - 1)
-    x.Price = (x.Price + 1) % (2**63 - 1)
-    x.ClOrdID = (x.ClOrdID + 1) % (2**64 - 1)
-    return x.pack_into(bs)
+from eobiarb import Arbiter
+from eobibook import BookBuilder, SyntheticFeed
+from eobifeed import Ring
+from eobirecovery import Recovery
+from etijournal import IN, Journal
+from etimatch import BUY, SELL, Engine
+from etistream import FrameDecoder, MessageWriter, SocketTransport
+
+
+# i.e. compare the default dataclasses with the ones generated by `eti2py.py --slots`
+@pytest.fixture(params=['eti.v9_0', 'eti.v9_0_slots'], ids=['dict', 'slots'])
+def eti(request):
+    if request.param.endswith('_slots') and sys.version_info < (3, 10):
+        pytest.skip('dataclass slots require Python 3.10 or later')
+    return importlib.import_module(request.param)
 
-def test_pack_ioc(benchmark):
-    x = NewOrderSingleShortRequest()
+@pytest.fixture(params=['eobi.v9_0', 'eobi.v9_0_slots'], ids=['dict', 'slots'])
+def eobi(request):
+    if request.param.endswith('_slots') and sys.version_info < (3, 10):
+        pytest.skip('dataclass slots require Python 3.10 or later')
+    return importlib.import_module(request.param)
+
+
+def mk_ioc(eti):
+    x = eti.NewOrderSingleShortRequest()
     x.ExecutingTrader = 1337
     x.EnrichmentRuleID = 1
-    x.ApplSeqIndicator = ApplSeqIndicator.NO_RECOVERY_REQUIRED
-    x.PriceValidityCheckType = PriceValidityCheckType.NONE
-    x.ValueCheckTypeValue = ValueCheckTypeValue.DO_NOT_CHECK
-    x.OrderAttributeLiquidityProvision = OrderAttributeLiquidityProvision.N
-    x.TimeInForce = TimeInForce.IOC
-    x.ExecInst = ExecInst.Q # non-persistant order
-    x.TradingCapacity = TradingCapacity.MARKET_MAKER
-    x.PartyIdInvestmentDecisionMakerQualifier = PartyIdInvestmentDecisionMakerQualifier.ALGO
-    x.ExecutingTraderQualifier = ExecutingTraderQualifier.ALGO
-
-    x.Side = Side.BUY
+    x.ApplSeqIndicator = eti.ApplSeqIndicator.NO_RECOVERY_REQUIRED
+    x.PriceValidityCheckType = eti.PriceValidityCheckType.NONE
+    x.ValueCheckTypeValue = eti.ValueCheckTypeValue.DO_NOT_CHECK
+    x.OrderAttributeLiquidityProvision = eti.OrderAttributeLiquidityProvision.N
+    x.TimeInForce = eti.TimeInForce.IOC
+    x.ExecInst = eti.ExecInst.Q # non-persistant order
+    x.TradingCapacity = eti.TradingCapacity.MARKET_MAKER
+    x.PartyIdInvestmentDecisionMakerQualifier = eti.PartyIdInvestmentDecisionMakerQualifier.ALGO
+    x.ExecutingTraderQualifier = eti.ExecutingTraderQualifier.ALGO
+
+    x.Side = eti.Side.BUY
     x.SimpleSecurityID = 23
 
     x.RequestHeader.MsgSeqNum = 3
     x.OrderQty = 42 * 10**4
     x.Price = 404 * 10**8
     x.ClOrdID = 666
+    return x
+
+def modify_ioc(x, bs):
+    x.RequestHeader.MsgSeqNum += 1
+    x.OrderQty = (x.OrderQty + 1) % (2**64 - 1)
+    x.Price = (x.Price + 1) % (2**63 - 1)
+    x.ClOrdID = (x.ClOrdID + 1) % (2**64 - 1)
+    return x.pack_into(bs)
+
+def test_pack_ioc(benchmark, eti):
+    x = mk_ioc(eti)
 
     bs = bytearray(96)
 
     n = benchmark(modify_ioc, x, bs)
     assert n == 96
 
+def patch_ioc(c, bs, i):
+    c.set_RequestHeader_MsgSeqNum(bs, 0, 3 + i)
+    c.set_OrderQty(bs, 0, 42 * 10**4 + i)
+    c.set_Price(bs, 0, 404 * 10**8 + i)
+    c.set_ClOrdID(bs, 0, 666 + i)
+
+# i.e. only patches the changed fields of a pre-packed order
+def test_patch_ioc(benchmark, eti):
+    x = mk_ioc(eti)
+    bs = bytearray(96)
+    x.pack_into(bs)
+
+    benchmark(patch_ioc, eti.NewOrderSingleShortRequest, bs, 1)
+    y = eti.unpack_from(bs)
+    assert (y.RequestHeader.MsgSeqNum, y.OrderQty, y.Price, y.ClOrdID) == (4, x.OrderQty + 1, x.Price + 1, 667)
+
 def unpack_ioc(bs, x):
     x.unpack_from(bs)
     return x
 
 
-def test_unpack_ioc(benchmark):
-    x = NewOrderSingleShortRequest()
-    x.ExecutingTrader = 1337
-    x.EnrichmentRuleID = 1
-    x.ApplSeqIndicator = ApplSeqIndicator.NO_RECOVERY_REQUIRED
-    x.PriceValidityCheckType = PriceValidityCheckType.NONE
-    x.ValueCheckTypeValue = ValueCheckTypeValue.DO_NOT_CHECK
-    x.OrderAttributeLiquidityProvision = OrderAttributeLiquidityProvision.N
-    x.TimeInForce = TimeInForce.IOC
-    x.ExecInst = ExecInst.Q # non-persistant order
-    x.TradingCapacity = TradingCapacity.MARKET_MAKER
-    x.PartyIdInvestmentDecisionMakerQualifier = PartyIdInvestmentDecisionMakerQualifier.ALGO
-    x.ExecutingTraderQualifier = ExecutingTraderQualifier.ALGO
-
-    x.Side = Side.BUY
-    x.SimpleSecurityID = 23
-
-    x.RequestHeader.MsgSeqNum = 3
-    x.OrderQty = 42 * 10**4
-    x.Price = 404 * 10**8
-    x.ClOrdID = 666
+def test_unpack_ioc(benchmark, eti):
+    x = mk_ioc(eti)
 
     bs = bytearray(96)
     x.pack_into(bs)
 
-    y = NewOrderSingleShortRequest()
+    y = eti.NewOrderSingleShortRequest()
     y = benchmark(unpack_ioc, bs, y)
     y.rstrip()
     assert y == x
+
+
+def unpack_raw_ioc(bs, x):
+    x.unpack_from(bs, enums=False)
+    return x
+
+def test_unpack_raw_ioc(benchmark, eti):
+    x = mk_ioc(eti)
+
+    bs = bytearray(96)
+    x.pack_into(bs)
+
+    y = eti.NewOrderSingleShortRequest()
+    y = benchmark(unpack_raw_ioc, bs, y)
+    assert y.Side == x.Side
+    assert type(y.Side) is int
+
+
+def test_create_ioc(benchmark, eti):
+    bs = bytearray(96)
+    mk_ioc(eti).pack_into(bs)
+
+    n = 1000
+    tracemalloc.start()
+    xs = [ eti.NewOrderSingleShortRequest.create_from(bs) for _ in range(n) ]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    benchmark.extra_info['bytes_per_object'] = size // n
+
+    y = benchmark(eti.NewOrderSingleShortRequest.create_from, bs)
+    assert y == xs[0]
+
+# i.e. the memory of retained EOBI order messages, e.g. of an order
+# book that keeps the message objects
+def test_create_order_add(benchmark, eobi):
+    x = eobi.OrderAdd()
+    x.SecurityID = 23
+    x.OrderDetails.Price = 404 * 10**8
+    bs = x.pack()
+
+    n = 1000
+    tracemalloc.start()
+    xs = [ eobi.OrderAdd.create_from(bs) for _ in range(n) ]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    benchmark.extra_info['bytes_per_object'] = size // n
+
+    y = benchmark(eobi.OrderAdd.create_from, bs)
+    assert y == xs[0]
+
+def view_ioc(eti, bs):
+    v = eti.view_from(bs)
+    return v.RequestHeader.MsgSeqNum, v.Price, v.OrderQty, v.ClOrdID
+
+def test_view_ioc(benchmark, eti):
+    x = mk_ioc(eti)
+    bs = bytearray(96)
+    x.pack_into(bs)
+
+    r = benchmark(view_ioc, eti, bs)
+    assert r == (x.RequestHeader.MsgSeqNum, x.Price, x.OrderQty, x.ClOrdID)
+
+def test_unpack_many_ioc(benchmark, eti):
+    pytest.importorskip('numpy')
+    n = 10000
+    bs = mk_ioc(eti).pack() * n
+    offsets = range(0, n * 96, 96)
+
+    r = benchmark(eti.unpack_many, bs, offsets)
+    assert len(r) == n
+
+def unpack_loop(eti, bs, offsets):
+    return [ eti.unpack_from(bs, off) for off in offsets ]
+
+def test_unpack_loop_ioc(benchmark, eti):
+    n = 10000
+    bs = mk_ioc(eti).pack() * n
+    offsets = range(0, n * 96, 96)
+
+    r = benchmark(unpack_loop, eti, bs, offsets)
+    assert len(r) == n
+
+def mk_exec_response(eti, n):
+    x = eti.OrderExecResponse()
+    for i in range(n):
+        g = eti.FillsGrpComp()
+        g.FillPx = 10**8 + i
+        g.FillQty = 10**4 * (i + 1)
+        x.FillsGrp.append(g)
+    x.NoFills = n
+    x.update_length()
+    return x
+
+def decode_all(d, bss):
+    for bs in bss:
+        x = d.unpack_from(bs)
+    return x
+
+# i.e. after the first round the Decoder doesn't allocate new message objects
+@pytest.mark.parametrize('msg', ['ioc', 'exec'])
+def test_decoder(benchmark, eti, msg):
+    if msg == 'ioc':
+        bss = [ mk_ioc(eti).pack() ]
+    else:
+        bss = [ mk_exec_response(eti, n).pack() for n in (3, 1, 2) ]
+    d = eti.Decoder()
+    x = decode_all(d, bss)
+
+    n = 1000
+    tracemalloc.start()
+    a = tracemalloc.get_traced_memory()[0]
+    for _ in range(n):
+        assert decode_all(d, bss) is x
+    b = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    benchmark.extra_info['bytes_per_message'] = (b - a) / (n * len(bss))
+    assert b - a < 1024
+
+    benchmark(decode_all, d, bss)
+
+def test_projection_ioc(benchmark, eti):
+    bs = mk_ioc(eti).pack()
+    f = eti.compile_projection(eti.TemplateID.NewOrderSingleShortRequest,
+            ['RequestHeader.MsgSeqNum', 'Price', 'OrderQty', 'ClOrdID'])
+
+    r = benchmark(f, bs)
+    assert r == (3, 404 * 10**8, 42 * 10**4, 666)
+
+def recv_all(s, buf, n):
+    while n:
+        n -= s.recv_into(buf, n)
+
+def send_burst(x, bs, a, b, buf, n):
+    for i in range(n):
+        x.ClOrdID = i
+        k = x.pack_into(bs)
+        a.sendall(memoryview(bs)[:k])
+    recv_all(b, buf, n * 96)
+
+def write_burst(x, w, b, buf, n):
+    for i in range(n):
+        x.ClOrdID = i
+        w.pack(x)
+    w.flush()
+    recv_all(b, buf, n * 96)
+
+# i.e. one send() call per order vs. one for the whole burst
+@pytest.mark.parametrize('batched', [False, True], ids=['single', 'batched'])
+def test_burst_ioc(benchmark, eti, batched):
+    n = 64
+    x = mk_ioc(eti)
+    a, b = socket.socketpair()
+    buf = bytearray(n * 96)
+    with a, b:
+        if batched:
+            w = MessageWriter(SocketTransport(a))
+            benchmark(write_burst, x, w, b, buf, n)
+        else:
+            benchmark(send_burst, x, bytearray(96), a, b, buf, n)
+
+def frame_all(d, bs):
+    d.feed(bs)
+    return sum(1 for _ in d)
+
+# i.e. splitting a 64 KiB read into its messages
+def test_frame_ioc(benchmark, eti):
+    n = 64 * 1024 // 96
+    bs = mk_ioc(eti).pack() * n
+    d = FrameDecoder(eti.header_st)
+
+    assert benchmark(frame_all, d, bs) == n
+
+# i.e. an aggressive IOC against a book with 10^5 resting orders
+def test_match_ioc(benchmark):
+    e = Engine()
+    w = object()
+    for i in range(10**5):
+        side = BUY if i % 2 else SELL
+        e.new(w, i, i % 20, side, 900 - i % 500 if side == BUY else 1100 + i % 500, 10**9)
+    n = len(e)
+
+    o, fills = benchmark(e.new, w, 0, 0, BUY, 1100, 100, True)
+    assert fills and len(e) == n
+    benchmark.extra_info.update(e.stats())
+
+# i.e. the per-message cost of recording a received message into a
+# journal vs. pretty-printing it
+@pytest.fixture(params=['journal', 'pformat'])
+def logger(request, tmp_path):
+    if request.param == 'journal':
+        j = Journal(str(tmp_path / 'bench.jrn'), 'eti.v9_0')
+        yield lambda m, bs: j.record(0, IN, bs)
+        j.close()
+    else:
+        from dressup import pformat
+        yield lambda m, bs: pformat(m, width=45)
+
+def test_log_ioc(benchmark, eti, logger):
+    x = mk_ioc(eti)
+    bs = x.pack()
+    benchmark(logger, x, bs)
+
+def unpack_packet(eobi, bs):
+    i = eobi.PacketHeader().sizes[0]
+    k = 0
+    while i < len(bs):
+        m = eobi.unpack_from(bs, i)
+        if m.MessageHeader.TemplateID == eobi.TemplateID.OrderAdd:
+            k += 1
+        i += m.MessageHeader.BodyLen
+    return k
+
+def iter_packet(eobi, bs):
+    k = 0
+    add = eobi.TemplateID.OrderAdd
+    for tid, i, _ in eobi.iter_messages(bs):
+        if tid == add:
+            eobi.unpack_from(bs, i)
+            k += 1
+    return k
+
+# i.e. an EOBI packet with 2 relevant messages and 20 others, where
+# iter_messages() only unpacks the relevant ones
+@pytest.mark.parametrize('walk', [unpack_packet, iter_packet], ids=['unpack', 'iter'])
+def test_walk_eobi(benchmark, walk):
+    import eobi.v9_0 as eobi
+    bs = eobi.PacketHeader().pack() + (eobi.OrderAdd().pack() + eobi.Heartbeat().pack() * 10) * 2
+
+    assert benchmark(walk, eobi, bs) == 2
+
+def replay(b, ps):
+    for p in ps:
+        b.packet(p)
+    return b
+
+# i.e. replaying 10^4 packets (about 9 messages each) of a synthetic feed
+# for 1000 instruments into empty books
+def test_book_replay(benchmark):
+    import eobi.v13_0 as eobi
+    ps = list(SyntheticFeed(eobi, securities=1000).packets(10**4))
+
+    b = benchmark.pedantic(replay, setup=lambda: ((BookBuilder(eobi), ps), {}), rounds=10)
+    assert b.unknown == 0
+    benchmark.extra_info['messages'] = b.messages
+    if benchmark.stats:
+        benchmark.extra_info['us/message'] = benchmark.stats.stats.mean / b.messages * 1e6
+
+def arbitrate(arb, ps):
+    n = 0
+    for p in ps:
+        n += arb.packet(0, p)
+        n += arb.packet(1, p)
+    return n
+
+# i.e. both feeds deliver the same 10^4 packets, i.e. each packet is
+# forwarded once and dropped once as duplicate
+def test_arbiter(benchmark):
+    import eobi.v13_0 as eobi
+    ps = list(SyntheticFeed(eobi, securities=1000).packets(10**4))
+
+    n = benchmark.pedantic(arbitrate, setup=lambda: ((Arbiter(eobi), ps), {}), rounds=10)
+    assert n == len(ps)
+    if benchmark.stats:
+        benchmark.extra_info['us/packet'] = benchmark.stats.stats.mean / (2 * len(ps)) * 1e6
+
+def recover(r, ps):
+    for p in ps:
+        r.snapshot(p)
+    return r
+
+# i.e. recovering 200 market segments (2000 instruments) from
+# interleaved snapshot cycles
+def test_recovery(benchmark):
+    import eobi.v13_0 as eobi
+    f = SyntheticFeed(eobi, securities=2000, segments=200)
+    for _ in f.packets(2 * 10**4):
+        pass
+    cycles = [ f.snapshot(seg) for seg in range(200) ]
+    ps = [ p for xs in itertools.zip_longest(*cycles) for p in xs if p is not None ]
+
+    r = benchmark.pedantic(recover, setup=lambda: ((Recovery(eobi), ps), {}), rounds=10)
+    assert r.recoveries == 200
+    benchmark.extra_info['orders'] = len(f.live)
+    if benchmark.stats:
+        benchmark.extra_info['us/order'] = benchmark.stats.stats.mean / len(f.live) * 1e6
+
+def push_drain(r, ps):
+    for p in ps:
+        r.push(p, 0)
+    return r.drain(len, limit=len(ps))[0]
+
+# i.e. the receiver side cost of handing a packet to a worker (plus the
+# bare consumer side cost)
+def test_ring(benchmark):
+    import eobi.v13_0 as eobi
+    ps = list(SyntheticFeed(eobi).packets(10**4))
+    r = Ring(16 * 1024 * 1024)
+
+    assert benchmark(push_drain, r, ps) == len(ps)
+    if benchmark.stats:
+        benchmark.extra_info['us/packet'] = benchmark.stats.stats.mean / len(ps) * 1e6
+    r.close(unlink=True)
@@ -0,0 +1,4029 @@
+# auto-generated by Georg Sauthoff's eti2py.py
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: BSL-1.0
+
+import operator
+import struct
+import threading
+from dataclasses import dataclass, field, is_dataclass
+from enum import IntEnum
+
+def rstrip_dc(x):
+    for k, v in x.__dict__.items():
+        if type(v) is bytes:
+            x.__setattr__(k, x.__getattribute__(k).rstrip(b'\0'))
+        elif is_dataclass(v):
+            rstrip_dc(v)
+
+def enumerize(i, klasse):
+    try:
+        return klasse(i)
+    except ValueError:
+        return i
+
+_st_B = struct.Struct('<B')
+_st_h = struct.Struct('<h')
+_st_H = struct.Struct('<H')
+_st_i = struct.Struct('<i')
+_st_I = struct.Struct('<I')
+_st_q = struct.Struct('<q')
+_st_Q = struct.Struct('<Q')
+
+# NB: NumPy is optional, i.e. it's only imported when a dtype is requested
+_np_fmts = { 'B': 'u1', 'h': '<i2', 'H': '<u2', 'i': '<i4', 'I': '<u4', 'q': '<i8', 'Q': '<u8' }
+
+def _make_dtype(cls):
+    import numpy as np
+    names   = [ k for k, _, _ in cls.layout ]
+    formats = [ f.dtype() if isinstance(f, type) else _np_fmts.get(f, f'S{f[:-1]}')
+                for _, f, _ in cls.layout ]
+    offsets = [ off for _, _, off in cls.layout ]
+    return np.dtype({ 'names': names, 'formats': formats, 'offsets': offsets,
+                      'itemsize': cls.sizes[0] })
+
+def _unpack_many(cls, buf, offsets):
+    import numpy as np
+    dt = cls.dtype()
+    a = np.frombuffer(buf, dtype=np.uint8)
+    idx = np.asarray(offsets, dtype=np.intp)[:, None] + np.arange(dt.itemsize)
+    return a[idx].view(dt)[:, 0].view(np.recarray)
+
+version = '13.0'
+sub_version = 'A0001'
+build = '7'
+
+def _mk_TemplateID():
+    class TemplateID(IntEnum):
+        PacketHeader = 13001
+        Heartbeat = 13002
+        OrderAdd = 13100
+        OrderModify = 13101
+        OrderDelete = 13102
+        OrderMassDelete = 13103
+        FullOrderExecution = 13104
+        PartialOrderExecution = 13105
+        OrderModifySamePrio = 13106
+        ExecutionSummary = 13202
+        MassInstrumentStateChange = 13301
+        ProductSummary = 13600
+        InstrumentSummary = 13601
+        SnapshotOrder = 13602
+    return TemplateID
+
+def _mk_CompletionIndicator():
+    class CompletionIndicator(IntEnum):
+        INCOMPLETE = 0
+        COMPLETE = 1
+        NO_VALUE = 0xFF
+    CompletionIndicator._tab = { v.value: v for v in CompletionIndicator }
+    return CompletionIndicator
+
+def _mk_ApplSeqResetIndicator():
+    class ApplSeqResetIndicator(IntEnum):
+        NO_RESET = 0
+        RESET = 1
+        NO_VALUE = 0xFF
+    ApplSeqResetIndicator._tab = { v.value: v for v in ApplSeqResetIndicator }
+    return ApplSeqResetIndicator
+
+def _mk_Side():
+    class Side(IntEnum):
+        BUY = 1
+        SELL = 2
+        NO_VALUE = 0xFF
+    Side._tab = { v.value: v for v in Side }
+    return Side
+
+def _mk_OrdType():
+    class OrdType(IntEnum):
+        MARKET = 1
+        LIMIT = 2
+        NO_VALUE = 0xFF
+    OrdType._tab = { v.value: v for v in OrdType }
+    return OrdType
+
+def _mk_MatchSubType():
+    class MatchSubType(IntEnum):
+        OPENING_AUCTION = 1
+        CONTINUOUS = 5
+        NO_VALUE = 0xFF
+    MatchSubType._tab = { v.value: v for v in MatchSubType }
+    return MatchSubType
+
+def _mk_AggressorSide():
+    class AggressorSide(IntEnum):
+        BUY = 1
+        SELL = 2
+        NO_VALUE = 0xFF
+    AggressorSide._tab = { v.value: v for v in AggressorSide }
+    return AggressorSide
+
+def _mk_TradeCondition():
+    class TradeCondition(IntEnum):
+        IMPLIED_TRADE = 1
+        NO_VALUE = 0xFF
+    TradeCondition._tab = { v.value: v for v in TradeCondition }
+    return TradeCondition
+
+def _mk_MDEntryType():
+    class MDEntryType(IntEnum):
+        TRADE = 2
+        OPENING_PRICE = 4
+        CLOSING_PRICE = 5
+        HIGH_PRICE = 7
+        LOW_PRICE = 8
+        NO_VALUE = 0xFF
+    MDEntryType._tab = { v.value: v for v in MDEntryType }
+    return MDEntryType
+
+def _mk_SoldOutIndicator():
+    class SoldOutIndicator(IntEnum):
+        NO = 0
+        SOLDOUT = 1
+        NO_VALUE = 0xFF
+    SoldOutIndicator._tab = { v.value: v for v in SoldOutIndicator }
+    return SoldOutIndicator
+
+def _mk_MarketCondition():
+    class MarketCondition(IntEnum):
+        NORMAL = 0
+        STRESSED = 1
+        NO_VALUE = 0xFF
+    MarketCondition._tab = { v.value: v for v in MarketCondition }
+    return MarketCondition
+
+def _mk_SecurityStatus():
+    class SecurityStatus(IntEnum):
+        ACTIVE = 1
+        INACTIVE = 2
+        NO_VALUE = 0xFF
+    SecurityStatus._tab = { v.value: v for v in SecurityStatus }
+    return SecurityStatus
+
+def _mk_SecurityTradingStatus():
+    class SecurityTradingStatus(IntEnum):
+        CLOSED = 200
+        CONTINUOUS = 203
+        NO_VALUE = 0xFF
+    SecurityTradingStatus._tab = { v.value: v for v in SecurityTradingStatus }
+    return SecurityTradingStatus
+
+def _mk_TradingSessionSubID():
+    class TradingSessionSubID(IntEnum):
+        CLOSING = 4
+        QUIESCENT = 7
+        NO_VALUE = 0xFF
+    TradingSessionSubID._tab = { v.value: v for v in TradingSessionSubID }
+    return TradingSessionSubID
+
+def _mk_TradSesStatus():
+    class TradSesStatus(IntEnum):
+        HALTED = 1
+        OPEN = 2
+        CLOSED = 3
+        NO_VALUE = 0xFF
+    TradSesStatus._tab = { v.value: v for v in TradSesStatus }
+    return TradSesStatus
+
+def _mk_MarketSegmentStatus():
+    class MarketSegmentStatus(IntEnum):
+        ACTIVE = 1
+        INACTIVE = 2
+        NO_VALUE = 0xFF
+    MarketSegmentStatus._tab = { v.value: v for v in MarketSegmentStatus }
+    return MarketSegmentStatus
+
+def _mk_SecurityMassTradingStatus():
+    class SecurityMassTradingStatus(IntEnum):
+        CLOSED = 200
+        INTRADAYAUCTION = 203
+        NO_VALUE = 0xFF
+    SecurityMassTradingStatus._tab = { v.value: v for v in SecurityMassTradingStatus }
+    return SecurityMassTradingStatus
+
+def _mk_MessageHeaderComp():
+    @dataclass
+    class MessageHeaderComp:
+        sizes = (8, 8)
+
+        BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHI', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('BodyLen', 'H', 0),
+            ('TemplateID', 'H', 2),
+            ('MsgSeqNum', 'I', 4),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.BodyLen, self.TemplateID, self.MsgSeqNum)
+            return off + 8
+        def pack(self):
+            bs = bytearray(8)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.BodyLen, self.TemplateID, self.MsgSeqNum = self.st(0).unpack_from(buf, off)
+            return off + 8
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = MessageHeaderComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return MessageHeaderComp
+
+def _mk_MessageHeaderCompView():
+    class MessageHeaderCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def BodyLen(self):
+            return _st_H.unpack_from(self._buf, self._off)[0]
+        @property
+        def TemplateID(self):
+            return _st_H.unpack_from(self._buf, self._off + 2)[0]
+        @property
+        def MsgSeqNum(self):
+            return _st_I.unpack_from(self._buf, self._off + 4)[0]
+
+        def unpack(self):
+            return MessageHeaderComp.create_from(self._buf, self._off)
+
+    return MessageHeaderCompView
+
+def _mk_OrderDetailsComp():
+    @dataclass
+    class OrderDetailsComp:
+        sizes = (32, 32)
+
+        TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:0
+        DisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:8
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:16
+        OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:17
+        # PADDING=6 # fmt:6x, size:6, off:18
+        Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:24
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<QQBB6xq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('TrdRegTSTimePriority', 'Q', 0),
+            ('DisplayQty', 'Q', 8),
+            ('Side', 'B', 16),
+            ('OrdType', 'B', 17),
+            ('Price', 'q', 24),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.TrdRegTSTimePriority, self.DisplayQty, self.Side, self.OrdType, self.Price)
+            return off + 32
+        def pack(self):
+            bs = bytearray(32)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.TrdRegTSTimePriority, self.DisplayQty, self.Side, self.OrdType, self.Price = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.Side, self.OrdType = Side._tab.get(self.Side, self.Side), OrdType._tab.get(self.OrdType, self.OrdType)
+            return off + 32
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderDetailsComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off, v)
+        @staticmethod
+        def set_DisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 17, v)
+        @staticmethod
+        def set_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 24, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return OrderDetailsComp
+
+def _mk_OrderDetailsCompView():
+    class OrderDetailsCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def TrdRegTSTimePriority(self):
+            return _st_Q.unpack_from(self._buf, self._off)[0]
+        @property
+        def DisplayQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def OrdType(self):
+            return _st_B.unpack_from(self._buf, self._off + 17)[0]
+        @property
+        def Price(self):
+            return _st_q.unpack_from(self._buf, self._off + 24)[0]
+
+        def unpack(self):
+            return OrderDetailsComp.create_from(self._buf, self._off)
+
+    return OrderDetailsCompView
+
+def _mk_MDInstrumentEntryGrpComp():
+    @dataclass
+    class MDInstrumentEntryGrpComp:
+        sizes = (24, 24)
+
+        MDEntryPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:0
+        MDEntrySize: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:8
+        MDEntryType: int = MDEntryType(0xFF) # u1, enum:MDEntryType, fmt:B, size:1, off:16
+        # PADDING=7 # fmt:7x, size:7, off:17
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<qQB7x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MDEntryPx', 'q', 0),
+            ('MDEntrySize', 'Q', 8),
+            ('MDEntryType', 'B', 16),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.MDEntryPx, self.MDEntrySize, self.MDEntryType)
+            return off + 24
+        def pack(self):
+            bs = bytearray(24)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MDEntryPx, self.MDEntrySize, self.MDEntryType = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.MDEntryType = MDEntryType._tab.get(self.MDEntryType, self.MDEntryType)
+            return off + 24
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = MDInstrumentEntryGrpComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MDEntryPx(buf, off, v):
+            _st_q.pack_into(buf, off, v)
+        @staticmethod
+        def set_MDEntrySize(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_MDEntryType(buf, off, v):
+            _st_B.pack_into(buf, off + 16, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return MDInstrumentEntryGrpComp
+
+def _mk_MDInstrumentEntryGrpCompView():
+    class MDInstrumentEntryGrpCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MDEntryPx(self):
+            return _st_q.unpack_from(self._buf, self._off)[0]
+        @property
+        def MDEntrySize(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def MDEntryType(self):
+            return _st_B.unpack_from(self._buf, self._off + 16)[0]
+
+        def unpack(self):
+            return MDInstrumentEntryGrpComp.create_from(self._buf, self._off)
+
+    return MDInstrumentEntryGrpCompView
+
+def _mk_InstrumentStateComp():
+    @dataclass
+    class InstrumentStateComp:
+        sizes = (16, 16)
+
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:0
+        SecurityStatus: int = SecurityStatus(0xFF) # u1, enum:SecurityStatus, fmt:B, size:1, off:8
+        SecurityTradingStatus: int = SecurityTradingStatus(0xFF) # u1, enum:SecurityTradingStatus, fmt:B, size:1, off:9
+        # PADDING=6 # fmt:6x, size:6, off:10
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<qBB6x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('SecurityID', 'q', 0),
+            ('SecurityStatus', 'B', 8),
+            ('SecurityTradingStatus', 'B', 9),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.SecurityID, self.SecurityStatus, self.SecurityTradingStatus)
+            return off + 16
+        def pack(self):
+            bs = bytearray(16)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.SecurityID, self.SecurityStatus, self.SecurityTradingStatus = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.SecurityStatus, self.SecurityTradingStatus = SecurityStatus._tab.get(self.SecurityStatus, self.SecurityStatus), SecurityTradingStatus._tab.get(self.SecurityTradingStatus, self.SecurityTradingStatus)
+            return off + 16
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = InstrumentStateComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off, v)
+        @staticmethod
+        def set_SecurityStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_SecurityTradingStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 9, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return InstrumentStateComp
+
+def _mk_InstrumentStateCompView():
+    class InstrumentStateCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off)[0]
+        @property
+        def SecurityStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def SecurityTradingStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 9)[0]
+
+        def unpack(self):
+            return InstrumentStateComp.create_from(self._buf, self._off)
+
+    return InstrumentStateCompView
+
+def _mk_PacketHeader():
+    @dataclass
+    class PacketHeader:
+        sizes = (32, 32)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(32, 13001)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        ApplSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:8
+        MarketSegmentID: int = -2147483648 # i4, fmt:i, size:4, off:12
+        PartitionID: int = 0xFF # u1, fmt:B, size:1, off:16
+        CompletionIndicator: int = CompletionIndicator(0xFF) # u1, enum:CompletionIndicator, fmt:B, size:1, off:17
+        ApplSeqResetIndicator: int = ApplSeqResetIndicator(0xFF) # u1, enum:ApplSeqResetIndicator, fmt:B, size:1, off:18
+        DSCP: int = 0xFF # u1, fmt:B, size:1, off:19
+        # PADDING=4 # fmt:4x, size:4, off:20
+        TransactTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIIiBBBB4xQ', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('ApplSeqNum', 'I', 8),
+            ('MarketSegmentID', 'i', 12),
+            ('PartitionID', 'B', 16),
+            ('CompletionIndicator', 'B', 17),
+            ('ApplSeqResetIndicator', 'B', 18),
+            ('DSCP', 'B', 19),
+            ('TransactTime', 'Q', 24),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.ApplSeqNum, self.MarketSegmentID, self.PartitionID, self.CompletionIndicator, self.ApplSeqResetIndicator, self.DSCP, self.TransactTime)
+            return off + 32
+        def pack(self):
+            bs = bytearray(32)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.ApplSeqNum, self.MarketSegmentID, self.PartitionID, self.CompletionIndicator, self.ApplSeqResetIndicator, self.DSCP, self.TransactTime = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.CompletionIndicator, self.ApplSeqResetIndicator = CompletionIndicator._tab.get(self.CompletionIndicator, self.CompletionIndicator), ApplSeqResetIndicator._tab.get(self.ApplSeqResetIndicator, self.ApplSeqResetIndicator)
+            return off + 32
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = PacketHeader()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ApplSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_MarketSegmentID(buf, off, v):
+            _st_i.pack_into(buf, off + 12, v)
+        @staticmethod
+        def set_PartitionID(buf, off, v):
+            _st_B.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_CompletionIndicator(buf, off, v):
+            _st_B.pack_into(buf, off + 17, v)
+        @staticmethod
+        def set_ApplSeqResetIndicator(buf, off, v):
+            _st_B.pack_into(buf, off + 18, v)
+        @staticmethod
+        def set_DSCP(buf, off, v):
+            _st_B.pack_into(buf, off + 19, v)
+        @staticmethod
+        def set_TransactTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return PacketHeader
+
+def _mk_PacketHeaderView():
+    class PacketHeaderView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def ApplSeqNum(self):
+            return _st_I.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def MarketSegmentID(self):
+            return _st_i.unpack_from(self._buf, self._off + 12)[0]
+        @property
+        def PartitionID(self):
+            return _st_B.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def CompletionIndicator(self):
+            return _st_B.unpack_from(self._buf, self._off + 17)[0]
+        @property
+        def ApplSeqResetIndicator(self):
+            return _st_B.unpack_from(self._buf, self._off + 18)[0]
+        @property
+        def DSCP(self):
+            return _st_B.unpack_from(self._buf, self._off + 19)[0]
+        @property
+        def TransactTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+
+        def unpack(self):
+            return PacketHeader.create_from(self._buf, self._off)
+
+    return PacketHeaderView
+
+def _mk_Heartbeat():
+    @dataclass
+    class Heartbeat:
+        sizes = (16, 16)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(16, 13002)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        LastMsgSeqNumProcessed: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:8
+        # PADDING=4 # fmt:4x, size:4, off:12
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHII4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('LastMsgSeqNumProcessed', 'I', 8),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.LastMsgSeqNumProcessed)
+            return off + 16
+        def pack(self):
+            bs = bytearray(16)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.LastMsgSeqNumProcessed = self.st(0).unpack_from(buf, off)
+            return off + 16
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = Heartbeat()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_LastMsgSeqNumProcessed(buf, off, v):
+            _st_I.pack_into(buf, off + 8, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return Heartbeat
+
+def _mk_HeartbeatView():
+    class HeartbeatView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def LastMsgSeqNumProcessed(self):
+            return _st_I.unpack_from(self._buf, self._off + 8)[0]
+
+        def unpack(self):
+            return Heartbeat.create_from(self._buf, self._off)
+
+    return HeartbeatView
+
+def _mk_OrderAdd():
+    @dataclass
+    class OrderAdd:
+        sizes = (56, 56)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(56, 13100)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:16
+        OrderDetails: OrderDetailsComp = field(default_factory=OrderDetailsComp) # fmt:?, size:32, off:24
+        #    TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    DisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:32
+        #    Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:40
+        #    OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:41
+        #    # PADDING=6 # fmt:6x, size:6, off:42
+        #    Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:48
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIQqQQBB6xq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('TrdRegTSTimeIn', 'Q', 8),
+            ('SecurityID', 'q', 16),
+            ('OrderDetails', OrderDetailsComp, 24),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price)
+            return off + 56
+        def pack(self):
+            bs = bytearray(56)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.Side, c1.OrdType = Side._tab.get(c1.Side, c1.Side), OrdType._tab.get(c1.OrdType, c1.OrdType)
+            return off + 56
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderAdd()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_OrderDetails_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_OrderDetails_DisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_OrderDetails_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_OrderDetails_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 41, v)
+        @staticmethod
+        def set_OrderDetails_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 48, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            self.OrderDetails.rstrip()
+
+    return OrderAdd
+
+def _mk_OrderAddView():
+    class OrderAddView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def TrdRegTSTimeIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def OrderDetails(self):
+            return OrderDetailsCompView(self._buf, self._off + 24)
+
+        def unpack(self):
+            return OrderAdd.create_from(self._buf, self._off)
+
+    return OrderAddView
+
+def _mk_OrderModify():
+    @dataclass
+    class OrderModify:
+        sizes = (80, 80)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(80, 13101)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        PrevPrice: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:24
+        PrevDisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:32
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:40
+        OrderDetails: OrderDetailsComp = field(default_factory=OrderDetailsComp) # fmt:?, size:32, off:48
+        #    TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:48
+        #    DisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:56
+        #    Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:64
+        #    OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:65
+        #    # PADDING=6 # fmt:6x, size:6, off:66
+        #    Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:72
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIQQqQqQQBB6xq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('TrdRegTSTimeIn', 'Q', 8),
+            ('RequestTime', 'Q', 16),
+            ('PrevPrice', 'q', 24),
+            ('PrevDisplayQty', 'Q', 32),
+            ('SecurityID', 'q', 40),
+            ('OrderDetails', OrderDetailsComp, 48),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.RequestTime, self.PrevPrice, self.PrevDisplayQty, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price)
+            return off + 80
+        def pack(self):
+            bs = bytearray(80)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.RequestTime, self.PrevPrice, self.PrevDisplayQty, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.Side, c1.OrdType = Side._tab.get(c1.Side, c1.Side), OrdType._tab.get(c1.OrdType, c1.OrdType)
+            return off + 80
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderModify()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_PrevPrice(buf, off, v):
+            _st_q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_PrevDisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_OrderDetails_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_OrderDetails_DisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_OrderDetails_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 64, v)
+        @staticmethod
+        def set_OrderDetails_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 65, v)
+        @staticmethod
+        def set_OrderDetails_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 72, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            self.OrderDetails.rstrip()
+
+    return OrderModify
+
+def _mk_OrderModifyView():
+    class OrderModifyView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def TrdRegTSTimeIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def RequestTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def PrevPrice(self):
+            return _st_q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def PrevDisplayQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def OrderDetails(self):
+            return OrderDetailsCompView(self._buf, self._off + 48)
+
+        def unpack(self):
+            return OrderModify.create_from(self._buf, self._off)
+
+    return OrderModifyView
+
+def _mk_OrderDelete():
+    @dataclass
+    class OrderDelete:
+        sizes = (64, 64)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(64, 13102)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        TransactTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:24
+        OrderDetails: OrderDetailsComp = field(default_factory=OrderDetailsComp) # fmt:?, size:32, off:32
+        #    TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    DisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:40
+        #    Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:48
+        #    OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:49
+        #    # PADDING=6 # fmt:6x, size:6, off:50
+        #    Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:56
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIQQqQQBB6xq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('TrdRegTSTimeIn', 'Q', 8),
+            ('TransactTime', 'Q', 16),
+            ('SecurityID', 'q', 24),
+            ('OrderDetails', OrderDetailsComp, 32),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.TransactTime, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price)
+            return off + 64
+        def pack(self):
+            bs = bytearray(64)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.TransactTime, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.Side, c1.OrdType = Side._tab.get(c1.Side, c1.Side), OrdType._tab.get(c1.OrdType, c1.OrdType)
+            return off + 64
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderDelete()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TransactTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_OrderDetails_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_OrderDetails_DisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_OrderDetails_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_OrderDetails_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 49, v)
+        @staticmethod
+        def set_OrderDetails_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 56, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            self.OrderDetails.rstrip()
+
+    return OrderDelete
+
+def _mk_OrderDeleteView():
+    class OrderDeleteView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def TrdRegTSTimeIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TransactTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def OrderDetails(self):
+            return OrderDetailsCompView(self._buf, self._off + 32)
+
+        def unpack(self):
+            return OrderDelete.create_from(self._buf, self._off)
+
+    return OrderDeleteView
+
+def _mk_OrderMassDelete():
+    @dataclass
+    class OrderMassDelete:
+        sizes = (24, 24)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(24, 13103)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:8
+        TransactTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIqQ', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('SecurityID', 'q', 8),
+            ('TransactTime', 'Q', 16),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.SecurityID, self.TransactTime)
+            return off + 24
+        def pack(self):
+            bs = bytearray(24)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.SecurityID, self.TransactTime = self.st(0).unpack_from(buf, off)
+            return off + 24
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderMassDelete()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TransactTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return OrderMassDelete
+
+def _mk_OrderMassDeleteView():
+    class OrderMassDeleteView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TransactTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+
+        def unpack(self):
+            return OrderMassDelete.create_from(self._buf, self._off)
+
+    return OrderMassDeleteView
+
+def _mk_FullOrderExecution():
+    @dataclass
+    class FullOrderExecution:
+        sizes = (56, 56)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(56, 13104)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:8
+        # PADDING=7 # fmt:7x, size:7, off:9
+        Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:16
+        TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:32
+        LastQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:40
+        LastPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:48
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIB7xqQqQq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('Side', 'B', 8),
+            ('Price', 'q', 16),
+            ('TrdRegTSTimePriority', 'Q', 24),
+            ('SecurityID', 'q', 32),
+            ('LastQty', 'Q', 40),
+            ('LastPx', 'q', 48),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.Side, self.Price, self.TrdRegTSTimePriority, self.SecurityID, self.LastQty, self.LastPx)
+            return off + 56
+        def pack(self):
+            bs = bytearray(56)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.Side, self.Price, self.TrdRegTSTimePriority, self.SecurityID, self.LastQty, self.LastPx = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.Side = Side._tab.get(self.Side, self.Side)
+            return off + 56
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = FullOrderExecution()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_LastQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_LastPx(buf, off, v):
+            _st_q.pack_into(buf, off + 48, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return FullOrderExecution
+
+def _mk_FullOrderExecutionView():
+    class FullOrderExecutionView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def Price(self):
+            return _st_q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def TrdRegTSTimePriority(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def LastQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def LastPx(self):
+            return _st_q.unpack_from(self._buf, self._off + 48)[0]
+
+        def unpack(self):
+            return FullOrderExecution.create_from(self._buf, self._off)
+
+    return FullOrderExecutionView
+
+def _mk_PartialOrderExecution():
+    @dataclass
+    class PartialOrderExecution:
+        sizes = (56, 56)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(56, 13105)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:8
+        # PADDING=7 # fmt:7x, size:7, off:9
+        Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:16
+        TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:32
+        LastQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:40
+        LastPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:48
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIB7xqQqQq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('Side', 'B', 8),
+            ('Price', 'q', 16),
+            ('TrdRegTSTimePriority', 'Q', 24),
+            ('SecurityID', 'q', 32),
+            ('LastQty', 'Q', 40),
+            ('LastPx', 'q', 48),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.Side, self.Price, self.TrdRegTSTimePriority, self.SecurityID, self.LastQty, self.LastPx)
+            return off + 56
+        def pack(self):
+            bs = bytearray(56)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.Side, self.Price, self.TrdRegTSTimePriority, self.SecurityID, self.LastQty, self.LastPx = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.Side = Side._tab.get(self.Side, self.Side)
+            return off + 56
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = PartialOrderExecution()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_LastQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_LastPx(buf, off, v):
+            _st_q.pack_into(buf, off + 48, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return PartialOrderExecution
+
+def _mk_PartialOrderExecutionView():
+    class PartialOrderExecutionView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def Price(self):
+            return _st_q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def TrdRegTSTimePriority(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def LastQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def LastPx(self):
+            return _st_q.unpack_from(self._buf, self._off + 48)[0]
+
+        def unpack(self):
+            return PartialOrderExecution.create_from(self._buf, self._off)
+
+    return PartialOrderExecutionView
+
+def _mk_OrderModifySamePrio():
+    @dataclass
+    class OrderModifySamePrio:
+        sizes = (72, 72)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(72, 13106)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        TransactTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        PrevDisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:24
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:32
+        OrderDetails: OrderDetailsComp = field(default_factory=OrderDetailsComp) # fmt:?, size:32, off:40
+        #    TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    DisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:48
+        #    Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:56
+        #    OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:57
+        #    # PADDING=6 # fmt:6x, size:6, off:58
+        #    Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:64
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIQQQqQQBB6xq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('TrdRegTSTimeIn', 'Q', 8),
+            ('TransactTime', 'Q', 16),
+            ('PrevDisplayQty', 'Q', 24),
+            ('SecurityID', 'q', 32),
+            ('OrderDetails', OrderDetailsComp, 40),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.TransactTime, self.PrevDisplayQty, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price)
+            return off + 72
+        def pack(self):
+            bs = bytearray(72)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.TrdRegTSTimeIn, self.TransactTime, self.PrevDisplayQty, self.SecurityID, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.Side, c1.OrdType = Side._tab.get(c1.Side, c1.Side), OrdType._tab.get(c1.OrdType, c1.OrdType)
+            return off + 72
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderModifySamePrio()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TransactTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_PrevDisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_OrderDetails_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_OrderDetails_DisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_OrderDetails_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_OrderDetails_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 57, v)
+        @staticmethod
+        def set_OrderDetails_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 64, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            self.OrderDetails.rstrip()
+
+    return OrderModifySamePrio
+
+def _mk_OrderModifySamePrioView():
+    class OrderModifySamePrioView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def TrdRegTSTimeIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TransactTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def PrevDisplayQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def OrderDetails(self):
+            return OrderDetailsCompView(self._buf, self._off + 40)
+
+        def unpack(self):
+            return OrderModifySamePrio.create_from(self._buf, self._off)
+
+    return OrderModifySamePrioView
+
+def _mk_ExecutionSummary():
+    @dataclass
+    class ExecutionSummary:
+        sizes = (80, 80)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(80, 13202)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:8
+        AggressorTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        LastQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:40
+        AggressorSide: int = AggressorSide(0xFF) # u1, enum:AggressorSide, fmt:B, size:1, off:48
+        TradeCondition: int = TradeCondition(0xFF) # u1, enum:TradeCondition, fmt:B, size:1, off:49
+        # PADDING=6 # fmt:6x, size:6, off:50
+        LastPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:56
+        RestingHiddenQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:64
+        RestingCxlQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:72
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIqQQQQBB6xqQQ', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('SecurityID', 'q', 8),
+            ('AggressorTime', 'Q', 16),
+            ('RequestTime', 'Q', 24),
+            ('ExecID', 'Q', 32),
+            ('LastQty', 'Q', 40),
+            ('AggressorSide', 'B', 48),
+            ('TradeCondition', 'B', 49),
+            ('LastPx', 'q', 56),
+            ('RestingHiddenQty', 'Q', 64),
+            ('RestingCxlQty', 'Q', 72),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.SecurityID, self.AggressorTime, self.RequestTime, self.ExecID, self.LastQty, self.AggressorSide, self.TradeCondition, self.LastPx, self.RestingHiddenQty, self.RestingCxlQty)
+            return off + 80
+        def pack(self):
+            bs = bytearray(80)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.SecurityID, self.AggressorTime, self.RequestTime, self.ExecID, self.LastQty, self.AggressorSide, self.TradeCondition, self.LastPx, self.RestingHiddenQty, self.RestingCxlQty = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.AggressorSide, self.TradeCondition = AggressorSide._tab.get(self.AggressorSide, self.AggressorSide), TradeCondition._tab.get(self.TradeCondition, self.TradeCondition)
+            return off + 80
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = ExecutionSummary()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_AggressorTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_LastQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_AggressorSide(buf, off, v):
+            _st_B.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_TradeCondition(buf, off, v):
+            _st_B.pack_into(buf, off + 49, v)
+        @staticmethod
+        def set_LastPx(buf, off, v):
+            _st_q.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_RestingHiddenQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 64, v)
+        @staticmethod
+        def set_RestingCxlQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 72, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return ExecutionSummary
+
+def _mk_ExecutionSummaryView():
+    class ExecutionSummaryView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def AggressorTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def RequestTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def LastQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def AggressorSide(self):
+            return _st_B.unpack_from(self._buf, self._off + 48)[0]
+        @property
+        def TradeCondition(self):
+            return _st_B.unpack_from(self._buf, self._off + 49)[0]
+        @property
+        def LastPx(self):
+            return _st_q.unpack_from(self._buf, self._off + 56)[0]
+        @property
+        def RestingHiddenQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 64)[0]
+        @property
+        def RestingCxlQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 72)[0]
+
+        def unpack(self):
+            return ExecutionSummary.create_from(self._buf, self._off)
+
+    return ExecutionSummaryView
+
+def _mk_ProductSummary():
+    @dataclass
+    class ProductSummary:
+        sizes = (16, 16)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(16, 13600)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        LastMsgSeqNumProcessed: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:8
+        TradingSessionSubID: int = TradingSessionSubID(0xFF) # u1, enum:TradingSessionSubID, fmt:B, size:1, off:12
+        TradSesStatus: int = TradSesStatus(0xFF) # u1, enum:TradSesStatus, fmt:B, size:1, off:13
+        MarketSegmentStatus: int = MarketSegmentStatus(0xFF) # u1, enum:MarketSegmentStatus, fmt:B, size:1, off:14
+        # PADDING=1 # fmt:1x, size:1, off:15
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIIBBB1x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('LastMsgSeqNumProcessed', 'I', 8),
+            ('TradingSessionSubID', 'B', 12),
+            ('TradSesStatus', 'B', 13),
+            ('MarketSegmentStatus', 'B', 14),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.LastMsgSeqNumProcessed, self.TradingSessionSubID, self.TradSesStatus, self.MarketSegmentStatus)
+            return off + 16
+        def pack(self):
+            bs = bytearray(16)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, self.LastMsgSeqNumProcessed, self.TradingSessionSubID, self.TradSesStatus, self.MarketSegmentStatus = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.TradingSessionSubID, self.TradSesStatus, self.MarketSegmentStatus = TradingSessionSubID._tab.get(self.TradingSessionSubID, self.TradingSessionSubID), TradSesStatus._tab.get(self.TradSesStatus, self.TradSesStatus), MarketSegmentStatus._tab.get(self.MarketSegmentStatus, self.MarketSegmentStatus)
+            return off + 16
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = ProductSummary()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_LastMsgSeqNumProcessed(buf, off, v):
+            _st_I.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TradingSessionSubID(buf, off, v):
+            _st_B.pack_into(buf, off + 12, v)
+        @staticmethod
+        def set_TradSesStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 13, v)
+        @staticmethod
+        def set_MarketSegmentStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 14, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+
+    return ProductSummary
+
+def _mk_ProductSummaryView():
+    class ProductSummaryView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def LastMsgSeqNumProcessed(self):
+            return _st_I.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TradingSessionSubID(self):
+            return _st_B.unpack_from(self._buf, self._off + 12)[0]
+        @property
+        def TradSesStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 13)[0]
+        @property
+        def MarketSegmentStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 14)[0]
+
+        def unpack(self):
+            return ProductSummary.create_from(self._buf, self._off)
+
+    return ProductSummaryView
+
+def _mk_InstrumentSummary():
+    @dataclass
+    class InstrumentSummary:
+        sizes = (40, 160)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(40, 13601)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:8
+        TransactTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        TotNoOrders: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        SecurityStatus: int = SecurityStatus(0xFF) # u1, enum:SecurityStatus, fmt:B, size:1, off:28
+        SecurityTradingStatus: int = SecurityTradingStatus(0xFF) # u1, enum:SecurityTradingStatus, fmt:B, size:1, off:29
+        MarketCondition: int = MarketCondition(0xFF) # u1, enum:MarketCondition, fmt:B, size:1, off:30
+        SoldOutIndicator: int = SoldOutIndicator(0xFF) # u1, enum:SoldOutIndicator, fmt:B, size:1, off:31
+        NoMDEntries: int = 0 # u1, fmt:B, size:1, off:32
+        # PADDING=7 # fmt:7x, size:7, off:33
+        MDInstrumentEntryGrp: [MDInstrumentEntryGrpComp] = field(default_factory=list) # fmt:?, size:24, off:40
+        #    MDEntryPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:40
+        #    MDEntrySize: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:48
+        #    MDEntryType: int = MDEntryType(0xFF) # u1, enum:MDEntryType, fmt:B, size:1, off:56
+        #    # PADDING=7 # fmt:7x, size:7, off:57
+
+        def update_length(self):
+            self.MessageHeader.BodyLen = 8 + 32 + self.NoMDEntries * 24
+
+        fmt = ( '<?', '<qQIBBBBB7x', '<?', )
+        _struct = [ None, None, None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('SecurityID', 'q', 8),
+            ('TransactTime', 'Q', 16),
+            ('TotNoOrders', 'I', 24),
+            ('SecurityStatus', 'B', 28),
+            ('SecurityTradingStatus', 'B', 29),
+            ('MarketCondition', 'B', 30),
+            ('SoldOutIndicator', 'B', 31),
+            ('NoMDEntries', 'B', 32),
+        )
+        def pack_into(self, buf, off=0):
+            self.MessageHeader.pack_into(buf, off)
+            self.st(1).pack_into(buf, off + 8, self.SecurityID, self.TransactTime, self.TotNoOrders, self.SecurityStatus, self.SecurityTradingStatus, self.MarketCondition, self.SoldOutIndicator, self.NoMDEntries)
+            o = off + 40
+            for v in self.MDInstrumentEntryGrp:
+                v.pack_into(buf, o)
+                o += 24
+            return o
+        def pack(self):
+            bs = bytearray(160)
+            n = self.pack_into(bs)
+            mv = memoryview(bs)
+            return bytes(mv[:n])
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MessageHeader.unpack_from(buf, off, enums, strip)
+            self.SecurityID, self.TransactTime, self.TotNoOrders, self.SecurityStatus, self.SecurityTradingStatus, self.MarketCondition, self.SoldOutIndicator, self.NoMDEntries = self.st(1).unpack_from(buf, off + 8)
+            if enums:
+                self.SecurityStatus, self.SecurityTradingStatus, self.MarketCondition, self.SoldOutIndicator = SecurityStatus._tab.get(self.SecurityStatus, self.SecurityStatus), SecurityTradingStatus._tab.get(self.SecurityTradingStatus, self.SecurityTradingStatus), MarketCondition._tab.get(self.MarketCondition, self.MarketCondition), SoldOutIndicator._tab.get(self.SoldOutIndicator, self.SoldOutIndicator)
+            o = off + 40
+            xs = self.MDInstrumentEntryGrp
+            n = self.NoMDEntries
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(MDInstrumentEntryGrpComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 24
+            return o
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = InstrumentSummary()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TransactTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_TotNoOrders(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_SecurityStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 28, v)
+        @staticmethod
+        def set_SecurityTradingStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 29, v)
+        @staticmethod
+        def set_MarketCondition(buf, off, v):
+            _st_B.pack_into(buf, off + 30, v)
+        @staticmethod
+        def set_SoldOutIndicator(buf, off, v):
+            _st_B.pack_into(buf, off + 31, v)
+        @staticmethod
+        def set_NoMDEntries(buf, off, v):
+            _st_B.pack_into(buf, off + 32, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            for v in self.MDInstrumentEntryGrp:
+                v.rstrip()
+
+    return InstrumentSummary
+
+def _mk_InstrumentSummaryView():
+    class InstrumentSummaryView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TransactTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def TotNoOrders(self):
+            return _st_I.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def SecurityStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 28)[0]
+        @property
+        def SecurityTradingStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 29)[0]
+        @property
+        def MarketCondition(self):
+            return _st_B.unpack_from(self._buf, self._off + 30)[0]
+        @property
+        def SoldOutIndicator(self):
+            return _st_B.unpack_from(self._buf, self._off + 31)[0]
+        @property
+        def NoMDEntries(self):
+            return _st_B.unpack_from(self._buf, self._off + 32)[0]
+
+        def unpack(self):
+            return InstrumentSummary.create_from(self._buf, self._off)
+
+    return InstrumentSummaryView
+
+def _mk_SnapshotOrder():
+    @dataclass
+    class SnapshotOrder:
+        sizes = (40, 40)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(40, 13602)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        OrderDetails: OrderDetailsComp = field(default_factory=OrderDetailsComp) # fmt:?, size:32, off:8
+        #    TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    DisplayQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:16
+        #    Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:24
+        #    OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:25
+        #    # PADDING=6 # fmt:6x, size:6, off:26
+        #    Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:32
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<HHIQQBB6xq', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('OrderDetails', OrderDetailsComp, 8),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price)
+            return off + 40
+        def pack(self):
+            bs = bytearray(40)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeader
+            c1 = self.OrderDetails
+            c0.BodyLen, c0.TemplateID, c0.MsgSeqNum, c1.TrdRegTSTimePriority, c1.DisplayQty, c1.Side, c1.OrdType, c1.Price = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.Side, c1.OrdType = Side._tab.get(c1.Side, c1.Side), OrdType._tab.get(c1.OrdType, c1.OrdType)
+            return off + 40
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = SnapshotOrder()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_OrderDetails_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_OrderDetails_DisplayQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_OrderDetails_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_OrderDetails_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 25, v)
+        @staticmethod
+        def set_OrderDetails_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 32, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            self.OrderDetails.rstrip()
+
+    return SnapshotOrder
+
+def _mk_SnapshotOrderView():
+    class SnapshotOrderView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def OrderDetails(self):
+            return OrderDetailsCompView(self._buf, self._off + 8)
+
+        def unpack(self):
+            return SnapshotOrder.create_from(self._buf, self._off)
+
+    return SnapshotOrderView
+
+def _mk_MassInstrumentStateChange():
+    @dataclass
+    class MassInstrumentStateChange:
+        sizes = (16, 400)
+
+        MessageHeader: MessageHeaderComp = field(default_factory=lambda : MessageHeaderComp(16, 13301)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFF # u2, fmt:H, size:2, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:2
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+        SecurityMassTradingStatus: int = SecurityMassTradingStatus(0xFF) # u1, enum:SecurityMassTradingStatus, fmt:B, size:1, off:8
+        NoRelatedSym: int = 0 # u1, fmt:B, size:1, off:9
+        # PADDING=6 # fmt:6x, size:6, off:10
+        InstrumentState: [InstrumentStateComp] = field(default_factory=list) # fmt:?, size:16, off:16
+        #    SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:16
+        #    SecurityStatus: int = SecurityStatus(0xFF) # u1, enum:SecurityStatus, fmt:B, size:1, off:24
+        #    SecurityTradingStatus: int = SecurityTradingStatus(0xFF) # u1, enum:SecurityTradingStatus, fmt:B, size:1, off:25
+        #    # PADDING=6 # fmt:6x, size:6, off:26
+
+        def update_length(self):
+            self.MessageHeader.BodyLen = 8 + 8 + self.NoRelatedSym * 16
+
+        fmt = ( '<?', '<BB6x', '<?', )
+        _struct = [ None, None, None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeader', MessageHeaderComp, 0),
+            ('SecurityMassTradingStatus', 'B', 8),
+            ('NoRelatedSym', 'B', 9),
+        )
+        def pack_into(self, buf, off=0):
+            self.MessageHeader.pack_into(buf, off)
+            self.st(1).pack_into(buf, off + 8, self.SecurityMassTradingStatus, self.NoRelatedSym)
+            o = off + 16
+            for v in self.InstrumentState:
+                v.pack_into(buf, o)
+                o += 16
+            return o
+        def pack(self):
+            bs = bytearray(400)
+            n = self.pack_into(bs)
+            mv = memoryview(bs)
+            return bytes(mv[:n])
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MessageHeader.unpack_from(buf, off, enums, strip)
+            self.SecurityMassTradingStatus, self.NoRelatedSym = self.st(1).unpack_from(buf, off + 8)
+            if enums:
+                self.SecurityMassTradingStatus = SecurityMassTradingStatus._tab.get(self.SecurityMassTradingStatus, self.SecurityMassTradingStatus)
+            o = off + 16
+            xs = self.InstrumentState
+            n = self.NoRelatedSym
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(InstrumentStateComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 16
+            return o
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = MassInstrumentStateChange()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeader_BodyLen(buf, off, v):
+            _st_H.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeader_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 2, v)
+        @staticmethod
+        def set_MessageHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_SecurityMassTradingStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_NoRelatedSym(buf, off, v):
+            _st_B.pack_into(buf, off + 9, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeader.rstrip()
+            for v in self.InstrumentState:
+                v.rstrip()
+
+    return MassInstrumentStateChange
+
+def _mk_MassInstrumentStateChangeView():
+    class MassInstrumentStateChangeView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeader(self):
+            return MessageHeaderCompView(self._buf, self._off)
+        @property
+        def SecurityMassTradingStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def NoRelatedSym(self):
+            return _st_B.unpack_from(self._buf, self._off + 9)[0]
+
+        def unpack(self):
+            return MassInstrumentStateChange.create_from(self._buf, self._off)
+
+    return MassInstrumentStateChangeView
+
+_tid2name = (
+              'PacketHeader', # 13001
+              'Heartbeat', # 13002
+              None, # 13003
+              None, # 13004
+              None, # 13005
+              None, # 13006
+              None, # 13007
+              None, # 13008
+              None, # 13009
+              None, # 13010
+              None, # 13011
+              None, # 13012
+              None, # 13013
+              None, # 13014
+              None, # 13015
+              None, # 13016
+              None, # 13017
+              None, # 13018
+              None, # 13019
+              None, # 13020
+              None, # 13021
+              None, # 13022
+              None, # 13023
+              None, # 13024
+              None, # 13025
+              None, # 13026
+              None, # 13027
+              None, # 13028
+              None, # 13029
+              None, # 13030
+              None, # 13031
+              None, # 13032
+              None, # 13033
+              None, # 13034
+              None, # 13035
+              None, # 13036
+              None, # 13037
+              None, # 13038
+              None, # 13039
+              None, # 13040
+              None, # 13041
+              None, # 13042
+              None, # 13043
+              None, # 13044
+              None, # 13045
+              None, # 13046
+              None, # 13047
+              None, # 13048
+              None, # 13049
+              None, # 13050
+              None, # 13051
+              None, # 13052
+              None, # 13053
+              None, # 13054
+              None, # 13055
+              None, # 13056
+              None, # 13057
+              None, # 13058
+              None, # 13059
+              None, # 13060
+              None, # 13061
+              None, # 13062
+              None, # 13063
+              None, # 13064
+              None, # 13065
+              None, # 13066
+              None, # 13067
+              None, # 13068
+              None, # 13069
+              None, # 13070
+              None, # 13071
+              None, # 13072
+              None, # 13073
+              None, # 13074
+              None, # 13075
+              None, # 13076
+              None, # 13077
+              None, # 13078
+              None, # 13079
+              None, # 13080
+              None, # 13081
+              None, # 13082
+              None, # 13083
+              None, # 13084
+              None, # 13085
+              None, # 13086
+              None, # 13087
+              None, # 13088
+              None, # 13089
+              None, # 13090
+              None, # 13091
+              None, # 13092
+              None, # 13093
+              None, # 13094
+              None, # 13095
+              None, # 13096
+              None, # 13097
+              None, # 13098
+              None, # 13099
+              'OrderAdd', # 13100
+              'OrderModify', # 13101
+              'OrderDelete', # 13102
+              'OrderMassDelete', # 13103
+              'FullOrderExecution', # 13104
+              'PartialOrderExecution', # 13105
+              'OrderModifySamePrio', # 13106
+              None, # 13107
+              None, # 13108
+              None, # 13109
+              None, # 13110
+              None, # 13111
+              None, # 13112
+              None, # 13113
+              None, # 13114
+              None, # 13115
+              None, # 13116
+              None, # 13117
+              None, # 13118
+              None, # 13119
+              None, # 13120
+              None, # 13121
+              None, # 13122
+              None, # 13123
+              None, # 13124
+              None, # 13125
+              None, # 13126
+              None, # 13127
+              None, # 13128
+              None, # 13129
+              None, # 13130
+              None, # 13131
+              None, # 13132
+              None, # 13133
+              None, # 13134
+              None, # 13135
+              None, # 13136
+              None, # 13137
+              None, # 13138
+              None, # 13139
+              None, # 13140
+              None, # 13141
+              None, # 13142
+              None, # 13143
+              None, # 13144
+              None, # 13145
+              None, # 13146
+              None, # 13147
+              None, # 13148
+              None, # 13149
+              None, # 13150
+              None, # 13151
+              None, # 13152
+              None, # 13153
+              None, # 13154
+              None, # 13155
+              None, # 13156
+              None, # 13157
+              None, # 13158
+              None, # 13159
+              None, # 13160
+              None, # 13161
+              None, # 13162
+              None, # 13163
+              None, # 13164
+              None, # 13165
+              None, # 13166
+              None, # 13167
+              None, # 13168
+              None, # 13169
+              None, # 13170
+              None, # 13171
+              None, # 13172
+              None, # 13173
+              None, # 13174
+              None, # 13175
+              None, # 13176
+              None, # 13177
+              None, # 13178
+              None, # 13179
+              None, # 13180
+              None, # 13181
+              None, # 13182
+              None, # 13183
+              None, # 13184
+              None, # 13185
+              None, # 13186
+              None, # 13187
+              None, # 13188
+              None, # 13189
+              None, # 13190
+              None, # 13191
+              None, # 13192
+              None, # 13193
+              None, # 13194
+              None, # 13195
+              None, # 13196
+              None, # 13197
+              None, # 13198
+              None, # 13199
+              None, # 13200
+              None, # 13201
+              'ExecutionSummary', # 13202
+              None, # 13203
+              None, # 13204
+              None, # 13205
+              None, # 13206
+              None, # 13207
+              None, # 13208
+              None, # 13209
+              None, # 13210
+              None, # 13211
+              None, # 13212
+              None, # 13213
+              None, # 13214
+              None, # 13215
+              None, # 13216
+              None, # 13217
+              None, # 13218
+              None, # 13219
+              None, # 13220
+              None, # 13221
+              None, # 13222
+              None, # 13223
+              None, # 13224
+              None, # 13225
+              None, # 13226
+              None, # 13227
+              None, # 13228
+              None, # 13229
+              None, # 13230
+              None, # 13231
+              None, # 13232
+              None, # 13233
+              None, # 13234
+              None, # 13235
+              None, # 13236
+              None, # 13237
+              None, # 13238
+              None, # 13239
+              None, # 13240
+              None, # 13241
+              None, # 13242
+              None, # 13243
+              None, # 13244
+              None, # 13245
+              None, # 13246
+              None, # 13247
+              None, # 13248
+              None, # 13249
+              None, # 13250
+              None, # 13251
+              None, # 13252
+              None, # 13253
+              None, # 13254
+              None, # 13255
+              None, # 13256
+              None, # 13257
+              None, # 13258
+              None, # 13259
+              None, # 13260
+              None, # 13261
+              None, # 13262
+              None, # 13263
+              None, # 13264
+              None, # 13265
+              None, # 13266
+              None, # 13267
+              None, # 13268
+              None, # 13269
+              None, # 13270
+              None, # 13271
+              None, # 13272
+              None, # 13273
+              None, # 13274
+              None, # 13275
+              None, # 13276
+              None, # 13277
+              None, # 13278
+              None, # 13279
+              None, # 13280
+              None, # 13281
+              None, # 13282
+              None, # 13283
+              None, # 13284
+              None, # 13285
+              None, # 13286
+              None, # 13287
+              None, # 13288
+              None, # 13289
+              None, # 13290
+              None, # 13291
+              None, # 13292
+              None, # 13293
+              None, # 13294
+              None, # 13295
+              None, # 13296
+              None, # 13297
+              None, # 13298
+              None, # 13299
+              None, # 13300
+              'MassInstrumentStateChange', # 13301
+              None, # 13302
+              None, # 13303
+              None, # 13304
+              None, # 13305
+              None, # 13306
+              None, # 13307
+              None, # 13308
+              None, # 13309
+              None, # 13310
+              None, # 13311
+              None, # 13312
+              None, # 13313
+              None, # 13314
+              None, # 13315
+              None, # 13316
+              None, # 13317
+              None, # 13318
+              None, # 13319
+              None, # 13320
+              None, # 13321
+              None, # 13322
+              None, # 13323
+              None, # 13324
+              None, # 13325
+              None, # 13326
+              None, # 13327
+              None, # 13328
+              None, # 13329
+              None, # 13330
+              None, # 13331
+              None, # 13332
+              None, # 13333
+              None, # 13334
+              None, # 13335
+              None, # 13336
+              None, # 13337
+              None, # 13338
+              None, # 13339
+              None, # 13340
+              None, # 13341
+              None, # 13342
+              None, # 13343
+              None, # 13344
+              None, # 13345
+              None, # 13346
+              None, # 13347
+              None, # 13348
+              None, # 13349
+              None, # 13350
+              None, # 13351
+              None, # 13352
+              None, # 13353
+              None, # 13354
+              None, # 13355
+              None, # 13356
+              None, # 13357
+              None, # 13358
+              None, # 13359
+              None, # 13360
+              None, # 13361
+              None, # 13362
+              None, # 13363
+              None, # 13364
+              None, # 13365
+              None, # 13366
+              None, # 13367
+              None, # 13368
+              None, # 13369
+              None, # 13370
+              None, # 13371
+              None, # 13372
+              None, # 13373
+              None, # 13374
+              None, # 13375
+              None, # 13376
+              None, # 13377
+              None, # 13378
+              None, # 13379
+              None, # 13380
+              None, # 13381
+              None, # 13382
+              None, # 13383
+              None, # 13384
+              None, # 13385
+              None, # 13386
+              None, # 13387
+              None, # 13388
+              None, # 13389
+              None, # 13390
+              None, # 13391
+              None, # 13392
+              None, # 13393
+              None, # 13394
+              None, # 13395
+              None, # 13396
+              None, # 13397
+              None, # 13398
+              None, # 13399
+              None, # 13400
+              None, # 13401
+              None, # 13402
+              None, # 13403
+              None, # 13404
+              None, # 13405
+              None, # 13406
+              None, # 13407
+              None, # 13408
+              None, # 13409
+              None, # 13410
+              None, # 13411
+              None, # 13412
+              None, # 13413
+              None, # 13414
+              None, # 13415
+              None, # 13416
+              None, # 13417
+              None, # 13418
+              None, # 13419
+              None, # 13420
+              None, # 13421
+              None, # 13422
+              None, # 13423
+              None, # 13424
+              None, # 13425
+              None, # 13426
+              None, # 13427
+              None, # 13428
+              None, # 13429
+              None, # 13430
+              None, # 13431
+              None, # 13432
+              None, # 13433
+              None, # 13434
+              None, # 13435
+              None, # 13436
+              None, # 13437
+              None, # 13438
+              None, # 13439
+              None, # 13440
+              None, # 13441
+              None, # 13442
+              None, # 13443
+              None, # 13444
+              None, # 13445
+              None, # 13446
+              None, # 13447
+              None, # 13448
+              None, # 13449
+              None, # 13450
+              None, # 13451
+              None, # 13452
+              None, # 13453
+              None, # 13454
+              None, # 13455
+              None, # 13456
+              None, # 13457
+              None, # 13458
+              None, # 13459
+              None, # 13460
+              None, # 13461
+              None, # 13462
+              None, # 13463
+              None, # 13464
+              None, # 13465
+              None, # 13466
+              None, # 13467
+              None, # 13468
+              None, # 13469
+              None, # 13470
+              None, # 13471
+              None, # 13472
+              None, # 13473
+              None, # 13474
+              None, # 13475
+              None, # 13476
+              None, # 13477
+              None, # 13478
+              None, # 13479
+              None, # 13480
+              None, # 13481
+              None, # 13482
+              None, # 13483
+              None, # 13484
+              None, # 13485
+              None, # 13486
+              None, # 13487
+              None, # 13488
+              None, # 13489
+              None, # 13490
+              None, # 13491
+              None, # 13492
+              None, # 13493
+              None, # 13494
+              None, # 13495
+              None, # 13496
+              None, # 13497
+              None, # 13498
+              None, # 13499
+              None, # 13500
+              None, # 13501
+              None, # 13502
+              None, # 13503
+              None, # 13504
+              None, # 13505
+              None, # 13506
+              None, # 13507
+              None, # 13508
+              None, # 13509
+              None, # 13510
+              None, # 13511
+              None, # 13512
+              None, # 13513
+              None, # 13514
+              None, # 13515
+              None, # 13516
+              None, # 13517
+              None, # 13518
+              None, # 13519
+              None, # 13520
+              None, # 13521
+              None, # 13522
+              None, # 13523
+              None, # 13524
+              None, # 13525
+              None, # 13526
+              None, # 13527
+              None, # 13528
+              None, # 13529
+              None, # 13530
+              None, # 13531
+              None, # 13532
+              None, # 13533
+              None, # 13534
+              None, # 13535
+              None, # 13536
+              None, # 13537
+              None, # 13538
+              None, # 13539
+              None, # 13540
+              None, # 13541
+              None, # 13542
+              None, # 13543
+              None, # 13544
+              None, # 13545
+              None, # 13546
+              None, # 13547
+              None, # 13548
+              None, # 13549
+              None, # 13550
+              None, # 13551
+              None, # 13552
+              None, # 13553
+              None, # 13554
+              None, # 13555
+              None, # 13556
+              None, # 13557
+              None, # 13558
+              None, # 13559
+              None, # 13560
+              None, # 13561
+              None, # 13562
+              None, # 13563
+              None, # 13564
+              None, # 13565
+              None, # 13566
+              None, # 13567
+              None, # 13568
+              None, # 13569
+              None, # 13570
+              None, # 13571
+              None, # 13572
+              None, # 13573
+              None, # 13574
+              None, # 13575
+              None, # 13576
+              None, # 13577
+              None, # 13578
+              None, # 13579
+              None, # 13580
+              None, # 13581
+              None, # 13582
+              None, # 13583
+              None, # 13584
+              None, # 13585
+              None, # 13586
+              None, # 13587
+              None, # 13588
+              None, # 13589
+              None, # 13590
+              None, # 13591
+              None, # 13592
+              None, # 13593
+              None, # 13594
+              None, # 13595
+              None, # 13596
+              None, # 13597
+              None, # 13598
+              None, # 13599
+              'ProductSummary', # 13600
+              'InstrumentSummary', # 13601
+              'SnapshotOrder', # 13602
+)
+
+_tid2class = [ None ] * 602
+_tid2view  = [ None ] * 602
+
+def _mk_tid2class():
+    for i, name in enumerate(_tid2name):
+        if name is not None and _tid2class[i] is None:
+            _tid2class[i] = __getattr__(name)
+    return _tid2class
+
+def _mk_tid2view():
+    for i, name in enumerate(_tid2name):
+        if name is not None and _tid2view[i] is None:
+            _tid2view[i] = __getattr__(name + 'View')
+    return _tid2view
+
+# i.e. the BodyLen of each fixed size template (indexed by template ID),
+# 0 for unknown and variable size templates
+tid2size = (
+              32, # 13001
+              16, # 13002
+              0, # 13003
+              0, # 13004
+              0, # 13005
+              0, # 13006
+              0, # 13007
+              0, # 13008
+              0, # 13009
+              0, # 13010
+              0, # 13011
+              0, # 13012
+              0, # 13013
+              0, # 13014
+              0, # 13015
+              0, # 13016
+              0, # 13017
+              0, # 13018
+              0, # 13019
+              0, # 13020
+              0, # 13021
+              0, # 13022
+              0, # 13023
+              0, # 13024
+              0, # 13025
+              0, # 13026
+              0, # 13027
+              0, # 13028
+              0, # 13029
+              0, # 13030
+              0, # 13031
+              0, # 13032
+              0, # 13033
+              0, # 13034
+              0, # 13035
+              0, # 13036
+              0, # 13037
+              0, # 13038
+              0, # 13039
+              0, # 13040
+              0, # 13041
+              0, # 13042
+              0, # 13043
+              0, # 13044
+              0, # 13045
+              0, # 13046
+              0, # 13047
+              0, # 13048
+              0, # 13049
+              0, # 13050
+              0, # 13051
+              0, # 13052
+              0, # 13053
+              0, # 13054
+              0, # 13055
+              0, # 13056
+              0, # 13057
+              0, # 13058
+              0, # 13059
+              0, # 13060
+              0, # 13061
+              0, # 13062
+              0, # 13063
+              0, # 13064
+              0, # 13065
+              0, # 13066
+              0, # 13067
+              0, # 13068
+              0, # 13069
+              0, # 13070
+              0, # 13071
+              0, # 13072
+              0, # 13073
+              0, # 13074
+              0, # 13075
+              0, # 13076
+              0, # 13077
+              0, # 13078
+              0, # 13079
+              0, # 13080
+              0, # 13081
+              0, # 13082
+              0, # 13083
+              0, # 13084
+              0, # 13085
+              0, # 13086
+              0, # 13087
+              0, # 13088
+              0, # 13089
+              0, # 13090
+              0, # 13091
+              0, # 13092
+              0, # 13093
+              0, # 13094
+              0, # 13095
+              0, # 13096
+              0, # 13097
+              0, # 13098
+              0, # 13099
+              56, # 13100
+              80, # 13101
+              64, # 13102
+              24, # 13103
+              56, # 13104
+              56, # 13105
+              72, # 13106
+              0, # 13107
+              0, # 13108
+              0, # 13109
+              0, # 13110
+              0, # 13111
+              0, # 13112
+              0, # 13113
+              0, # 13114
+              0, # 13115
+              0, # 13116
+              0, # 13117
+              0, # 13118
+              0, # 13119
+              0, # 13120
+              0, # 13121
+              0, # 13122
+              0, # 13123
+              0, # 13124
+              0, # 13125
+              0, # 13126
+              0, # 13127
+              0, # 13128
+              0, # 13129
+              0, # 13130
+              0, # 13131
+              0, # 13132
+              0, # 13133
+              0, # 13134
+              0, # 13135
+              0, # 13136
+              0, # 13137
+              0, # 13138
+              0, # 13139
+              0, # 13140
+              0, # 13141
+              0, # 13142
+              0, # 13143
+              0, # 13144
+              0, # 13145
+              0, # 13146
+              0, # 13147
+              0, # 13148
+              0, # 13149
+              0, # 13150
+              0, # 13151
+              0, # 13152
+              0, # 13153
+              0, # 13154
+              0, # 13155
+              0, # 13156
+              0, # 13157
+              0, # 13158
+              0, # 13159
+              0, # 13160
+              0, # 13161
+              0, # 13162
+              0, # 13163
+              0, # 13164
+              0, # 13165
+              0, # 13166
+              0, # 13167
+              0, # 13168
+              0, # 13169
+              0, # 13170
+              0, # 13171
+              0, # 13172
+              0, # 13173
+              0, # 13174
+              0, # 13175
+              0, # 13176
+              0, # 13177
+              0, # 13178
+              0, # 13179
+              0, # 13180
+              0, # 13181
+              0, # 13182
+              0, # 13183
+              0, # 13184
+              0, # 13185
+              0, # 13186
+              0, # 13187
+              0, # 13188
+              0, # 13189
+              0, # 13190
+              0, # 13191
+              0, # 13192
+              0, # 13193
+              0, # 13194
+              0, # 13195
+              0, # 13196
+              0, # 13197
+              0, # 13198
+              0, # 13199
+              0, # 13200
+              0, # 13201
+              80, # 13202
+              0, # 13203
+              0, # 13204
+              0, # 13205
+              0, # 13206
+              0, # 13207
+              0, # 13208
+              0, # 13209
+              0, # 13210
+              0, # 13211
+              0, # 13212
+              0, # 13213
+              0, # 13214
+              0, # 13215
+              0, # 13216
+              0, # 13217
+              0, # 13218
+              0, # 13219
+              0, # 13220
+              0, # 13221
+              0, # 13222
+              0, # 13223
+              0, # 13224
+              0, # 13225
+              0, # 13226
+              0, # 13227
+              0, # 13228
+              0, # 13229
+              0, # 13230
+              0, # 13231
+              0, # 13232
+              0, # 13233
+              0, # 13234
+              0, # 13235
+              0, # 13236
+              0, # 13237
+              0, # 13238
+              0, # 13239
+              0, # 13240
+              0, # 13241
+              0, # 13242
+              0, # 13243
+              0, # 13244
+              0, # 13245
+              0, # 13246
+              0, # 13247
+              0, # 13248
+              0, # 13249
+              0, # 13250
+              0, # 13251
+              0, # 13252
+              0, # 13253
+              0, # 13254
+              0, # 13255
+              0, # 13256
+              0, # 13257
+              0, # 13258
+              0, # 13259
+              0, # 13260
+              0, # 13261
+              0, # 13262
+              0, # 13263
+              0, # 13264
+              0, # 13265
+              0, # 13266
+              0, # 13267
+              0, # 13268
+              0, # 13269
+              0, # 13270
+              0, # 13271
+              0, # 13272
+              0, # 13273
+              0, # 13274
+              0, # 13275
+              0, # 13276
+              0, # 13277
+              0, # 13278
+              0, # 13279
+              0, # 13280
+              0, # 13281
+              0, # 13282
+              0, # 13283
+              0, # 13284
+              0, # 13285
+              0, # 13286
+              0, # 13287
+              0, # 13288
+              0, # 13289
+              0, # 13290
+              0, # 13291
+              0, # 13292
+              0, # 13293
+              0, # 13294
+              0, # 13295
+              0, # 13296
+              0, # 13297
+              0, # 13298
+              0, # 13299
+              0, # 13300
+              0, # 13301
+              0, # 13302
+              0, # 13303
+              0, # 13304
+              0, # 13305
+              0, # 13306
+              0, # 13307
+              0, # 13308
+              0, # 13309
+              0, # 13310
+              0, # 13311
+              0, # 13312
+              0, # 13313
+              0, # 13314
+              0, # 13315
+              0, # 13316
+              0, # 13317
+              0, # 13318
+              0, # 13319
+              0, # 13320
+              0, # 13321
+              0, # 13322
+              0, # 13323
+              0, # 13324
+              0, # 13325
+              0, # 13326
+              0, # 13327
+              0, # 13328
+              0, # 13329
+              0, # 13330
+              0, # 13331
+              0, # 13332
+              0, # 13333
+              0, # 13334
+              0, # 13335
+              0, # 13336
+              0, # 13337
+              0, # 13338
+              0, # 13339
+              0, # 13340
+              0, # 13341
+              0, # 13342
+              0, # 13343
+              0, # 13344
+              0, # 13345
+              0, # 13346
+              0, # 13347
+              0, # 13348
+              0, # 13349
+              0, # 13350
+              0, # 13351
+              0, # 13352
+              0, # 13353
+              0, # 13354
+              0, # 13355
+              0, # 13356
+              0, # 13357
+              0, # 13358
+              0, # 13359
+              0, # 13360
+              0, # 13361
+              0, # 13362
+              0, # 13363
+              0, # 13364
+              0, # 13365
+              0, # 13366
+              0, # 13367
+              0, # 13368
+              0, # 13369
+              0, # 13370
+              0, # 13371
+              0, # 13372
+              0, # 13373
+              0, # 13374
+              0, # 13375
+              0, # 13376
+              0, # 13377
+              0, # 13378
+              0, # 13379
+              0, # 13380
+              0, # 13381
+              0, # 13382
+              0, # 13383
+              0, # 13384
+              0, # 13385
+              0, # 13386
+              0, # 13387
+              0, # 13388
+              0, # 13389
+              0, # 13390
+              0, # 13391
+              0, # 13392
+              0, # 13393
+              0, # 13394
+              0, # 13395
+              0, # 13396
+              0, # 13397
+              0, # 13398
+              0, # 13399
+              0, # 13400
+              0, # 13401
+              0, # 13402
+              0, # 13403
+              0, # 13404
+              0, # 13405
+              0, # 13406
+              0, # 13407
+              0, # 13408
+              0, # 13409
+              0, # 13410
+              0, # 13411
+              0, # 13412
+              0, # 13413
+              0, # 13414
+              0, # 13415
+              0, # 13416
+              0, # 13417
+              0, # 13418
+              0, # 13419
+              0, # 13420
+              0, # 13421
+              0, # 13422
+              0, # 13423
+              0, # 13424
+              0, # 13425
+              0, # 13426
+              0, # 13427
+              0, # 13428
+              0, # 13429
+              0, # 13430
+              0, # 13431
+              0, # 13432
+              0, # 13433
+              0, # 13434
+              0, # 13435
+              0, # 13436
+              0, # 13437
+              0, # 13438
+              0, # 13439
+              0, # 13440
+              0, # 13441
+              0, # 13442
+              0, # 13443
+              0, # 13444
+              0, # 13445
+              0, # 13446
+              0, # 13447
+              0, # 13448
+              0, # 13449
+              0, # 13450
+              0, # 13451
+              0, # 13452
+              0, # 13453
+              0, # 13454
+              0, # 13455
+              0, # 13456
+              0, # 13457
+              0, # 13458
+              0, # 13459
+              0, # 13460
+              0, # 13461
+              0, # 13462
+              0, # 13463
+              0, # 13464
+              0, # 13465
+              0, # 13466
+              0, # 13467
+              0, # 13468
+              0, # 13469
+              0, # 13470
+              0, # 13471
+              0, # 13472
+              0, # 13473
+              0, # 13474
+              0, # 13475
+              0, # 13476
+              0, # 13477
+              0, # 13478
+              0, # 13479
+              0, # 13480
+              0, # 13481
+              0, # 13482
+              0, # 13483
+              0, # 13484
+              0, # 13485
+              0, # 13486
+              0, # 13487
+              0, # 13488
+              0, # 13489
+              0, # 13490
+              0, # 13491
+              0, # 13492
+              0, # 13493
+              0, # 13494
+              0, # 13495
+              0, # 13496
+              0, # 13497
+              0, # 13498
+              0, # 13499
+              0, # 13500
+              0, # 13501
+              0, # 13502
+              0, # 13503
+              0, # 13504
+              0, # 13505
+              0, # 13506
+              0, # 13507
+              0, # 13508
+              0, # 13509
+              0, # 13510
+              0, # 13511
+              0, # 13512
+              0, # 13513
+              0, # 13514
+              0, # 13515
+              0, # 13516
+              0, # 13517
+              0, # 13518
+              0, # 13519
+              0, # 13520
+              0, # 13521
+              0, # 13522
+              0, # 13523
+              0, # 13524
+              0, # 13525
+              0, # 13526
+              0, # 13527
+              0, # 13528
+              0, # 13529
+              0, # 13530
+              0, # 13531
+              0, # 13532
+              0, # 13533
+              0, # 13534
+              0, # 13535
+              0, # 13536
+              0, # 13537
+              0, # 13538
+              0, # 13539
+              0, # 13540
+              0, # 13541
+              0, # 13542
+              0, # 13543
+              0, # 13544
+              0, # 13545
+              0, # 13546
+              0, # 13547
+              0, # 13548
+              0, # 13549
+              0, # 13550
+              0, # 13551
+              0, # 13552
+              0, # 13553
+              0, # 13554
+              0, # 13555
+              0, # 13556
+              0, # 13557
+              0, # 13558
+              0, # 13559
+              0, # 13560
+              0, # 13561
+              0, # 13562
+              0, # 13563
+              0, # 13564
+              0, # 13565
+              0, # 13566
+              0, # 13567
+              0, # 13568
+              0, # 13569
+              0, # 13570
+              0, # 13571
+              0, # 13572
+              0, # 13573
+              0, # 13574
+              0, # 13575
+              0, # 13576
+              0, # 13577
+              0, # 13578
+              0, # 13579
+              0, # 13580
+              0, # 13581
+              0, # 13582
+              0, # 13583
+              0, # 13584
+              0, # 13585
+              0, # 13586
+              0, # 13587
+              0, # 13588
+              0, # 13589
+              0, # 13590
+              0, # 13591
+              0, # 13592
+              0, # 13593
+              0, # 13594
+              0, # 13595
+              0, # 13596
+              0, # 13597
+              0, # 13598
+              0, # 13599
+              16, # 13600
+              0, # 13601
+              40, # 13602
+)
+
+tid_st = struct.Struct('<2xH')
+header_st = struct.Struct('<HH')
+
+# i.e. returns (BodyLen, TemplateID) without unpacking anything else
+def peek_header(bs, off=0):
+    return header_st.unpack_from(bs, off)
+
+class UnpackError(Exception):
+    pass
+
+# i.e. yields (TemplateID, offset, BodyLen) of each message in bs
+# (e.g. a packet) without unpacking them, where the BodyLen of fixed
+# size templates is checked against tid2size
+def iter_messages(bs, off=0):
+    end = len(bs)
+    while off < end:
+        n, tid = header_st.unpack_from(bs, off)
+        i = tid - 13001
+        if i < 0 or i >= 602:
+            raise UnpackError(f'template ID out of range: {tid} not in [13001..13602]')
+        k = tid2size[i]
+        if (n != k if k else n < header_st.size) or off + n > end:
+            raise UnpackError(f'invalid BodyLen {n} of template {tid} at offset {off}')
+        yield tid, off, n
+        off += n
+
+def _template(tid, suffix=''):
+    name = _tid2name[tid-13001]
+    if name is None:
+        raise UnpackError(f'unknown template ID: {tid}')
+    return __getattr__(name + suffix)
+
+def unpack_from(bs, off=0, enums=True, strip=False):
+    tid = tid_st.unpack_from(bs, off)[0]
+    if tid < 13001 or tid  > 13602:
+        raise UnpackError(f'template ID out of range: {tid} not in [13001..13602]')
+    c = _tid2class[tid-13001]
+    if c is None:
+        c = _tid2class[tid-13001] = _template(tid)
+    return c.create_from(bs, off, enums, strip)
+
+# i.e. unpacks into a pool of reusable objects per template, instead of
+# creating new ones, such that the returned object is only valid until
+# pool_size other messages of the same template were unpacked
+class Decoder:
+    def __init__(self, pool_size=1, enums=True, strip=False):
+        self.pool_size = pool_size
+        self.enums = enums
+        self.strip = strip
+        self._pools = [ None ] * 602
+        self._next = [ 0 ] * 602
+
+    def unpack_from(self, bs, off=0):
+        tid = tid_st.unpack_from(bs, off)[0]
+        if tid < 13001 or tid  > 13602:
+            raise UnpackError(f'template ID out of range: {tid} not in [13001..13602]')
+        i = tid - 13001
+        p = self._pools[i]
+        if p is None:
+            c = _template(tid)
+            p = self._pools[i] = [ c() for _ in range(self.pool_size) ]
+        j = self._next[i]
+        self._next[i] = (j + 1) % self.pool_size
+        x = p[j]
+        x.unpack_from(bs, off, self.enums, self.strip)
+        return x
+
+def view_from(bs, off=0):
+    tid = tid_st.unpack_from(bs, off)[0]
+    if tid < 13001 or tid  > 13602:
+        raise UnpackError(f'template ID out of range: {tid} not in [13001..13602]')
+    c = _tid2view[tid-13001]
+    if c is None:
+        c = _tid2view[tid-13001] = _template(tid, 'View')
+    return c(bs, off)
+
+# i.e. all messages at the offsets must have the same template ID
+def unpack_many(bs, offsets):
+    import numpy as np
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if len(offsets) == 0:
+        raise UnpackError('no offsets')
+    a = np.frombuffer(bs, dtype=np.uint8)
+    tids = a[offsets[:, None] + np.arange(2, 2 + 2)].view('<u2')[:, 0]
+    tid = int(tids[0])
+    if tid < 13001 or tid  > 13602:
+        raise UnpackError(f'template ID out of range: {tid} not in [13001..13602]')
+    if (tids != tid).any():
+        raise UnpackError(f'template IDs differ from first one: {tid}')
+    c = _template(tid)
+    if not hasattr(c, 'dtype'):
+        raise UnpackError(f'{c.__name__} has no fixed layout')
+    return c.unpack_many(bs, offsets)
+
+def _field(c, name):
+    off = 0
+    for k in name.split('.'):
+        for m, f, o in getattr(c, 'layout', ()):
+            if m == k:
+                break
+        else:
+            raise KeyError(f'{c.__name__} has no fixed offset field {k}')
+        off += o
+        c = f
+    if isinstance(f, type):
+        raise KeyError(f'{name} is a component and not a field')
+    return off, f
+
+# i.e. returns a function that unpacks just the named fields of a message
+# with the template ID (e.g. 'Price' or 'RequestHeader.MsgSeqNum'),
+# with a single struct call, in the same order - without checking
+# the template ID
+def compile_projection(tid, names):
+    if tid < 13001 or tid  > 13602:
+        raise UnpackError(f'template ID out of range: {tid} not in [13001..13602]')
+    c = _template(tid)
+    xs = sorted((*_field(c, name), i) for i, name in enumerate(names))
+    fmt = '<'
+    pos = 0
+    for off, f, i in xs:
+        if off < pos:
+            raise KeyError(f'duplicate field: {names[i]}')
+        if off > pos:
+            fmt += f'{off - pos}x'
+        fmt += f
+        pos = off + struct.calcsize(f)
+    st = struct.Struct(fmt)
+    ps = [ i for _, _, i in xs ]
+    if ps == list(range(len(ps))):
+        return st.unpack_from
+    # i.e. permutation of the unpacked values back to the requested order
+    g = operator.itemgetter(*sorted(range(len(ps)), key=ps.__getitem__))
+    def f(bs, off=0):
+        return g(st.unpack_from(bs, off))
+    return f
+
+def _mk_request2response():
+    request2response = {
+    }
+    return request2response
+
+_lazy = {
+    'TemplateID': (_mk_TemplateID, ()),
+    'CompletionIndicator': (_mk_CompletionIndicator, ()),
+    'ApplSeqResetIndicator': (_mk_ApplSeqResetIndicator, ()),
+    'Side': (_mk_Side, ()),
+    'OrdType': (_mk_OrdType, ()),
+    'MatchSubType': (_mk_MatchSubType, ()),
+    'AggressorSide': (_mk_AggressorSide, ()),
+    'TradeCondition': (_mk_TradeCondition, ()),
+    'MDEntryType': (_mk_MDEntryType, ()),
+    'SoldOutIndicator': (_mk_SoldOutIndicator, ()),
+    'MarketCondition': (_mk_MarketCondition, ()),
+    'SecurityStatus': (_mk_SecurityStatus, ()),
+    'SecurityTradingStatus': (_mk_SecurityTradingStatus, ()),
+    'TradingSessionSubID': (_mk_TradingSessionSubID, ()),
+    'TradSesStatus': (_mk_TradSesStatus, ()),
+    'MarketSegmentStatus': (_mk_MarketSegmentStatus, ()),
+    'SecurityMassTradingStatus': (_mk_SecurityMassTradingStatus, ()),
+    'MessageHeaderComp': (_mk_MessageHeaderComp, ()),
+    'MessageHeaderCompView': (_mk_MessageHeaderCompView, ('MessageHeaderComp', )),
+    'OrderDetailsComp': (_mk_OrderDetailsComp, ('Side', 'OrdType', )),
+    'OrderDetailsCompView': (_mk_OrderDetailsCompView, ('OrderDetailsComp', )),
+    'MDInstrumentEntryGrpComp': (_mk_MDInstrumentEntryGrpComp, ('MDEntryType', )),
+    'MDInstrumentEntryGrpCompView': (_mk_MDInstrumentEntryGrpCompView, ('MDInstrumentEntryGrpComp', )),
+    'InstrumentStateComp': (_mk_InstrumentStateComp, ('SecurityStatus', 'SecurityTradingStatus', )),
+    'InstrumentStateCompView': (_mk_InstrumentStateCompView, ('InstrumentStateComp', )),
+    'PacketHeader': (_mk_PacketHeader, ('MessageHeaderComp', 'CompletionIndicator', 'ApplSeqResetIndicator', )),
+    'PacketHeaderView': (_mk_PacketHeaderView, ('PacketHeader', 'MessageHeaderCompView', )),
+    'Heartbeat': (_mk_Heartbeat, ('MessageHeaderComp', )),
+    'HeartbeatView': (_mk_HeartbeatView, ('Heartbeat', 'MessageHeaderCompView', )),
+    'OrderAdd': (_mk_OrderAdd, ('MessageHeaderComp', 'OrderDetailsComp', )),
+    'OrderAddView': (_mk_OrderAddView, ('OrderAdd', 'MessageHeaderCompView', 'OrderDetailsCompView', )),
+    'OrderModify': (_mk_OrderModify, ('MessageHeaderComp', 'OrderDetailsComp', )),
+    'OrderModifyView': (_mk_OrderModifyView, ('OrderModify', 'MessageHeaderCompView', 'OrderDetailsCompView', )),
+    'OrderDelete': (_mk_OrderDelete, ('MessageHeaderComp', 'OrderDetailsComp', )),
+    'OrderDeleteView': (_mk_OrderDeleteView, ('OrderDelete', 'MessageHeaderCompView', 'OrderDetailsCompView', )),
+    'OrderMassDelete': (_mk_OrderMassDelete, ('MessageHeaderComp', )),
+    'OrderMassDeleteView': (_mk_OrderMassDeleteView, ('OrderMassDelete', 'MessageHeaderCompView', )),
+    'FullOrderExecution': (_mk_FullOrderExecution, ('MessageHeaderComp', 'Side', )),
+    'FullOrderExecutionView': (_mk_FullOrderExecutionView, ('FullOrderExecution', 'MessageHeaderCompView', )),
+    'PartialOrderExecution': (_mk_PartialOrderExecution, ('MessageHeaderComp', 'Side', )),
+    'PartialOrderExecutionView': (_mk_PartialOrderExecutionView, ('PartialOrderExecution', 'MessageHeaderCompView', )),
+    'OrderModifySamePrio': (_mk_OrderModifySamePrio, ('MessageHeaderComp', 'OrderDetailsComp', )),
+    'OrderModifySamePrioView': (_mk_OrderModifySamePrioView, ('OrderModifySamePrio', 'MessageHeaderCompView', 'OrderDetailsCompView', )),
+    'ExecutionSummary': (_mk_ExecutionSummary, ('MessageHeaderComp', 'AggressorSide', 'TradeCondition', )),
+    'ExecutionSummaryView': (_mk_ExecutionSummaryView, ('ExecutionSummary', 'MessageHeaderCompView', )),
+    'ProductSummary': (_mk_ProductSummary, ('MessageHeaderComp', 'TradingSessionSubID', 'TradSesStatus', 'MarketSegmentStatus', )),
+    'ProductSummaryView': (_mk_ProductSummaryView, ('ProductSummary', 'MessageHeaderCompView', )),
+    'InstrumentSummary': (_mk_InstrumentSummary, ('MessageHeaderComp', 'SecurityStatus', 'SecurityTradingStatus', 'MarketCondition', 'SoldOutIndicator', 'MDInstrumentEntryGrpComp', )),
+    'InstrumentSummaryView': (_mk_InstrumentSummaryView, ('InstrumentSummary', 'MessageHeaderCompView', )),
+    'SnapshotOrder': (_mk_SnapshotOrder, ('MessageHeaderComp', 'OrderDetailsComp', )),
+    'SnapshotOrderView': (_mk_SnapshotOrderView, ('SnapshotOrder', 'MessageHeaderCompView', 'OrderDetailsCompView', )),
+    'MassInstrumentStateChange': (_mk_MassInstrumentStateChange, ('MessageHeaderComp', 'SecurityMassTradingStatus', 'InstrumentStateComp', )),
+    'MassInstrumentStateChangeView': (_mk_MassInstrumentStateChangeView, ('MassInstrumentStateChange', 'MessageHeaderCompView', )),
+    'tid2class': (_mk_tid2class, ()),
+    'tid2view': (_mk_tid2view, ()),
+    'request2response': (_mk_request2response, ('TemplateID', )),
+}
+
+_lock = threading.RLock()
+
+def __getattr__(name):
+    try:
+        mk, deps = _lazy[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    g = globals()
+    with _lock:
+        if name in g:
+            return g[name]
+        for d in deps:
+            if d not in g:
+                __getattr__(d)
+        x = mk()
+        if isinstance(x, type):
+            x.__qualname__ = name
+        g[name] = x
+    return x
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
+def warmup():
+    for name in _lazy:
+        x = __getattr__(name)
+        if is_dataclass(x):
+            for i in range(len(x.fmt)):
+                x.st(i)
+
+# NB: i.e. a star import creates all classes (as warmup() does, except
+# for the struct objects), since it has to bind all names, thus, the
+# lazy definition only pays off with a plain import of the module
+__all__ = [ 'version', 'sub_version', 'build', 'enumerize', 'rstrip_dc',
+            'tid_st', 'header_st', 'tid2size', 'UnpackError', 'peek_header', 'iter_messages',
+            'unpack_from', 'Decoder',
+            'view_from', 'unpack_many', 'compile_projection', 'warmup' ] + list(_lazy)
+
@@ -73,36 +73,28 @@ def main():
     s.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
     bufs = ( bytearray(1500), )
+    heartbeat = int(eobi.TemplateID.Heartbeat)
 
     while True:
         #bs = s.recv(1500)
         n, msgs, msg_flags, addr = s.recvmsg_into(bufs, 32)
         bs = memoryview(bufs[0])[:n]
 
-        ph = eobi.unpack_from(bs)
-        ph.rstrip()
-        assert ph.MessageHeader.TemplateID == eobi.TemplateID.PacketHeader
+        # i.e. only the messages that are logged are unpacked
+        it = eobi.iter_messages(bs)
+        tid, _, _ = next(it)
+        assert tid == eobi.TemplateID.PacketHeader
 
-        i    = ph.MessageHeader.BodyLen
-        tail = bs
-        k    = 0
-
-        while i < n:
-            m = eobi.unpack_from(tail[i:])
-            m.rstrip()
-
-            if (m.MessageHeader.TemplateID != eobi.TemplateID.Heartbeat
-                    or args.love):
+        for k, (tid, i, _) in enumerate(it):
+            if tid != heartbeat or args.love:
                 if k == 0:
                     if msgs and msgs[0][2] != b'\0':
                         tos = ord(msgs[0][2])
                         log.info('tl;dr DSCP flag: ' + tldr2str_map[tos])
+                    ph = eobi.unpack_from(bs, strip=True)
                     log.info(f'Received ({n} bytes) - PacketHeader: {pformat(ph, width=45)}')
+                m = eobi.unpack_from(bs, i, strip=True)
                 log.info(f'Message: {pformat(m, width=45)}')
 
-            k += 1
-            i += m.MessageHeader.BodyLen
-
-
 if __name__ == '__main__':
     sys.exit(main())
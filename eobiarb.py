@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+
+
+# Arbitrate the redundant A/B services of an EOBI feed
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import importlib
+import logging
+import selectors
+import socket
+import struct
+import sys
+import time
+
+
+log = logging.getLogger(__name__)
+
+
+class Feed:
+
+    def __init__(self, name):
+        self.name = name
+        self.next = {}
+        self.epoch = {}
+        self.packets = 0
+        self.forwarded = 0
+        self.heartbeats = 0
+        self.gaps = 0
+        self.lost = 0
+        self.reordered = 0
+        self.resyncs = 0
+
+    # i.e. tracks the sequence of this feed alone, per MarketSegmentID,
+    # returns the number of sequence resets of the segment
+    def seen(self, seg, seq, reset):
+        self.packets += 1
+        if reset:
+            self.next.pop(seg, None)
+            self.epoch[seg] = self.epoch.get(seg, 0) + 1
+        n = self.next.get(seg)
+        if n is None or seq >= n:
+            if n is not None and seq > n:
+                self.gaps += 1
+                self.lost += seq - n
+            self.next[seg] = seq + 1
+        else:
+            self.reordered += 1
+        return self.epoch.get(seg, 0)
+
+    # i.e. the feed lost the packet with the ApplSeqResetIndicator, thus,
+    # its restarted sequence was counted as reordered by seen()
+    def resync(self, seg, seq, epoch):
+        self.reordered -= 1
+        self.resyncs += 1
+        self.epoch[seg] = epoch
+        self.next[seg] = seq + 1
+
+    def stats(self):
+        return { 'packets': self.packets, 'forwarded': self.forwarded,
+                'heartbeats': self.heartbeats, 'gaps': self.gaps, 'lost': self.lost,
+                'reordered': self.reordered, 'resyncs': self.resyncs }
+
+
+# i.e. the arbitrated sequence of one MarketSegmentID, where next is
+# the lowest ApplSeqNum that wasn't forwarded, yet, high the highest
+# forwarded one and the bitmap marks the forwarded ones in
+# [next, next + window)
+class Segment:
+
+    __slots__ = ('next', 'high', 'bitmap', 'epoch')
+
+    def __init__(self, seq, window, epoch=0):
+        self.next = seq
+        self.high = seq - 1
+        self.bitmap = bytearray(window // 8)
+        self.epoch = epoch
+
+
+# Forwards the first arrival of each packet of redundant EOBI feeds (A
+# and B), i.e. the packets are deduplicated by (MarketSegmentID,
+# ApplSeqNum), which is extracted from the PacketHeader with one struct
+# call, i.e. the packet body isn't decoded at all.
+#
+# Per MarketSegmentID, the arbiter keeps a sliding bitmap of window
+# sequence numbers beyond the lowest one that wasn't forwarded, yet.
+# A sequence number is missing (i.e. lost on all feeds) once every
+# feed has moved past it or once it drops out of the window, then
+# on_gap(seg, first, last) is called and the arbiter moves on. A packet
+# that arrives after its sequence number was declared missing is
+# dropped, i.e. the output of a segment is never rewound.
+#
+# A packet with the ApplSeqResetIndicator set restarts the sequence of
+# its MarketSegmentID, i.e. packets of feeds that didn't see the reset,
+# yet, are dropped as stale. A feed that lost the packet with the reset
+# is resynchronised when its sequence restarts, i.e. when it jumps back
+# into the window of the restarted sequence.
+#
+# Packets that just contain a heartbeat aren't sequenced, thus, they
+# are just counted per feed (e.g. for detecting a stalled feed).
+class Arbiter:
+
+    def __init__(self, eobi, feeds=('A', 'B'), window=4096, on_gap=None):
+        if window % 8:
+            raise ValueError('window must be a multiple of 8')
+        self.feeds = [ Feed(name) for name in feeds ]
+        self.window = window
+        self.on_gap = on_gap
+        self.segments = {}
+        self.header = eobi.compile_projection(eobi.TemplateID.PacketHeader,
+                ['MessageHeader.BodyLen', 'ApplSeqNum', 'MarketSegmentID', 'ApplSeqResetIndicator'])
+        self.tid_st = eobi.tid_st
+        self.heartbeat = int(eobi.TemplateID.Heartbeat)
+        self.duplicates = 0
+        self.stale = 0
+        self.gaps = 0
+        self.missing = 0
+
+    # i.e. returns True if the packet is forwarded
+    def packet(self, i, bs):
+        f = self.feeds[i]
+        n, seq, seg, reset = self.header(bs)
+        if len(bs) > n and self.tid_st.unpack_from(bs, n)[0] == self.heartbeat:
+            f.heartbeats += 1
+            return False
+        e = f.seen(seg, seq, reset == 1)
+        s = self.segments.get(seg)
+        if s is None or e > s.epoch:
+            s = self.segments[seg] = Segment(seq, self.window, e)
+        elif e < s.epoch:
+            # i.e. the sequence of the feed went back into the window
+            if f.next[seg] != seq + 1 and s.next - self.window <= seq < s.next + self.window:
+                f.resync(seg, seq, s.epoch)
+            else:
+                self.stale += 1
+                return False
+        r = self.forward(seg, s, seq)
+        if r:
+            f.forwarded += 1
+        else:
+            self.duplicates += 1
+        if s.high >= s.next and len(self.feeds) > 1:
+            # i.e. there is a hole that all feeds might have moved past
+            self.check(seg, s)
+        return r
+
+    def forward(self, seg, s, seq):
+        w = self.window
+        d = seq - s.next
+        if d < 0:
+            return False
+        if d >= w:
+            # i.e. the other feeds are too far behind
+            self.skip(seg, s, seq - w + 1)
+        bm = s.bitmap
+        k = seq % w
+        b = 1 << (k & 7)
+        if bm[k >> 3] & b:
+            return False
+        bm[k >> 3] |= b
+        if seq > s.high:
+            s.high = seq
+        if seq == s.next:
+            self.advance(s)
+        return True
+
+    # i.e. moves next past the forwarded packets
+    def advance(self, s):
+        w = self.window
+        bm = s.bitmap
+        t = s.next
+        while True:
+            k = t % w
+            b = 1 << (k & 7)
+            if not bm[k >> 3] & b:
+                break
+            bm[k >> 3] &= ~b
+            t += 1
+        s.next = t
+
+    # i.e. declares [next, seq) as missing, unless forwarded, where only
+    # the window needs to be checked, i.e. a large jump costs O(window)
+    def skip(self, seg, s, seq):
+        w = self.window
+        bm = s.bitmap
+        first = None
+        t = s.next
+        end = min(seq, t + w)
+        while t < end:
+            k = t % w
+            b = 1 << (k & 7)
+            if bm[k >> 3] & b:
+                bm[k >> 3] &= ~b
+                if first is not None:
+                    self.gap(seg, first, t - 1)
+                    first = None
+            elif first is None:
+                first = t
+            t += 1
+        if end < seq and first is None:
+            first = end
+        if first is not None:
+            self.gap(seg, first, seq - 1)
+        s.next = seq
+        self.advance(s)
+
+    # i.e. a sequence number that all feeds have moved past is lost
+    def check(self, seg, s):
+        lo = min(f.next.get(seg, 0) if f.epoch.get(seg, 0) == s.epoch else 0 for f in self.feeds)
+        if lo > s.next:
+            self.skip(seg, s, lo)
+
+    def gap(self, seg, first, last):
+        self.gaps += 1
+        self.missing += last - first + 1
+        log.warning(f'Gap on MarketSegmentID {seg}: ApplSeqNum {first}..{last} missing on all feeds')
+        if self.on_gap is not None:
+            self.on_gap(seg, first, last)
+
+    def stats(self):
+        return { 'duplicates': self.duplicates, 'stale': self.stale, 'gaps': self.gaps, 'missing': self.missing,
+                **{ f.name: f.stats() for f in self.feeds } }
+
+
+def join(group, port, address):
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    s.bind((group, port))
+    mreq = struct.pack('4s4s', socket.inet_aton(group), socket.inet_aton(address))
+    s.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    s.setblocking(False)
+    return s
+
+def group(s):
+    host, port = s.rsplit(':', 1)
+    return host, int(port)
+
+def run(arb, socks, forward=None, interval=10):
+    sel = selectors.DefaultSelector()
+    for i, s in enumerate(socks):
+        sel.register(s, selectors.EVENT_READ, i)
+    out = None
+    if forward is not None:
+        out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    buf = bytearray(1500)
+    mv = memoryview(buf)
+    t = time.monotonic() + interval
+    while True:
+        for key, _ in sel.select(interval):
+            s, i = key.fileobj, key.data
+            while True:
+                try:
+                    n = s.recv_into(buf)
+                except BlockingIOError:
+                    break
+                if arb.packet(i, mv[:n]) and out is not None:
+                    out.sendto(mv[:n], forward)
+        if time.monotonic() >= t:
+            log.info(f'Arbitration: {arb.stats()}')
+            t = time.monotonic() + interval
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Arbitrate the A/B services of an EOBI feed')
+    p.add_argument('address', help='IPv4 address of interface to bind')
+    p.add_argument('-a', type=group, required=True, metavar='GROUP:PORT', help='multicast group of service A')
+    p.add_argument('-b', type=group, required=True, metavar='GROUP:PORT', help='multicast group of service B')
+    p.add_argument('--forward', type=group, metavar='HOST:PORT',
+            help='send the arbitrated packets to that UDP address')
+    p.add_argument('--window', type=int, default=4096,
+            help='number of sequence numbers tracked per MarketSegmentID (default: %(default)d)')
+    p.add_argument('--stats-interval', type=float, default=10, metavar='SECONDS',
+            help='log the statistics every SECONDS (default: %(default)s)')
+    p.add_argument('--release', '-r', default='9.1', help='EOBI release (default: %(default)s)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, datefmt='%Y-%m-%d %H:%M:%S',
+            format='%(asctime)s.%(msecs)03d [%(name)s] %(levelname).1s   %(message)s')
+    eobi = importlib.import_module(f'eobi.v{args.release.replace(".", "_")}')
+    arb = Arbiter(eobi, window=args.window)
+    socks = [ join(*args.a, args.address), join(*args.b, args.address) ]
+    try:
+        run(arb, socks, args.forward, args.stats_interval)
+    except KeyboardInterrupt:
+        log.info(f'Arbitration: {arb.stats()}')
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+
+
+# Build order-by-order books from an EOBI feed
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import array
+import bisect
+import importlib
+import logging
+import random
+import sys
+import time
+
+
+log = logging.getLogger(__name__)
+
+
+BUY = 1
+SELL = 2
+
+
+# i.e. one side of a book, where the price levels are kept in two
+# parallel arrays that are sorted such that the best level is the last
+# one, i.e. the top of book is available in O(1) and a new or removed
+# level usually just moves a few elements at the end.
+#
+# Each level maps the TrdRegTSTimePriority of its orders to their
+# display quantity, in time priority order, and orders maps the
+# priority to the price, i.e. no objects are created per order.
+class Side:
+
+    def __init__(self, side):
+        self.sign = 1 if side == BUY else -1
+        self.keys = array.array('q')
+        self.qtys = array.array('q')
+        self.levels = {}
+        self.orders = {}
+
+    def __len__(self):
+        return len(self.orders)
+
+    def index(self, price):
+        return bisect.bisect_left(self.keys, self.sign * price)
+
+    # i.e. replaces an order with the same priority (e.g. a replayed
+    # OrderAdd), returns True in that case
+    def add(self, prio, price, qty):
+        dup = prio in self.orders
+        if dup:
+            self.remove(prio)
+        lvl = self.levels.get(price)
+        i = self.index(price)
+        if lvl is None:
+            lvl = self.levels[price] = {}
+            self.keys.insert(i, self.sign * price)
+            self.qtys.insert(i, 0)
+        lvl[prio] = qty
+        self.qtys[i] += qty
+        self.orders[prio] = price
+        return dup
+
+    # i.e. returns the price and quantity of the removed order or None
+    def remove(self, prio):
+        price = self.orders.pop(prio, None)
+        if price is None:
+            return None
+        lvl = self.levels[price]
+        qty = lvl.pop(prio)
+        i = self.index(price)
+        if lvl:
+            self.qtys[i] -= qty
+        else:
+            del self.levels[price]
+            del self.keys[i]
+            del self.qtys[i]
+        return price, qty
+
+    # i.e. sets the quantity while keeping the time priority, returns
+    # False if the order is unknown
+    def update(self, prio, qty):
+        price = self.orders.get(prio)
+        if price is None:
+            return False
+        if qty <= 0:
+            self.remove(prio)
+            return True
+        lvl = self.levels[price]
+        self.qtys[self.index(price)] += qty - lvl[prio]
+        lvl[prio] = qty
+        return True
+
+    def reduce(self, prio, qty):
+        price = self.orders.get(prio)
+        if price is None:
+            return False
+        return self.update(prio, self.levels[price][prio] - qty)
+
+    # i.e. the orders on that level with that quantity, in time priority
+    # order, for layouts without TrdRegTSPrevTimePriority
+    def find(self, price, qty):
+        return [ prio for prio, q in self.levels.get(price, {}).items() if q == qty ]
+
+    def best(self):
+        if not self.keys:
+            return None, 0
+        return self.sign * self.keys[-1], self.qtys[-1]
+
+    # i.e. the n best levels as (price, qty, #orders) tuples
+    def depth(self, n=5):
+        return [ (self.sign * k, q, len(self.levels[self.sign * k]))
+                for k, q in zip(reversed(self.keys[-n:]), reversed(self.qtys[-n:])) ]
+
+    def clear(self):
+        self.__init__(BUY if self.sign == 1 else SELL)
+
+
+class Book:
+
+    def __init__(self, security_id):
+        self.security_id = security_id
+        self.sides = (None, Side(BUY), Side(SELL))
+        self.last_px = None
+        self.last_qty = 0
+        self.volume = 0
+        self.trades = 0
+
+    def __len__(self):
+        return len(self.sides[BUY]) + len(self.sides[SELL])
+
+    # i.e. (bid price, bid qty, ask price, ask qty)
+    def top(self):
+        return (*self.sides[BUY].best(), *self.sides[SELL].best())
+
+    def clear(self):
+        self.sides[BUY].clear()
+        self.sides[SELL].clear()
+
+
+# Applies the order book messages of EOBI packets (i.e. of a generated
+# eobi.vX_Y module) to one Book per SecurityID.
+#
+# The messages are never unpacked into dataclass objects, instead, just
+# the required fields are extracted with one struct call (cf.
+# compile_projection()) and all other messages are skipped (cf.
+# iter_messages()).
+#
+# Messages that refer to an unknown order (e.g. due to a gap in the
+# feed or because the feed was joined late) are counted as unknown,
+# which means that the book needs to be recovered.
+#
+# Layouts without TrdRegTSPrevTimePriority in OrderModify (i.e. not
+# the ones of the exchange) are supported on a best effort basis, i.e.
+# the modified order is looked up by its previous price and quantity,
+# where an ambiguous lookup picks the first match, is logged and
+# counted.
+class BookBuilder:
+
+    def __init__(self, eobi):
+        self.eobi = eobi
+        self.books = {}
+        self.messages = 0
+        self.unknown = 0
+        self.ambiguous = 0
+        self.duplicates = 0
+        T = eobi.TemplateID
+        d = 'OrderDetails.'
+        order = [ 'SecurityID', d + 'Side', d + 'TrdRegTSTimePriority', d + 'Price', d + 'DisplayQty' ]
+        exe = [ 'SecurityID', 'Side', 'TrdRegTSTimePriority', 'LastQty' ]
+        if any(k == 'TrdRegTSPrevTimePriority' for k, _, _ in eobi.OrderModify.layout):
+            modify = ('TrdRegTSPrevTimePriority', self.modify)
+        else:
+            modify = ('PrevDisplayQty', self.modify_by_qty)
+        xs = [
+            (T.OrderAdd,              self.add,      order),
+            (T.OrderModify,           modify[1],     order + [ 'PrevPrice', modify[0] ]),
+            (T.OrderModifySamePrio,   self.update,   order),
+            (T.OrderDelete,           self.delete,   order[:3]),
+            (T.OrderMassDelete,       self.clear,    [ 'SecurityID' ]),
+            (T.FullOrderExecution,    self.fill,     exe),
+            (T.PartialOrderExecution, self.fill,     exe),
+            (T.ExecutionSummary,      self.summary,  [ 'SecurityID', 'LastPx', 'LastQty' ]),
+        ]
+        self.handlers = { tid: (f, eobi.compile_projection(tid, names)) for tid, f, names in xs }
+
+    def __getitem__(self, security_id):
+        return self.books[security_id]
+
+    def book(self, security_id):
+        b = self.books.get(security_id)
+        if b is None:
+            b = self.books[security_id] = Book(security_id)
+        return b
+
+    # i.e. applies all messages of the packet, starting after the
+    # PacketHeader at off
+    def packet(self, bs, off=0):
+        hs = self.handlers
+        for tid, i, _ in self.eobi.iter_messages(bs, off):
+            h = hs.get(tid)
+            if h is not None:
+                h[0](*h[1](bs, i))
+                self.messages += 1
+
+    # i.e. applies a single message
+    def message(self, bs, off=0):
+        h = self.handlers.get(self.eobi.peek_header(bs, off)[1])
+        if h is not None:
+            h[0](*h[1](bs, off))
+            self.messages += 1
+
+    def add(self, sec, side, prio, price, qty):
+        if self.book(sec).sides[side].add(prio, price, qty):
+            self.duplicates += 1
+
+    def modify(self, sec, side, prio, price, qty, prev_price, prev_prio):
+        s = self.book(sec).sides[side]
+        if s.remove(prev_prio) is None:
+            self.unknown += 1
+        s.add(prio, price, qty)
+
+    def modify_by_qty(self, sec, side, prio, price, qty, prev_price, prev_qty):
+        s = self.book(sec).sides[side]
+        ps = s.find(prev_price, prev_qty)
+        if not ps:
+            self.unknown += 1
+        else:
+            if len(ps) > 1:
+                self.ambiguous += 1
+                log.warning(f'OrderModify of SecurityID {sec} matches {len(ps)} orders'
+                        f' (price {prev_price}, quantity {prev_qty}) - picking the first one')
+            s.remove(ps[0])
+        s.add(prio, price, qty)
+
+    def update(self, sec, side, prio, price, qty):
+        if not self.book(sec).sides[side].update(prio, qty):
+            self.unknown += 1
+
+    def delete(self, sec, side, prio):
+        if self.book(sec).sides[side].remove(prio) is None:
+            self.unknown += 1
+
+    def clear(self, sec):
+        self.book(sec).clear()
+
+    def fill(self, sec, side, prio, qty):
+        if not self.book(sec).sides[side].reduce(prio, qty):
+            self.unknown += 1
+
+    def summary(self, sec, px, qty):
+        b = self.book(sec)
+        b.last_px = px
+        b.last_qty = qty
+        b.volume += qty
+        b.trades += 1
+
+
+# Generates EOBI packets of a random but consistent order flow, e.g.
+# for tests and benchmarks, i.e. orders are added around a mid price,
+# modified, deleted and executed. The expected state of each book is
+# available in the live attribute, i.e. a dict (SecurityID, Side,
+# TrdRegTSTimePriority) -> (Price, DisplayQty).
+class SyntheticFeed:
+
+    def __init__(self, eobi, securities=100, segments=10, seed=0, mtu=1400):
+        self.eobi = eobi
+        self.securities = securities
+        self.segments = segments
+        self.rnd = random.Random(seed)
+        self.mtu = mtu
+        self.prio = 10**18
+        self.seq = [ 0 ] * segments
+        self.live = {}
+        self.keys = [ [] for _ in range(securities) ]
+        T = eobi.TemplateID
+        self.msgs = { tid: getattr(eobi, tid.name)() for tid in (T.OrderAdd, T.OrderModify,
+            T.OrderModifySamePrio, T.OrderDelete, T.FullOrderExecution,
+            T.PartialOrderExecution, T.ExecutionSummary) }
+        self.has_prev_prio = any(k == 'TrdRegTSPrevTimePriority' for k, _, _ in eobi.OrderModify.layout)
+
+    def details(self, x, prio, side, price, qty):
+        d = x.OrderDetails
+        d.TrdRegTSTimePriority = prio
+        d.Side = side
+        d.Price = price
+        d.DisplayQty = qty
+        d.OrdType = self.eobi.OrdType.LIMIT
+        return x
+
+    def pick(self, sec):
+        ks = self.keys[sec]
+        i = self.rnd.randrange(len(ks))
+        k = ks[i]
+        ks[i] = ks[-1]
+        ks.pop()
+        return k
+
+    # i.e. returns the packed message
+    def next(self, sec):
+        rnd = self.rnd
+        T = self.eobi.TemplateID
+        op = rnd.random()
+        self.prio += rnd.randrange(1, 1000)
+        if op < 0.45 or len(self.keys[sec]) < 10:
+            side = rnd.choice((BUY, SELL))
+            price = (100 + (-rnd.randrange(1, 20) if side == BUY else rnd.randrange(1, 20))) * 10**8
+            qty = rnd.randrange(1, 100) * 10**4
+            k = (sec, side, self.prio)
+            self.live[k] = price, qty
+            self.keys[sec].append(k)
+            x = self.details(self.msgs[T.OrderAdd], self.prio, side, price, qty)
+            x.SecurityID = sec
+            return x.pack()
+        k = self.pick(sec)
+        _, side, prio = k
+        price, qty = self.live.pop(k)
+        if op < 0.75:
+            x = self.details(self.msgs[T.OrderDelete], prio, side, price, qty)
+            qty = 0
+        elif op < 0.85 and not self.has_prev_prio:
+            # i.e. without TrdRegTSPrevTimePriority an OrderModify doesn't
+            # identify the order, thus, it's replaced by a delete and an add
+            d = self.details(self.msgs[T.OrderDelete], prio, side, price, qty)
+            d.SecurityID = sec
+            price += rnd.choice((-1, 1)) * 10**8
+            k = (sec, side, self.prio)
+            x = self.details(self.msgs[T.OrderAdd], self.prio, side, price, qty)
+            x.SecurityID = sec
+            self.live[k] = price, qty
+            self.keys[sec].append(k)
+            return d.pack() + x.pack()
+        elif op < 0.85:
+            x = self.msgs[T.OrderModify]
+            x.PrevPrice = price
+            x.PrevDisplayQty = qty
+            x.TrdRegTSPrevTimePriority = prio
+            price += rnd.choice((-1, 1)) * 10**8
+            k = (sec, side, self.prio)
+            self.details(x, self.prio, side, price, qty)
+        elif op < 0.9:
+            x = self.msgs[T.OrderModifySamePrio]
+            x.PrevDisplayQty = qty
+            qty = max(10**4, qty - 10**4)
+            self.details(x, prio, side, price, qty)
+        else:
+            x = self.msgs[T.FullOrderExecution if op < 0.95 else T.PartialOrderExecution]
+            x.Side = side
+            x.Price = price
+            x.TrdRegTSTimePriority = prio
+            x.LastPx = price
+            x.LastQty = qty if op < 0.95 else qty // 2
+            qty -= x.LastQty
+            x.SecurityID = sec
+            y = self.msgs[T.ExecutionSummary]
+            y.SecurityID = sec
+            y.LastPx = price
+            y.LastQty = x.LastQty
+            y.AggressorSide = SELL if side == BUY else BUY
+            bs = y.pack() + x.pack()
+            if qty:
+                self.live[k] = price, qty
+                self.keys[sec].append(k)
+            return bs
+        x.SecurityID = sec
+        if qty:
+            self.live[k] = price, qty
+            self.keys[sec].append(k)
+        return x.pack()
+
+    # i.e. yields packets, where each packet contains messages of one
+    # market segment, i.e. of the securities sec with sec % segments
+    # == segment
+    def packets(self, n, per_packet=8):
+        eobi = self.eobi
+        h = eobi.PacketHeader()
+        for _ in range(n):
+            seg = self.rnd.randrange(self.segments)
+            self.seq[seg] += 1
+            h.ApplSeqNum = self.seq[seg]
+            h.MarketSegmentID = seg
+            h.PartitionID = 1
+            h.CompletionIndicator = eobi.CompletionIndicator.COMPLETE
+            bs = [ h.pack() ]
+            k = len(bs[0])
+            secs = range(seg, self.securities, self.segments)
+            for _ in range(per_packet):
+                m = self.next(self.rnd.choice(secs))
+                k += len(m)
+                if k > self.mtu:
+                    break
+                bs.append(m)
+            yield b''.join(bs)
+
+
+    # i.e. returns the packets of one snapshot cycle of a market segment
+    # that reflects the state after its current ApplSeqNum
+    def snapshot(self, seg):
+        eobi = self.eobi
+        x = eobi.ProductSummary()
+        x.LastMsgSeqNumProcessed = self.seq[seg]
+        ms = [ x.pack() ]
+        x = eobi.InstrumentSummary()
+        o = eobi.SnapshotOrder()
+        for sec in range(seg, self.securities, self.segments):
+            ks = sorted(self.keys[sec], key=lambda k: k[2])
+            x.SecurityID = sec
+            x.TotNoOrders = len(ks)
+            ms.append(x.pack())
+            for k in ks:
+                ms.append(self.details(o, k[2], k[1], *self.live[k]).pack())
+        h = eobi.PacketHeader()
+        h.MarketSegmentID = seg
+        h.PartitionID = 1
+        n = len(h.pack())
+        ps = [ [] ]
+        k = n
+        for m in ms:
+            if k + len(m) > self.mtu:
+                ps.append([])
+                k = n
+            ps[-1].append(m)
+            k += len(m)
+        for i, p in enumerate(ps, 1):
+            h.ApplSeqNum = i
+            h.CompletionIndicator = eobi.CompletionIndicator.COMPLETE if i == len(ps) \
+                    else eobi.CompletionIndicator.INCOMPLETE
+            p.insert(0, h.pack())
+        return [ b''.join(p) for p in ps ]
+
+
+def replay(eobi, n, securities, seed=0):
+    feed = SyntheticFeed(eobi, securities, seed=seed)
+    ps = list(feed.packets(n))
+    b = BookBuilder(eobi)
+    t = time.perf_counter()
+    for p in ps:
+        b.packet(p)
+    t = time.perf_counter() - t
+    return b, t
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Replay a synthetic EOBI feed into order books')
+    p.add_argument('-n', type=int, default=100000, help='number of packets (default: %(default)d)')
+    p.add_argument('--securities', type=int, default=1000, help='number of instruments (default: %(default)d)')
+    p.add_argument('--release', '-r', default='13.0', help='EOBI release (default: %(default)s)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    eobi = importlib.import_module(f'eobi.v{args.release.replace(".", "_")}')
+    b, t = replay(eobi, args.n, args.securities)
+    orders = sum(len(x) for x in b.books.values())
+    print(f'packets={args.n} messages={b.messages} orders={orders} unknown={b.unknown}'
+            f' time={t:.2f}s messages/s={b.messages / t:.0f} us/message={t / b.messages * 1e6:.2f}')
+
+if __name__ == '__main__':
+    sys.exit(main())
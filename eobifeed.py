@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+
+
+# Multi-process EOBI feed handler, sharded by MarketSegmentID
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import importlib
+import logging
+import multiprocessing
+import os
+import selectors
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+
+from eobiarb import group, join
+from eobibook import BookBuilder, SyntheticFeed
+
+
+log = logging.getLogger(__name__)
+
+
+# Single-producer single-consumer ring buffer of variable sized records
+# in shared memory, i.e. for handing packets from the receiver to one
+# worker process without copying them through a pipe.
+#
+# Each record consists of a 16 byte header (length, receive timestamp)
+# and the packet, padded to 8 bytes. A record never wraps around, i.e.
+# at the end of the buffer a wrap marker is written instead.
+#
+# The header of the segment contains the positions and counters, where
+# the producer only writes the first cache line and the consumer only
+# the second one, thus, no locks are required. Positions are increasing
+# byte counts, i.e. head - tail is the backlog. Note that this relies
+# on aligned 8 byte stores being atomic and on stores becoming visible
+# in order, as on x86-64.
+class Ring:
+
+    HEAD = 128
+    WRAP = 0xFFFFFFFF
+
+    # i.e. producer line: head, pushed, dropped, stop, size
+    # consumer line: tail, processed, messages, lag, max lag (in ns)
+    HEAD_OFF, PUSHED_OFF, DROPPED_OFF, STOP_OFF, SIZE_OFF = 0, 8, 16, 24, 32
+    TAIL_OFF, PROCESSED_OFF, MESSAGES_OFF, LAG_OFF, MAX_LAG_OFF = 64, 72, 80, 88, 96
+
+    q = struct.Struct('<Q')
+    len_st = struct.Struct('<I')
+    rec_st = struct.Struct('<I4xQ')
+
+    def __init__(self, size=16 * 1024 * 1024, name=None):
+        if name is None:
+            size = (size + 7) & ~7
+            self.shm = shared_memory.SharedMemory(create=True, size=self.HEAD + size)
+            self.shm.buf[:self.HEAD] = bytes(self.HEAD)
+            self.q.pack_into(self.shm.buf, self.SIZE_OFF, size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.size = self.get(self.SIZE_OFF)
+        self.data = self.buf[self.HEAD:self.HEAD + self.size]
+        self.head = self.get(self.HEAD_OFF)
+        self.tail = self.get(self.TAIL_OFF)
+        self.pushed = self.get(self.PUSHED_OFF)
+        self.processed = self.get(self.PROCESSED_OFF)
+        self.max_lag = self.get(self.MAX_LAG_OFF)
+
+    def get(self, off):
+        return self.q.unpack_from(self.buf, off)[0]
+
+    def set(self, off, v):
+        self.q.pack_into(self.buf, off, v)
+
+    # i.e. returns False if the ring is full
+    def push(self, bs, t):
+        n = len(bs)
+        k = (16 + n + 7) & ~7
+        size = self.size
+        if k > size:
+            raise ValueError(f'record of {k} bytes exceeds the ring size of {size} bytes')
+        head = self.head
+        off = head % size
+        pad = size - off if off + k > size else 0
+        if head + pad + k - self.tail > size:
+            # i.e. the cached tail is outdated, in general
+            self.tail = self.get(self.TAIL_OFF)
+            if head + pad + k - self.tail > size:
+                return False
+        data = self.data
+        if pad:
+            self.len_st.pack_into(data, off, self.WRAP)
+            off = 0
+            head += pad
+        self.rec_st.pack_into(data, off, n, t)
+        data[off + 16:off + 16 + n] = bs
+        self.head = head + k
+        self.pushed += 1
+        self.set(self.PUSHED_OFF, self.pushed)
+        self.set(self.HEAD_OFF, self.head)
+        return True
+
+    def drop(self):
+        self.set(self.DROPPED_OFF, self.get(self.DROPPED_OFF) + 1)
+
+    # i.e. calls f for up to limit records, returns their number and the
+    # timestamp of the last one
+    def drain(self, f, limit=1024):
+        head = self.get(self.HEAD_OFF)
+        tail = self.tail
+        size = self.size
+        data = self.data
+        n = 0
+        t = 0
+        while tail < head and n < limit:
+            off = tail % size
+            k = self.len_st.unpack_from(data, off)[0]
+            if k == self.WRAP:
+                tail += size - off
+                continue
+            t = self.q.unpack_from(data, off + 8)[0]
+            f(data[off + 16:off + 16 + k])
+            tail += (16 + k + 7) & ~7
+            n += 1
+        if n:
+            self.tail = tail
+            self.processed += n
+            self.set(self.PROCESSED_OFF, self.processed)
+            self.set(self.TAIL_OFF, tail)
+        return n, t
+
+    # i.e. publishes the progress of the consumer
+    def progress(self, messages, lag):
+        self.set(self.MESSAGES_OFF, messages)
+        self.set(self.LAG_OFF, lag)
+        if lag > self.max_lag:
+            self.max_lag = lag
+            self.set(self.MAX_LAG_OFF, lag)
+
+    def stop(self):
+        self.set(self.STOP_OFF, 1)
+
+    def stopped(self):
+        return self.get(self.STOP_OFF) != 0
+
+    def stats(self):
+        pushed, processed = self.get(self.PUSHED_OFF), self.get(self.PROCESSED_OFF)
+        return { 'pushed': pushed, 'dropped': self.get(self.DROPPED_OFF), 'processed': processed,
+                'messages': self.get(self.MESSAGES_OFF), 'backlog': pushed - processed,
+                'backlog_bytes': self.get(self.HEAD_OFF) - self.get(self.TAIL_OFF),
+                'lag_us': self.get(self.LAG_OFF) / 1000, 'max_lag_us': self.get(self.MAX_LAG_OFF) / 1000 }
+
+    def close(self, unlink=False):
+        self.data.release()
+        self.buf = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+# i.e. the default result a worker publishes when it's stopped, i.e. the
+# top of each book
+def tops(b):
+    return { 'messages': b.messages, 'unknown': b.unknown,
+            'tops': { sec: book.top() for sec, book in b.books.items() } }
+
+def work(name, shard, module, cpu, handler, result, results):
+    if cpu is not None:
+        os.sched_setaffinity(0, { cpu })
+    eobi = importlib.import_module(module)
+    r = Ring(name=name)
+    h = handler(eobi)
+    idle = 0
+    while True:
+        # i.e. read before draining, since the producer sets it after
+        # pushing its last records
+        stopped = r.stopped()
+        n, t = r.drain(h.packet)
+        if n:
+            r.progress(h.messages, time.monotonic_ns() - t)
+            idle = 0
+        elif stopped:
+            break
+        else:
+            # i.e. spin a little before backing off
+            idle += 1
+            if idle > 1000:
+                time.sleep(0.0001)
+    results.put((shard, result(h)))
+    r.close()
+
+
+# Distributes the packets of an EOBI feed over worker processes, i.e.
+# the receiver just peeks at the MarketSegmentID of the PacketHeader
+# and pushes the raw packet into the shared memory ring of its shard
+# (i.e. MarketSegmentID modulo the number of workers), thus, all
+# packets of a market segment are processed in order by the same
+# worker.
+#
+# Each worker optionally is pinned to a CPU, decodes its packets with
+# handler(eobi) (by default, a BookBuilder) and publishes its progress
+# and lag in the header of its ring. When stopped, each worker drains
+# its ring and publishes result(handler) (e.g. the top of its books).
+#
+# A full ring drops the packet (and counts it), since the receiver of a
+# multicast feed mustn't block.
+class Feed:
+
+    def __init__(self, eobi, workers=2, cpus=None, ring_size=16 * 1024 * 1024,
+            handler=BookBuilder, result=tops):
+        self.peek = eobi.compile_projection(eobi.TemplateID.PacketHeader, [ 'MarketSegmentID' ])
+        self.rings = [ Ring(ring_size) for _ in range(workers) ]
+        self.results = multiprocessing.Queue()
+        self.procs = [ multiprocessing.Process(target=work, daemon=True,
+            args=(r.name, i, eobi.__name__, cpus[i % len(cpus)] if cpus else None,
+                handler, result, self.results))
+            for i, r in enumerate(self.rings) ]
+
+    def start(self):
+        for p in self.procs:
+            p.start()
+
+    # i.e. returns False if the packet was dropped
+    def packet(self, bs):
+        r = self.rings[self.peek(bs)[0] % len(self.rings)]
+        try:
+            if r.push(bs, time.monotonic_ns()):
+                return True
+        except ValueError as e:
+            log.warning(f'Dropping packet: {e}')
+        r.drop()
+        return False
+
+    # i.e. waits for free space instead of dropping, e.g. for replaying
+    # a recorded feed, raises ValueError if the packet can't ever fit
+    def put(self, bs):
+        r = self.rings[self.peek(bs)[0] % len(self.rings)]
+        while not r.push(bs, time.monotonic_ns()):
+            os.sched_yield()
+
+    def stats(self):
+        return [ r.stats() for r in self.rings ]
+
+    # i.e. returns the results of the workers, in shard order, raises
+    # queue.Empty if a worker died or hangs, where the rings are
+    # unlinked in any case
+    def stop(self, timeout=60):
+        for r in self.rings:
+            r.stop()
+        try:
+            xs = dict(self.results.get(timeout=timeout) for _ in self.procs)
+            for p in self.procs:
+                p.join(timeout)
+        finally:
+            for p in self.procs:
+                if p.is_alive():
+                    log.error(f'Terminating worker {p.name}')
+                    p.terminate()
+                    p.join()
+            self.final_stats = self.stats()
+            for r in self.rings:
+                r.close(unlink=True)
+        return [ xs[i] for i in range(len(self.procs)) ]
+
+
+def report(stats, o=sys.stdout):
+    for i, x in enumerate(stats):
+        print(f'shard {i}: packets={x["processed"]}/{x["pushed"]} dropped={x["dropped"]}'
+                f' messages={x["messages"]} backlog={x["backlog"]} ({x["backlog_bytes"]} bytes)'
+                f' lag={x["lag_us"]:.1f}us max_lag={x["max_lag_us"]:.1f}us', file=o)
+
+def run(feed, socks, interval=10):
+    sel = selectors.DefaultSelector()
+    for s in socks:
+        sel.register(s, selectors.EVENT_READ)
+    buf = bytearray(1500)
+    mv = memoryview(buf)
+    t = time.monotonic() + interval
+    while True:
+        for key, _ in sel.select(interval):
+            s = key.fileobj
+            while True:
+                try:
+                    n = s.recv_into(buf)
+                except BlockingIOError:
+                    break
+                feed.packet(mv[:n])
+        if time.monotonic() >= t:
+            report(feed.stats())
+            t = time.monotonic() + interval
+
+# i.e. pushes a synthetic feed through the workers as fast as they
+# can process it
+def replay(feed, eobi, n, securities, segments, seed=0):
+    ps = list(SyntheticFeed(eobi, securities, segments, seed).packets(n))
+    t = time.perf_counter()
+    for p in ps:
+        feed.put(p)
+    rs = feed.stop()
+    return rs, time.perf_counter() - t
+
+def cpu_list(s):
+    return [ int(x) for x in s.split(',') ]
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Multi-process EOBI feed handler, sharded by MarketSegmentID')
+    p.add_argument('address', nargs='?', help='IPv4 address of interface to bind')
+    p.add_argument('-g', action='append', type=group, default=[], metavar='GROUP:PORT',
+            help='multicast group of an incremental channel')
+    p.add_argument('--workers', '-j', type=int, default=2, help='number of worker processes (default: %(default)d)')
+    p.add_argument('--cpus', type=cpu_list, metavar='CPU,...',
+            help='pin the workers to these CPUs (round-robin)')
+    p.add_argument('--receiver-cpu', type=int, metavar='CPU', help='pin the receiver to this CPU')
+    p.add_argument('--ring-size', type=int, default=16, metavar='MIB',
+            help='shared memory ring size per worker (default: %(default)d MiB)')
+    p.add_argument('--stats-interval', type=float, default=10, metavar='SECONDS',
+            help='report the per-shard lag every SECONDS (default: %(default)s)')
+    p.add_argument('--synthetic', type=int, metavar='N',
+            help='replay N packets of a synthetic feed instead of receiving, and report the throughput')
+    p.add_argument('--securities', type=int, default=1000, help='synthetic instruments (default: %(default)d)')
+    p.add_argument('--segments', type=int, default=100, help='synthetic market segments (default: %(default)d)')
+    p.add_argument('--release', '-r', default='13.0', help='EOBI release (default: %(default)s)')
+    args = p.parse_args()
+    if args.synthetic is None and (args.address is None or not args.g):
+        p.error('address and -g are required unless --synthetic is given')
+    return args
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, datefmt='%Y-%m-%d %H:%M:%S',
+            format='%(asctime)s.%(msecs)03d [%(name)s] %(levelname).1s   %(message)s')
+    eobi = importlib.import_module(f'eobi.v{args.release.replace(".", "_")}')
+    if args.receiver_cpu is not None:
+        os.sched_setaffinity(0, { args.receiver_cpu })
+    feed = Feed(eobi, args.workers, args.cpus, args.ring_size * 1024 * 1024)
+    feed.start()
+    if args.synthetic is not None:
+        rs, t = replay(feed, eobi, args.synthetic, args.securities, args.segments)
+        messages = sum(x['messages'] for x in rs)
+        print(f'workers={args.workers} packets={args.synthetic} messages={messages}'
+                f' time={t:.2f}s packets/s={args.synthetic / t:.0f} messages/s={messages / t:.0f}')
+        report(feed.final_stats)
+        return 0
+    socks = [ join(*g, args.address) for g in args.g ]
+    try:
+        run(feed, socks, args.stats_interval)
+    except KeyboardInterrupt:
+        report(feed.stats())
+        feed.stop()
+
+if __name__ == '__main__':
+    sys.exit(main())
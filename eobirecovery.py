@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+
+
+# Recover EOBI order books from the snapshot channels
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import collections
+import importlib
+import itertools
+import logging
+import selectors
+import sys
+import time
+
+from eobiarb import group, join
+from eobibook import Book, BookBuilder
+from etihist import Histogram
+
+
+log = logging.getLogger(__name__)
+
+
+# i.e. the recovery state of one MarketSegmentID, where the buffer
+# contains the contiguous incremental packets [next - len(buffer), next)
+# and books the instruments of the current snapshot cycle
+class Pending:
+
+    __slots__ = ('start', 'buffer', 'bytes', 'next', 'books', 'book', 'orders',
+            'snap_seq', 'last')
+
+    def __init__(self, start):
+        self.start = start
+        self.buffer = collections.deque()
+        self.bytes = 0
+        self.next = 0
+        self.books = None
+        self.book = None
+        self.orders = 0
+        self.snap_seq = 0
+        self.last = 0
+
+
+# Keeps the books of a BookBuilder consistent with the incremental
+# stream of an EOBI feed, i.e. when the feed was joined late or when
+# the ApplSeqNum of a MarketSegmentID jumps, the segment is recovered
+# from the snapshot channel:
+#
+# 1. its incremental packets are buffered
+# 2. one complete snapshot cycle of the segment is consumed, i.e. a
+#    ProductSummary followed by an InstrumentSummary per instrument,
+#    each followed by TotNoOrders SnapshotOrder messages
+# 3. the snapshot books replace the books of the segment and the
+#    buffered packets past the LastMsgSeqNumProcessed of the snapshot
+#    are applied
+# 4. the segment is live again, i.e. its incremental packets are
+#    directly applied
+#
+# All pending segments are recovered concurrently from the same pass
+# over the snapshot channel, i.e. recovering many products takes about
+# one snapshot cycle instead of one cycle per product. A snapshot
+# packet of a live segment is skipped after peeking at its header.
+#
+# The buffered packets of all segments are limited to max_buffer bytes,
+# i.e. the oldest packets of a segment are dropped such that it waits
+# for a more recent snapshot cycle. A recovery that doesn't complete
+# within timeout seconds is restarted (cf. expire()).
+class Recovery:
+
+    def __init__(self, eobi, builder=None, max_buffer=64 * 1024 * 1024, timeout=60,
+            clock=time.monotonic_ns):
+        self.eobi = eobi
+        self.builder = builder or BookBuilder(eobi)
+        self.max_buffer = max_buffer
+        self.timeout = int(timeout * 1e9)
+        self.clock = clock
+        self.next = {}
+        self.pending = {}
+        self.securities = {}
+        T = eobi.TemplateID
+        self.header = eobi.compile_projection(T.PacketHeader,
+                ['MessageHeader.BodyLen', 'ApplSeqNum', 'MarketSegmentID', 'ApplSeqResetIndicator'])
+        self.snap_header = eobi.compile_projection(T.PacketHeader,
+                ['MessageHeader.BodyLen', 'ApplSeqNum', 'MarketSegmentID', 'CompletionIndicator'])
+        self.tid_st = eobi.tid_st
+        self.heartbeat = int(T.Heartbeat)
+        self.complete = int(eobi.CompletionIndicator.COMPLETE)
+        self.product = (int(T.ProductSummary), eobi.compile_projection(T.ProductSummary,
+            [ 'LastMsgSeqNumProcessed' ]))
+        self.instrument = (int(T.InstrumentSummary), eobi.compile_projection(T.InstrumentSummary,
+            [ 'SecurityID', 'TotNoOrders' ]))
+        d = 'OrderDetails.'
+        self.order = (int(T.SnapshotOrder), eobi.compile_projection(T.SnapshotOrder,
+            [ d + 'Side', d + 'TrdRegTSTimePriority', d + 'Price', d + 'DisplayQty' ]))
+        self.buffered = 0
+        self.peak = 0
+        self.dropped = 0
+        self.late = 0
+        self.gaps = 0
+        self.recoveries = 0
+        self.aborted = 0
+        self.stale = 0
+        self.timeouts = 0
+        self.durations = Histogram()
+
+    # i.e. processes a packet of the incremental stream
+    def incremental(self, bs):
+        n, seq, seg, reset = self.header(bs)
+        if len(bs) > n and self.tid_st.unpack_from(bs, n)[0] == self.heartbeat:
+            return
+        p = self.pending.get(seg)
+        if p is None:
+            nx = self.next.get(seg)
+            if seq == nx or (reset == 1 and nx is not None):
+                self.next[seg] = seq + 1
+                self.builder.packet(bs)
+                return
+            if nx is not None and seq < nx:
+                self.late += 1
+                return
+            if nx is not None:
+                self.gaps += 1
+                log.warning(f'Gap on MarketSegmentID {seg}: expected ApplSeqNum {nx}, got {seq} - recovering')
+                del self.next[seg]
+            p = self.pending[seg] = Pending(self.clock())
+        self.buffer(p, seq, bs)
+
+    def buffer(self, p, seq, bs):
+        if p.buffer and seq != p.next:
+            if seq < p.next:
+                self.late += 1
+                return
+            # i.e. a gap while recovering, thus, the snapshot must be
+            # more recent than this packet
+            self.drop(p, len(p.buffer))
+        p.buffer.append(bytes(bs))
+        p.next = seq + 1
+        p.bytes += len(bs)
+        self.buffered += len(bs)
+        if self.buffered > self.peak:
+            self.peak = self.buffered
+        if self.buffered > self.max_buffer:
+            self.drop(p, max(1, len(p.buffer) // 2))
+
+    def drop(self, p, k):
+        for _ in range(k):
+            n = len(p.buffer.popleft())
+            p.bytes -= n
+            self.buffered -= n
+        self.dropped += k
+
+    # i.e. processes a packet of the snapshot channel
+    def snapshot(self, bs):
+        n, seq, seg, completion = self.snap_header(bs)
+        p = self.pending.get(seg)
+        if p is None:
+            if seg in self.next:
+                return
+            # i.e. a segment without any incremental packet, so far
+            p = self.pending[seg] = Pending(self.clock())
+        if p.books is not None and seq != p.snap_seq:
+            self.abort(seg, p, f'expected snapshot ApplSeqNum {p.snap_seq}, got {seq}')
+        if p.books is None:
+            if len(bs) <= n or self.tid_st.unpack_from(bs, n)[0] != self.product[0]:
+                # i.e. wait for the start of the next cycle
+                return
+            p.books = {}
+        p.snap_seq = seq + 1
+        product, instrument, order = self.product, self.instrument, self.order
+        for tid, i, _ in self.eobi.iter_messages(bs, n):
+            if tid == order[0]:
+                if p.book is None:
+                    # i.e. joined mid-packet or a malformed packet
+                    return self.abort(seg, p, 'SnapshotOrder before any InstrumentSummary')
+                side, prio, price, qty = order[1](bs, i)
+                p.book.sides[side].add(prio, price, qty)
+                p.orders -= 1
+            elif tid == instrument[0]:
+                if p.orders:
+                    return self.abort(seg, p, f'{p.orders} orders of {p.book.security_id} missing')
+                sec, p.orders = instrument[1](bs, i)
+                p.book = p.books[sec] = Book(sec)
+            elif tid == product[0]:
+                p.last = product[1](bs, i)[0]
+        if completion == self.complete:
+            if p.orders:
+                return self.abort(seg, p, f'{p.orders} orders of {p.book.security_id} missing')
+            self.finish(seg, p)
+
+    def abort(self, seg, p, reason):
+        log.warning(f'Incomplete snapshot cycle of MarketSegmentID {seg}: {reason}')
+        self.aborted += 1
+        self.reset(p)
+
+    # i.e. discards the current snapshot cycle
+    def reset(self, p):
+        p.books = None
+        p.book = None
+        p.orders = 0
+
+    def finish(self, seg, p):
+        first = p.next - len(p.buffer)
+        if p.next and p.last + 1 < first:
+            # i.e. the snapshot predates the buffered (or dropped) packets
+            self.stale += 1
+            p.books = None
+            return
+        books = self.builder.books
+        for sec in self.securities.get(seg, set()).difference(p.books):
+            books.pop(sec, None)
+        books.update(p.books)
+        self.securities[seg] = set(p.books)
+        k = p.last + 1 - first
+        for bs in itertools.islice(p.buffer, max(0, k), None):
+            self.builder.packet(bs)
+        self.next[seg] = max(p.last + 1, p.next)
+        self.buffered -= p.bytes
+        del self.pending[seg]
+        self.recoveries += 1
+        t = self.clock() - p.start
+        self.durations.record(t)
+        orders = sum(len(x) for x in p.books.values())
+        log.info(f'Recovered MarketSegmentID {seg} in {t / 1e6:.1f} ms: {len(p.books)} instruments,'
+                f' {orders} orders, LastMsgSeqNumProcessed {p.last},'
+                f' applied {max(0, len(p.buffer) - k)} buffered packets ({p.bytes} bytes)')
+
+    # i.e. restarts the recoveries that take longer than the timeout
+    def expire(self):
+        now = self.clock()
+        for seg, p in self.pending.items():
+            if now - p.start > self.timeout:
+                log.error(f'Recovery of MarketSegmentID {seg} timed out after {(now - p.start) / 1e9:.1f} s'
+                        f' - restarting')
+                self.timeouts += 1
+                self.drop(p, len(p.buffer))
+                self.reset(p)
+                p.next = 0
+                p.start = now
+
+    def stats(self):
+        return { 'live': len(self.next), 'pending': len(self.pending), 'recoveries': self.recoveries,
+                'gaps': self.gaps, 'late': self.late, 'aborted': self.aborted, 'stale': self.stale,
+                'timeouts': self.timeouts, 'buffered': self.buffered, 'peak': self.peak,
+                'dropped': self.dropped, 'recovery_us': self.durations.summary() }
+
+
+def run(rec, incremental, snapshot, interval=10):
+    sel = selectors.DefaultSelector()
+    for s in incremental:
+        sel.register(s, selectors.EVENT_READ, rec.incremental)
+    for s in snapshot:
+        sel.register(s, selectors.EVENT_READ, rec.snapshot)
+    buf = bytearray(1500)
+    mv = memoryview(buf)
+    t = time.monotonic() + interval
+    while True:
+        for key, _ in sel.select(interval):
+            s, f = key.fileobj, key.data
+            while True:
+                try:
+                    n = s.recv_into(buf)
+                except BlockingIOError:
+                    break
+                f(mv[:n])
+        if time.monotonic() >= t:
+            rec.expire()
+            log.info(f'Recovery: {rec.stats()}')
+            t = time.monotonic() + interval
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Maintain EOBI order books, recovering from the snapshot channels')
+    p.add_argument('address', help='IPv4 address of interface to bind')
+    p.add_argument('-i', action='append', type=group, required=True, metavar='GROUP:PORT',
+            help='multicast group of an incremental channel (e.g. port 59001)')
+    p.add_argument('-s', action='append', type=group, required=True, metavar='GROUP:PORT',
+            help='multicast group of a snapshot channel (e.g. port 59000)')
+    p.add_argument('--max-buffer', type=int, default=64, metavar='MIB',
+            help='limit of buffered incremental packets while recovering (default: %(default)d MiB)')
+    p.add_argument('--timeout', type=float, default=60, metavar='SECONDS',
+            help='restart recoveries that take longer than that (default: %(default)s)')
+    p.add_argument('--stats-interval', type=float, default=10, metavar='SECONDS',
+            help='log the statistics every SECONDS (default: %(default)s)')
+    p.add_argument('--release', '-r', default='13.0', help='EOBI release (default: %(default)s)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, datefmt='%Y-%m-%d %H:%M:%S',
+            format='%(asctime)s.%(msecs)03d [%(name)s] %(levelname).1s   %(message)s')
+    eobi = importlib.import_module(f'eobi.v{args.release.replace(".", "_")}')
+    rec = Recovery(eobi, max_buffer=args.max_buffer * 1024 * 1024, timeout=args.timeout)
+    incremental = [ join(*g, args.address) for g in args.i ]
+    snapshot = [ join(*g, args.address) for g in args.s ]
+    try:
+        run(rec, incremental, snapshot, args.stats_interval)
+    except KeyboardInterrupt:
+        log.info(f'Recovery: {rec.stats()}')
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,5472 @@
+# auto-generated by Georg Sauthoff's eti2py.py
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: BSL-1.0
+
+import operator
+import struct
+import threading
+from dataclasses import dataclass, field, is_dataclass
+from enum import IntEnum
+
+def rstrip_dc(x):
+    for k, v in x.__dict__.items():
+        if type(v) is bytes:
+            x.__setattr__(k, x.__getattribute__(k).rstrip(b'\0'))
+        elif is_dataclass(v):
+            rstrip_dc(v)
+
+def enumerize(i, klasse):
+    try:
+        return klasse(i)
+    except ValueError:
+        return i
+
+_st_B = struct.Struct('<B')
+_st_h = struct.Struct('<h')
+_st_H = struct.Struct('<H')
+_st_i = struct.Struct('<i')
+_st_I = struct.Struct('<I')
+_st_q = struct.Struct('<q')
+_st_Q = struct.Struct('<Q')
+
+# NB: NumPy is optional, i.e. it's only imported when a dtype is requested
+_np_fmts = { 'B': 'u1', 'h': '<i2', 'H': '<u2', 'i': '<i4', 'I': '<u4', 'q': '<i8', 'Q': '<u8' }
+
+def _make_dtype(cls):
+    import numpy as np
+    names   = [ k for k, _, _ in cls.layout ]
+    formats = [ f.dtype() if isinstance(f, type) else _np_fmts.get(f, f'S{f[:-1]}')
+                for _, f, _ in cls.layout ]
+    offsets = [ off for _, _, off in cls.layout ]
+    return np.dtype({ 'names': names, 'formats': formats, 'offsets': offsets,
+                      'itemsize': cls.sizes[0] })
+
+def _unpack_many(cls, buf, offsets):
+    import numpy as np
+    dt = cls.dtype()
+    a = np.frombuffer(buf, dtype=np.uint8)
+    idx = np.asarray(offsets, dtype=np.intp)[:, None] + np.arange(dt.itemsize)
+    return a[idx].view(dt)[:, 0].view(np.recarray)
+
+version = '9.0'
+sub_version = 'C0001'
+build = '42'
+
+def _mk_TemplateID():
+    class TemplateID(IntEnum):
+        LogonRequest = 10000
+        LogonResponse = 10001
+        LogoutRequest = 10002
+        LogoutResponse = 10003
+        Reject = 10010
+        Heartbeat = 10011
+        UserLoginRequest = 10018
+        UserLoginResponse = 10019
+        UserLogoutResponse = 10024
+        NewOrderResponse = 10101
+        NewOrderNRResponse = 10102
+        OrderExecResponse = 10103
+        ModifyOrderSingleRequest = 10106
+        ModifyOrderResponse = 10107
+        DeleteOrderSingleRequest = 10109
+        DeleteOrderResponse = 10110
+        OrderExecReportBroadcast = 10117
+        DeleteAllOrderRequest = 10120
+        NewOrderSingleShortRequest = 10125
+    return TemplateID
+
+def _mk_ApplID():
+    class ApplID(IntEnum):
+        SESSION_DATA = 4
+        TRADE = 5
+        NO_VALUE = 0xFF
+    ApplID._tab = { v.value: v for v in ApplID }
+    return ApplID
+
+def _mk_ApplResendFlag():
+    class ApplResendFlag(IntEnum):
+        FALSE = 0
+        TRUE = 1
+        NO_VALUE = 0xFF
+    ApplResendFlag._tab = { v.value: v for v in ApplResendFlag }
+    return ApplResendFlag
+
+def _mk_LastFragment():
+    class LastFragment(IntEnum):
+        NOT_LAST_MESSAGE = 0
+        LAST_MESSAGE = 1
+        NO_VALUE = 0xFF
+    LastFragment._tab = { v.value: v for v in LastFragment }
+    return LastFragment
+
+def _mk_ApplUsageOrders():
+    class ApplUsageOrders(IntEnum):
+        AUTOMATED = ord('A')
+        BOTH = ord('B')
+        MANUAL = ord('M')
+        NONE = ord('N')
+        NO_VALUE = 0
+    ApplUsageOrders._tab = { v.value: v for v in ApplUsageOrders }
+    return ApplUsageOrders
+
+def _mk_ApplUsageQuotes():
+    class ApplUsageQuotes(IntEnum):
+        AUTOMATED = ord('A')
+        BOTH = ord('B')
+        MANUAL = ord('M')
+        NONE = ord('N')
+        NO_VALUE = 0
+    ApplUsageQuotes._tab = { v.value: v for v in ApplUsageQuotes }
+    return ApplUsageQuotes
+
+def _mk_OrderRoutingIndicator():
+    class OrderRoutingIndicator(IntEnum):
+        NO = ord('N')
+        YES = ord('Y')
+        NO_VALUE = 0
+    OrderRoutingIndicator._tab = { v.value: v for v in OrderRoutingIndicator }
+    return OrderRoutingIndicator
+
+def _mk_TradSesMode():
+    class TradSesMode(IntEnum):
+        DEVELOPMENT = 1
+        SIMULATION = 2
+        PRODUCTION = 3
+        ACCEPTANCE = 4
+        NO_VALUE = 0xFF
+    TradSesMode._tab = { v.value: v for v in TradSesMode }
+    return TradSesMode
+
+def _mk_SessionRejectReason():
+    class SessionRejectReason(IntEnum):
+        REQUIRED_TAG_MISSING = 1
+        OTHER = 99
+        PRICE_NOT_REASONABLE = 105
+        NO_VALUE = 0xFFFFFFFF
+    SessionRejectReason._tab = { v.value: v for v in SessionRejectReason }
+    return SessionRejectReason
+
+def _mk_Side():
+    class Side(IntEnum):
+        BUY = 1
+        SELL = 2
+        NO_VALUE = 0xFF
+    Side._tab = { v.value: v for v in Side }
+    return Side
+
+def _mk_LegSide():
+    class LegSide(IntEnum):
+        BUY = 1
+        SELL = 2
+        NO_VALUE = 0xFF
+    LegSide._tab = { v.value: v for v in LegSide }
+    return LegSide
+
+def _mk_ApplSeqIndicator():
+    class ApplSeqIndicator(IntEnum):
+        NO_RECOVERY_REQUIRED = 0
+        RECOVERY_REQUIRED = 1
+        NO_VALUE = 0xFF
+    ApplSeqIndicator._tab = { v.value: v for v in ApplSeqIndicator }
+    return ApplSeqIndicator
+
+def _mk_PriceValidityCheckType():
+    class PriceValidityCheckType(IntEnum):
+        NONE = 0
+        OPTIONAL = 1
+        MANDATORY = 2
+        NO_VALUE = 0xFF
+    PriceValidityCheckType._tab = { v.value: v for v in PriceValidityCheckType }
+    return PriceValidityCheckType
+
+def _mk_ValueCheckTypeValue():
+    class ValueCheckTypeValue(IntEnum):
+        DO_NOT_CHECK = 0
+        CHECK = 1
+        NO_VALUE = 0xFF
+    ValueCheckTypeValue._tab = { v.value: v for v in ValueCheckTypeValue }
+    return ValueCheckTypeValue
+
+def _mk_OrderAttributeLiquidityProvision():
+    class OrderAttributeLiquidityProvision(IntEnum):
+        N = 0
+        Y = 1
+        NO_VALUE = 0xFF
+    OrderAttributeLiquidityProvision._tab = { v.value: v for v in OrderAttributeLiquidityProvision }
+    return OrderAttributeLiquidityProvision
+
+def _mk_TimeInForce():
+    class TimeInForce(IntEnum):
+        DAY = 0
+        GTC = 1
+        IOC = 3
+        FOK = 4
+        GTD = 6
+        NO_VALUE = 0xFF
+    TimeInForce._tab = { v.value: v for v in TimeInForce }
+    return TimeInForce
+
+def _mk_ExecInst():
+    class ExecInst(IntEnum):
+        H = 1
+        Q = 2
+        H_Q = 3
+        H_6 = 5
+        Q_6 = 6
+        NO_VALUE = 0xFF
+    ExecInst._tab = { v.value: v for v in ExecInst }
+    return ExecInst
+
+def _mk_TradingCapacity():
+    class TradingCapacity(IntEnum):
+        CUSTOMER = 1
+        PRINCIPAL = 5
+        MARKET_MAKER = 6
+        NO_VALUE = 0xFF
+    TradingCapacity._tab = { v.value: v for v in TradingCapacity }
+    return TradingCapacity
+
+def _mk_PartyIdInvestmentDecisionMakerQualifier():
+    class PartyIdInvestmentDecisionMakerQualifier(IntEnum):
+        ALGO = 22
+        HUMAN = 24
+        NO_VALUE = 0xFF
+    PartyIdInvestmentDecisionMakerQualifier._tab = { v.value: v for v in PartyIdInvestmentDecisionMakerQualifier }
+    return PartyIdInvestmentDecisionMakerQualifier
+
+def _mk_ExecutingTraderQualifier():
+    class ExecutingTraderQualifier(IntEnum):
+        ALGO = 22
+        HUMAN = 24
+        NO_VALUE = 0xFF
+    ExecutingTraderQualifier._tab = { v.value: v for v in ExecutingTraderQualifier }
+    return ExecutingTraderQualifier
+
+def _mk_OrdStatus():
+    class OrdStatus(IntEnum):
+        NEW = ord('0')
+        PARTIALLY_FILLED = ord('1')
+        FILLED = ord('2')
+        CANCELED = ord('4')
+        NO_VALUE = 0
+    OrdStatus._tab = { v.value: v for v in OrdStatus }
+    return OrdStatus
+
+def _mk_ExecType():
+    class ExecType(IntEnum):
+        NEW = ord('0')
+        CANCELED = ord('4')
+        REPLACED = ord('5')
+        TRADE = ord('F')
+        NO_VALUE = 0
+    ExecType._tab = { v.value: v for v in ExecType }
+    return ExecType
+
+def _mk_ExecRestatementReason():
+    class ExecRestatementReason(IntEnum):
+        ORDER_ADDED = 101
+        ORDER_MODIFIED = 102
+        ORDER_CANCELLED = 103
+        IOC_ORDER_CANCELLED = 105
+        BOOK_ORDER_EXECUTED = 108
+        NO_VALUE = 0xFFFF
+    ExecRestatementReason._tab = { v.value: v for v in ExecRestatementReason }
+    return ExecRestatementReason
+
+def _mk_ProductComplex():
+    class ProductComplex(IntEnum):
+        SIMPLE_INSTRUMENT = 1
+        NO_VALUE = 0xFF
+    ProductComplex._tab = { v.value: v for v in ProductComplex }
+    return ProductComplex
+
+def _mk_LegPositionEffect():
+    class LegPositionEffect(IntEnum):
+        CLOSE = ord('C')
+        OPEN = ord('O')
+        NO_VALUE = 0
+    LegPositionEffect._tab = { v.value: v for v in LegPositionEffect }
+    return LegPositionEffect
+
+def _mk_OrdType():
+    class OrdType(IntEnum):
+        MARKET = 1
+        LIMIT = 2
+        NO_VALUE = 0xFF
+    OrdType._tab = { v.value: v for v in OrdType }
+    return OrdType
+
+def _mk_MessageHeaderInComp():
+    @dataclass
+    class MessageHeaderInComp:
+        sizes = (16, 16)
+
+        BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        # PADDING=2 # fmt:2x, size:2, off:14
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('BodyLen', 'I', 0),
+            ('TemplateID', 'H', 4),
+            ('NetworkMsgID', '8s', 6),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.BodyLen, self.TemplateID, self.NetworkMsgID)
+            return off + 16
+        def pack(self):
+            bs = bytearray(16)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.BodyLen, self.TemplateID, self.NetworkMsgID = self.st(0).unpack_from(buf, off)
+            if strip:
+                self.NetworkMsgID = self.NetworkMsgID.rstrip(b'\0')
+            return off + 16
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = MessageHeaderInComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.NetworkMsgID = self.NetworkMsgID.rstrip(b'\0')
+
+    return MessageHeaderInComp
+
+def _mk_MessageHeaderInCompView():
+    class MessageHeaderInCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def BodyLen(self):
+            return _st_I.unpack_from(self._buf, self._off)[0]
+        @property
+        def TemplateID(self):
+            return _st_H.unpack_from(self._buf, self._off + 4)[0]
+        @property
+        def NetworkMsgID(self):
+            return bytes(self._buf[self._off + 6:self._off + 14])
+
+        def unpack(self):
+            return MessageHeaderInComp.create_from(self._buf, self._off)
+
+    return MessageHeaderInCompView
+
+def _mk_MessageHeaderOutComp():
+    @dataclass
+    class MessageHeaderOutComp:
+        sizes = (8, 8)
+
+        BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        # PADDING=2 # fmt:2x, size:2, off:6
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('BodyLen', 'I', 0),
+            ('TemplateID', 'H', 4),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.BodyLen, self.TemplateID)
+            return off + 8
+        def pack(self):
+            bs = bytearray(8)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.BodyLen, self.TemplateID = self.st(0).unpack_from(buf, off)
+            return off + 8
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = MessageHeaderOutComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return MessageHeaderOutComp
+
+def _mk_MessageHeaderOutCompView():
+    class MessageHeaderOutCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def BodyLen(self):
+            return _st_I.unpack_from(self._buf, self._off)[0]
+        @property
+        def TemplateID(self):
+            return _st_H.unpack_from(self._buf, self._off + 4)[0]
+
+        def unpack(self):
+            return MessageHeaderOutComp.create_from(self._buf, self._off)
+
+    return MessageHeaderOutCompView
+
+def _mk_RequestHeaderComp():
+    @dataclass
+    class RequestHeaderComp:
+        sizes = (8, 8)
+
+        MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:4
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<II', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MsgSeqNum', 'I', 0),
+            ('SenderSubID', 'I', 4),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.MsgSeqNum, self.SenderSubID)
+            return off + 8
+        def pack(self):
+            bs = bytearray(8)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MsgSeqNum, self.SenderSubID = self.st(0).unpack_from(buf, off)
+            return off + 8
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = RequestHeaderComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 4, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return RequestHeaderComp
+
+def _mk_RequestHeaderCompView():
+    class RequestHeaderCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MsgSeqNum(self):
+            return _st_I.unpack_from(self._buf, self._off)[0]
+        @property
+        def SenderSubID(self):
+            return _st_I.unpack_from(self._buf, self._off + 4)[0]
+
+        def unpack(self):
+            return RequestHeaderComp.create_from(self._buf, self._off)
+
+    return RequestHeaderCompView
+
+def _mk_ResponseHeaderComp():
+    @dataclass
+    class ResponseHeaderComp:
+        sizes = (24, 24)
+
+        RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:0
+        SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        # PADDING=4 # fmt:4x, size:4, off:20
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<QQI4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('RequestTime', 'Q', 0),
+            ('SendingTime', 'Q', 8),
+            ('MsgSeqNum', 'I', 16),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.RequestTime, self.SendingTime, self.MsgSeqNum)
+            return off + 24
+        def pack(self):
+            bs = bytearray(24)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.RequestTime, self.SendingTime, self.MsgSeqNum = self.st(0).unpack_from(buf, off)
+            return off + 24
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = ResponseHeaderComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off, v)
+        @staticmethod
+        def set_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return ResponseHeaderComp
+
+def _mk_ResponseHeaderCompView():
+    class ResponseHeaderCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def RequestTime(self):
+            return _st_Q.unpack_from(self._buf, self._off)[0]
+        @property
+        def SendingTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def MsgSeqNum(self):
+            return _st_I.unpack_from(self._buf, self._off + 16)[0]
+
+        def unpack(self):
+            return ResponseHeaderComp.create_from(self._buf, self._off)
+
+    return ResponseHeaderCompView
+
+def _mk_ResponseHeaderMEComp():
+    @dataclass
+    class ResponseHeaderMEComp:
+        sizes = (64, 64)
+
+        RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:0
+        TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:40
+        PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:44
+        ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:46
+        ApplMsgID: bytes = b'' # fmt:16s, size:16, off:47
+        LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:63
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<QQQQQIHB16sB', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('RequestTime', 'Q', 0),
+            ('TrdRegTSTimeIn', 'Q', 8),
+            ('TrdRegTSTimeOut', 'Q', 16),
+            ('ResponseIn', 'Q', 24),
+            ('SendingTime', 'Q', 32),
+            ('MsgSeqNum', 'I', 40),
+            ('PartitionID', 'H', 44),
+            ('ApplID', 'B', 46),
+            ('ApplMsgID', '16s', 47),
+            ('LastFragment', 'B', 63),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.RequestTime, self.TrdRegTSTimeIn, self.TrdRegTSTimeOut, self.ResponseIn, self.SendingTime, self.MsgSeqNum, self.PartitionID, self.ApplID, self.ApplMsgID, self.LastFragment)
+            return off + 64
+        def pack(self):
+            bs = bytearray(64)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.RequestTime, self.TrdRegTSTimeIn, self.TrdRegTSTimeOut, self.ResponseIn, self.SendingTime, self.MsgSeqNum, self.PartitionID, self.ApplID, self.ApplMsgID, self.LastFragment = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.ApplID, self.LastFragment = ApplID._tab.get(self.ApplID, self.ApplID), LastFragment._tab.get(self.LastFragment, self.LastFragment)
+            if strip:
+                self.ApplMsgID = self.ApplMsgID.rstrip(b'\0')
+            return off + 64
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = ResponseHeaderMEComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off, v)
+        @staticmethod
+        def set_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 44, v)
+        @staticmethod
+        def set_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 46, v)
+        @staticmethod
+        def set_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 47, v)
+        @staticmethod
+        def set_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 63, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.ApplMsgID = self.ApplMsgID.rstrip(b'\0')
+
+    return ResponseHeaderMEComp
+
+def _mk_ResponseHeaderMECompView():
+    class ResponseHeaderMECompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def RequestTime(self):
+            return _st_Q.unpack_from(self._buf, self._off)[0]
+        @property
+        def TrdRegTSTimeIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TrdRegTSTimeOut(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def ResponseIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def SendingTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def MsgSeqNum(self):
+            return _st_I.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def PartitionID(self):
+            return _st_H.unpack_from(self._buf, self._off + 44)[0]
+        @property
+        def ApplID(self):
+            return _st_B.unpack_from(self._buf, self._off + 46)[0]
+        @property
+        def ApplMsgID(self):
+            return bytes(self._buf[self._off + 47:self._off + 63])
+        @property
+        def LastFragment(self):
+            return _st_B.unpack_from(self._buf, self._off + 63)[0]
+
+        def unpack(self):
+            return ResponseHeaderMEComp.create_from(self._buf, self._off)
+
+    return ResponseHeaderMECompView
+
+def _mk_NRResponseHeaderMEComp():
+    @dataclass
+    class NRResponseHeaderMEComp:
+        sizes = (48, 48)
+
+        RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:0
+        TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:40
+        LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:44
+        # PADDING=3 # fmt:3x, size:3, off:45
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<QQQQQIB3x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('RequestTime', 'Q', 0),
+            ('TrdRegTSTimeIn', 'Q', 8),
+            ('TrdRegTSTimeOut', 'Q', 16),
+            ('ResponseIn', 'Q', 24),
+            ('SendingTime', 'Q', 32),
+            ('MsgSeqNum', 'I', 40),
+            ('LastFragment', 'B', 44),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.RequestTime, self.TrdRegTSTimeIn, self.TrdRegTSTimeOut, self.ResponseIn, self.SendingTime, self.MsgSeqNum, self.LastFragment)
+            return off + 48
+        def pack(self):
+            bs = bytearray(48)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.RequestTime, self.TrdRegTSTimeIn, self.TrdRegTSTimeOut, self.ResponseIn, self.SendingTime, self.MsgSeqNum, self.LastFragment = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.LastFragment = LastFragment._tab.get(self.LastFragment, self.LastFragment)
+            return off + 48
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = NRResponseHeaderMEComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off, v)
+        @staticmethod
+        def set_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 44, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return NRResponseHeaderMEComp
+
+def _mk_NRResponseHeaderMECompView():
+    class NRResponseHeaderMECompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def RequestTime(self):
+            return _st_Q.unpack_from(self._buf, self._off)[0]
+        @property
+        def TrdRegTSTimeIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def TrdRegTSTimeOut(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def ResponseIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def SendingTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def MsgSeqNum(self):
+            return _st_I.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def LastFragment(self):
+            return _st_B.unpack_from(self._buf, self._off + 44)[0]
+
+        def unpack(self):
+            return NRResponseHeaderMEComp.create_from(self._buf, self._off)
+
+    return NRResponseHeaderMECompView
+
+def _mk_RBCHeaderMEComp():
+    @dataclass
+    class RBCHeaderMEComp:
+        sizes = (56, 56)
+
+        TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:0
+        NotificationIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        ApplSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:28
+        ApplMsgID: bytes = b'' # fmt:16s, size:16, off:30
+        ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:46
+        ApplResendFlag: int = ApplResendFlag(0xFF) # u1, enum:ApplResendFlag, fmt:B, size:1, off:47
+        LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:48
+        # PADDING=7 # fmt:7x, size:7, off:49
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<QQQIH16sBBB7x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('TrdRegTSTimeOut', 'Q', 0),
+            ('NotificationIn', 'Q', 8),
+            ('SendingTime', 'Q', 16),
+            ('ApplSubID', 'I', 24),
+            ('PartitionID', 'H', 28),
+            ('ApplMsgID', '16s', 30),
+            ('ApplID', 'B', 46),
+            ('ApplResendFlag', 'B', 47),
+            ('LastFragment', 'B', 48),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.TrdRegTSTimeOut, self.NotificationIn, self.SendingTime, self.ApplSubID, self.PartitionID, self.ApplMsgID, self.ApplID, self.ApplResendFlag, self.LastFragment)
+            return off + 56
+        def pack(self):
+            bs = bytearray(56)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.TrdRegTSTimeOut, self.NotificationIn, self.SendingTime, self.ApplSubID, self.PartitionID, self.ApplMsgID, self.ApplID, self.ApplResendFlag, self.LastFragment = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.ApplID, self.ApplResendFlag, self.LastFragment = ApplID._tab.get(self.ApplID, self.ApplID), ApplResendFlag._tab.get(self.ApplResendFlag, self.ApplResendFlag), LastFragment._tab.get(self.LastFragment, self.LastFragment)
+            if strip:
+                self.ApplMsgID = self.ApplMsgID.rstrip(b'\0')
+            return off + 56
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = RBCHeaderMEComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off, v)
+        @staticmethod
+        def set_NotificationIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ApplSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 28, v)
+        @staticmethod
+        def set_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 30, v)
+        @staticmethod
+        def set_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 46, v)
+        @staticmethod
+        def set_ApplResendFlag(buf, off, v):
+            _st_B.pack_into(buf, off + 47, v)
+        @staticmethod
+        def set_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 48, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.ApplMsgID = self.ApplMsgID.rstrip(b'\0')
+
+    return RBCHeaderMEComp
+
+def _mk_RBCHeaderMECompView():
+    class RBCHeaderMECompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def TrdRegTSTimeOut(self):
+            return _st_Q.unpack_from(self._buf, self._off)[0]
+        @property
+        def NotificationIn(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def SendingTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def ApplSubID(self):
+            return _st_I.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def PartitionID(self):
+            return _st_H.unpack_from(self._buf, self._off + 28)[0]
+        @property
+        def ApplMsgID(self):
+            return bytes(self._buf[self._off + 30:self._off + 46])
+        @property
+        def ApplID(self):
+            return _st_B.unpack_from(self._buf, self._off + 46)[0]
+        @property
+        def ApplResendFlag(self):
+            return _st_B.unpack_from(self._buf, self._off + 47)[0]
+        @property
+        def LastFragment(self):
+            return _st_B.unpack_from(self._buf, self._off + 48)[0]
+
+        def unpack(self):
+            return RBCHeaderMEComp.create_from(self._buf, self._off)
+
+    return RBCHeaderMECompView
+
+def _mk_NotifHeaderComp():
+    @dataclass
+    class NotifHeaderComp:
+        sizes = (8, 8)
+
+        SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:0
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<Q', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('SendingTime', 'Q', 0),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.SendingTime)
+            return off + 8
+        def pack(self):
+            bs = bytearray(8)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.SendingTime = self.st(0).unpack_from(buf, off)
+            return off + 8
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = NotifHeaderComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return NotifHeaderComp
+
+def _mk_NotifHeaderCompView():
+    class NotifHeaderCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def SendingTime(self):
+            return _st_Q.unpack_from(self._buf, self._off)[0]
+
+        def unpack(self):
+            return NotifHeaderComp.create_from(self._buf, self._off)
+
+    return NotifHeaderCompView
+
+def _mk_FillsGrpComp():
+    @dataclass
+    class FillsGrpComp:
+        sizes = (24, 24)
+
+        FillPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:0
+        FillQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:8
+        FillMatchID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        FillExecID: int = -2147483648 # i4, fmt:i, size:4, off:20
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<qQIi', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('FillPx', 'q', 0),
+            ('FillQty', 'Q', 8),
+            ('FillMatchID', 'I', 16),
+            ('FillExecID', 'i', 20),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.FillPx, self.FillQty, self.FillMatchID, self.FillExecID)
+            return off + 24
+        def pack(self):
+            bs = bytearray(24)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.FillPx, self.FillQty, self.FillMatchID, self.FillExecID = self.st(0).unpack_from(buf, off)
+            return off + 24
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = FillsGrpComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_FillPx(buf, off, v):
+            _st_q.pack_into(buf, off, v)
+        @staticmethod
+        def set_FillQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_FillMatchID(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_FillExecID(buf, off, v):
+            _st_i.pack_into(buf, off + 20, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return FillsGrpComp
+
+def _mk_FillsGrpCompView():
+    class FillsGrpCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def FillPx(self):
+            return _st_q.unpack_from(self._buf, self._off)[0]
+        @property
+        def FillQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def FillMatchID(self):
+            return _st_I.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def FillExecID(self):
+            return _st_i.unpack_from(self._buf, self._off + 20)[0]
+
+        def unpack(self):
+            return FillsGrpComp.create_from(self._buf, self._off)
+
+    return FillsGrpCompView
+
+def _mk_LegOrdGrpComp():
+    @dataclass
+    class LegOrdGrpComp:
+        sizes = (8, 8)
+
+        LegPositionEffect: int = LegPositionEffect(0) # i1, enum:LegPositionEffect, fmt:B, size:1, off:0
+        # PADDING=7 # fmt:7x, size:7, off:1
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<B7x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('LegPositionEffect', 'B', 0),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.LegPositionEffect)
+            return off + 8
+        def pack(self):
+            bs = bytearray(8)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.LegPositionEffect = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.LegPositionEffect = LegPositionEffect._tab.get(self.LegPositionEffect, self.LegPositionEffect)
+            return off + 8
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = LegOrdGrpComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_LegPositionEffect(buf, off, v):
+            _st_B.pack_into(buf, off, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return LegOrdGrpComp
+
+def _mk_LegOrdGrpCompView():
+    class LegOrdGrpCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def LegPositionEffect(self):
+            return _st_B.unpack_from(self._buf, self._off)[0]
+
+        def unpack(self):
+            return LegOrdGrpComp.create_from(self._buf, self._off)
+
+    return LegOrdGrpCompView
+
+def _mk_InstrmntLegExecGrpComp():
+    @dataclass
+    class InstrmntLegExecGrpComp:
+        sizes = (32, 32)
+
+        LegSecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:0
+        LegLastPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:8
+        LegLastQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:16
+        LegSide: int = LegSide(0xFF) # u1, enum:LegSide, fmt:B, size:1, off:24
+        # PADDING=7 # fmt:7x, size:7, off:25
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<qqQB7x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('LegSecurityID', 'q', 0),
+            ('LegLastPx', 'q', 8),
+            ('LegLastQty', 'Q', 16),
+            ('LegSide', 'B', 24),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            self.st(0).pack_into(buf, off, self.LegSecurityID, self.LegLastPx, self.LegLastQty, self.LegSide)
+            return off + 32
+        def pack(self):
+            bs = bytearray(32)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.LegSecurityID, self.LegLastPx, self.LegLastQty, self.LegSide = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.LegSide = LegSide._tab.get(self.LegSide, self.LegSide)
+            return off + 32
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = InstrmntLegExecGrpComp()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_LegSecurityID(buf, off, v):
+            _st_q.pack_into(buf, off, v)
+        @staticmethod
+        def set_LegLastPx(buf, off, v):
+            _st_q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_LegLastQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_LegSide(buf, off, v):
+            _st_B.pack_into(buf, off + 24, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            pass
+
+    return InstrmntLegExecGrpComp
+
+def _mk_InstrmntLegExecGrpCompView():
+    class InstrmntLegExecGrpCompView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def LegSecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off)[0]
+        @property
+        def LegLastPx(self):
+            return _st_q.unpack_from(self._buf, self._off + 8)[0]
+        @property
+        def LegLastQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 16)[0]
+        @property
+        def LegSide(self):
+            return _st_B.unpack_from(self._buf, self._off + 24)[0]
+
+        def unpack(self):
+            return InstrmntLegExecGrpComp.create_from(self._buf, self._off)
+
+    return InstrmntLegExecGrpCompView
+
+def _mk_LogonRequest():
+    @dataclass
+    class LogonRequest:
+        sizes = (280, 280)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(280, 10000)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+        HeartBtInt: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        PartyIDSessionID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:28
+        DefaultCstmApplVerID: bytes = b'9.0' # fmt:30s, size:30, off:32
+        Password: bytes = b'' # fmt:32s, size:32, off:62
+        ApplUsageOrders: int = ApplUsageOrders(0) # i1, enum:ApplUsageOrders, fmt:B, size:1, off:94
+        ApplUsageQuotes: int = ApplUsageQuotes(0) # i1, enum:ApplUsageQuotes, fmt:B, size:1, off:95
+        OrderRoutingIndicator: int = OrderRoutingIndicator(0) # i1, enum:OrderRoutingIndicator, fmt:B, size:1, off:96
+        ApplicationSystemName: bytes = b'' # fmt:30s, size:30, off:97
+        ApplicationSystemVersion: bytes = b'' # fmt:30s, size:30, off:127
+        ApplicationSystemVendor: bytes = b'' # fmt:30s, size:30, off:157
+        FIXEngineName: bytes = b'' # fmt:30s, size:30, off:187
+        FIXEngineVersion: bytes = b'' # fmt:30s, size:30, off:217
+        FIXEngineVendor: bytes = b'' # fmt:30s, size:30, off:247
+        # PADDING=3 # fmt:3x, size:3, off:277
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xIIII30s32sBBB30s30s30s30s30s30s3x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+            ('HeartBtInt', 'I', 24),
+            ('PartyIDSessionID', 'I', 28),
+            ('DefaultCstmApplVerID', '30s', 32),
+            ('Password', '32s', 62),
+            ('ApplUsageOrders', 'B', 94),
+            ('ApplUsageQuotes', 'B', 95),
+            ('OrderRoutingIndicator', 'B', 96),
+            ('ApplicationSystemName', '30s', 97),
+            ('ApplicationSystemVersion', '30s', 127),
+            ('ApplicationSystemVendor', '30s', 157),
+            ('FIXEngineName', '30s', 187),
+            ('FIXEngineVersion', '30s', 217),
+            ('FIXEngineVendor', '30s', 247),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.HeartBtInt, self.PartyIDSessionID, self.DefaultCstmApplVerID, self.Password, self.ApplUsageOrders, self.ApplUsageQuotes, self.OrderRoutingIndicator, self.ApplicationSystemName, self.ApplicationSystemVersion, self.ApplicationSystemVendor, self.FIXEngineName, self.FIXEngineVersion, self.FIXEngineVendor)
+            return off + 280
+        def pack(self):
+            bs = bytearray(280)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.HeartBtInt, self.PartyIDSessionID, self.DefaultCstmApplVerID, self.Password, self.ApplUsageOrders, self.ApplUsageQuotes, self.OrderRoutingIndicator, self.ApplicationSystemName, self.ApplicationSystemVersion, self.ApplicationSystemVendor, self.FIXEngineName, self.FIXEngineVersion, self.FIXEngineVendor = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.ApplUsageOrders, self.ApplUsageQuotes, self.OrderRoutingIndicator = ApplUsageOrders._tab.get(self.ApplUsageOrders, self.ApplUsageOrders), ApplUsageQuotes._tab.get(self.ApplUsageQuotes, self.ApplUsageQuotes), OrderRoutingIndicator._tab.get(self.OrderRoutingIndicator, self.OrderRoutingIndicator)
+            if strip:
+                c0.NetworkMsgID, self.DefaultCstmApplVerID, self.Password, self.ApplicationSystemName, self.ApplicationSystemVersion, self.ApplicationSystemVendor, self.FIXEngineName, self.FIXEngineVersion, self.FIXEngineVendor = c0.NetworkMsgID.rstrip(b'\0'), self.DefaultCstmApplVerID.rstrip(b'\0'), self.Password.rstrip(b'\0'), self.ApplicationSystemName.rstrip(b'\0'), self.ApplicationSystemVersion.rstrip(b'\0'), self.ApplicationSystemVendor.rstrip(b'\0'), self.FIXEngineName.rstrip(b'\0'), self.FIXEngineVersion.rstrip(b'\0'), self.FIXEngineVendor.rstrip(b'\0')
+            return off + 280
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = LogonRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+        @staticmethod
+        def set_HeartBtInt(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_PartyIDSessionID(buf, off, v):
+            _st_I.pack_into(buf, off + 28, v)
+        @staticmethod
+        def set_DefaultCstmApplVerID(buf, off, v):
+            struct.pack_into('30s', buf, off + 32, v)
+        @staticmethod
+        def set_Password(buf, off, v):
+            struct.pack_into('32s', buf, off + 62, v)
+        @staticmethod
+        def set_ApplUsageOrders(buf, off, v):
+            _st_B.pack_into(buf, off + 94, v)
+        @staticmethod
+        def set_ApplUsageQuotes(buf, off, v):
+            _st_B.pack_into(buf, off + 95, v)
+        @staticmethod
+        def set_OrderRoutingIndicator(buf, off, v):
+            _st_B.pack_into(buf, off + 96, v)
+        @staticmethod
+        def set_ApplicationSystemName(buf, off, v):
+            struct.pack_into('30s', buf, off + 97, v)
+        @staticmethod
+        def set_ApplicationSystemVersion(buf, off, v):
+            struct.pack_into('30s', buf, off + 127, v)
+        @staticmethod
+        def set_ApplicationSystemVendor(buf, off, v):
+            struct.pack_into('30s', buf, off + 157, v)
+        @staticmethod
+        def set_FIXEngineName(buf, off, v):
+            struct.pack_into('30s', buf, off + 187, v)
+        @staticmethod
+        def set_FIXEngineVersion(buf, off, v):
+            struct.pack_into('30s', buf, off + 217, v)
+        @staticmethod
+        def set_FIXEngineVendor(buf, off, v):
+            struct.pack_into('30s', buf, off + 247, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+            self.DefaultCstmApplVerID, self.Password, self.ApplicationSystemName, self.ApplicationSystemVersion, self.ApplicationSystemVendor, self.FIXEngineName, self.FIXEngineVersion, self.FIXEngineVendor = self.DefaultCstmApplVerID.rstrip(b'\0'), self.Password.rstrip(b'\0'), self.ApplicationSystemName.rstrip(b'\0'), self.ApplicationSystemVersion.rstrip(b'\0'), self.ApplicationSystemVendor.rstrip(b'\0'), self.FIXEngineName.rstrip(b'\0'), self.FIXEngineVersion.rstrip(b'\0'), self.FIXEngineVendor.rstrip(b'\0')
+
+    return LogonRequest
+
+def _mk_LogonRequestView():
+    class LogonRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+        @property
+        def HeartBtInt(self):
+            return _st_I.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def PartyIDSessionID(self):
+            return _st_I.unpack_from(self._buf, self._off + 28)[0]
+        @property
+        def DefaultCstmApplVerID(self):
+            return bytes(self._buf[self._off + 32:self._off + 62])
+        @property
+        def Password(self):
+            return bytes(self._buf[self._off + 62:self._off + 94])
+        @property
+        def ApplUsageOrders(self):
+            return _st_B.unpack_from(self._buf, self._off + 94)[0]
+        @property
+        def ApplUsageQuotes(self):
+            return _st_B.unpack_from(self._buf, self._off + 95)[0]
+        @property
+        def OrderRoutingIndicator(self):
+            return _st_B.unpack_from(self._buf, self._off + 96)[0]
+        @property
+        def ApplicationSystemName(self):
+            return bytes(self._buf[self._off + 97:self._off + 127])
+        @property
+        def ApplicationSystemVersion(self):
+            return bytes(self._buf[self._off + 127:self._off + 157])
+        @property
+        def ApplicationSystemVendor(self):
+            return bytes(self._buf[self._off + 157:self._off + 187])
+        @property
+        def FIXEngineName(self):
+            return bytes(self._buf[self._off + 187:self._off + 217])
+        @property
+        def FIXEngineVersion(self):
+            return bytes(self._buf[self._off + 217:self._off + 247])
+        @property
+        def FIXEngineVendor(self):
+            return bytes(self._buf[self._off + 247:self._off + 277])
+
+        def unpack(self):
+            return LogonRequest.create_from(self._buf, self._off)
+
+    return LogonRequestView
+
+def _mk_LogonResponse():
+    @dataclass
+    class LogonResponse:
+        sizes = (88, 88)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(88, 10001)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeader: ResponseHeaderComp = field(default_factory=ResponseHeaderComp) # fmt:?, size:24, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        #    # PADDING=4 # fmt:4x, size:4, off:28
+        ThrottleTimeInterval: int = -9223372036854775808 # i8, fmt:q, size:8, off:32
+        ThrottleNoMsgs: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:40
+        ThrottleDisconnectLimit: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:44
+        HeartBtInt: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        SessionInstanceID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:52
+        TradSesMode: int = TradSesMode(0xFF) # u1, enum:TradSesMode, fmt:B, size:1, off:56
+        DefaultCstmApplVerID: bytes = b'9.0' # fmt:30s, size:30, off:57
+        # PADDING=1 # fmt:1x, size:1, off:87
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQI4xqIIIIB30s1x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeader', ResponseHeaderComp, 8),
+            ('ThrottleTimeInterval', 'q', 32),
+            ('ThrottleNoMsgs', 'I', 40),
+            ('ThrottleDisconnectLimit', 'I', 44),
+            ('HeartBtInt', 'I', 48),
+            ('SessionInstanceID', 'I', 52),
+            ('TradSesMode', 'B', 56),
+            ('DefaultCstmApplVerID', '30s', 57),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum, self.ThrottleTimeInterval, self.ThrottleNoMsgs, self.ThrottleDisconnectLimit, self.HeartBtInt, self.SessionInstanceID, self.TradSesMode, self.DefaultCstmApplVerID)
+            return off + 88
+        def pack(self):
+            bs = bytearray(88)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum, self.ThrottleTimeInterval, self.ThrottleNoMsgs, self.ThrottleDisconnectLimit, self.HeartBtInt, self.SessionInstanceID, self.TradSesMode, self.DefaultCstmApplVerID = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.TradSesMode = TradSesMode._tab.get(self.TradSesMode, self.TradSesMode)
+            if strip:
+                self.DefaultCstmApplVerID = self.DefaultCstmApplVerID.rstrip(b'\0')
+            return off + 88
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = LogonResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeader_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeader_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ThrottleTimeInterval(buf, off, v):
+            _st_q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_ThrottleNoMsgs(buf, off, v):
+            _st_I.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_ThrottleDisconnectLimit(buf, off, v):
+            _st_I.pack_into(buf, off + 44, v)
+        @staticmethod
+        def set_HeartBtInt(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_SessionInstanceID(buf, off, v):
+            _st_I.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_TradSesMode(buf, off, v):
+            _st_B.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_DefaultCstmApplVerID(buf, off, v):
+            struct.pack_into('30s', buf, off + 57, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeader.rstrip()
+            self.DefaultCstmApplVerID = self.DefaultCstmApplVerID.rstrip(b'\0')
+
+    return LogonResponse
+
+def _mk_LogonResponseView():
+    class LogonResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeader(self):
+            return ResponseHeaderCompView(self._buf, self._off + 8)
+        @property
+        def ThrottleTimeInterval(self):
+            return _st_q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def ThrottleNoMsgs(self):
+            return _st_I.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def ThrottleDisconnectLimit(self):
+            return _st_I.unpack_from(self._buf, self._off + 44)[0]
+        @property
+        def HeartBtInt(self):
+            return _st_I.unpack_from(self._buf, self._off + 48)[0]
+        @property
+        def SessionInstanceID(self):
+            return _st_I.unpack_from(self._buf, self._off + 52)[0]
+        @property
+        def TradSesMode(self):
+            return _st_B.unpack_from(self._buf, self._off + 56)[0]
+        @property
+        def DefaultCstmApplVerID(self):
+            return bytes(self._buf[self._off + 57:self._off + 87])
+
+        def unpack(self):
+            return LogonResponse.create_from(self._buf, self._off)
+
+    return LogonResponseView
+
+def _mk_LogoutRequest():
+    @dataclass
+    class LogoutRequest:
+        sizes = (24, 24)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(24, 10002)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xII', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID)
+            return off + 24
+        def pack(self):
+            bs = bytearray(24)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID = self.st(0).unpack_from(buf, off)
+            if strip:
+                c0.NetworkMsgID = c0.NetworkMsgID.rstrip(b'\0')
+            return off + 24
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = LogoutRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+
+    return LogoutRequest
+
+def _mk_LogoutRequestView():
+    class LogoutRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+
+        def unpack(self):
+            return LogoutRequest.create_from(self._buf, self._off)
+
+    return LogoutRequestView
+
+def _mk_LogoutResponse():
+    @dataclass
+    class LogoutResponse:
+        sizes = (32, 32)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(32, 10003)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeader: ResponseHeaderComp = field(default_factory=ResponseHeaderComp) # fmt:?, size:24, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        #    # PADDING=4 # fmt:4x, size:4, off:28
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQI4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeader', ResponseHeaderComp, 8),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum)
+            return off + 32
+        def pack(self):
+            bs = bytearray(32)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum = self.st(0).unpack_from(buf, off)
+            return off + 32
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = LogoutResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeader_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeader_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeader.rstrip()
+
+    return LogoutResponse
+
+def _mk_LogoutResponseView():
+    class LogoutResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeader(self):
+            return ResponseHeaderCompView(self._buf, self._off + 8)
+
+        def unpack(self):
+            return LogoutResponse.create_from(self._buf, self._off)
+
+    return LogoutResponseView
+
+def _mk_Reject():
+    @dataclass
+    class Reject:
+        sizes = (64, 2064)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(64, 10010)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        NRResponseHeaderME: NRResponseHeaderMEComp = field(default_factory=NRResponseHeaderMEComp) # fmt:?, size:48, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:52
+        #    # PADDING=3 # fmt:3x, size:3, off:53
+        SessionRejectReason: int = SessionRejectReason(0xFFFFFFFF) # u4, enum:SessionRejectReason, fmt:I, size:4, off:56
+        VarTextLen: int = 0 # u2, fmt:H, size:2, off:60
+        # PADDING=2 # fmt:2x, size:2, off:62
+        VarText: bytes = b'' # length:VarTextLen, fmt:?, size:0, off:64
+
+        def update_length(self):
+            self.MessageHeaderOut.BodyLen = (8 + 48 + 8 + self.VarTextLen + 7) // 8 * 8
+
+        fmt = ( '<?', '<?', '<IH2x', '<?', )
+        _struct = [ None, None, None, None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('NRResponseHeaderME', NRResponseHeaderMEComp, 8),
+            ('SessionRejectReason', 'I', 56),
+            ('VarTextLen', 'H', 60),
+        )
+        def pack_into(self, buf, off=0):
+            self.MessageHeaderOut.pack_into(buf, off)
+            self.NRResponseHeaderME.pack_into(buf, off + 8)
+            self.st(2).pack_into(buf, off + 56, self.SessionRejectReason, self.VarTextLen)
+            o = off + 64
+            slack = (o + self.VarTextLen + 7) // 8 * 8 - (o + self.VarTextLen)
+            struct.pack_into(f"<{self.VarTextLen}s{slack}x", buf, o, self.VarText)
+            o += self.VarTextLen + slack
+            return o
+        def pack(self):
+            bs = bytearray(2064)
+            n = self.pack_into(bs)
+            mv = memoryview(bs)
+            return bytes(mv[:n])
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MessageHeaderOut.unpack_from(buf, off, enums, strip)
+            self.NRResponseHeaderME.unpack_from(buf, off + 8, enums, strip)
+            self.SessionRejectReason, self.VarTextLen = self.st(2).unpack_from(buf, off + 56)
+            if enums:
+                self.SessionRejectReason = SessionRejectReason._tab.get(self.SessionRejectReason, self.SessionRejectReason)
+            o = off + 64
+            self.VarText = struct.unpack_from(f"<{self.VarTextLen}s", buf, o)[0]
+            if strip:
+                self.VarText = self.VarText.rstrip(b'\0')
+            o += self.VarTextLen
+            return o
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = Reject()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_NRResponseHeaderME_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_NRResponseHeaderME_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_NRResponseHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_NRResponseHeaderME_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_NRResponseHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_NRResponseHeaderME_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_NRResponseHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_SessionRejectReason(buf, off, v):
+            _st_I.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_VarTextLen(buf, off, v):
+            _st_H.pack_into(buf, off + 60, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.NRResponseHeaderME.rstrip()
+            self.VarText = self.VarText.rstrip(b'\0')
+
+    return Reject
+
+def _mk_RejectView():
+    class RejectView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def NRResponseHeaderME(self):
+            return NRResponseHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def SessionRejectReason(self):
+            return _st_I.unpack_from(self._buf, self._off + 56)[0]
+        @property
+        def VarTextLen(self):
+            return _st_H.unpack_from(self._buf, self._off + 60)[0]
+
+        def unpack(self):
+            return Reject.create_from(self._buf, self._off)
+
+    return RejectView
+
+def _mk_Heartbeat():
+    @dataclass
+    class Heartbeat:
+        sizes = (16, 16)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(16, 10011)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID)
+            return off + 16
+        def pack(self):
+            bs = bytearray(16)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID = self.st(0).unpack_from(buf, off)
+            if strip:
+                c0.NetworkMsgID = c0.NetworkMsgID.rstrip(b'\0')
+            return off + 16
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = Heartbeat()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+
+    return Heartbeat
+
+def _mk_HeartbeatView():
+    class HeartbeatView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+
+        def unpack(self):
+            return Heartbeat.create_from(self._buf, self._off)
+
+    return HeartbeatView
+
+def _mk_UserLoginRequest():
+    @dataclass
+    class UserLoginRequest:
+        sizes = (64, 64)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(64, 10018)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+        Username: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        Password: bytes = b'' # fmt:32s, size:32, off:28
+        # PADDING=4 # fmt:4x, size:4, off:60
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xIII32s4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+            ('Username', 'I', 24),
+            ('Password', '32s', 28),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.Username, self.Password)
+            return off + 64
+        def pack(self):
+            bs = bytearray(64)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.Username, self.Password = self.st(0).unpack_from(buf, off)
+            if strip:
+                c0.NetworkMsgID, self.Password = c0.NetworkMsgID.rstrip(b'\0'), self.Password.rstrip(b'\0')
+            return off + 64
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = UserLoginRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+        @staticmethod
+        def set_Username(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_Password(buf, off, v):
+            struct.pack_into('32s', buf, off + 28, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+            self.Password = self.Password.rstrip(b'\0')
+
+    return UserLoginRequest
+
+def _mk_UserLoginRequestView():
+    class UserLoginRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+        @property
+        def Username(self):
+            return _st_I.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def Password(self):
+            return bytes(self._buf[self._off + 28:self._off + 60])
+
+        def unpack(self):
+            return UserLoginRequest.create_from(self._buf, self._off)
+
+    return UserLoginRequestView
+
+def _mk_UserLoginResponse():
+    @dataclass
+    class UserLoginResponse:
+        sizes = (32, 32)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(32, 10019)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeader: ResponseHeaderComp = field(default_factory=ResponseHeaderComp) # fmt:?, size:24, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        #    # PADDING=4 # fmt:4x, size:4, off:28
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQI4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeader', ResponseHeaderComp, 8),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum)
+            return off + 32
+        def pack(self):
+            bs = bytearray(32)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum = self.st(0).unpack_from(buf, off)
+            return off + 32
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = UserLoginResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeader_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeader_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeader.rstrip()
+
+    return UserLoginResponse
+
+def _mk_UserLoginResponseView():
+    class UserLoginResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeader(self):
+            return ResponseHeaderCompView(self._buf, self._off + 8)
+
+        def unpack(self):
+            return UserLoginResponse.create_from(self._buf, self._off)
+
+    return UserLoginResponseView
+
+def _mk_UserLogoutResponse():
+    @dataclass
+    class UserLogoutResponse:
+        sizes = (32, 32)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(32, 10024)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeader: ResponseHeaderComp = field(default_factory=ResponseHeaderComp) # fmt:?, size:24, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:24
+        #    # PADDING=4 # fmt:4x, size:4, off:28
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQI4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeader', ResponseHeaderComp, 8),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum)
+            return off + 32
+        def pack(self):
+            bs = bytearray(32)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeader
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.SendingTime, c1.MsgSeqNum = self.st(0).unpack_from(buf, off)
+            return off + 32
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = UserLogoutResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeader_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeader_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 24, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeader.rstrip()
+
+    return UserLogoutResponse
+
+def _mk_UserLogoutResponseView():
+    class UserLogoutResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeader(self):
+            return ResponseHeaderCompView(self._buf, self._off + 8)
+
+        def unpack(self):
+            return UserLogoutResponse.create_from(self._buf, self._off)
+
+    return UserLogoutResponseView
+
+def _mk_NewOrderResponse():
+    @dataclass
+    class NewOrderResponse:
+        sizes = (128, 128)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(128, 10101)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeaderME: ResponseHeaderMEComp = field(default_factory=ResponseHeaderMEComp) # fmt:?, size:64, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        #    PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:52
+        #    ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:54
+        #    ApplMsgID: bytes = b'' # fmt:16s, size:16, off:55
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:71
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:72
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:80
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:88
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:96
+        TrdRegTSEntryTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:104
+        TrdRegTSTimePriority: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:112
+        OrdStatus: int = OrdStatus(0) # i1, enum:OrdStatus, fmt:B, size:1, off:120
+        ExecType: int = ExecType(0) # i1, enum:ExecType, fmt:B, size:1, off:121
+        ExecRestatementReason: int = ExecRestatementReason(0xFFFF) # u2, enum:ExecRestatementReason, fmt:H, size:2, off:122
+        ProductComplex: int = ProductComplex(0xFF) # u1, enum:ProductComplex, fmt:B, size:1, off:124
+        # PADDING=3 # fmt:3x, size:3, off:125
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQQQQIHB16sBQQqQQQBBHB3x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeaderME', ResponseHeaderMEComp, 8),
+            ('OrderID', 'Q', 72),
+            ('ClOrdID', 'Q', 80),
+            ('SecurityID', 'q', 88),
+            ('ExecID', 'Q', 96),
+            ('TrdRegTSEntryTime', 'Q', 104),
+            ('TrdRegTSTimePriority', 'Q', 112),
+            ('OrdStatus', 'B', 120),
+            ('ExecType', 'B', 121),
+            ('ExecRestatementReason', 'H', 122),
+            ('ProductComplex', 'B', 124),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeaderME
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.PartitionID, c1.ApplID, c1.ApplMsgID, c1.LastFragment, self.OrderID, self.ClOrdID, self.SecurityID, self.ExecID, self.TrdRegTSEntryTime, self.TrdRegTSTimePriority, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex)
+            return off + 128
+        def pack(self):
+            bs = bytearray(128)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeaderME
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.PartitionID, c1.ApplID, c1.ApplMsgID, c1.LastFragment, self.OrderID, self.ClOrdID, self.SecurityID, self.ExecID, self.TrdRegTSEntryTime, self.TrdRegTSTimePriority, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.ApplID, c1.LastFragment, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex = ApplID._tab.get(c1.ApplID, c1.ApplID), LastFragment._tab.get(c1.LastFragment, c1.LastFragment), OrdStatus._tab.get(self.OrdStatus, self.OrdStatus), ExecType._tab.get(self.ExecType, self.ExecType), ExecRestatementReason._tab.get(self.ExecRestatementReason, self.ExecRestatementReason), ProductComplex._tab.get(self.ProductComplex, self.ProductComplex)
+            if strip:
+                c1.ApplMsgID = c1.ApplMsgID.rstrip(b'\0')
+            return off + 128
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = NewOrderResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeaderME_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ResponseHeaderME_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_ResponseHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_ResponseHeaderME_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_ResponseHeaderME_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 54, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 55, v)
+        @staticmethod
+        def set_ResponseHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 71, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 96, v)
+        @staticmethod
+        def set_TrdRegTSEntryTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 104, v)
+        @staticmethod
+        def set_TrdRegTSTimePriority(buf, off, v):
+            _st_Q.pack_into(buf, off + 112, v)
+        @staticmethod
+        def set_OrdStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 120, v)
+        @staticmethod
+        def set_ExecType(buf, off, v):
+            _st_B.pack_into(buf, off + 121, v)
+        @staticmethod
+        def set_ExecRestatementReason(buf, off, v):
+            _st_H.pack_into(buf, off + 122, v)
+        @staticmethod
+        def set_ProductComplex(buf, off, v):
+            _st_B.pack_into(buf, off + 124, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeaderME.rstrip()
+
+    return NewOrderResponse
+
+def _mk_NewOrderResponseView():
+    class NewOrderResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeaderME(self):
+            return ResponseHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 96)[0]
+        @property
+        def TrdRegTSEntryTime(self):
+            return _st_Q.unpack_from(self._buf, self._off + 104)[0]
+        @property
+        def TrdRegTSTimePriority(self):
+            return _st_Q.unpack_from(self._buf, self._off + 112)[0]
+        @property
+        def OrdStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 120)[0]
+        @property
+        def ExecType(self):
+            return _st_B.unpack_from(self._buf, self._off + 121)[0]
+        @property
+        def ExecRestatementReason(self):
+            return _st_H.unpack_from(self._buf, self._off + 122)[0]
+        @property
+        def ProductComplex(self):
+            return _st_B.unpack_from(self._buf, self._off + 124)[0]
+
+        def unpack(self):
+            return NewOrderResponse.create_from(self._buf, self._off)
+
+    return NewOrderResponseView
+
+def _mk_NewOrderNRResponse():
+    @dataclass
+    class NewOrderNRResponse:
+        sizes = (96, 96)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(96, 10102)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        NRResponseHeaderME: NRResponseHeaderMEComp = field(default_factory=NRResponseHeaderMEComp) # fmt:?, size:48, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:52
+        #    # PADDING=3 # fmt:3x, size:3, off:53
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:56
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:64
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:72
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:80
+        OrdStatus: int = OrdStatus(0) # i1, enum:OrdStatus, fmt:B, size:1, off:88
+        ExecType: int = ExecType(0) # i1, enum:ExecType, fmt:B, size:1, off:89
+        ExecRestatementReason: int = ExecRestatementReason(0xFFFF) # u2, enum:ExecRestatementReason, fmt:H, size:2, off:90
+        ProductComplex: int = ProductComplex(0xFF) # u1, enum:ProductComplex, fmt:B, size:1, off:92
+        # PADDING=3 # fmt:3x, size:3, off:93
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQQQQIB3xQQqQBBHB3x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('NRResponseHeaderME', NRResponseHeaderMEComp, 8),
+            ('OrderID', 'Q', 56),
+            ('ClOrdID', 'Q', 64),
+            ('SecurityID', 'q', 72),
+            ('ExecID', 'Q', 80),
+            ('OrdStatus', 'B', 88),
+            ('ExecType', 'B', 89),
+            ('ExecRestatementReason', 'H', 90),
+            ('ProductComplex', 'B', 92),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.NRResponseHeaderME
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.LastFragment, self.OrderID, self.ClOrdID, self.SecurityID, self.ExecID, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex)
+            return off + 96
+        def pack(self):
+            bs = bytearray(96)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.NRResponseHeaderME
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.LastFragment, self.OrderID, self.ClOrdID, self.SecurityID, self.ExecID, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.LastFragment, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex = LastFragment._tab.get(c1.LastFragment, c1.LastFragment), OrdStatus._tab.get(self.OrdStatus, self.OrdStatus), ExecType._tab.get(self.ExecType, self.ExecType), ExecRestatementReason._tab.get(self.ExecRestatementReason, self.ExecRestatementReason), ProductComplex._tab.get(self.ProductComplex, self.ProductComplex)
+            return off + 96
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = NewOrderNRResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_NRResponseHeaderME_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_NRResponseHeaderME_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_NRResponseHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_NRResponseHeaderME_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_NRResponseHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_NRResponseHeaderME_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_NRResponseHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 64, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_OrdStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_ExecType(buf, off, v):
+            _st_B.pack_into(buf, off + 89, v)
+        @staticmethod
+        def set_ExecRestatementReason(buf, off, v):
+            _st_H.pack_into(buf, off + 90, v)
+        @staticmethod
+        def set_ProductComplex(buf, off, v):
+            _st_B.pack_into(buf, off + 92, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.NRResponseHeaderME.rstrip()
+
+    return NewOrderNRResponse
+
+def _mk_NewOrderNRResponseView():
+    class NewOrderNRResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def NRResponseHeaderME(self):
+            return NRResponseHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 56)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 64)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def OrdStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def ExecType(self):
+            return _st_B.unpack_from(self._buf, self._off + 89)[0]
+        @property
+        def ExecRestatementReason(self):
+            return _st_H.unpack_from(self._buf, self._off + 90)[0]
+        @property
+        def ProductComplex(self):
+            return _st_B.unpack_from(self._buf, self._off + 92)[0]
+
+        def unpack(self):
+            return NewOrderNRResponse.create_from(self._buf, self._off)
+
+    return NewOrderNRResponseView
+
+def _mk_OrderExecResponse():
+    @dataclass
+    class OrderExecResponse:
+        sizes = (136, 21736)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(136, 10103)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeaderME: ResponseHeaderMEComp = field(default_factory=ResponseHeaderMEComp) # fmt:?, size:64, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        #    PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:52
+        #    ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:54
+        #    ApplMsgID: bytes = b'' # fmt:16s, size:16, off:55
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:71
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:72
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:80
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:88
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:96
+        LeavesQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:104
+        CumQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:112
+        CxlQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:120
+        NoLegExecs: int = 0 # u2, fmt:H, size:2, off:128
+        ExecRestatementReason: int = ExecRestatementReason(0xFFFF) # u2, enum:ExecRestatementReason, fmt:H, size:2, off:130
+        OrdStatus: int = OrdStatus(0) # i1, enum:OrdStatus, fmt:B, size:1, off:132
+        ExecType: int = ExecType(0) # i1, enum:ExecType, fmt:B, size:1, off:133
+        NoFills: int = 0 # u1, fmt:B, size:1, off:134
+        # PADDING=1 # fmt:1x, size:1, off:135
+        FillsGrp: [FillsGrpComp] = field(default_factory=list) # fmt:?, size:24, off:136
+        #    FillPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:136
+        #    FillQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:144
+        #    FillMatchID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:152
+        #    FillExecID: int = -2147483648 # i4, fmt:i, size:4, off:156
+        InstrmntLegExecGrp: [InstrmntLegExecGrpComp] = field(default_factory=list) # fmt:?, size:32, off:160
+        #    LegSecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:160
+        #    LegLastPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:168
+        #    LegLastQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:176
+        #    LegSide: int = LegSide(0xFF) # u1, enum:LegSide, fmt:B, size:1, off:184
+        #    # PADDING=7 # fmt:7x, size:7, off:185
+
+        def update_length(self):
+            self.MessageHeaderOut.BodyLen = 8 + 64 + 64 + self.NoFills * 24 + self.NoLegExecs * 32
+
+        fmt = ( '<?', '<?', '<QQqQQQQHHBBB1x', '<?', '<?', )
+        _struct = [ None, None, None, None, None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeaderME', ResponseHeaderMEComp, 8),
+            ('OrderID', 'Q', 72),
+            ('ClOrdID', 'Q', 80),
+            ('SecurityID', 'q', 88),
+            ('ExecID', 'Q', 96),
+            ('LeavesQty', 'Q', 104),
+            ('CumQty', 'Q', 112),
+            ('CxlQty', 'Q', 120),
+            ('NoLegExecs', 'H', 128),
+            ('ExecRestatementReason', 'H', 130),
+            ('OrdStatus', 'B', 132),
+            ('ExecType', 'B', 133),
+            ('NoFills', 'B', 134),
+        )
+        def pack_into(self, buf, off=0):
+            self.MessageHeaderOut.pack_into(buf, off)
+            self.ResponseHeaderME.pack_into(buf, off + 8)
+            self.st(2).pack_into(buf, off + 72, self.OrderID, self.ClOrdID, self.SecurityID, self.ExecID, self.LeavesQty, self.CumQty, self.CxlQty, self.NoLegExecs, self.ExecRestatementReason, self.OrdStatus, self.ExecType, self.NoFills)
+            o = off + 136
+            for v in self.FillsGrp:
+                v.pack_into(buf, o)
+                o += 24
+            for v in self.InstrmntLegExecGrp:
+                v.pack_into(buf, o)
+                o += 32
+            return o
+        def pack(self):
+            bs = bytearray(21736)
+            n = self.pack_into(bs)
+            mv = memoryview(bs)
+            return bytes(mv[:n])
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MessageHeaderOut.unpack_from(buf, off, enums, strip)
+            self.ResponseHeaderME.unpack_from(buf, off + 8, enums, strip)
+            self.OrderID, self.ClOrdID, self.SecurityID, self.ExecID, self.LeavesQty, self.CumQty, self.CxlQty, self.NoLegExecs, self.ExecRestatementReason, self.OrdStatus, self.ExecType, self.NoFills = self.st(2).unpack_from(buf, off + 72)
+            if enums:
+                self.ExecRestatementReason, self.OrdStatus, self.ExecType = ExecRestatementReason._tab.get(self.ExecRestatementReason, self.ExecRestatementReason), OrdStatus._tab.get(self.OrdStatus, self.OrdStatus), ExecType._tab.get(self.ExecType, self.ExecType)
+            o = off + 136
+            xs = self.FillsGrp
+            n = self.NoFills
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(FillsGrpComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 24
+            xs = self.InstrmntLegExecGrp
+            n = self.NoLegExecs
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(InstrmntLegExecGrpComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 32
+            return o
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderExecResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeaderME_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ResponseHeaderME_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_ResponseHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_ResponseHeaderME_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_ResponseHeaderME_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 54, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 55, v)
+        @staticmethod
+        def set_ResponseHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 71, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 96, v)
+        @staticmethod
+        def set_LeavesQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 104, v)
+        @staticmethod
+        def set_CumQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 112, v)
+        @staticmethod
+        def set_CxlQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 120, v)
+        @staticmethod
+        def set_NoLegExecs(buf, off, v):
+            _st_H.pack_into(buf, off + 128, v)
+        @staticmethod
+        def set_ExecRestatementReason(buf, off, v):
+            _st_H.pack_into(buf, off + 130, v)
+        @staticmethod
+        def set_OrdStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 132, v)
+        @staticmethod
+        def set_ExecType(buf, off, v):
+            _st_B.pack_into(buf, off + 133, v)
+        @staticmethod
+        def set_NoFills(buf, off, v):
+            _st_B.pack_into(buf, off + 134, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeaderME.rstrip()
+            for v in self.FillsGrp:
+                v.rstrip()
+            for v in self.InstrmntLegExecGrp:
+                v.rstrip()
+
+    return OrderExecResponse
+
+def _mk_OrderExecResponseView():
+    class OrderExecResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeaderME(self):
+            return ResponseHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 96)[0]
+        @property
+        def LeavesQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 104)[0]
+        @property
+        def CumQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 112)[0]
+        @property
+        def CxlQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 120)[0]
+        @property
+        def NoLegExecs(self):
+            return _st_H.unpack_from(self._buf, self._off + 128)[0]
+        @property
+        def ExecRestatementReason(self):
+            return _st_H.unpack_from(self._buf, self._off + 130)[0]
+        @property
+        def OrdStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 132)[0]
+        @property
+        def ExecType(self):
+            return _st_B.unpack_from(self._buf, self._off + 133)[0]
+        @property
+        def NoFills(self):
+            return _st_B.unpack_from(self._buf, self._off + 134)[0]
+
+        def unpack(self):
+            return OrderExecResponse.create_from(self._buf, self._off)
+
+    return OrderExecResponseView
+
+def _mk_ModifyOrderSingleRequest():
+    @dataclass
+    class ModifyOrderSingleRequest:
+        sizes = (112, 112)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(112, 10106)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        OrigClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:48
+        OrderQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:56
+        SimpleSecurityID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:64
+        MarketSegmentID: int = -2147483648 # i4, fmt:i, size:4, off:68
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:72
+        OrdType: int = OrdType(0xFF) # u1, enum:OrdType, fmt:B, size:1, off:73
+        TimeInForce: int = TimeInForce(0xFF) # u1, enum:TimeInForce, fmt:B, size:1, off:74
+        ExecInst: int = ExecInst(0xFF) # u1, enum:ExecInst, fmt:B, size:1, off:75
+        FreeText1: bytes = b'' # fmt:12s, size:12, off:76
+        FreeText2: bytes = b'' # fmt:12s, size:12, off:88
+        FreeText3: bytes = b'' # fmt:12s, size:12, off:100
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xIIQQQqQIiBBBB12s12s12s', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+            ('OrderID', 'Q', 24),
+            ('ClOrdID', 'Q', 32),
+            ('OrigClOrdID', 'Q', 40),
+            ('Price', 'q', 48),
+            ('OrderQty', 'Q', 56),
+            ('SimpleSecurityID', 'I', 64),
+            ('MarketSegmentID', 'i', 68),
+            ('Side', 'B', 72),
+            ('OrdType', 'B', 73),
+            ('TimeInForce', 'B', 74),
+            ('ExecInst', 'B', 75),
+            ('FreeText1', '12s', 76),
+            ('FreeText2', '12s', 88),
+            ('FreeText3', '12s', 100),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.Price, self.OrderQty, self.SimpleSecurityID, self.MarketSegmentID, self.Side, self.OrdType, self.TimeInForce, self.ExecInst, self.FreeText1, self.FreeText2, self.FreeText3)
+            return off + 112
+        def pack(self):
+            bs = bytearray(112)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.Price, self.OrderQty, self.SimpleSecurityID, self.MarketSegmentID, self.Side, self.OrdType, self.TimeInForce, self.ExecInst, self.FreeText1, self.FreeText2, self.FreeText3 = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.Side, self.OrdType, self.TimeInForce, self.ExecInst = Side._tab.get(self.Side, self.Side), OrdType._tab.get(self.OrdType, self.OrdType), TimeInForce._tab.get(self.TimeInForce, self.TimeInForce), ExecInst._tab.get(self.ExecInst, self.ExecInst)
+            if strip:
+                c0.NetworkMsgID, self.FreeText1, self.FreeText2, self.FreeText3 = c0.NetworkMsgID.rstrip(b'\0'), self.FreeText1.rstrip(b'\0'), self.FreeText2.rstrip(b'\0'), self.FreeText3.rstrip(b'\0')
+            return off + 112
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = ModifyOrderSingleRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_OrigClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_OrderQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_SimpleSecurityID(buf, off, v):
+            _st_I.pack_into(buf, off + 64, v)
+        @staticmethod
+        def set_MarketSegmentID(buf, off, v):
+            _st_i.pack_into(buf, off + 68, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_OrdType(buf, off, v):
+            _st_B.pack_into(buf, off + 73, v)
+        @staticmethod
+        def set_TimeInForce(buf, off, v):
+            _st_B.pack_into(buf, off + 74, v)
+        @staticmethod
+        def set_ExecInst(buf, off, v):
+            _st_B.pack_into(buf, off + 75, v)
+        @staticmethod
+        def set_FreeText1(buf, off, v):
+            struct.pack_into('12s', buf, off + 76, v)
+        @staticmethod
+        def set_FreeText2(buf, off, v):
+            struct.pack_into('12s', buf, off + 88, v)
+        @staticmethod
+        def set_FreeText3(buf, off, v):
+            struct.pack_into('12s', buf, off + 100, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+            self.FreeText1, self.FreeText2, self.FreeText3 = self.FreeText1.rstrip(b'\0'), self.FreeText2.rstrip(b'\0'), self.FreeText3.rstrip(b'\0')
+
+    return ModifyOrderSingleRequest
+
+def _mk_ModifyOrderSingleRequestView():
+    class ModifyOrderSingleRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def OrigClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def Price(self):
+            return _st_q.unpack_from(self._buf, self._off + 48)[0]
+        @property
+        def OrderQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 56)[0]
+        @property
+        def SimpleSecurityID(self):
+            return _st_I.unpack_from(self._buf, self._off + 64)[0]
+        @property
+        def MarketSegmentID(self):
+            return _st_i.unpack_from(self._buf, self._off + 68)[0]
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def OrdType(self):
+            return _st_B.unpack_from(self._buf, self._off + 73)[0]
+        @property
+        def TimeInForce(self):
+            return _st_B.unpack_from(self._buf, self._off + 74)[0]
+        @property
+        def ExecInst(self):
+            return _st_B.unpack_from(self._buf, self._off + 75)[0]
+        @property
+        def FreeText1(self):
+            return bytes(self._buf[self._off + 76:self._off + 88])
+        @property
+        def FreeText2(self):
+            return bytes(self._buf[self._off + 88:self._off + 100])
+        @property
+        def FreeText3(self):
+            return bytes(self._buf[self._off + 100:self._off + 112])
+
+        def unpack(self):
+            return ModifyOrderSingleRequest.create_from(self._buf, self._off)
+
+    return ModifyOrderSingleRequestView
+
+def _mk_ModifyOrderResponse():
+    @dataclass
+    class ModifyOrderResponse:
+        sizes = (144, 144)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(144, 10107)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeaderME: ResponseHeaderMEComp = field(default_factory=ResponseHeaderMEComp) # fmt:?, size:64, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        #    PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:52
+        #    ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:54
+        #    ApplMsgID: bytes = b'' # fmt:16s, size:16, off:55
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:71
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:72
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:80
+        OrigClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:88
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:96
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:104
+        LeavesQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:112
+        CumQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:120
+        CxlQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:128
+        OrdStatus: int = OrdStatus(0) # i1, enum:OrdStatus, fmt:B, size:1, off:136
+        ExecType: int = ExecType(0) # i1, enum:ExecType, fmt:B, size:1, off:137
+        ExecRestatementReason: int = ExecRestatementReason(0xFFFF) # u2, enum:ExecRestatementReason, fmt:H, size:2, off:138
+        # PADDING=4 # fmt:4x, size:4, off:140
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQQQQIHB16sBQQQqQQQQBBH4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeaderME', ResponseHeaderMEComp, 8),
+            ('OrderID', 'Q', 72),
+            ('ClOrdID', 'Q', 80),
+            ('OrigClOrdID', 'Q', 88),
+            ('SecurityID', 'q', 96),
+            ('ExecID', 'Q', 104),
+            ('LeavesQty', 'Q', 112),
+            ('CumQty', 'Q', 120),
+            ('CxlQty', 'Q', 128),
+            ('OrdStatus', 'B', 136),
+            ('ExecType', 'B', 137),
+            ('ExecRestatementReason', 'H', 138),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeaderME
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.PartitionID, c1.ApplID, c1.ApplMsgID, c1.LastFragment, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SecurityID, self.ExecID, self.LeavesQty, self.CumQty, self.CxlQty, self.OrdStatus, self.ExecType, self.ExecRestatementReason)
+            return off + 144
+        def pack(self):
+            bs = bytearray(144)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeaderME
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.PartitionID, c1.ApplID, c1.ApplMsgID, c1.LastFragment, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SecurityID, self.ExecID, self.LeavesQty, self.CumQty, self.CxlQty, self.OrdStatus, self.ExecType, self.ExecRestatementReason = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.ApplID, c1.LastFragment, self.OrdStatus, self.ExecType, self.ExecRestatementReason = ApplID._tab.get(c1.ApplID, c1.ApplID), LastFragment._tab.get(c1.LastFragment, c1.LastFragment), OrdStatus._tab.get(self.OrdStatus, self.OrdStatus), ExecType._tab.get(self.ExecType, self.ExecType), ExecRestatementReason._tab.get(self.ExecRestatementReason, self.ExecRestatementReason)
+            if strip:
+                c1.ApplMsgID = c1.ApplMsgID.rstrip(b'\0')
+            return off + 144
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = ModifyOrderResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeaderME_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ResponseHeaderME_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_ResponseHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_ResponseHeaderME_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_ResponseHeaderME_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 54, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 55, v)
+        @staticmethod
+        def set_ResponseHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 71, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_OrigClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 96, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 104, v)
+        @staticmethod
+        def set_LeavesQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 112, v)
+        @staticmethod
+        def set_CumQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 120, v)
+        @staticmethod
+        def set_CxlQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 128, v)
+        @staticmethod
+        def set_OrdStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 136, v)
+        @staticmethod
+        def set_ExecType(buf, off, v):
+            _st_B.pack_into(buf, off + 137, v)
+        @staticmethod
+        def set_ExecRestatementReason(buf, off, v):
+            _st_H.pack_into(buf, off + 138, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeaderME.rstrip()
+
+    return ModifyOrderResponse
+
+def _mk_ModifyOrderResponseView():
+    class ModifyOrderResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeaderME(self):
+            return ResponseHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def OrigClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 96)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 104)[0]
+        @property
+        def LeavesQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 112)[0]
+        @property
+        def CumQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 120)[0]
+        @property
+        def CxlQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 128)[0]
+        @property
+        def OrdStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 136)[0]
+        @property
+        def ExecType(self):
+            return _st_B.unpack_from(self._buf, self._off + 137)[0]
+        @property
+        def ExecRestatementReason(self):
+            return _st_H.unpack_from(self._buf, self._off + 138)[0]
+
+        def unpack(self):
+            return ModifyOrderResponse.create_from(self._buf, self._off)
+
+    return ModifyOrderResponseView
+
+def _mk_DeleteOrderSingleRequest():
+    @dataclass
+    class DeleteOrderSingleRequest:
+        sizes = (56, 56)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(56, 10109)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        OrigClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        SimpleSecurityID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        MarketSegmentID: int = -2147483648 # i4, fmt:i, size:4, off:52
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xIIQQQIi', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+            ('OrderID', 'Q', 24),
+            ('ClOrdID', 'Q', 32),
+            ('OrigClOrdID', 'Q', 40),
+            ('SimpleSecurityID', 'I', 48),
+            ('MarketSegmentID', 'i', 52),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SimpleSecurityID, self.MarketSegmentID)
+            return off + 56
+        def pack(self):
+            bs = bytearray(56)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SimpleSecurityID, self.MarketSegmentID = self.st(0).unpack_from(buf, off)
+            if strip:
+                c0.NetworkMsgID = c0.NetworkMsgID.rstrip(b'\0')
+            return off + 56
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = DeleteOrderSingleRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_OrigClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_SimpleSecurityID(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_MarketSegmentID(buf, off, v):
+            _st_i.pack_into(buf, off + 52, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+
+    return DeleteOrderSingleRequest
+
+def _mk_DeleteOrderSingleRequestView():
+    class DeleteOrderSingleRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def OrigClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def SimpleSecurityID(self):
+            return _st_I.unpack_from(self._buf, self._off + 48)[0]
+        @property
+        def MarketSegmentID(self):
+            return _st_i.unpack_from(self._buf, self._off + 52)[0]
+
+        def unpack(self):
+            return DeleteOrderSingleRequest.create_from(self._buf, self._off)
+
+    return DeleteOrderSingleRequestView
+
+def _mk_DeleteOrderResponse():
+    @dataclass
+    class DeleteOrderResponse:
+        sizes = (136, 136)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(136, 10110)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        ResponseHeaderME: ResponseHeaderMEComp = field(default_factory=ResponseHeaderMEComp) # fmt:?, size:64, off:8
+        #    RequestTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    TrdRegTSTimeIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ResponseIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:32
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:48
+        #    PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:52
+        #    ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:54
+        #    ApplMsgID: bytes = b'' # fmt:16s, size:16, off:55
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:71
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:72
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:80
+        OrigClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:88
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:96
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:104
+        CumQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:112
+        CxlQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:120
+        OrdStatus: int = OrdStatus(0) # i1, enum:OrdStatus, fmt:B, size:1, off:128
+        ExecType: int = ExecType(0) # i1, enum:ExecType, fmt:B, size:1, off:129
+        ExecRestatementReason: int = ExecRestatementReason(0xFFFF) # u2, enum:ExecRestatementReason, fmt:H, size:2, off:130
+        ProductComplex: int = ProductComplex(0xFF) # u1, enum:ProductComplex, fmt:B, size:1, off:132
+        # PADDING=3 # fmt:3x, size:3, off:133
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH2xQQQQQIHB16sBQQQqQQQBBHB3x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('ResponseHeaderME', ResponseHeaderMEComp, 8),
+            ('OrderID', 'Q', 72),
+            ('ClOrdID', 'Q', 80),
+            ('OrigClOrdID', 'Q', 88),
+            ('SecurityID', 'q', 96),
+            ('ExecID', 'Q', 104),
+            ('CumQty', 'Q', 112),
+            ('CxlQty', 'Q', 120),
+            ('OrdStatus', 'B', 128),
+            ('ExecType', 'B', 129),
+            ('ExecRestatementReason', 'H', 130),
+            ('ProductComplex', 'B', 132),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeaderME
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.PartitionID, c1.ApplID, c1.ApplMsgID, c1.LastFragment, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SecurityID, self.ExecID, self.CumQty, self.CxlQty, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex)
+            return off + 136
+        def pack(self):
+            bs = bytearray(136)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderOut
+            c1 = self.ResponseHeaderME
+            c0.BodyLen, c0.TemplateID, c1.RequestTime, c1.TrdRegTSTimeIn, c1.TrdRegTSTimeOut, c1.ResponseIn, c1.SendingTime, c1.MsgSeqNum, c1.PartitionID, c1.ApplID, c1.ApplMsgID, c1.LastFragment, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SecurityID, self.ExecID, self.CumQty, self.CxlQty, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex = self.st(0).unpack_from(buf, off)
+            if enums:
+                c1.ApplID, c1.LastFragment, self.OrdStatus, self.ExecType, self.ExecRestatementReason, self.ProductComplex = ApplID._tab.get(c1.ApplID, c1.ApplID), LastFragment._tab.get(c1.LastFragment, c1.LastFragment), OrdStatus._tab.get(self.OrdStatus, self.OrdStatus), ExecType._tab.get(self.ExecType, self.ExecType), ExecRestatementReason._tab.get(self.ExecRestatementReason, self.ExecRestatementReason), ProductComplex._tab.get(self.ProductComplex, self.ProductComplex)
+            if strip:
+                c1.ApplMsgID = c1.ApplMsgID.rstrip(b'\0')
+            return off + 136
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = DeleteOrderResponse()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_ResponseHeaderME_RequestTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_ResponseHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_ResponseHeaderME_ResponseIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_ResponseHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_ResponseHeaderME_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_ResponseHeaderME_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 52, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 54, v)
+        @staticmethod
+        def set_ResponseHeaderME_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 55, v)
+        @staticmethod
+        def set_ResponseHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 71, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_OrigClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 96, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 104, v)
+        @staticmethod
+        def set_CumQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 112, v)
+        @staticmethod
+        def set_CxlQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 120, v)
+        @staticmethod
+        def set_OrdStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 128, v)
+        @staticmethod
+        def set_ExecType(buf, off, v):
+            _st_B.pack_into(buf, off + 129, v)
+        @staticmethod
+        def set_ExecRestatementReason(buf, off, v):
+            _st_H.pack_into(buf, off + 130, v)
+        @staticmethod
+        def set_ProductComplex(buf, off, v):
+            _st_B.pack_into(buf, off + 132, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.ResponseHeaderME.rstrip()
+
+    return DeleteOrderResponse
+
+def _mk_DeleteOrderResponseView():
+    class DeleteOrderResponseView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def ResponseHeaderME(self):
+            return ResponseHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def OrigClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 96)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 104)[0]
+        @property
+        def CumQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 112)[0]
+        @property
+        def CxlQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 120)[0]
+        @property
+        def OrdStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 128)[0]
+        @property
+        def ExecType(self):
+            return _st_B.unpack_from(self._buf, self._off + 129)[0]
+        @property
+        def ExecRestatementReason(self):
+            return _st_H.unpack_from(self._buf, self._off + 130)[0]
+        @property
+        def ProductComplex(self):
+            return _st_B.unpack_from(self._buf, self._off + 132)[0]
+
+        def unpack(self):
+            return DeleteOrderResponse.create_from(self._buf, self._off)
+
+    return DeleteOrderResponseView
+
+def _mk_OrderExecReportBroadcast():
+    @dataclass
+    class OrderExecReportBroadcast:
+        sizes = (160, 21920)
+
+        MessageHeaderOut: MessageHeaderOutComp = field(default_factory=lambda : MessageHeaderOutComp(160, 10117)) # fmt:?, size:8, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    # PADDING=2 # fmt:2x, size:2, off:6
+        RBCHeaderME: RBCHeaderMEComp = field(default_factory=RBCHeaderMEComp) # fmt:?, size:56, off:8
+        #    TrdRegTSTimeOut: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:8
+        #    NotificationIn: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:16
+        #    SendingTime: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:24
+        #    ApplSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:32
+        #    PartitionID: int = 0xFFFF # u2, fmt:H, size:2, off:36
+        #    ApplMsgID: bytes = b'' # fmt:16s, size:16, off:38
+        #    ApplID: int = ApplID(0xFF) # u1, enum:ApplID, fmt:B, size:1, off:54
+        #    ApplResendFlag: int = ApplResendFlag(0xFF) # u1, enum:ApplResendFlag, fmt:B, size:1, off:55
+        #    LastFragment: int = LastFragment(0xFF) # u1, enum:LastFragment, fmt:B, size:1, off:56
+        #    # PADDING=7 # fmt:7x, size:7, off:57
+        OrderID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:64
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:72
+        OrigClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:80
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:88
+        ExecID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:96
+        LeavesQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:104
+        CumQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:112
+        CxlQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:120
+        OrderQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:128
+        Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:136
+        MarketSegmentID: int = -2147483648 # i4, fmt:i, size:4, off:144
+        NoLegExecs: int = 0 # u2, fmt:H, size:2, off:148
+        ExecRestatementReason: int = ExecRestatementReason(0xFFFF) # u2, enum:ExecRestatementReason, fmt:H, size:2, off:150
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:152
+        OrdStatus: int = OrdStatus(0) # i1, enum:OrdStatus, fmt:B, size:1, off:153
+        ExecType: int = ExecType(0) # i1, enum:ExecType, fmt:B, size:1, off:154
+        NoFills: int = 0 # u1, fmt:B, size:1, off:155
+        NoLegs: int = 0 # u1, fmt:B, size:1, off:156
+        # PADDING=3 # fmt:3x, size:3, off:157
+        LegOrdGrp: [LegOrdGrpComp] = field(default_factory=list) # fmt:?, size:8, off:160
+        #    LegPositionEffect: int = LegPositionEffect(0) # i1, enum:LegPositionEffect, fmt:B, size:1, off:160
+        #    # PADDING=7 # fmt:7x, size:7, off:161
+        FillsGrp: [FillsGrpComp] = field(default_factory=list) # fmt:?, size:24, off:168
+        #    FillPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:168
+        #    FillQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:176
+        #    FillMatchID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:184
+        #    FillExecID: int = -2147483648 # i4, fmt:i, size:4, off:188
+        InstrmntLegExecGrp: [InstrmntLegExecGrpComp] = field(default_factory=list) # fmt:?, size:32, off:192
+        #    LegSecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:192
+        #    LegLastPx: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:200
+        #    LegLastQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:208
+        #    LegSide: int = LegSide(0xFF) # u1, enum:LegSide, fmt:B, size:1, off:216
+        #    # PADDING=7 # fmt:7x, size:7, off:217
+
+        def update_length(self):
+            self.MessageHeaderOut.BodyLen = 8 + 56 + 96 + self.NoLegs * 8 + self.NoFills * 24 + self.NoLegExecs * 32
+
+        fmt = ( '<?', '<?', '<QQQqQQQQQqiHHBBBBB3x', '<?', '<?', '<?', )
+        _struct = [ None, None, None, None, None, None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderOut', MessageHeaderOutComp, 0),
+            ('RBCHeaderME', RBCHeaderMEComp, 8),
+            ('OrderID', 'Q', 64),
+            ('ClOrdID', 'Q', 72),
+            ('OrigClOrdID', 'Q', 80),
+            ('SecurityID', 'q', 88),
+            ('ExecID', 'Q', 96),
+            ('LeavesQty', 'Q', 104),
+            ('CumQty', 'Q', 112),
+            ('CxlQty', 'Q', 120),
+            ('OrderQty', 'Q', 128),
+            ('Price', 'q', 136),
+            ('MarketSegmentID', 'i', 144),
+            ('NoLegExecs', 'H', 148),
+            ('ExecRestatementReason', 'H', 150),
+            ('Side', 'B', 152),
+            ('OrdStatus', 'B', 153),
+            ('ExecType', 'B', 154),
+            ('NoFills', 'B', 155),
+            ('NoLegs', 'B', 156),
+        )
+        def pack_into(self, buf, off=0):
+            self.MessageHeaderOut.pack_into(buf, off)
+            self.RBCHeaderME.pack_into(buf, off + 8)
+            self.st(2).pack_into(buf, off + 64, self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SecurityID, self.ExecID, self.LeavesQty, self.CumQty, self.CxlQty, self.OrderQty, self.Price, self.MarketSegmentID, self.NoLegExecs, self.ExecRestatementReason, self.Side, self.OrdStatus, self.ExecType, self.NoFills, self.NoLegs)
+            o = off + 160
+            for v in self.LegOrdGrp:
+                v.pack_into(buf, o)
+                o += 8
+            for v in self.FillsGrp:
+                v.pack_into(buf, o)
+                o += 24
+            for v in self.InstrmntLegExecGrp:
+                v.pack_into(buf, o)
+                o += 32
+            return o
+        def pack(self):
+            bs = bytearray(21920)
+            n = self.pack_into(bs)
+            mv = memoryview(bs)
+            return bytes(mv[:n])
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            self.MessageHeaderOut.unpack_from(buf, off, enums, strip)
+            self.RBCHeaderME.unpack_from(buf, off + 8, enums, strip)
+            self.OrderID, self.ClOrdID, self.OrigClOrdID, self.SecurityID, self.ExecID, self.LeavesQty, self.CumQty, self.CxlQty, self.OrderQty, self.Price, self.MarketSegmentID, self.NoLegExecs, self.ExecRestatementReason, self.Side, self.OrdStatus, self.ExecType, self.NoFills, self.NoLegs = self.st(2).unpack_from(buf, off + 64)
+            if enums:
+                self.ExecRestatementReason, self.Side, self.OrdStatus, self.ExecType = ExecRestatementReason._tab.get(self.ExecRestatementReason, self.ExecRestatementReason), Side._tab.get(self.Side, self.Side), OrdStatus._tab.get(self.OrdStatus, self.OrdStatus), ExecType._tab.get(self.ExecType, self.ExecType)
+            o = off + 160
+            xs = self.LegOrdGrp
+            n = self.NoLegs
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(LegOrdGrpComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 8
+            xs = self.FillsGrp
+            n = self.NoFills
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(FillsGrpComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 24
+            xs = self.InstrmntLegExecGrp
+            n = self.NoLegExecs
+            del xs[n:]
+            while len(xs) < n:
+                xs.append(InstrmntLegExecGrpComp())
+            for v in xs:
+                v.unpack_from(buf, o, enums, strip)
+                o += 32
+            return o
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = OrderExecReportBroadcast()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderOut_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderOut_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_RBCHeaderME_TrdRegTSTimeOut(buf, off, v):
+            _st_Q.pack_into(buf, off + 8, v)
+        @staticmethod
+        def set_RBCHeaderME_NotificationIn(buf, off, v):
+            _st_Q.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RBCHeaderME_SendingTime(buf, off, v):
+            _st_Q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_RBCHeaderME_ApplSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_RBCHeaderME_PartitionID(buf, off, v):
+            _st_H.pack_into(buf, off + 36, v)
+        @staticmethod
+        def set_RBCHeaderME_ApplMsgID(buf, off, v):
+            struct.pack_into('16s', buf, off + 38, v)
+        @staticmethod
+        def set_RBCHeaderME_ApplID(buf, off, v):
+            _st_B.pack_into(buf, off + 54, v)
+        @staticmethod
+        def set_RBCHeaderME_ApplResendFlag(buf, off, v):
+            _st_B.pack_into(buf, off + 55, v)
+        @staticmethod
+        def set_RBCHeaderME_LastFragment(buf, off, v):
+            _st_B.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_OrderID(buf, off, v):
+            _st_Q.pack_into(buf, off + 64, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_OrigClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_ExecID(buf, off, v):
+            _st_Q.pack_into(buf, off + 96, v)
+        @staticmethod
+        def set_LeavesQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 104, v)
+        @staticmethod
+        def set_CumQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 112, v)
+        @staticmethod
+        def set_CxlQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 120, v)
+        @staticmethod
+        def set_OrderQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 128, v)
+        @staticmethod
+        def set_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 136, v)
+        @staticmethod
+        def set_MarketSegmentID(buf, off, v):
+            _st_i.pack_into(buf, off + 144, v)
+        @staticmethod
+        def set_NoLegExecs(buf, off, v):
+            _st_H.pack_into(buf, off + 148, v)
+        @staticmethod
+        def set_ExecRestatementReason(buf, off, v):
+            _st_H.pack_into(buf, off + 150, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 152, v)
+        @staticmethod
+        def set_OrdStatus(buf, off, v):
+            _st_B.pack_into(buf, off + 153, v)
+        @staticmethod
+        def set_ExecType(buf, off, v):
+            _st_B.pack_into(buf, off + 154, v)
+        @staticmethod
+        def set_NoFills(buf, off, v):
+            _st_B.pack_into(buf, off + 155, v)
+        @staticmethod
+        def set_NoLegs(buf, off, v):
+            _st_B.pack_into(buf, off + 156, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderOut.rstrip()
+            self.RBCHeaderME.rstrip()
+            for v in self.LegOrdGrp:
+                v.rstrip()
+            for v in self.FillsGrp:
+                v.rstrip()
+            for v in self.InstrmntLegExecGrp:
+                v.rstrip()
+
+    return OrderExecReportBroadcast
+
+def _mk_OrderExecReportBroadcastView():
+    class OrderExecReportBroadcastView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderOut(self):
+            return MessageHeaderOutCompView(self._buf, self._off)
+        @property
+        def RBCHeaderME(self):
+            return RBCHeaderMECompView(self._buf, self._off + 8)
+        @property
+        def OrderID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 64)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def OrigClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def ExecID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 96)[0]
+        @property
+        def LeavesQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 104)[0]
+        @property
+        def CumQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 112)[0]
+        @property
+        def CxlQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 120)[0]
+        @property
+        def OrderQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 128)[0]
+        @property
+        def Price(self):
+            return _st_q.unpack_from(self._buf, self._off + 136)[0]
+        @property
+        def MarketSegmentID(self):
+            return _st_i.unpack_from(self._buf, self._off + 144)[0]
+        @property
+        def NoLegExecs(self):
+            return _st_H.unpack_from(self._buf, self._off + 148)[0]
+        @property
+        def ExecRestatementReason(self):
+            return _st_H.unpack_from(self._buf, self._off + 150)[0]
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 152)[0]
+        @property
+        def OrdStatus(self):
+            return _st_B.unpack_from(self._buf, self._off + 153)[0]
+        @property
+        def ExecType(self):
+            return _st_B.unpack_from(self._buf, self._off + 154)[0]
+        @property
+        def NoFills(self):
+            return _st_B.unpack_from(self._buf, self._off + 155)[0]
+        @property
+        def NoLegs(self):
+            return _st_B.unpack_from(self._buf, self._off + 156)[0]
+
+        def unpack(self):
+            return OrderExecReportBroadcast.create_from(self._buf, self._off)
+
+    return OrderExecReportBroadcastView
+
+def _mk_DeleteAllOrderRequest():
+    @dataclass
+    class DeleteAllOrderRequest:
+        sizes = (48, 48)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(48, 10120)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+        SecurityID: int = -9223372036854775808 # i8, fmt:q, size:8, off:24
+        MarketSegmentID: int = -2147483648 # i4, fmt:i, size:4, off:32
+        TargetPartyIDSessionID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:36
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:40
+        # PADDING=7 # fmt:7x, size:7, off:41
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xIIqiIB7x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+            ('SecurityID', 'q', 24),
+            ('MarketSegmentID', 'i', 32),
+            ('TargetPartyIDSessionID', 'I', 36),
+            ('Side', 'B', 40),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.SecurityID, self.MarketSegmentID, self.TargetPartyIDSessionID, self.Side)
+            return off + 48
+        def pack(self):
+            bs = bytearray(48)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.SecurityID, self.MarketSegmentID, self.TargetPartyIDSessionID, self.Side = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.Side = Side._tab.get(self.Side, self.Side)
+            if strip:
+                c0.NetworkMsgID = c0.NetworkMsgID.rstrip(b'\0')
+            return off + 48
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = DeleteAllOrderRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+        @staticmethod
+        def set_SecurityID(buf, off, v):
+            _st_q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_MarketSegmentID(buf, off, v):
+            _st_i.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_TargetPartyIDSessionID(buf, off, v):
+            _st_I.pack_into(buf, off + 36, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 40, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+
+    return DeleteAllOrderRequest
+
+def _mk_DeleteAllOrderRequestView():
+    class DeleteAllOrderRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+        @property
+        def SecurityID(self):
+            return _st_q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def MarketSegmentID(self):
+            return _st_i.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def TargetPartyIDSessionID(self):
+            return _st_I.unpack_from(self._buf, self._off + 36)[0]
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 40)[0]
+
+        def unpack(self):
+            return DeleteAllOrderRequest.create_from(self._buf, self._off)
+
+    return DeleteAllOrderRequestView
+
+def _mk_NewOrderSingleShortRequest():
+    @dataclass
+    class NewOrderSingleShortRequest:
+        sizes = (96, 96)
+
+        MessageHeaderIn: MessageHeaderInComp = field(default_factory=lambda : MessageHeaderInComp(96, 10125)) # fmt:?, size:16, off:0
+        #    BodyLen: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:0
+        #    TemplateID: int = 0xFFFF # u2, fmt:H, size:2, off:4
+        #    NetworkMsgID: bytes = b'' # fmt:8s, size:8, off:6
+        #    # PADDING=2 # fmt:2x, size:2, off:14
+        RequestHeader: RequestHeaderComp = field(default_factory=RequestHeaderComp) # fmt:?, size:8, off:16
+        #    MsgSeqNum: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:16
+        #    SenderSubID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:20
+        Price: int = -9223372036854775808 # i8, scale:8, fmt:q, size:8, off:24
+        OrderQty: int = 0xFFFFFFFFFFFFFFFF # u8, scale:4, fmt:Q, size:8, off:32
+        ClOrdID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:40
+        PartyIdClientID: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:48
+        PartyIdInvestmentDecisionMaker: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:56
+        ExecutingTrader: int = 0xFFFFFFFFFFFFFFFF # u8, fmt:Q, size:8, off:64
+        SimpleSecurityID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:72
+        MatchInstCrossID: int = 0xFFFFFFFF # u4, fmt:I, size:4, off:76
+        EnrichmentRuleID: int = 0xFFFF # u2, fmt:H, size:2, off:80
+        Side: int = Side(0xFF) # u1, enum:Side, fmt:B, size:1, off:82
+        ApplSeqIndicator: int = ApplSeqIndicator(0xFF) # u1, enum:ApplSeqIndicator, fmt:B, size:1, off:83
+        PriceValidityCheckType: int = PriceValidityCheckType(0xFF) # u1, enum:PriceValidityCheckType, fmt:B, size:1, off:84
+        ValueCheckTypeValue: int = ValueCheckTypeValue(0xFF) # u1, enum:ValueCheckTypeValue, fmt:B, size:1, off:85
+        OrderAttributeLiquidityProvision: int = OrderAttributeLiquidityProvision(0xFF) # u1, enum:OrderAttributeLiquidityProvision, fmt:B, size:1, off:86
+        TimeInForce: int = TimeInForce(0xFF) # u1, enum:TimeInForce, fmt:B, size:1, off:87
+        ExecInst: int = ExecInst(0xFF) # u1, enum:ExecInst, fmt:B, size:1, off:88
+        TradingCapacity: int = TradingCapacity(0xFF) # u1, enum:TradingCapacity, fmt:B, size:1, off:89
+        PartyIdInvestmentDecisionMakerQualifier: int = PartyIdInvestmentDecisionMakerQualifier(0xFF) # u1, enum:PartyIdInvestmentDecisionMakerQualifier, fmt:B, size:1, off:90
+        ExecutingTraderQualifier: int = ExecutingTraderQualifier(0xFF) # u1, enum:ExecutingTraderQualifier, fmt:B, size:1, off:91
+        # PADDING=4 # fmt:4x, size:4, off:92
+
+        def update_length(self):
+            pass
+
+        fmt = ( '<IH8s2xIIqQQQQQIIHBBBBBBBBBB4x', )
+        _struct = [ None ]
+
+        @classmethod
+        def st(cls, i):
+            if cls._struct[i] is None:
+                cls._struct[i] = struct.Struct(cls.fmt[i])
+            return cls._struct[i]
+
+        layout = (
+            ('MessageHeaderIn', MessageHeaderInComp, 0),
+            ('RequestHeader', RequestHeaderComp, 16),
+            ('Price', 'q', 24),
+            ('OrderQty', 'Q', 32),
+            ('ClOrdID', 'Q', 40),
+            ('PartyIdClientID', 'Q', 48),
+            ('PartyIdInvestmentDecisionMaker', 'Q', 56),
+            ('ExecutingTrader', 'Q', 64),
+            ('SimpleSecurityID', 'I', 72),
+            ('MatchInstCrossID', 'I', 76),
+            ('EnrichmentRuleID', 'H', 80),
+            ('Side', 'B', 82),
+            ('ApplSeqIndicator', 'B', 83),
+            ('PriceValidityCheckType', 'B', 84),
+            ('ValueCheckTypeValue', 'B', 85),
+            ('OrderAttributeLiquidityProvision', 'B', 86),
+            ('TimeInForce', 'B', 87),
+            ('ExecInst', 'B', 88),
+            ('TradingCapacity', 'B', 89),
+            ('PartyIdInvestmentDecisionMakerQualifier', 'B', 90),
+            ('ExecutingTraderQualifier', 'B', 91),
+        )
+        _dtype = None
+
+        @classmethod
+        def dtype(cls):
+            if cls._dtype is None:
+                cls._dtype = _make_dtype(cls)
+            return cls._dtype
+
+        @classmethod
+        def unpack_many(cls, buf, offsets):
+            return _unpack_many(cls, buf, offsets)
+        def pack_into(self, buf, off=0):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            self.st(0).pack_into(buf, off, c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.Price, self.OrderQty, self.ClOrdID, self.PartyIdClientID, self.PartyIdInvestmentDecisionMaker, self.ExecutingTrader, self.SimpleSecurityID, self.MatchInstCrossID, self.EnrichmentRuleID, self.Side, self.ApplSeqIndicator, self.PriceValidityCheckType, self.ValueCheckTypeValue, self.OrderAttributeLiquidityProvision, self.TimeInForce, self.ExecInst, self.TradingCapacity, self.PartyIdInvestmentDecisionMakerQualifier, self.ExecutingTraderQualifier)
+            return off + 96
+        def pack(self):
+            bs = bytearray(96)
+            self.pack_into(bs)
+            return bytes(bs)
+
+        def unpack_from(self, buf, off=0, enums=True, strip=False):
+            c0 = self.MessageHeaderIn
+            c1 = self.RequestHeader
+            c0.BodyLen, c0.TemplateID, c0.NetworkMsgID, c1.MsgSeqNum, c1.SenderSubID, self.Price, self.OrderQty, self.ClOrdID, self.PartyIdClientID, self.PartyIdInvestmentDecisionMaker, self.ExecutingTrader, self.SimpleSecurityID, self.MatchInstCrossID, self.EnrichmentRuleID, self.Side, self.ApplSeqIndicator, self.PriceValidityCheckType, self.ValueCheckTypeValue, self.OrderAttributeLiquidityProvision, self.TimeInForce, self.ExecInst, self.TradingCapacity, self.PartyIdInvestmentDecisionMakerQualifier, self.ExecutingTraderQualifier = self.st(0).unpack_from(buf, off)
+            if enums:
+                self.Side, self.ApplSeqIndicator, self.PriceValidityCheckType, self.ValueCheckTypeValue, self.OrderAttributeLiquidityProvision, self.TimeInForce, self.ExecInst, self.TradingCapacity, self.PartyIdInvestmentDecisionMakerQualifier, self.ExecutingTraderQualifier = Side._tab.get(self.Side, self.Side), ApplSeqIndicator._tab.get(self.ApplSeqIndicator, self.ApplSeqIndicator), PriceValidityCheckType._tab.get(self.PriceValidityCheckType, self.PriceValidityCheckType), ValueCheckTypeValue._tab.get(self.ValueCheckTypeValue, self.ValueCheckTypeValue), OrderAttributeLiquidityProvision._tab.get(self.OrderAttributeLiquidityProvision, self.OrderAttributeLiquidityProvision), TimeInForce._tab.get(self.TimeInForce, self.TimeInForce), ExecInst._tab.get(self.ExecInst, self.ExecInst), TradingCapacity._tab.get(self.TradingCapacity, self.TradingCapacity), PartyIdInvestmentDecisionMakerQualifier._tab.get(self.PartyIdInvestmentDecisionMakerQualifier, self.PartyIdInvestmentDecisionMakerQualifier), ExecutingTraderQualifier._tab.get(self.ExecutingTraderQualifier, self.ExecutingTraderQualifier)
+            if strip:
+                c0.NetworkMsgID = c0.NetworkMsgID.rstrip(b'\0')
+            return off + 96
+        @staticmethod
+        def create_from(buf, off=0, enums=True, strip=False):
+            obj = NewOrderSingleShortRequest()
+            obj.unpack_from(buf, off, enums, strip)
+            return obj
+
+        @staticmethod
+        def set_MessageHeaderIn_BodyLen(buf, off, v):
+            _st_I.pack_into(buf, off, v)
+        @staticmethod
+        def set_MessageHeaderIn_TemplateID(buf, off, v):
+            _st_H.pack_into(buf, off + 4, v)
+        @staticmethod
+        def set_MessageHeaderIn_NetworkMsgID(buf, off, v):
+            struct.pack_into('8s', buf, off + 6, v)
+        @staticmethod
+        def set_RequestHeader_MsgSeqNum(buf, off, v):
+            _st_I.pack_into(buf, off + 16, v)
+        @staticmethod
+        def set_RequestHeader_SenderSubID(buf, off, v):
+            _st_I.pack_into(buf, off + 20, v)
+        @staticmethod
+        def set_Price(buf, off, v):
+            _st_q.pack_into(buf, off + 24, v)
+        @staticmethod
+        def set_OrderQty(buf, off, v):
+            _st_Q.pack_into(buf, off + 32, v)
+        @staticmethod
+        def set_ClOrdID(buf, off, v):
+            _st_Q.pack_into(buf, off + 40, v)
+        @staticmethod
+        def set_PartyIdClientID(buf, off, v):
+            _st_Q.pack_into(buf, off + 48, v)
+        @staticmethod
+        def set_PartyIdInvestmentDecisionMaker(buf, off, v):
+            _st_Q.pack_into(buf, off + 56, v)
+        @staticmethod
+        def set_ExecutingTrader(buf, off, v):
+            _st_Q.pack_into(buf, off + 64, v)
+        @staticmethod
+        def set_SimpleSecurityID(buf, off, v):
+            _st_I.pack_into(buf, off + 72, v)
+        @staticmethod
+        def set_MatchInstCrossID(buf, off, v):
+            _st_I.pack_into(buf, off + 76, v)
+        @staticmethod
+        def set_EnrichmentRuleID(buf, off, v):
+            _st_H.pack_into(buf, off + 80, v)
+        @staticmethod
+        def set_Side(buf, off, v):
+            _st_B.pack_into(buf, off + 82, v)
+        @staticmethod
+        def set_ApplSeqIndicator(buf, off, v):
+            _st_B.pack_into(buf, off + 83, v)
+        @staticmethod
+        def set_PriceValidityCheckType(buf, off, v):
+            _st_B.pack_into(buf, off + 84, v)
+        @staticmethod
+        def set_ValueCheckTypeValue(buf, off, v):
+            _st_B.pack_into(buf, off + 85, v)
+        @staticmethod
+        def set_OrderAttributeLiquidityProvision(buf, off, v):
+            _st_B.pack_into(buf, off + 86, v)
+        @staticmethod
+        def set_TimeInForce(buf, off, v):
+            _st_B.pack_into(buf, off + 87, v)
+        @staticmethod
+        def set_ExecInst(buf, off, v):
+            _st_B.pack_into(buf, off + 88, v)
+        @staticmethod
+        def set_TradingCapacity(buf, off, v):
+            _st_B.pack_into(buf, off + 89, v)
+        @staticmethod
+        def set_PartyIdInvestmentDecisionMakerQualifier(buf, off, v):
+            _st_B.pack_into(buf, off + 90, v)
+        @staticmethod
+        def set_ExecutingTraderQualifier(buf, off, v):
+            _st_B.pack_into(buf, off + 91, v)
+
+        def __setattr__(self, k, v): 
+            if k not in self.__annotations__: 
+                raise AttributeError(f'{self.__class__.__name__} dataclass has no field {k}')
+            super().__setattr__(k, v)
+        def rstrip(self):
+            self.MessageHeaderIn.rstrip()
+            self.RequestHeader.rstrip()
+
+    return NewOrderSingleShortRequest
+
+def _mk_NewOrderSingleShortRequestView():
+    class NewOrderSingleShortRequestView:
+        __slots__ = ('_buf', '_off')
+
+        def __init__(self, buf, off=0):
+            self._buf = buf
+            self._off = off
+
+        @property
+        def MessageHeaderIn(self):
+            return MessageHeaderInCompView(self._buf, self._off)
+        @property
+        def RequestHeader(self):
+            return RequestHeaderCompView(self._buf, self._off + 16)
+        @property
+        def Price(self):
+            return _st_q.unpack_from(self._buf, self._off + 24)[0]
+        @property
+        def OrderQty(self):
+            return _st_Q.unpack_from(self._buf, self._off + 32)[0]
+        @property
+        def ClOrdID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 40)[0]
+        @property
+        def PartyIdClientID(self):
+            return _st_Q.unpack_from(self._buf, self._off + 48)[0]
+        @property
+        def PartyIdInvestmentDecisionMaker(self):
+            return _st_Q.unpack_from(self._buf, self._off + 56)[0]
+        @property
+        def ExecutingTrader(self):
+            return _st_Q.unpack_from(self._buf, self._off + 64)[0]
+        @property
+        def SimpleSecurityID(self):
+            return _st_I.unpack_from(self._buf, self._off + 72)[0]
+        @property
+        def MatchInstCrossID(self):
+            return _st_I.unpack_from(self._buf, self._off + 76)[0]
+        @property
+        def EnrichmentRuleID(self):
+            return _st_H.unpack_from(self._buf, self._off + 80)[0]
+        @property
+        def Side(self):
+            return _st_B.unpack_from(self._buf, self._off + 82)[0]
+        @property
+        def ApplSeqIndicator(self):
+            return _st_B.unpack_from(self._buf, self._off + 83)[0]
+        @property
+        def PriceValidityCheckType(self):
+            return _st_B.unpack_from(self._buf, self._off + 84)[0]
+        @property
+        def ValueCheckTypeValue(self):
+            return _st_B.unpack_from(self._buf, self._off + 85)[0]
+        @property
+        def OrderAttributeLiquidityProvision(self):
+            return _st_B.unpack_from(self._buf, self._off + 86)[0]
+        @property
+        def TimeInForce(self):
+            return _st_B.unpack_from(self._buf, self._off + 87)[0]
+        @property
+        def ExecInst(self):
+            return _st_B.unpack_from(self._buf, self._off + 88)[0]
+        @property
+        def TradingCapacity(self):
+            return _st_B.unpack_from(self._buf, self._off + 89)[0]
+        @property
+        def PartyIdInvestmentDecisionMakerQualifier(self):
+            return _st_B.unpack_from(self._buf, self._off + 90)[0]
+        @property
+        def ExecutingTraderQualifier(self):
+            return _st_B.unpack_from(self._buf, self._off + 91)[0]
+
+        def unpack(self):
+            return NewOrderSingleShortRequest.create_from(self._buf, self._off)
+
+    return NewOrderSingleShortRequestView
+
+_tid2name = (
+              'LogonRequest', # 10000
+              'LogonResponse', # 10001
+              'LogoutRequest', # 10002
+              'LogoutResponse', # 10003
+              None, # 10004
+              None, # 10005
+              None, # 10006
+              None, # 10007
+              None, # 10008
+              None, # 10009
+              'Reject', # 10010
+              'Heartbeat', # 10011
+              None, # 10012
+              None, # 10013
+              None, # 10014
+              None, # 10015
+              None, # 10016
+              None, # 10017
+              'UserLoginRequest', # 10018
+              'UserLoginResponse', # 10019
+              None, # 10020
+              None, # 10021
+              None, # 10022
+              None, # 10023
+              'UserLogoutResponse', # 10024
+              None, # 10025
+              None, # 10026
+              None, # 10027
+              None, # 10028
+              None, # 10029
+              None, # 10030
+              None, # 10031
+              None, # 10032
+              None, # 10033
+              None, # 10034
+              None, # 10035
+              None, # 10036
+              None, # 10037
+              None, # 10038
+              None, # 10039
+              None, # 10040
+              None, # 10041
+              None, # 10042
+              None, # 10043
+              None, # 10044
+              None, # 10045
+              None, # 10046
+              None, # 10047
+              None, # 10048
+              None, # 10049
+              None, # 10050
+              None, # 10051
+              None, # 10052
+              None, # 10053
+              None, # 10054
+              None, # 10055
+              None, # 10056
+              None, # 10057
+              None, # 10058
+              None, # 10059
+              None, # 10060
+              None, # 10061
+              None, # 10062
+              None, # 10063
+              None, # 10064
+              None, # 10065
+              None, # 10066
+              None, # 10067
+              None, # 10068
+              None, # 10069
+              None, # 10070
+              None, # 10071
+              None, # 10072
+              None, # 10073
+              None, # 10074
+              None, # 10075
+              None, # 10076
+              None, # 10077
+              None, # 10078
+              None, # 10079
+              None, # 10080
+              None, # 10081
+              None, # 10082
+              None, # 10083
+              None, # 10084
+              None, # 10085
+              None, # 10086
+              None, # 10087
+              None, # 10088
+              None, # 10089
+              None, # 10090
+              None, # 10091
+              None, # 10092
+              None, # 10093
+              None, # 10094
+              None, # 10095
+              None, # 10096
+              None, # 10097
+              None, # 10098
+              None, # 10099
+              None, # 10100
+              'NewOrderResponse', # 10101
+              'NewOrderNRResponse', # 10102
+              'OrderExecResponse', # 10103
+              None, # 10104
+              None, # 10105
+              'ModifyOrderSingleRequest', # 10106
+              'ModifyOrderResponse', # 10107
+              None, # 10108
+              'DeleteOrderSingleRequest', # 10109
+              'DeleteOrderResponse', # 10110
+              None, # 10111
+              None, # 10112
+              None, # 10113
+              None, # 10114
+              None, # 10115
+              None, # 10116
+              'OrderExecReportBroadcast', # 10117
+              None, # 10118
+              None, # 10119
+              'DeleteAllOrderRequest', # 10120
+              None, # 10121
+              None, # 10122
+              None, # 10123
+              None, # 10124
+              'NewOrderSingleShortRequest', # 10125
+)
+
+_tid2class = [ None ] * 126
+_tid2view  = [ None ] * 126
+
+def _mk_tid2class():
+    for i, name in enumerate(_tid2name):
+        if name is not None and _tid2class[i] is None:
+            _tid2class[i] = __getattr__(name)
+    return _tid2class
+
+def _mk_tid2view():
+    for i, name in enumerate(_tid2name):
+        if name is not None and _tid2view[i] is None:
+            _tid2view[i] = __getattr__(name + 'View')
+    return _tid2view
+
+# i.e. the BodyLen of each fixed size template (indexed by template ID),
+# 0 for unknown and variable size templates
+tid2size = (
+              280, # 10000
+              88, # 10001
+              24, # 10002
+              32, # 10003
+              0, # 10004
+              0, # 10005
+              0, # 10006
+              0, # 10007
+              0, # 10008
+              0, # 10009
+              0, # 10010
+              16, # 10011
+              0, # 10012
+              0, # 10013
+              0, # 10014
+              0, # 10015
+              0, # 10016
+              0, # 10017
+              64, # 10018
+              32, # 10019
+              0, # 10020
+              0, # 10021
+              0, # 10022
+              0, # 10023
+              32, # 10024
+              0, # 10025
+              0, # 10026
+              0, # 10027
+              0, # 10028
+              0, # 10029
+              0, # 10030
+              0, # 10031
+              0, # 10032
+              0, # 10033
+              0, # 10034
+              0, # 10035
+              0, # 10036
+              0, # 10037
+              0, # 10038
+              0, # 10039
+              0, # 10040
+              0, # 10041
+              0, # 10042
+              0, # 10043
+              0, # 10044
+              0, # 10045
+              0, # 10046
+              0, # 10047
+              0, # 10048
+              0, # 10049
+              0, # 10050
+              0, # 10051
+              0, # 10052
+              0, # 10053
+              0, # 10054
+              0, # 10055
+              0, # 10056
+              0, # 10057
+              0, # 10058
+              0, # 10059
+              0, # 10060
+              0, # 10061
+              0, # 10062
+              0, # 10063
+              0, # 10064
+              0, # 10065
+              0, # 10066
+              0, # 10067
+              0, # 10068
+              0, # 10069
+              0, # 10070
+              0, # 10071
+              0, # 10072
+              0, # 10073
+              0, # 10074
+              0, # 10075
+              0, # 10076
+              0, # 10077
+              0, # 10078
+              0, # 10079
+              0, # 10080
+              0, # 10081
+              0, # 10082
+              0, # 10083
+              0, # 10084
+              0, # 10085
+              0, # 10086
+              0, # 10087
+              0, # 10088
+              0, # 10089
+              0, # 10090
+              0, # 10091
+              0, # 10092
+              0, # 10093
+              0, # 10094
+              0, # 10095
+              0, # 10096
+              0, # 10097
+              0, # 10098
+              0, # 10099
+              0, # 10100
+              128, # 10101
+              96, # 10102
+              0, # 10103
+              0, # 10104
+              0, # 10105
+              112, # 10106
+              144, # 10107
+              0, # 10108
+              56, # 10109
+              136, # 10110
+              0, # 10111
+              0, # 10112
+              0, # 10113
+              0, # 10114
+              0, # 10115
+              0, # 10116
+              0, # 10117
+              0, # 10118
+              0, # 10119
+              48, # 10120
+              0, # 10121
+              0, # 10122
+              0, # 10123
+              0, # 10124
+              96, # 10125
+)
+
+tid_st = struct.Struct('<4xH')
+header_st = struct.Struct('<IH')
+
+# i.e. returns (BodyLen, TemplateID) without unpacking anything else
+def peek_header(bs, off=0):
+    return header_st.unpack_from(bs, off)
+
+class UnpackError(Exception):
+    pass
+
+# i.e. yields (TemplateID, offset, BodyLen) of each message in bs
+# (e.g. a packet) without unpacking them, where the BodyLen of fixed
+# size templates is checked against tid2size
+def iter_messages(bs, off=0):
+    end = len(bs)
+    while off < end:
+        n, tid = header_st.unpack_from(bs, off)
+        i = tid - 10000
+        if i < 0 or i >= 126:
+            raise UnpackError(f'template ID out of range: {tid} not in [10000..10125]')
+        k = tid2size[i]
+        if (n != k if k else n < header_st.size) or off + n > end:
+            raise UnpackError(f'invalid BodyLen {n} of template {tid} at offset {off}')
+        yield tid, off, n
+        off += n
+
+def _template(tid, suffix=''):
+    name = _tid2name[tid-10000]
+    if name is None:
+        raise UnpackError(f'unknown template ID: {tid}')
+    return __getattr__(name + suffix)
+
+def unpack_from(bs, off=0, enums=True, strip=False):
+    tid = tid_st.unpack_from(bs, off)[0]
+    if tid < 10000 or tid  > 10125:
+        raise UnpackError(f'template ID out of range: {tid} not in [10000..10125]')
+    c = _tid2class[tid-10000]
+    if c is None:
+        c = _tid2class[tid-10000] = _template(tid)
+    return c.create_from(bs, off, enums, strip)
+
+# i.e. unpacks into a pool of reusable objects per template, instead of
+# creating new ones, such that the returned object is only valid until
+# pool_size other messages of the same template were unpacked
+class Decoder:
+    def __init__(self, pool_size=1, enums=True, strip=False):
+        self.pool_size = pool_size
+        self.enums = enums
+        self.strip = strip
+        self._pools = [ None ] * 126
+        self._next = [ 0 ] * 126
+
+    def unpack_from(self, bs, off=0):
+        tid = tid_st.unpack_from(bs, off)[0]
+        if tid < 10000 or tid  > 10125:
+            raise UnpackError(f'template ID out of range: {tid} not in [10000..10125]')
+        i = tid - 10000
+        p = self._pools[i]
+        if p is None:
+            c = _template(tid)
+            p = self._pools[i] = [ c() for _ in range(self.pool_size) ]
+        j = self._next[i]
+        self._next[i] = (j + 1) % self.pool_size
+        x = p[j]
+        x.unpack_from(bs, off, self.enums, self.strip)
+        return x
+
+def view_from(bs, off=0):
+    tid = tid_st.unpack_from(bs, off)[0]
+    if tid < 10000 or tid  > 10125:
+        raise UnpackError(f'template ID out of range: {tid} not in [10000..10125]')
+    c = _tid2view[tid-10000]
+    if c is None:
+        c = _tid2view[tid-10000] = _template(tid, 'View')
+    return c(bs, off)
+
+# i.e. all messages at the offsets must have the same template ID
+def unpack_many(bs, offsets):
+    import numpy as np
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if len(offsets) == 0:
+        raise UnpackError('no offsets')
+    a = np.frombuffer(bs, dtype=np.uint8)
+    tids = a[offsets[:, None] + np.arange(4, 4 + 2)].view('<u2')[:, 0]
+    tid = int(tids[0])
+    if tid < 10000 or tid  > 10125:
+        raise UnpackError(f'template ID out of range: {tid} not in [10000..10125]')
+    if (tids != tid).any():
+        raise UnpackError(f'template IDs differ from first one: {tid}')
+    c = _template(tid)
+    if not hasattr(c, 'dtype'):
+        raise UnpackError(f'{c.__name__} has no fixed layout')
+    return c.unpack_many(bs, offsets)
+
+def _field(c, name):
+    off = 0
+    for k in name.split('.'):
+        for m, f, o in getattr(c, 'layout', ()):
+            if m == k:
+                break
+        else:
+            raise KeyError(f'{c.__name__} has no fixed offset field {k}')
+        off += o
+        c = f
+    if isinstance(f, type):
+        raise KeyError(f'{name} is a component and not a field')
+    return off, f
+
+# i.e. returns a function that unpacks just the named fields of a message
+# with the template ID (e.g. 'Price' or 'RequestHeader.MsgSeqNum'),
+# with a single struct call, in the same order - without checking
+# the template ID
+def compile_projection(tid, names):
+    if tid < 10000 or tid  > 10125:
+        raise UnpackError(f'template ID out of range: {tid} not in [10000..10125]')
+    c = _template(tid)
+    xs = sorted((*_field(c, name), i) for i, name in enumerate(names))
+    fmt = '<'
+    pos = 0
+    for off, f, i in xs:
+        if off < pos:
+            raise KeyError(f'duplicate field: {names[i]}')
+        if off > pos:
+            fmt += f'{off - pos}x'
+        fmt += f
+        pos = off + struct.calcsize(f)
+    st = struct.Struct(fmt)
+    ps = [ i for _, _, i in xs ]
+    if ps == list(range(len(ps))):
+        return st.unpack_from
+    # i.e. permutation of the unpacked values back to the requested order
+    g = operator.itemgetter(*sorted(range(len(ps)), key=ps.__getitem__))
+    def f(bs, off=0):
+        return g(st.unpack_from(bs, off))
+    return f
+
+def _mk_request2response():
+    request2response = {
+        TemplateID.LogonRequest: [ ( LogonResponse, None, [  ] ), ],
+        TemplateID.LogoutRequest: [ ( LogoutResponse, None, [  ] ), ],
+        TemplateID.UserLoginRequest: [ ( UserLoginResponse, None, [  ] ), ],
+        TemplateID.NewOrderSingleShortRequest: [ ( None, None, [ ( NewOrderNRResponse, 'ExecType is New', [  ] ),( OrderExecResponse, 'ExecType is Trade', [ ( OrderExecReportBroadcast, None, [  ] ), ] ), ] ), ],
+        TemplateID.ModifyOrderSingleRequest: [ ( ModifyOrderResponse, None, [  ] ), ],
+        TemplateID.DeleteOrderSingleRequest: [ ( DeleteOrderResponse, None, [  ] ),( Reject, None, [  ] ), ],
+    }
+    return request2response
+
+_lazy = {
+    'TemplateID': (_mk_TemplateID, ()),
+    'ApplID': (_mk_ApplID, ()),
+    'ApplResendFlag': (_mk_ApplResendFlag, ()),
+    'LastFragment': (_mk_LastFragment, ()),
+    'ApplUsageOrders': (_mk_ApplUsageOrders, ()),
+    'ApplUsageQuotes': (_mk_ApplUsageQuotes, ()),
+    'OrderRoutingIndicator': (_mk_OrderRoutingIndicator, ()),
+    'TradSesMode': (_mk_TradSesMode, ()),
+    'SessionRejectReason': (_mk_SessionRejectReason, ()),
+    'Side': (_mk_Side, ()),
+    'LegSide': (_mk_LegSide, ()),
+    'ApplSeqIndicator': (_mk_ApplSeqIndicator, ()),
+    'PriceValidityCheckType': (_mk_PriceValidityCheckType, ()),
+    'ValueCheckTypeValue': (_mk_ValueCheckTypeValue, ()),
+    'OrderAttributeLiquidityProvision': (_mk_OrderAttributeLiquidityProvision, ()),
+    'TimeInForce': (_mk_TimeInForce, ()),
+    'ExecInst': (_mk_ExecInst, ()),
+    'TradingCapacity': (_mk_TradingCapacity, ()),
+    'PartyIdInvestmentDecisionMakerQualifier': (_mk_PartyIdInvestmentDecisionMakerQualifier, ()),
+    'ExecutingTraderQualifier': (_mk_ExecutingTraderQualifier, ()),
+    'OrdStatus': (_mk_OrdStatus, ()),
+    'ExecType': (_mk_ExecType, ()),
+    'ExecRestatementReason': (_mk_ExecRestatementReason, ()),
+    'ProductComplex': (_mk_ProductComplex, ()),
+    'LegPositionEffect': (_mk_LegPositionEffect, ()),
+    'OrdType': (_mk_OrdType, ()),
+    'MessageHeaderInComp': (_mk_MessageHeaderInComp, ()),
+    'MessageHeaderInCompView': (_mk_MessageHeaderInCompView, ('MessageHeaderInComp', )),
+    'MessageHeaderOutComp': (_mk_MessageHeaderOutComp, ()),
+    'MessageHeaderOutCompView': (_mk_MessageHeaderOutCompView, ('MessageHeaderOutComp', )),
+    'RequestHeaderComp': (_mk_RequestHeaderComp, ()),
+    'RequestHeaderCompView': (_mk_RequestHeaderCompView, ('RequestHeaderComp', )),
+    'ResponseHeaderComp': (_mk_ResponseHeaderComp, ()),
+    'ResponseHeaderCompView': (_mk_ResponseHeaderCompView, ('ResponseHeaderComp', )),
+    'ResponseHeaderMEComp': (_mk_ResponseHeaderMEComp, ('ApplID', 'LastFragment', )),
+    'ResponseHeaderMECompView': (_mk_ResponseHeaderMECompView, ('ResponseHeaderMEComp', )),
+    'NRResponseHeaderMEComp': (_mk_NRResponseHeaderMEComp, ('LastFragment', )),
+    'NRResponseHeaderMECompView': (_mk_NRResponseHeaderMECompView, ('NRResponseHeaderMEComp', )),
+    'RBCHeaderMEComp': (_mk_RBCHeaderMEComp, ('ApplID', 'ApplResendFlag', 'LastFragment', )),
+    'RBCHeaderMECompView': (_mk_RBCHeaderMECompView, ('RBCHeaderMEComp', )),
+    'NotifHeaderComp': (_mk_NotifHeaderComp, ()),
+    'NotifHeaderCompView': (_mk_NotifHeaderCompView, ('NotifHeaderComp', )),
+    'FillsGrpComp': (_mk_FillsGrpComp, ()),
+    'FillsGrpCompView': (_mk_FillsGrpCompView, ('FillsGrpComp', )),
+    'LegOrdGrpComp': (_mk_LegOrdGrpComp, ('LegPositionEffect', )),
+    'LegOrdGrpCompView': (_mk_LegOrdGrpCompView, ('LegOrdGrpComp', )),
+    'InstrmntLegExecGrpComp': (_mk_InstrmntLegExecGrpComp, ('LegSide', )),
+    'InstrmntLegExecGrpCompView': (_mk_InstrmntLegExecGrpCompView, ('InstrmntLegExecGrpComp', )),
+    'LogonRequest': (_mk_LogonRequest, ('MessageHeaderInComp', 'RequestHeaderComp', 'ApplUsageOrders', 'ApplUsageQuotes', 'OrderRoutingIndicator', )),
+    'LogonRequestView': (_mk_LogonRequestView, ('LogonRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'LogonResponse': (_mk_LogonResponse, ('MessageHeaderOutComp', 'ResponseHeaderComp', 'TradSesMode', )),
+    'LogonResponseView': (_mk_LogonResponseView, ('LogonResponse', 'MessageHeaderOutCompView', 'ResponseHeaderCompView', )),
+    'LogoutRequest': (_mk_LogoutRequest, ('MessageHeaderInComp', 'RequestHeaderComp', )),
+    'LogoutRequestView': (_mk_LogoutRequestView, ('LogoutRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'LogoutResponse': (_mk_LogoutResponse, ('MessageHeaderOutComp', 'ResponseHeaderComp', )),
+    'LogoutResponseView': (_mk_LogoutResponseView, ('LogoutResponse', 'MessageHeaderOutCompView', 'ResponseHeaderCompView', )),
+    'Reject': (_mk_Reject, ('MessageHeaderOutComp', 'NRResponseHeaderMEComp', 'SessionRejectReason', )),
+    'RejectView': (_mk_RejectView, ('Reject', 'MessageHeaderOutCompView', 'NRResponseHeaderMECompView', )),
+    'Heartbeat': (_mk_Heartbeat, ('MessageHeaderInComp', )),
+    'HeartbeatView': (_mk_HeartbeatView, ('Heartbeat', 'MessageHeaderInCompView', )),
+    'UserLoginRequest': (_mk_UserLoginRequest, ('MessageHeaderInComp', 'RequestHeaderComp', )),
+    'UserLoginRequestView': (_mk_UserLoginRequestView, ('UserLoginRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'UserLoginResponse': (_mk_UserLoginResponse, ('MessageHeaderOutComp', 'ResponseHeaderComp', )),
+    'UserLoginResponseView': (_mk_UserLoginResponseView, ('UserLoginResponse', 'MessageHeaderOutCompView', 'ResponseHeaderCompView', )),
+    'UserLogoutResponse': (_mk_UserLogoutResponse, ('MessageHeaderOutComp', 'ResponseHeaderComp', )),
+    'UserLogoutResponseView': (_mk_UserLogoutResponseView, ('UserLogoutResponse', 'MessageHeaderOutCompView', 'ResponseHeaderCompView', )),
+    'NewOrderResponse': (_mk_NewOrderResponse, ('MessageHeaderOutComp', 'ResponseHeaderMEComp', 'OrdStatus', 'ExecType', 'ExecRestatementReason', 'ProductComplex', )),
+    'NewOrderResponseView': (_mk_NewOrderResponseView, ('NewOrderResponse', 'MessageHeaderOutCompView', 'ResponseHeaderMECompView', )),
+    'NewOrderNRResponse': (_mk_NewOrderNRResponse, ('MessageHeaderOutComp', 'NRResponseHeaderMEComp', 'OrdStatus', 'ExecType', 'ExecRestatementReason', 'ProductComplex', )),
+    'NewOrderNRResponseView': (_mk_NewOrderNRResponseView, ('NewOrderNRResponse', 'MessageHeaderOutCompView', 'NRResponseHeaderMECompView', )),
+    'OrderExecResponse': (_mk_OrderExecResponse, ('MessageHeaderOutComp', 'ResponseHeaderMEComp', 'ExecRestatementReason', 'OrdStatus', 'ExecType', 'FillsGrpComp', 'InstrmntLegExecGrpComp', )),
+    'OrderExecResponseView': (_mk_OrderExecResponseView, ('OrderExecResponse', 'MessageHeaderOutCompView', 'ResponseHeaderMECompView', )),
+    'ModifyOrderSingleRequest': (_mk_ModifyOrderSingleRequest, ('MessageHeaderInComp', 'RequestHeaderComp', 'Side', 'OrdType', 'TimeInForce', 'ExecInst', )),
+    'ModifyOrderSingleRequestView': (_mk_ModifyOrderSingleRequestView, ('ModifyOrderSingleRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'ModifyOrderResponse': (_mk_ModifyOrderResponse, ('MessageHeaderOutComp', 'ResponseHeaderMEComp', 'OrdStatus', 'ExecType', 'ExecRestatementReason', )),
+    'ModifyOrderResponseView': (_mk_ModifyOrderResponseView, ('ModifyOrderResponse', 'MessageHeaderOutCompView', 'ResponseHeaderMECompView', )),
+    'DeleteOrderSingleRequest': (_mk_DeleteOrderSingleRequest, ('MessageHeaderInComp', 'RequestHeaderComp', )),
+    'DeleteOrderSingleRequestView': (_mk_DeleteOrderSingleRequestView, ('DeleteOrderSingleRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'DeleteOrderResponse': (_mk_DeleteOrderResponse, ('MessageHeaderOutComp', 'ResponseHeaderMEComp', 'OrdStatus', 'ExecType', 'ExecRestatementReason', 'ProductComplex', )),
+    'DeleteOrderResponseView': (_mk_DeleteOrderResponseView, ('DeleteOrderResponse', 'MessageHeaderOutCompView', 'ResponseHeaderMECompView', )),
+    'OrderExecReportBroadcast': (_mk_OrderExecReportBroadcast, ('MessageHeaderOutComp', 'RBCHeaderMEComp', 'ExecRestatementReason', 'Side', 'OrdStatus', 'ExecType', 'LegOrdGrpComp', 'FillsGrpComp', 'InstrmntLegExecGrpComp', )),
+    'OrderExecReportBroadcastView': (_mk_OrderExecReportBroadcastView, ('OrderExecReportBroadcast', 'MessageHeaderOutCompView', 'RBCHeaderMECompView', )),
+    'DeleteAllOrderRequest': (_mk_DeleteAllOrderRequest, ('MessageHeaderInComp', 'RequestHeaderComp', 'Side', )),
+    'DeleteAllOrderRequestView': (_mk_DeleteAllOrderRequestView, ('DeleteAllOrderRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'NewOrderSingleShortRequest': (_mk_NewOrderSingleShortRequest, ('MessageHeaderInComp', 'RequestHeaderComp', 'Side', 'ApplSeqIndicator', 'PriceValidityCheckType', 'ValueCheckTypeValue', 'OrderAttributeLiquidityProvision', 'TimeInForce', 'ExecInst', 'TradingCapacity', 'PartyIdInvestmentDecisionMakerQualifier', 'ExecutingTraderQualifier', )),
+    'NewOrderSingleShortRequestView': (_mk_NewOrderSingleShortRequestView, ('NewOrderSingleShortRequest', 'MessageHeaderInCompView', 'RequestHeaderCompView', )),
+    'tid2class': (_mk_tid2class, ()),
+    'tid2view': (_mk_tid2view, ()),
+    'request2response': (_mk_request2response, ('TemplateID', 'LogonResponse', 'LogoutResponse', 'UserLoginResponse', 'NewOrderNRResponse', 'OrderExecResponse', 'OrderExecReportBroadcast', 'ModifyOrderResponse', 'DeleteOrderResponse', 'Reject', )),
+}
+
+_lock = threading.RLock()
+
+def __getattr__(name):
+    try:
+        mk, deps = _lazy[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    g = globals()
+    with _lock:
+        if name in g:
+            return g[name]
+        for d in deps:
+            if d not in g:
+                __getattr__(d)
+        x = mk()
+        if isinstance(x, type):
+            x.__qualname__ = name
+        g[name] = x
+    return x
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
+def warmup():
+    for name in _lazy:
+        x = __getattr__(name)
+        if is_dataclass(x):
+            for i in range(len(x.fmt)):
+                x.st(i)
+
+# NB: i.e. a star import creates all classes (as warmup() does, except
+# for the struct objects), since it has to bind all names, thus, the
+# lazy definition only pays off with a plain import of the module
+__all__ = [ 'version', 'sub_version', 'build', 'enumerize', 'rstrip_dc',
+            'tid_st', 'header_st', 'tid2size', 'UnpackError', 'peek_header', 'iter_messages',
+            'unpack_from', 'Decoder',
+            'view_from', 'unpack_many', 'compile_projection', 'warmup' ] + list(_lazy)
+
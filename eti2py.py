@@ -6,9 +6,12 @@
 # NB: The generated code is licensed differently, i.e. it is
 # licensed under the permissive Boost Software License.
 
+import argparse
+import io
 import itertools
 import re
 import sys
+import textwrap
 import xml.etree.ElementTree as ET
 
 from etimodel import get_min_sizes, get_max_sizes
@@ -101,32 +104,77 @@ def get_sizes(st, dt):
         h[name] = s
     return h
 
-def gen_header(o=sys.stdout):
+def gen_header(slots=False, o=sys.stdout):
     print('''# auto-generated by Georg Sauthoff's eti2py.py
 #
 # SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
 # SPDX-License-Identifier: BSL-1.0
 
+import operator
 import struct
+import threading
 from dataclasses import dataclass, field, is_dataclass
 from enum import IntEnum
-
-def rstrip_dc(x):
+''', file=o)
+    if slots:
+        print('''def rstrip_dc(x):
+    for k in x.__slots__:
+        v = x.__getattribute__(k)
+        if type(v) is bytes:
+            x.__setattr__(k, v.rstrip(b'\\0'))
+        elif is_dataclass(v):
+            rstrip_dc(v)''', file=o)
+    else:
+        print('''def rstrip_dc(x):
     for k, v in x.__dict__.items():
         if type(v) is bytes:
             x.__setattr__(k, x.__getattribute__(k).rstrip(b'\\0'))
         elif is_dataclass(v):
-            rstrip_dc(v)
-
+            rstrip_dc(v)''', file=o)
+    print('''
 def enumerize(i, klasse):
     try:
         return klasse(i)
     except ValueError:
         return i
 ''', file=o)
+    for c in view_fmts:
+        print(f"_st_{c} = struct.Struct('<{c}')", file=o)
+    print('''
+# NB: NumPy is optional, i.e. it's only imported when a dtype is requested
+_np_fmts = { 'B': 'u1', 'h': '<i2', 'H': '<u2', 'i': '<i4', 'I': '<u4', 'q': '<i8', 'Q': '<u8' }
+
+def _make_dtype(cls):
+    import numpy as np
+    names   = [ k for k, _, _ in cls.layout ]
+    formats = [ f.dtype() if isinstance(f, type) else _np_fmts.get(f, f'S{f[:-1]}')
+                for _, f, _ in cls.layout ]
+    offsets = [ off for _, _, off in cls.layout ]
+    return np.dtype({ 'names': names, 'formats': formats, 'offsets': offsets,
+                      'itemsize': cls.sizes[0] })
+
+def _unpack_many(cls, buf, offsets):
+    import numpy as np
+    dt = cls.dtype()
+    a = np.frombuffer(buf, dtype=np.uint8)
+    idx = np.asarray(offsets, dtype=np.intp)[:, None] + np.arange(dt.itemsize)
+    return a[idx].view(dt)[:, 0].view(np.recarray)
+''', file=o)
+
+# i.e. classes etc. are wrapped into functions that are only called on
+# first access (cf. the generated module __getattr__())
+def gen_lazy(name, body, deps, lazy, o=sys.stdout):
+    print(f'def _mk_{name}():', file=o)
+    print(textwrap.indent(body, '    '), end='', file=o)
+    print(f'    return {name}\n', file=o)
+    lazy.append((name, tuple(deps)))
+
+# i.e. for decoding without having to catch a ValueError for unknown values
+def gen_enum_table(name, o=sys.stdout):
+    print(f'{name}._tab = {{ v.value: v for v in {name} }}', file=o)
 
-def gen_enums(dt, ts, o=sys.stdout):
-    def pp_nv(e, vs):
+def gen_enums(dt, ts, lazy, o=sys.stdout):
+    def pp_nv(e, vs, o):
         nv = e.get('noValue')
         if nv in vs:
             return
@@ -138,31 +186,36 @@ def gen_enums(dt, ts, o=sys.stdout):
             print(f'    NO_VALUE = {nv}', file=o)
 
 
-    print('class TemplateID(IntEnum):', file=o)
+    p = io.StringIO()
+    print('class TemplateID(IntEnum):', file=p)
     for tid, name in ts:
-        print(f'    {name} = {tid}', file=o)
-    print('', file=o)
+        print(f'    {name} = {tid}', file=p)
+    gen_lazy('TemplateID', p.getvalue(), (), lazy, o)
     for name, e in dt.items():
         if e.get('type') == 'int':
             vs = e.findall('ValidValue')
             if vs:
                 vs.sort(key = lambda x : int(x.get('value')))
                 ws = [ v.get('value') for v in vs ]
-                print(f'class {name}(IntEnum):', file=o)
+                p = io.StringIO()
+                print(f'class {name}(IntEnum):', file=p)
                 for v in vs:
-                    print(f'    {v.get("name").upper()} = {v.get("value")}', file=o)
-                pp_nv(e, ws)
-                print(file=o)
+                    print(f'    {v.get("name").upper()} = {v.get("value")}', file=p)
+                pp_nv(e, ws, p)
+                gen_enum_table(name, p)
+                gen_lazy(name, p.getvalue(), (), lazy, o)
         elif e.get('rootType') == 'String' and e.get('size') == '1':
             vs = e.findall('ValidValue')
             if vs:
                 vs.sort(key = lambda x : x.get('value'))
                 ws = [ v.get('value') for v in vs ]
-                print(f'class {name}(IntEnum):', file=o)
+                p = io.StringIO()
+                print(f'class {name}(IntEnum):', file=p)
                 for v in vs:
-                    print(f'''    {v.get("name").upper()} = ord('{v.get("value")}')''', file=o)
-                pp_nv(e, ws)
-                print(file=o)
+                    print(f'''    {v.get("name").upper()} = ord('{v.get("value")}')''', file=p)
+                pp_nv(e, ws, p)
+                gen_enum_table(name, p)
+                gen_lazy(name, p.getvalue(), (), lazy, o)
 
 def is_int(t):
     if t is not None:
@@ -257,7 +310,7 @@ def group_members(e, dt):
 def gen_fields(e, st, dt, us, sizes, min_sizes, version, o=sys.stdout, comment=False, off=0, fname=None):
     for m in e:
         if comment:
-            print('    #', end='')
+            print('    #', end='', file=o)
         atts = []
         t = dt.get(m.get('type'))
         if is_padding(t):
@@ -329,8 +382,23 @@ def get_header_name(m):
         assert(name.startswith('MessageHeader'))
         return name
 
-def gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, o=sys.stdout):
-    print(f'@dataclass\nclass {name}:')
+def flatten_members(e, st, obj, bindings):
+    xs = []
+    for m in e:
+        s = st.get(m.get('type'))
+        if s is None:
+            xs.append((obj, m))
+        else:
+            v = f'c{len(bindings)}'
+            bindings.append((v, f'{obj}.{m.get("name")}'))
+            xs.extend(flatten_members(s, st, v, bindings))
+    return xs
+
+def gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, slots=False, o=sys.stdout):
+    if slots:
+        print(f'@dataclass(slots=True)\nclass {name}:', file=o)
+    else:
+        print(f'@dataclass\nclass {name}:', file=o)
     print(f'    sizes = ({min_sizes[name]}, {max_sizes[name]})\n', file=o)
     gen_fields(e, st, dt, us, sizes, min_sizes, version, o)
 
@@ -359,10 +427,18 @@ def gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, o=sys.s
         print(f'        pass', file=o)
     print(file=o)
 
-    fs = [ ("'<" + ''.join(type_to_fmt(dt.get(a.get('type'))) for a in xs) + "'") for xs in ms ]
+    # i.e. fixed size blocks with nested components are packed/unpacked
+    # with a single struct call, including the nested members
+    flat = sizes[name] != 0 and any(st.get(m.get('type')) is not None for m in e)
+    if flat:
+        bindings = []
+        ls = flatten_members(e, st, 'self', bindings)
+        fs = [ "'<" + ''.join(type_to_fmt(dt.get(m.get('type'))) for _, m in ls) + "'" ]
+    else:
+        fs = [ ("'<" + ''.join(type_to_fmt(dt.get(a.get('type'))) for a in xs) + "'") for xs in ms ]
     print(f'    fmt = ( {", ".join(fs)}, )', file=o)
 
-    print(f'    _struct = [ {", ".join("None" for _ in ms)} ]', file=o)
+    print(f'    _struct = [ {", ".join("None" for _ in fs)} ]', file=o)
     print('''
     @classmethod
     def st(cls, i):
@@ -370,16 +446,164 @@ def gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, o=sys.s
             cls._struct[i] = struct.Struct(cls.fmt[i])
         return cls._struct[i]''', file=o)
 
-    gen_pack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o)
-    gen_unpack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o)
+    gen_layout(e, st, dt, sizes, sizes[name] != 0, o)
 
-    gen_setter(o)
+    if flat:
+        gen_flat_pack(name, dt, sizes, ls, bindings, o)
+        gen_flat_unpack(name, dt, sizes, ls, bindings, o)
+    else:
+        gen_pack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o)
+        gen_unpack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o)
 
-    print('    def rstrip(self):\n        rstrip_dc(self)', file=o)
+    gen_offset_setters(e, st, dt, sizes, o)
+
+    # NB: with __slots__ assigning an unknown field already raises AttributeError
+    if not slots:
+        gen_setter(o)
+
+    gen_rstrip(e, st, dt, o)
 
     print('', file=o)
 
 
+# i.e. (name, fmt, offset) of each non-padding member where a nested
+# component is represented by its class - for variable size blocks
+# only the members before the first repeating group or variable
+# length string are included
+def gen_layout(e, st, dt, sizes, fixed, o=sys.stdout):
+    print('\n    layout = (', file=o)
+    off = 0
+    for m in e:
+        t = dt.get(m.get('type'))
+        if sizes[m.get('type')] == 0 or m.get('minCardinality') is not None:
+            break
+        if st.get(m.get('type')) is not None:
+            print(f"        ('{m.get('name')}', {m.get('type')}, {off}),", file=o)
+        elif not is_padding(t):
+            print(f"        ('{m.get('name')}', '{type_to_fmt(t)}', {off}),", file=o)
+        off += sizes[m.get('type')]
+    print('    )', file=o)
+    if not fixed:
+        return
+    print('''    _dtype = None
+
+    @classmethod
+    def dtype(cls):
+        if cls._dtype is None:
+            cls._dtype = _make_dtype(cls)
+        return cls._dtype
+
+    @classmethod
+    def unpack_many(cls, buf, offsets):
+        return _unpack_many(cls, buf, offsets)''', file=o)
+
+
+# i.e. (name, type, offset) of each elementary member with a fixed
+# offset, including the ones of nested components
+def fixed_leaves(e, st, dt, sizes, prefix='', off=0):
+    xs = []
+    for m in e:
+        if sizes[m.get('type')] == 0 or m.get('minCardinality') is not None:
+            break
+        s = st.get(m.get('type'))
+        if s is not None:
+            xs.extend(fixed_leaves(s, st, dt, sizes, f'{prefix}{m.get("name")}_', off))
+        elif not is_padding(dt.get(m.get('type'))):
+            xs.append((prefix + m.get('name'), dt.get(m.get('type')), off))
+        off += sizes[m.get('type')]
+    return xs
+
+# i.e. for patching single fields of an already packed message
+def gen_offset_setters(e, st, dt, sizes, o=sys.stdout):
+    xs = fixed_leaves(e, st, dt, sizes)
+    for name, t, off in xs:
+        off_str = 'off' if off == 0 else f'off + {off}'
+        if is_int(t):
+            body = f'_st_{type_to_fmt(t)}.pack_into(buf, {off_str}, v)'
+        else:
+            body = f"struct.pack_into('{type_to_fmt(t)}', buf, {off_str}, v)"
+        print(f'''    @staticmethod
+    def set_{name}(buf, off, v):
+        {body}''', file=o)
+    if xs:
+        print(file=o)
+
+
+view_fmts = ('B', 'h', 'H', 'i', 'I', 'q', 'Q' )
+
+def gen_view(name, e, st, dt, sizes, o=sys.stdout):
+    print(f'''class {name}View:
+    __slots__ = ('_buf', '_off')
+
+    def __init__(self, buf, off=0):
+        self._buf = buf
+        self._off = off
+''', file=o)
+    off = 0
+    for m in e:
+        if off is None or m.get('minCardinality') is not None:
+            # i.e. the offsets of the fields after a repeating group aren't fixed
+            break
+        t = dt.get(m.get('type'))
+        l = sizes[m.get('type')]
+        off_str = 'self._off' if off == 0 else f'self._off + {off}'
+        if is_padding(t) or l == 0:
+            pass
+        elif is_int(t):
+            print(f'''    @property
+    def {m.get('name')}(self):
+        return _st_{type_to_fmt(t)}.unpack_from(self._buf, {off_str})[0]''', file=o)
+        elif is_fixed_string(t):
+            print(f'''    @property
+    def {m.get('name')}(self):
+        return bytes(self._buf[{off_str}:self._off + {off + l}])''', file=o)
+        elif st.get(m.get('type')) is not None and m.get('minCardinality') is None:
+            print(f'''    @property
+    def {m.get('name')}(self):
+        return {m.get('type')}View(self._buf, {off_str})''', file=o)
+        if l == 0:
+            off = None
+        else:
+            off += l
+    print(f'''
+    def unpack(self):
+        return {name}.create_from(self._buf, self._off)
+''', file=o)
+
+
+def is_string(t):
+    return (is_fixed_string(t) or is_var_string(t)) and not is_padding(t) and not is_int(t)
+
+# i.e. (obj, member) pairs, the stripping is conditional if cond is set
+def gen_strip(ls, dt, cond=None, o=sys.stdout):
+    xs = [ f'{v}.{m.get("name")}' for v, m in ls if is_string(dt.get(m.get('type'))) ]
+    if not xs:
+        return
+    indent = '        '
+    if cond:
+        print(f'{indent}if {cond}:', file=o)
+        indent += '    '
+    rhs = ', '.join(f"{x}.rstrip(b'\\0')" for x in xs)
+    print(f'{indent}{", ".join(xs)} = {rhs}', file=o)
+
+# i.e. only touches the string members, instead of inspecting each field
+# like rstrip_dc() does
+def gen_rstrip(e, st, dt, o=sys.stdout):
+    print('    def rstrip(self):', file=o)
+    n = 0
+    for m in e:
+        if st.get(m.get('type')) is None:
+            continue
+        if m.get('minCardinality') is None:
+            print(f'        self.{m.get("name")}.rstrip()', file=o)
+        else:
+            print(f'        for v in self.{m.get("name")}:\n            v.rstrip()', file=o)
+        n += 1
+    if any(is_string(dt.get(m.get('type'))) for m in e):
+        gen_strip([ ('self', m) for m in e ], dt, None, o)
+    elif n == 0:
+        print('        pass', file=o)
+
 def gen_setter(o=sys.stdout):
     print('''    def __setattr__(self, k, v): 
         if k not in self.__annotations__: 
@@ -420,7 +644,7 @@ def gen_pack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o=sys.stdout):
                     off_str = 'o'
                 print(f'        for v in self.{xs[0].get("name")}:', file=o)
                 print(f'            v.pack_into(buf, {off_str})', file=o)
-                print(f'            o += {l}')
+                print(f'            o += {l}', file=o)
             else:
                 print(f'        self.{xs[0].get("name")}.pack_into(buf, {off_str})', file=o)
                 if dyn:
@@ -445,7 +669,7 @@ def gen_pack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o=sys.stdout):
     print(file=o)
 
 def gen_unpack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o=sys.stdout):
-    print('    def unpack_from(self, buf, off=0):', file=o)
+    print('    def unpack_from(self, buf, off=0, enums=True, strip=False):', file=o)
     off = 0
     dyn = False
     for i, xs in enumerate(ms):
@@ -462,9 +686,10 @@ def gen_unpack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o=sys.stdout):
                 print(f'        {args} = self.st({i}).unpack_from(buf, {off_str})', file=o)
             es = [ m for m in xs if is_enum(dt.get(m.get('type'))) ]
             lhs = ', '.join('self.' + e.get('name') for e in es)
-            rhs = ', '.join(f"enumerize(self.{e.get('name')}, {dt.get(e.get('type')).get('name')})" for e in es)
+            rhs = ', '.join(f"{dt.get(e.get('type')).get('name')}._tab.get(self.{e.get('name')}, self.{e.get('name')})" for e in es)
             if lhs:
-                print(f'        {lhs} = {rhs}', file=o)
+                print(f'        if enums:\n            {lhs} = {rhs}', file=o)
+            gen_strip([ ('self', m) for m in xs ], dt, 'strip', o)
             if dyn:
                 print(f'        o += {l}', file=o)
         else:
@@ -473,20 +698,25 @@ def gen_unpack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o=sys.stdout):
                     print(f'        o = off + {off}', file=o)
                     dyn = True
                     off_str = 'o'
-                print(f'        self.{xs[0].get("name")} = struct.unpack_from(f"<{{self.{xs[0].get("counter")}}}s", buf, {off_str})', file=o)
+                print(f'        self.{xs[0].get("name")} = struct.unpack_from(f"<{{self.{xs[0].get("counter")}}}s", buf, {off_str})[0]', file=o)
+                gen_strip([ ('self', xs[0]) ], dt, 'strip', o)
                 print(f'        o += self.{xs[0].get("counter")}', file=o)
             elif xs[0].get('minCardinality') is not None:
                 if not dyn:
                     print(f'        o = off + {off}', file=o)
                     dyn = True
                     off_str = 'o'
-                print(f'        self.{xs[0].get("name")} = []', file=o)
-                print(f'        for i in range(self.{xs[0].get("counter")}):', file=o)
-                print(f'            v = {xs[0].get("type")}.create_from(buf, {off_str})', file=o)
-                print(f'            self.{xs[0].get("name")}.append(v)', file=o)
-                print(f'            o += {l}')
+                # i.e. group elements are reused, when unpacking into the same object again
+                print(f'        xs = self.{xs[0].get("name")}', file=o)
+                print(f'        n = self.{xs[0].get("counter")}', file=o)
+                print(f'        del xs[n:]', file=o)
+                print(f'        while len(xs) < n:', file=o)
+                print(f'            xs.append({xs[0].get("type")}())', file=o)
+                print(f'        for v in xs:', file=o)
+                print(f'            v.unpack_from(buf, {off_str}, enums, strip)', file=o)
+                print(f'            o += {l}', file=o)
             else:
-                print(f'        self.{xs[0].get("name")}.unpack_from(buf, {off_str})', file=o)
+                print(f'        self.{xs[0].get("name")}.unpack_from(buf, {off_str}, enums, strip)', file=o)
                 if dyn:
                     print(f'        o += {l}', file=o)
         off += l
@@ -495,84 +725,341 @@ def gen_unpack(name, e, st, dt, sizes, min_sizes, max_sizes, ms, o=sys.stdout):
         print('        return o', file=o)
     else:
         print(f'        return off + {off}', file=o)
-    print(f'''    @staticmethod\n    def create_from(buf, off=0):
+    print(f'''    @staticmethod\n    def create_from(buf, off=0, enums=True, strip=False):
         obj = {name}()
-        obj.unpack_from(buf, off)
+        obj.unpack_from(buf, off, enums, strip)
         return obj''', file=o)
     print(file=o)
 
 
-def gen_blocks(version, st, dt, us, o=sys.stdout):
+def get_deps(e, st, dt, enums):
+    xs = []
+    for m in e:
+        t = dt.get(m.get('type'))
+        if st.get(m.get('type')) is not None:
+            x = m.get('type')
+        elif is_enum(t):
+            x = t.get('name')
+        else:
+            continue
+        if x not in xs and (x in st or x in enums):
+            xs.append(x)
+    return xs
+
+def gen_blocks(version, st, dt, us, lazy, slots=False, o=sys.stdout):
     sizes = get_sizes(st, dt)
     min_sizes = get_min_sizes(st, dt)
     max_sizes = get_max_sizes(st, dt)
-    for name, e in st.items():
-        if e.get('type') == 'Message':
-            continue
-        gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, o)
-    for name, e in st.items():
-        if e.get('type') != 'Message':
-            continue
-        gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, o)
+    enums = set(name for name, _ in lazy)
+    for name, e in itertools.chain((i for i in st.items() if i[1].get('type') != 'Message'),
+                                   (i for i in st.items() if i[1].get('type') == 'Message')):
+        p = io.StringIO()
+        gen_block(name, e, st, dt, us, sizes, min_sizes, max_sizes, version, slots, p)
+        gen_lazy(name, p.getvalue(), get_deps(e, st, dt, enums), lazy, o)
 
+        p = io.StringIO()
+        gen_view(name, e, st, dt, sizes, p)
+        deps = [ name ] + [ f'{m.get("type")}View' for m in e
+                            if st.get(m.get('type')) is not None and m.get('minCardinality') is None ]
+        gen_lazy(f'{name}View', p.getvalue(), deps, lazy, o)
 
-def gen_unpack_factory(ts, dt, o=sys.stdout):
+
+def gen_flat_pack(name, dt, sizes, ls, bindings, o=sys.stdout):
+    print('    def pack_into(self, buf, off=0):', file=o)
+    for v, x in bindings:
+        print(f'        {v} = {x}', file=o)
+    args = ', '.join(f'{v}.{m.get("name")}' for v, m in ls if not is_padding(dt.get(m.get('type'))))
+    print(f'        self.st(0).pack_into(buf, off, {args})', file=o)
+    print(f'        return off + {sizes[name]}', file=o)
+    print(f'''    def pack(self):
+        bs = bytearray({sizes[name]})
+        self.pack_into(bs)
+        return bytes(bs)''', file=o)
+    print(file=o)
+
+def gen_flat_unpack(name, dt, sizes, ls, bindings, o=sys.stdout):
+    print('    def unpack_from(self, buf, off=0, enums=True, strip=False):', file=o)
+    for v, x in bindings:
+        print(f'        {v} = {x}', file=o)
+    args = ', '.join(f'{v}.{m.get("name")}' for v, m in ls if not is_padding(dt.get(m.get('type'))))
+    print(f'        {args} = self.st(0).unpack_from(buf, off)', file=o)
+    es = [ (v, m) for v, m in ls if is_enum(dt.get(m.get('type'))) ]
+    lhs = ', '.join(f'{v}.{m.get("name")}' for v, m in es)
+    rhs = ', '.join(f"{dt.get(m.get('type')).get('name')}._tab.get({v}.{m.get('name')}, {v}.{m.get('name')})" for v, m in es)
+    if lhs:
+        print(f'        if enums:\n            {lhs} = {rhs}', file=o)
+    gen_strip(ls, dt, 'strip', o)
+    print(f'        return off + {sizes[name]}', file=o)
+    print(f'''    @staticmethod\n    def create_from(buf, off=0, enums=True, strip=False):
+        obj = {name}()
+        obj.unpack_from(buf, off, enums, strip)
+        return obj''', file=o)
+    print(file=o)
+
+
+def gen_unpack_factory(ts, st, dt, lazy, o=sys.stdout):
     n = ts[-1][0] - ts[0][0] + 1
     a = ts[0][0]
     b = ts[-1][0]
     xs = [None] * n
     for tid, name in ts:
         xs[tid-a] = name
-    s = ',\n        '.join('None' if x is None else x for x in xs)
-    print(f'tid2class = [', file=o)
-    tid = a
-    for tid, x in enumerate(xs, tid):
+    print(f'_tid2name = (', file=o)
+    for tid, x in enumerate(xs, a):
         if x is None:
             print(f'              None, # {tid}', file=o)
         else:
-            print(f'              {x}, # {tid}', file=o)
-    print(f']\n', file=o)
+            print(f"              '{x}', # {tid}", file=o)
+    print(f')\n', file=o)
+
+    print(f'''_tid2class = [ None ] * {n}
+_tid2view  = [ None ] * {n}
+
+def _mk_tid2class():
+    for i, name in enumerate(_tid2name):
+        if name is not None and _tid2class[i] is None:
+            _tid2class[i] = __getattr__(name)
+    return _tid2class
+
+def _mk_tid2view():
+    for i, name in enumerate(_tid2name):
+        if name is not None and _tid2view[i] is None:
+            _tid2view[i] = __getattr__(name + 'View')
+    return _tid2view
+''', file=o)
+    lazy.append(('tid2class', ()))
+    lazy.append(('tid2view', ()))
+
+    sizes = get_sizes(st, dt)
+    print('# i.e. the BodyLen of each fixed size template (indexed by template ID),\n'
+          '# 0 for unknown and variable size templates', file=o)
+    print(f'tid2size = (', file=o)
+    for tid, x in enumerate(xs, a):
+        print(f'              {sizes[x] if x is not None else 0}, # {tid}', file=o)
+    print(f')\n', file=o)
 
     bl_size = dt['BodyLen'].get('size')
 
     print(f'''tid_st = struct.Struct('<{bl_size}xH')
+header_st = struct.Struct('<{type_to_fmt(dt['BodyLen'])}H')
+
+# i.e. returns (BodyLen, TemplateID) without unpacking anything else
+def peek_header(bs, off=0):
+    return header_st.unpack_from(bs, off)
 
 class UnpackError(Exception):
     pass
+
+# i.e. yields (TemplateID, offset, BodyLen) of each message in bs
+# (e.g. a packet) without unpacking them, where the BodyLen of fixed
+# size templates is checked against tid2size
+def iter_messages(bs, off=0):
+    end = len(bs)
+    while off < end:
+        n, tid = header_st.unpack_from(bs, off)
+        i = tid - {a}
+        if i < 0 or i >= {n}:
+            raise UnpackError(f'template ID out of range: {{tid}} not in [{a}..{b}]')
+        k = tid2size[i]
+        if (n != k if k else n < header_st.size) or off + n > end:
+            raise UnpackError(f'invalid BodyLen {{n}} of template {{tid}} at offset {{off}}')
+        yield tid, off, n
+        off += n
+
+def _template(tid, suffix=''):
+    name = _tid2name[tid-{a}]
+    if name is None:
+        raise UnpackError(f'unknown template ID: {{tid}}')
+    return __getattr__(name + suffix)
 ''', file=o)
 
-    print(f'''def unpack_from(bs, off=0):
+    print(f'''def unpack_from(bs, off=0, enums=True, strip=False):
     tid = tid_st.unpack_from(bs, off)[0]
     if tid < {a} or tid  > {b}:
         raise UnpackError(f'template ID out of range: {{tid}} not in [{a}..{b}]')
-    c = tid2class[tid-{a}]
+    c = _tid2class[tid-{a}]
     if c is None:
-        raise UnpackError(f'unknown template ID: {{tid}}')
-    return c.create_from(bs, off)
+        c = _tid2class[tid-{a}] = _template(tid)
+    return c.create_from(bs, off, enums, strip)
+
+# i.e. unpacks into a pool of reusable objects per template, instead of
+# creating new ones, such that the returned object is only valid until
+# pool_size other messages of the same template were unpacked
+class Decoder:
+    def __init__(self, pool_size=1, enums=True, strip=False):
+        self.pool_size = pool_size
+        self.enums = enums
+        self.strip = strip
+        self._pools = [ None ] * {n}
+        self._next = [ 0 ] * {n}
+
+    def unpack_from(self, bs, off=0):
+        tid = tid_st.unpack_from(bs, off)[0]
+        if tid < {a} or tid  > {b}:
+            raise UnpackError(f'template ID out of range: {{tid}} not in [{a}..{b}]')
+        i = tid - {a}
+        p = self._pools[i]
+        if p is None:
+            c = _template(tid)
+            p = self._pools[i] = [ c() for _ in range(self.pool_size) ]
+        j = self._next[i]
+        self._next[i] = (j + 1) % self.pool_size
+        x = p[j]
+        x.unpack_from(bs, off, self.enums, self.strip)
+        return x
+
+def view_from(bs, off=0):
+    tid = tid_st.unpack_from(bs, off)[0]
+    if tid < {a} or tid  > {b}:
+        raise UnpackError(f'template ID out of range: {{tid}} not in [{a}..{b}]')
+    c = _tid2view[tid-{a}]
+    if c is None:
+        c = _tid2view[tid-{a}] = _template(tid, 'View')
+    return c(bs, off)
+
+# i.e. all messages at the offsets must have the same template ID
+def unpack_many(bs, offsets):
+    import numpy as np
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if len(offsets) == 0:
+        raise UnpackError('no offsets')
+    a = np.frombuffer(bs, dtype=np.uint8)
+    tids = a[offsets[:, None] + np.arange({bl_size}, {bl_size} + 2)].view('<u2')[:, 0]
+    tid = int(tids[0])
+    if tid < {a} or tid  > {b}:
+        raise UnpackError(f'template ID out of range: {{tid}} not in [{a}..{b}]')
+    if (tids != tid).any():
+        raise UnpackError(f'template IDs differ from first one: {{tid}}')
+    c = _template(tid)
+    if not hasattr(c, 'dtype'):
+        raise UnpackError(f'{{c.__name__}} has no fixed layout')
+    return c.unpack_many(bs, offsets)
+
+def _field(c, name):
+    off = 0
+    for k in name.split('.'):
+        for m, f, o in getattr(c, 'layout', ()):
+            if m == k:
+                break
+        else:
+            raise KeyError(f'{{c.__name__}} has no fixed offset field {{k}}')
+        off += o
+        c = f
+    if isinstance(f, type):
+        raise KeyError(f'{{name}} is a component and not a field')
+    return off, f
+
+# i.e. returns a function that unpacks just the named fields of a message
+# with the template ID (e.g. 'Price' or 'RequestHeader.MsgSeqNum'),
+# with a single struct call, in the same order - without checking
+# the template ID
+def compile_projection(tid, names):
+    if tid < {a} or tid  > {b}:
+        raise UnpackError(f'template ID out of range: {{tid}} not in [{a}..{b}]')
+    c = _template(tid)
+    xs = sorted((*_field(c, name), i) for i, name in enumerate(names))
+    fmt = '<'
+    pos = 0
+    for off, f, i in xs:
+        if off < pos:
+            raise KeyError(f'duplicate field: {{names[i]}}')
+        if off > pos:
+            fmt += f'{{off - pos}}x'
+        fmt += f
+        pos = off + struct.calcsize(f)
+    st = struct.Struct(fmt)
+    ps = [ i for _, _, i in xs ]
+    if ps == list(range(len(ps))):
+        return st.unpack_from
+    # i.e. permutation of the unpacked values back to the requested order
+    g = operator.itemgetter(*sorted(range(len(ps)), key=ps.__getitem__))
+    def f(bs, off=0):
+        return g(st.unpack_from(bs, off))
+    return f
 ''', file=o)
 
 
-def gen_message_flows(mf, o=sys.stdout):
+def gen_message_flows(mf, lazy, o=sys.stdout):
+    deps = [ 'TemplateID' ]
     def f(xs):
-        print('[ ', end='', file=o)
+        print('[ ', end='', file=p)
         for name, cond, cs in xs:
             s = name
+            if name is not None and name not in deps:
+                deps.append(name)
             t = 'None' if cond is None else f"'{cond}'"
-            print(f'( {s}, {t}, ', end='', file=o)
+            print(f'( {s}, {t}, ', end='', file=p)
             f(cs)
-            print(f' ),', end='', file=o)
-        print(' ]', end='', file=o)
-    print('request2response = {', file=o)
+            print(f' ),', end='', file=p)
+        print(' ]', end='', file=p)
+    p = io.StringIO()
+    print('request2response = {', file=p)
     for k, v in mf.items():
-        print(f'    TemplateID.{k}: ', end='', file=o)
+        print(f'    TemplateID.{k}: ', end='', file=p)
         f(v)
-        print(',', file=o)
+        print(',', file=p)
+    print('}', file=p)
+    gen_lazy('request2response', p.getvalue(), deps, lazy, o)
+
+
+def gen_lazy_table(lazy, o=sys.stdout):
+    print('_lazy = {', file=o)
+    for name, deps in lazy:
+        ds = ''.join(f"'{d}', " for d in deps)
+        print(f"    '{name}': (_mk_{name}, ({ds})),", file=o)
     print('}\n', file=o)
 
+    print('''_lock = threading.RLock()
+
+def __getattr__(name):
+    try:
+        mk, deps = _lazy[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    g = globals()
+    with _lock:
+        if name in g:
+            return g[name]
+        for d in deps:
+            if d not in g:
+                __getattr__(d)
+        x = mk()
+        if isinstance(x, type):
+            x.__qualname__ = name
+        g[name] = x
+    return x
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
+
+def warmup():
+    for name in _lazy:
+        x = __getattr__(name)
+        if is_dataclass(x):
+            for i in range(len(x.fmt)):
+                x.st(i)
+
+# NB: i.e. a star import creates all classes (as warmup() does, except
+# for the struct objects), since it has to bind all names, thus, the
+# lazy definition only pays off with a plain import of the module
+__all__ = [ 'version', 'sub_version', 'build', 'enumerize', 'rstrip_dc',
+            'tid_st', 'header_st', 'tid2size', 'UnpackError', 'peek_header', 'iter_messages',
+            'unpack_from', 'Decoder',
+            'view_from', 'unpack_many', 'compile_projection', 'warmup' ] + list(_lazy)
+''', file=o)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Generate Python bindings for ETI/EOBI style protocol specifications')
+    p.add_argument('filename', help='protocol description XML file')
+    p.add_argument('--slots', action='store_true',
+            help='generate __slots__ dataclasses, i.e. cheaper attribute stores and smaller objects (requires Python 3.10 or later)')
+    args = p.parse_args()
+    return args
 
 def main():
-    filename = sys.argv[1]
-    d = ET.parse(filename)
+    args = parse_args()
+    d = ET.parse(args.filename)
 
     version = (d.getroot().get('version'), d.getroot().get('subVersion'))
     dt = get_data_types(d)
@@ -583,14 +1070,18 @@ def main():
 
     mf = get_message_flows(d)
 
-    gen_header()
+    lazy = []
+
+    gen_header(args.slots)
     gen_version(d)
-    gen_enums(dt, ts)
-    gen_blocks(version, st, dt, us)
+    gen_enums(dt, ts, lazy)
+    gen_blocks(version, st, dt, us, lazy, args.slots)
+
+    gen_unpack_factory(ts, st, dt, lazy)
 
-    gen_unpack_factory(ts, dt)
+    gen_message_flows(mf, lazy)
 
-    gen_message_flows(mf)
+    gen_lazy_table(lazy)
 
 
 if __name__ == '__main__':
@@ -7,78 +7,168 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 
+import argparse
 import asyncio
+import collections
 import logging
-import struct
 import sys
 
 import eti.v9_1 as eti
 
 from dressup import pformat
+import etijournal
+from eticorr import Correlator
+from etisched import SendScheduler, TokenBucket
+from etistream import FrameDecoder, MessageWriter, SessionProtocol, set_nodelay
 
 
 log = logging.getLogger(__name__)
 
-len_st = struct.Struct('<I')
 
+# i.e. with a journal, the message is just recorded there, cf.
+# `etijournal.py dump`
+def log_received(bs, journal=None, session=0):
+    m = eti.unpack_from(bs, strip=True)
+    if journal is not None:
+        journal.record(session, etijournal.IN, bs)
+    elif log.isEnabledFor(logging.INFO):
+        log.info(f'next message size: {len(bs)}')
+        log.info(f'Received: {pformat(m, width=45)}')
+    return m
 
-async def read_one(stream):
-    bs = await stream.readexactly(4)
-    n = len_st.unpack(bs)[0]
-    log.info(f'next message size: {n}')
-    rest = await stream.readexactly(n - 4)
-    bs += rest
-    m = eti.unpack_from(bs)
-    m.rstrip()
-    log.info(f'Received: {pformat(m, width=45)}')
 
-async def read_everything(stream):
-    try:
+class StreamSession:
+
+    def __init__(self, rstream, wstream, pool=None, journal=None, session=0):
+        self.rstream = rstream
+        self.wstream = wstream
+        self.journal = journal
+        self.session = session
+        t = wstream.transport
+        if journal is not None:
+            t = etijournal.JournalTransport(t, journal, session)
+        self.writer = MessageWriter(t, pool=pool)
+        self.corr = Correlator(eti.request2response, timeout=5)
+        self.sched = SendScheduler(self.writer, seq=1, on_send=self.corr.sent)
+        self.decoder = FrameDecoder(eti.header_st, pool=pool)
+
+    @staticmethod
+    async def connect(host, port, pool=None, journal=None, session=0):
+        rstream, wstream = await asyncio.open_connection(host, port)
+        set_nodelay(wstream.transport)
+        return StreamSession(rstream, wstream, pool, journal, session)
+
+    async def send(self, x):
+        self.sched.submit(x)
+        await self.wstream.drain()
+
+    # i.e. requires a concurrent reader, cf. read_everything()
+    async def request(self, x):
+        f = self.corr.request(x)
+        await self.send(x)
+        return await f
+
+    async def read_one(self):
         while True:
-            await read_one(stream)
-    except asyncio.IncompleteReadError:
-        log.info('Got EOF on read end')
+            for bs in self.decoder:
+                m = log_received(bs, self.journal, self.session)
+                self.corr.response(m)
+                return m
+            bs = await self.rstream.read(64 * 1024)
+            if not bs:
+                raise asyncio.IncompleteReadError(b'', None)
+            self.decoder.feed(bs)
 
+    async def read_everything(self):
+        try:
+            while True:
+                await self.read_one()
+        except asyncio.IncompleteReadError:
+            log.info('Got EOF on read end')
+        except ConnectionError as e:
+            log.warning(f'Connection lost: {e}')
+        finally:
+            self.corr.close()
+            self.decoder.release()
 
-async def client(host, port):
-    rstream, wstream = await asyncio.open_connection(host, port)
-    bs = bytearray(1024)
+    async def close(self):
+        self.sched.close()
+        self.wstream.close()
+        await self.wstream.wait_closed()
+        self.writer.release()
 
-    x = eti.LogonRequest()
-    x.HeartBtInt = 2300000 # ms
-    x.ApplUsageOrders = eti.ApplUsageOrders.AUTOMATED
-    x.ApplUsageQuotes = eti.ApplUsageQuotes.AUTOMATED
-    x.OrderRoutingIndicator = eti.OrderRoutingIndicator.NO
-    x.ApplicationSystemName = b'myRoboTrader'
-    x.ApplicationSystemVersion = b'1.666'
-    x.ApplicationSystemVendor = b'ACME Inc.'
 
-    x.PartyIDSessionID = 471142
-    x.Password = b'einsfueralles'
-    x.RequestHeader.MsgSeqNum = 1
+# i.e. same interface as StreamSession, on top of a BufferedProtocol
+class ProtocolSession(SessionProtocol):
 
-    n = x.pack_into(bs)
+    def __init__(self, pool=None, journal=None, session=0):
+        super().__init__(eti.header_st, pool=pool)
+        self.journal = journal
+        self.session = session
+        self.received = collections.deque()
+        self.waiter = None
 
-    wstream.write(memoryview(bs)[:n])
-    log.info('Sending Logon')
-    await wstream.drain()
-    await read_one(rstream)
+    @staticmethod
+    async def connect(host, port, pool=None, journal=None, session=0):
+        _, p = await asyncio.get_running_loop().create_connection(
+                lambda: ProtocolSession(pool, journal, session), host, port)
+        return p
 
-    x = eti.UserLoginRequest()
-    x.RequestHeader.MsgSeqNum = 2
-    x.Username = 23
-    x.Password = b'P4s7w0rd'
-    n = x.pack_into(bs)
+    def message_received(self, bs):
+        m = log_received(bs, self.journal, self.session)
+        self.corr.response(m)
+        self.received.append(m)
+        self.wakeup()
 
-    wstream.write(memoryview(bs)[:n])
-    log.info('Sending Login')
-    await wstream.drain()
-    await read_one(rstream)
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+        self.wakeup()
 
-    reader = asyncio.create_task(read_everything(rstream))
-    # ^ Python 3.7, prior:
-    # reader = asyncio.ensure_future(read_everything(rstream))
+    def wakeup(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        if self.journal is not None:
+            self.writer.transport = etijournal.JournalTransport(transport, self.journal, self.session)
+        self.corr = Correlator(eti.request2response, timeout=5)
+        self.sched = SendScheduler(self.writer, seq=1, on_send=self.corr.sent)
+
+    async def send(self, x):
+        self.sched.submit(x)
+
+    async def request(self, x):
+        f = self.corr.request(x)
+        await self.send(x)
+        return await f
+
+    async def read_one(self):
+        while not self.received:
+            if self.closed.done():
+                raise asyncio.IncompleteReadError(b'', None)
+            self.waiter = self.closed.get_loop().create_future()
+            await self.waiter
+        return self.received.popleft()
+
+    async def read_everything(self):
+        try:
+            while True:
+                await self.read_one()
+        except asyncio.IncompleteReadError:
+            log.info('Got EOF on read end')
+        except ConnectionError as e:
+            log.warning(f'Connection lost: {e}')
+        finally:
+            self.corr.close()
 
+    async def close(self):
+        self.sched.close()
+        self.transport.close()
+        await self.closed
+
+
+def mk_ioc(cl_ord_id):
     x = eti.NewOrderSingleShortRequest()
     x.RequestHeader.SenderSubID = 23 # logged in user name
     x.ExecutingTrader = 1337
@@ -94,30 +184,103 @@ async def client(host, port):
     x.PartyIdInvestmentDecisionMaker = 0
     x.ExecutingTraderQualifier = eti.ExecutingTraderQualifier.ALGO
 
-    x.RequestHeader.MsgSeqNum = 3
     x.Side = eti.Side.BUY
     x.OrderQty = 42 * 10**4
     x.SimpleSecurityID = 23
     x.Price = 404 * 10**8
-    x.ClOrdID = 666
-    n = x.pack_into(bs)
+    x.ClOrdID = cl_ord_id
+    return x
 
-    wstream.write(memoryview(bs)[:n])
-    log.info('Sending IOC')
-    await wstream.drain()
+async def connect(host, port, buffered=False, pool=None, journal=None, session=0):
+    if buffered:
+        s = await ProtocolSession.connect(host, port, pool, journal, session)
+    else:
+        s = await StreamSession.connect(host, port, pool, journal, session)
 
-    await asyncio.sleep(3)
+    s.reader = asyncio.create_task(s.read_everything())
+    # ^ Python 3.7, prior:
+    # s.reader = asyncio.ensure_future(s.read_everything())
+    return s
 
-    wc = wstream.close()
-    await wstream.wait_closed()
+# i.e. session logon and user login, returns False if rejected
+async def logon(s, session_id=471142, password=b'einsfueralles', username=23,
+        user_password=b'P4s7w0rd'):
+    x = eti.LogonRequest()
+    x.HeartBtInt = 2300000 # ms
+    x.ApplUsageOrders = eti.ApplUsageOrders.AUTOMATED
+    x.ApplUsageQuotes = eti.ApplUsageQuotes.AUTOMATED
+    x.OrderRoutingIndicator = eti.OrderRoutingIndicator.NO
+    x.ApplicationSystemName = b'myRoboTrader'
+    x.ApplicationSystemVersion = b'1.666'
+    x.ApplicationSystemVendor = b'ACME Inc.'
 
-    await reader
+    x.PartyIDSessionID = session_id
+    x.Password = password
+
+    log.info('Sending Logon')
+    m, = await s.request(x)
+    if not isinstance(m, eti.LogonResponse):
+        return False
+    # i.e. throttle the session as announced by the exchange
+    s.sched.bucket = TokenBucket.from_logon(m)
+
+    x = eti.UserLoginRequest()
+    x.Username = username
+    x.Password = user_password
+    log.info('Sending Login')
+    m, = await s.request(x)
+    return isinstance(m, eti.UserLoginResponse)
+
+async def client(host, port, buffered=False, orders=1, journal=None):
+    s = await connect(host, port, buffered, journal=journal)
+
+    if not await logon(s):
+        log.error('Logon failed')
+        await s.close()
+        await s.reader
+        return 1
+
+    # i.e. pipelined, the requests are correlated with their responses
+    log.info(f'Sending {orders} IOC(s)')
+    rs = await asyncio.gather(*[ s.request(mk_ioc(666 + i)) for i in range(orders) ],
+            return_exceptions=True)
+    # i.e. e.g. timed out requests or requests in flight when the
+    # connection was lost
+    errors = [ (666 + i, r) for i, r in enumerate(rs) if isinstance(r, BaseException) ]
+    for cl_ord_id, e in errors:
+        log.error(f'IOC (ClOrdID={cl_ord_id}) failed: {e!r}')
+
+    log.info(f'Send statistics: {s.sched.stats()}')
+    log.info(f'Round-trip latencies (us): {s.corr.stats()}')
+    await s.close()
+
+    await s.reader
+    if errors:
+        log.error(f'{len(errors)} of {orders} IOC(s) failed')
+        return 1
+
+def parse_args():
+    p = argparse.ArgumentParser(description='ETI example client')
+    p.add_argument('host', help='address to connect to')
+    p.add_argument('port', type=int, help='port to connect to')
+    p.add_argument('--buffered', action='store_true',
+            help='use a BufferedProtocol based transport instead of streams')
+    p.add_argument('--orders', type=int, default=1,
+            help='number of IOC orders to send without waiting for the responses (default: %(default)d)')
+    p.add_argument('--journal', metavar='FILE',
+            help='record all messages into a binary journal instead of logging them (cf. etijournal.py dump)')
+    args = p.parse_args()
+    return args
 
 def main():
-    host = sys.argv[1]
-    port = int(sys.argv[2])
+    args = parse_args()
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(client(host, port))
+    journal = etijournal.Journal(args.journal, eti.__name__) if args.journal else None
+    try:
+        return asyncio.run(client(args.host, args.port, args.buffered, args.orders, journal))
+    finally:
+        if journal is not None:
+            journal.close()
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+
+# Measure request/response round-trip times against an ETI server,
+# e.g. against eti_server.py with and without --buffered.
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from eti_client import eti, ProtocolSession, StreamSession
+from etihist import percentile
+
+
+async def measure(host, port, buffered, n, warmup):
+    if buffered:
+        s = await ProtocolSession.connect(host, port)
+    else:
+        s = await StreamSession.connect(host, port)
+
+    # i.e. a request with exactly one response
+    x = eti.UserLoginRequest()
+    x.Username = 23
+    x.Password = b'geheim'
+
+    ts = []
+    for i in range(warmup + n):
+        a = time.perf_counter_ns()
+        # i.e. registered such that the response is matched
+        f = s.corr.request(x)
+        await s.send(x)
+        await s.read_one()
+        b = time.perf_counter_ns()
+        await f
+        if i >= warmup:
+            ts.append(b - a)
+
+    await s.close()
+    return ts
+
+def report(ts):
+    ts.sort()
+    print(f'n={len(ts)}', ' '.join(f'p{p:g}={percentile(ts, p) / 1000:.1f}us'
+        for p in (50, 90, 99, 99.9)), f'max={ts[-1] / 1000:.1f}us')
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Measure ETI round-trip times')
+    p.add_argument('host', help='address to connect to')
+    p.add_argument('port', type=int, help='port to connect to')
+    p.add_argument('--buffered', action='store_true',
+            help='use a BufferedProtocol based transport instead of streams')
+    p.add_argument('-n', type=int, default=10000, help='number of round-trips (default: %(default)d)')
+    p.add_argument('--warmup', type=int, default=1000,
+            help='number of unrecorded round-trips before measuring (default: %(default)d)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    ts = asyncio.run(measure(args.host, args.port, args.buffered, args.n, args.warmup))
+    report(ts)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,19 +10,24 @@
 
 import argparse
 import asyncio
+import itertools
 import logging
 import random
-import struct
 import sys
 
 import eti.v13_0 as eti
 
 from dressup import pformat
+import etijournal
+from etimatch import BUY, Engine
+from etistream import FrameDecoder, MessageWriter, SessionProtocol
 
 
 log = logging.getLogger(__name__)
 
-len_st = struct.Struct('<I')
+responder = None
+matcher = None
+journal = None
 
 
 def set_seq_num(m, seq):
@@ -38,78 +43,403 @@ def set_seq_num(m, seq):
         # broadcast messages are out of sequence ...
         return seq
 
-def send_response(wstream, xs, seq, bs):
+# i.e. all the responses are flushed together, by the caller
+def send_response(w, xs, seq, cl_ord_id=None):
     if not xs:
         return seq
     T, cond, zs = random.choice(xs)
     if T is not None:
         m = T()
         seq = set_seq_num(m, seq)
+        if cl_ord_id is not None and hasattr(m, 'ClOrdID'):
+            m.ClOrdID = cl_ord_id
         m.update_length()
 
-        n = m.pack_into(bs)
+        n = len(w)
+        n = w.pack(m) - n
         log.info(f'Sending Response: {T} (n={n})')
-        wstream.write(memoryview(bs)[:n])
 
-    return send_response(wstream, zs, seq, bs)
+    return send_response(w, zs, seq, cl_ord_id)
 
-def send_reject(wstream, text, seq, bs):
+# i.e. as the exchange, the responses echo the MsgSeqNum and ClOrdID of
+# the request, such that a client is able to correlate them
+def respond(w, m):
+    xs = eti.request2response[m.MessageHeaderIn.TemplateID]
+    send_response(w, xs, m.RequestHeader.MsgSeqNum, getattr(m, 'ClOrdID', None))
+
+def send_reject(w, text, seq):
     m = eti.Reject()
     m.NRResponseHeaderME.MsgSeqNum = seq
     m.SessionRejectReason = eti.SessionRejectReason.OTHER
     m.VarText = text.encode()
     m.VarTextLen = len(m.VarText)
     m.update_length()
-    n = m.pack_into(bs)
+    w.pack(m)
     log.info('Sending Reject')
-    wstream.write(memoryview(bs)[:n])
     return seq + 1
 
+# i.e. deterministically follows the first alternative, unless one of
+# the alternatives contains a template named in prefer
+def flow(xs, prefer=frozenset()):
+    if not xs:
+        return []
+    def names(x):
+        T, cond, zs = x
+        return ({ T.__name__ } if T is not None else set()).union(*(names(z) for z in zs))
+    T, cond, zs = next((x for x in xs if names(x) & prefer), xs[0])
+    return ([] if T is None else [ T ]) + flow(zs, prefer)
+
+
+# Replies with responses that are packed once, at startup, i.e. per
+# request only the header is peeked at and the MsgSeqNum and ClOrdID
+# are copied from the request into the pre-packed responses.
+#
+# Only counters are maintained instead of logging each message.
+class Responder:
+
+    def __init__(self, prefer=frozenset()):
+        self.replies = {}
+        self.received = 0
+        self.sent = 0
+        self.unknown = 0
+        for tid, xs in eti.request2response.items():
+            ms = [ T() for T in flow(xs, prefer) ]
+            blob = bytearray()
+            seqs, cl_ord_ids = [], []
+            for m in ms:
+                m.update_length()
+                T = type(m)
+                # i.e. a Heartbeat just consists of its message header
+                f = getattr(T, f'set_{T.layout[1][0]}_MsgSeqNum', None) if len(T.layout) > 1 else None
+                if f is not None:
+                    seqs.append((f, len(blob)))
+                f = getattr(T, 'set_ClOrdID', None)
+                if f is not None:
+                    cl_ord_ids.append((f, len(blob)))
+                blob += m.pack()
+            c = getattr(eti, tid.name)
+            names = ['RequestHeader.MsgSeqNum']
+            if hasattr(c, 'set_ClOrdID'):
+                names.append('ClOrdID')
+            self.replies[tid] = (eti.compile_projection(tid, names), blob, seqs,
+                    cl_ord_ids if len(names) > 1 else [], len(ms))
+
+    def respond(self, w, bs):
+        self.received += 1
+        tid = eti.peek_header(bs)[1]
+        try:
+            proj, blob, seqs, cl_ord_ids, k = self.replies[tid]
+        except KeyError:
+            self.unknown += 1
+            return
+        vs = proj(bs)
+        for f, off in seqs:
+            f(blob, off, vs[0])
+        for f, off in cl_ord_ids:
+            f(blob, off, vs[1])
+        w.write(blob)
+        self.sent += k
+
+
+# i.e. NO_VALUE of unsigned 8 byte integers
+NO_U8 = 0xFFFFFFFFFFFFFFFF
+
+def u8(v):
+    return None if v == NO_U8 else v
+
+def ord_status(o):
+    if not o.leaves:
+        return eti.OrdStatus.FILLED
+    if not o.alive:
+        return eti.OrdStatus.CANCELED
+    return eti.OrdStatus.PARTIALLY_FILLED if o.cum else eti.OrdStatus.NEW
+
+
+# Processes order entry requests with an in-memory matching engine
+# (cf. etimatch.py) and replies with execution reports that contain a
+# fill for each match and - if legs > 0 - leg executions, as if all
+# instruments were complex instruments with that many legs.
+#
+# The counterparty of each match gets an OrderExecReportBroadcast on
+# its session. IOC and FOK orders are cancelled after matching, i.e.
+# FOK is treated as IOC.
+class Matcher:
+
+    def __init__(self, legs=0):
+        self.engine = Engine()
+        self.legs = legs
+        self.exec_ids = itertools.count(1)
+        self.handlers = {
+            eti.TemplateID.NewOrderSingleShortRequest : self.new,
+            eti.TemplateID.ModifyOrderSingleRequest   : self.modify,
+            eti.TemplateID.DeleteOrderSingleRequest   : self.delete,
+        }
+
+    def fill_exec(self, x, o, fills):
+        x.OrderID = o.order_id
+        x.ClOrdID = o.cl_ord_id
+        x.SecurityID = o.security_id
+        x.ExecID = next(self.exec_ids)
+        x.CumQty = o.cum
+        if o.alive or not o.leaves:
+            x.LeavesQty, x.CxlQty = o.leaves, 0
+        else:
+            x.LeavesQty, x.CxlQty = 0, o.leaves
+            x.ExecRestatementReason = eti.ExecRestatementReason.IOC_ORDER_CANCELLED
+        x.OrdStatus = ord_status(o)
+        x.ExecType = eti.ExecType.TRADE if fills else eti.ExecType.CANCELED
+        for f in fills:
+            g = eti.FillsGrpComp()
+            g.FillPx = f.price
+            g.FillQty = f.qty
+            g.FillMatchID = f.match_id & 0xFFFFFFFF
+            g.FillExecID = x.ExecID & 0x7FFFFFFF
+            x.FillsGrp.append(g)
+            for i in range(self.legs):
+                g = eti.InstrmntLegExecGrpComp()
+                g.LegSecurityID = o.security_id * 1000 + i + 1
+                g.LegLastPx = f.price
+                g.LegLastQty = f.qty
+                g.LegSide = eti.LegSide.BUY if (o.side == BUY) == (i % 2 == 0) else eti.LegSide.SELL
+                x.InstrmntLegExecGrp.append(g)
+        x.NoFills = len(x.FillsGrp)
+        x.NoLegExecs = len(x.InstrmntLegExecGrp)
+        x.update_length()
+        return x
+
+    def broadcast(self, o, fills, reason=None):
+        x = self.fill_exec(eti.OrderExecReportBroadcast(), o, fills)
+        x.OrderQty = o.qty
+        x.Price = o.price
+        x.Side = o.side
+        if reason is not None:
+            x.ExecRestatementReason = reason
+        return x
+
+    # i.e. one broadcast per passive order, on its session
+    def notify(self, w, fills):
+        ps = {}
+        for f in fills:
+            ps.setdefault(f.passive, []).append(f)
+        for p, fs in ps.items():
+            v = p.owner
+            if v.transport.is_closing():
+                continue
+            v.pack(self.broadcast(p, fs, eti.ExecRestatementReason.BOOK_ORDER_EXECUTED))
+            if v is not w:
+                v.flush()
+
+    def new(self, w, m, seq):
+        ioc = m.TimeInForce in (eti.TimeInForce.IOC, eti.TimeInForce.FOK)
+        o, fills = self.engine.new(w, m.ClOrdID, m.SimpleSecurityID, m.Side, m.Price,
+                m.OrderQty, ioc)
+        if o.alive and not fills:
+            x = eti.NewOrderNRResponse()
+            x.NRResponseHeaderME.MsgSeqNum = seq
+            x.OrderID = o.order_id
+            x.ClOrdID = o.cl_ord_id
+            x.SecurityID = o.security_id
+            x.ExecID = next(self.exec_ids)
+            x.OrdStatus = eti.OrdStatus.NEW
+            x.ExecType = eti.ExecType.NEW
+            x.ExecRestatementReason = eti.ExecRestatementReason.ORDER_ADDED
+            w.pack(x)
+            return
+        x = self.fill_exec(eti.OrderExecResponse(), o, fills)
+        x.ResponseHeaderME.MsgSeqNum = seq
+        w.pack(x)
+        w.pack(self.broadcast(o, fills))
+        self.notify(w, fills)
+
+    def modify(self, w, m, seq):
+        o, fills = self.engine.modify(w, u8(m.OrderID), u8(m.OrigClOrdID), m.ClOrdID,
+                m.Price, m.OrderQty)
+        if o is None:
+            send_reject(w, 'unknown order', seq)
+            return
+        x = eti.ModifyOrderResponse()
+        x.ResponseHeaderME.MsgSeqNum = seq
+        x.OrderID = o.order_id
+        x.ClOrdID = o.cl_ord_id
+        x.OrigClOrdID = m.OrigClOrdID
+        x.SecurityID = o.security_id
+        x.ExecID = next(self.exec_ids)
+        x.LeavesQty = o.leaves
+        x.CumQty = o.cum
+        x.CxlQty = 0
+        x.OrdStatus = ord_status(o)
+        x.ExecType = eti.ExecType.REPLACED
+        x.ExecRestatementReason = eti.ExecRestatementReason.ORDER_MODIFIED
+        w.pack(x)
+        if fills:
+            w.pack(self.broadcast(o, fills))
+            self.notify(w, fills)
+
+    def delete(self, w, m, seq):
+        o, _ = self.engine.delete(w, u8(m.OrderID), u8(m.OrigClOrdID))
+        if o is None:
+            send_reject(w, 'unknown order', seq)
+            return
+        x = eti.DeleteOrderResponse()
+        x.ResponseHeaderME.MsgSeqNum = seq
+        x.OrderID = o.order_id
+        x.ClOrdID = m.ClOrdID
+        x.OrigClOrdID = o.cl_ord_id
+        x.SecurityID = o.security_id
+        x.ExecID = next(self.exec_ids)
+        x.CumQty = o.cum
+        x.CxlQty = o.leaves
+        x.OrdStatus = eti.OrdStatus.CANCELED
+        x.ExecType = eti.ExecType.CANCELED
+        x.ExecRestatementReason = eti.ExecRestatementReason.ORDER_CANCELLED
+        w.pack(x)
+
+    # i.e. returns False if it isn't an order entry request
+    def respond(self, w, bs):
+        f = self.handlers.get(eti.peek_header(bs)[1])
+        if f is None:
+            return False
+        m = eti.unpack_from(bs)
+        log_received(m)
+        f(w, m, m.RequestHeader.MsgSeqNum)
+        return True
+
+
+async def report(interval):
+    n = 0
+    while True:
+        await asyncio.sleep(interval)
+        if responder is not None and responder.received != n:
+            r = responder
+            log.info(f'received {(r.received - n) / interval:.0f} msgs/s, total: received={r.received} sent={r.sent} unknown={r.unknown}')
+            n = r.received
+        if matcher is not None and matcher.engine.latency:
+            log.info(f'matching latency (us): {matcher.engine.stats()}')
+            del matcher.engine.latency[:]
+
+
+# i.e. with a journal, the messages are just recorded there, cf.
+# `etijournal.py dump`
+def log_received(m):
+    if journal is None and log.isEnabledFor(logging.INFO):
+        log.info(f'Received: {pformat(m, width=45)}')
+
 async def serve_session(rstream, wstream):
-    seq = 1
-    buf = bytearray(1024)
     global logon_count
     lc = logon_count
     logon_count += 1
-    try:
-        while True:
-            bs = await rstream.readexactly(4)
-            n = len_st.unpack(bs)[0]
-            rest = await rstream.readexactly(n - 4)
-            bs += rest
-            m = eti.unpack_from(bs)
-            m.rstrip()
-            log.info(f'Received: {pformat(m, width=45)}')
+    t = wstream.transport
+    if journal is not None:
+        t = etijournal.JournalTransport(t, journal, lc)
+    w = MessageWriter(t)
+    d = FrameDecoder(eti.header_st)
+    while True:
+        bs = await rstream.read(64 * 1024)
+        if not bs:
+            log.info('Got EOF on read end')
+            return
+        d.feed(bs)
+        for bs in d:
+            if journal is not None:
+                journal.record(lc, etijournal.IN, bs)
+            if matcher is not None and matcher.respond(w, bs):
+                continue
+            if responder is not None:
+                responder.respond(w, bs)
+                continue
+            m = eti.unpack_from(bs, strip=True)
+            log_received(m)
 
             if lc == reject_nth_logon:
-                send_reject(wstream, 'You cannot logon until you have payed your bills!',
-                    seq, buf)
+                send_reject(w, 'You cannot logon until you have payed your bills!', m.RequestHeader.MsgSeqNum)
+                w.flush()
                 await wstream.drain()
                 wstream.close()
                 await wstream.wait_closed()
                 log.info('rejected session, connection closed')
                 return
 
-            xs = eti.request2response[m.MessageHeaderIn.TemplateID]
+            respond(w, m)
+        # i.e. the responses to all requests received at once are sent at once
+        w.flush()
+        await wstream.drain()
+
+
+# i.e. same as serve_session(), but on top of a BufferedProtocol
+class Session(SessionProtocol):
+
+    def __init__(self):
+        super().__init__(eti.header_st)
+        global logon_count
+        self.lc = logon_count
+        logon_count += 1
+
+    def connection_made(self, transport):
+        super().connection_made(transport)
+        if journal is not None:
+            self.writer.transport = etijournal.JournalTransport(transport, journal, self.lc)
 
-            seq = send_response(wstream, xs, seq, buf)
-            await wstream.drain()
+    def message_received(self, bs):
+        if journal is not None:
+            journal.record(self.lc, etijournal.IN, bs)
+        if matcher is not None and matcher.respond(self.writer, bs):
+            return
+        if responder is not None:
+            responder.respond(self.writer, bs)
+            return
+        m = eti.unpack_from(bs, strip=True)
+        log_received(m)
 
-    except asyncio.IncompleteReadError:
+        if self.lc == reject_nth_logon:
+            send_reject(self.writer, 'You cannot logon until you have payed your bills!', m.RequestHeader.MsgSeqNum)
+            self.writer.flush()
+            self.transport.close()
+            log.info('rejected session, connection closed')
+            return
+
+        respond(self.writer, m)
+
+    def eof_received(self):
         log.info('Got EOF on read end')
 
 
-async def server(host, port):
-    s = await asyncio.start_server(serve_session, host, port)
+async def server(host, port, buffered=False, stats_interval=1):
+    if buffered:
+        s = await asyncio.get_running_loop().create_server(Session, host, port)
+    else:
+        s = await asyncio.start_server(serve_session, host, port)
 
-    async with s:
-        await s.serve_forever()
+    reporter = None
+    if responder is not None or matcher is not None:
+        reporter = asyncio.create_task(report(stats_interval))
+    try:
+        async with s:
+            await s.serve_forever()
+    finally:
+        if reporter is not None:
+            reporter.cancel()
 
 def parse_args():
     p = argparse.ArgumentParser(description='ETI example server')
     p.add_argument('host', help='address to bind to')
     p.add_argument('port', type=int, help='port to listen on')
     p.add_argument('--reject-nth-logon', type=int, help='reject the nth logon (count start at 0)')
+    p.add_argument('--buffered', action='store_true',
+            help='use a BufferedProtocol based transport instead of streams')
+    p.add_argument('--quiet', '-q', action='store_true',
+            help="don't log each message, e.g. when measuring latencies")
+    p.add_argument('--perf', action='store_true',
+            help='reply with pre-packed responses and only log counters, e.g. for load tests')
+    p.add_argument('--flow', action='append', default=[], metavar='TEMPLATE',
+            help='in --perf mode, prefer the alternative responses that contain TEMPLATE (e.g. OrderExecResponse), otherwise the first alternative is used')
+    p.add_argument('--stats-interval', type=float, default=1, metavar='SECONDS',
+            help='in --perf/--match mode, log the counters every SECONDS (default: %(default)s)')
+    p.add_argument('--match', action='store_true',
+            help='process order entry requests with a price-time priority matching engine')
+    p.add_argument('--legs', type=int, default=0,
+            help='in --match mode, add that many leg executions per fill (default: %(default)d)')
+    p.add_argument('--journal', metavar='FILE',
+            help='record all messages into a binary journal instead of logging them (cf. etijournal.py dump)')
     args = p.parse_args()
     return args
 
@@ -119,9 +449,19 @@ def main():
     reject_nth_logon = args.reject_nth_logon
     global logon_count
     logon_count = 0
-    logging.basicConfig(level=logging.INFO, datefmt='%Y-%m-%d %H:%M:%S',
+    global responder
+    responder = Responder(set(args.flow)) if args.perf else None
+    global matcher
+    matcher = Matcher(args.legs) if args.match else None
+    global journal
+    journal = etijournal.Journal(args.journal, eti.__name__) if args.journal else None
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, datefmt='%Y-%m-%d %H:%M:%S',
             format='%(asctime)s.%(msecs)03d [%(name)s] %(levelname).1s   %(message)s')
-    asyncio.run(server(args.host, args.port))
+    try:
+        asyncio.run(server(args.host, args.port, args.buffered, args.stats_interval))
+    finally:
+        if journal is not None:
+            journal.close()
 
 if __name__ == '__main__':
     try:
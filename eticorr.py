@@ -0,0 +1,215 @@
+
+# Correlate pipelined ETI requests with their responses
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import asyncio
+import collections
+import logging
+import time
+
+from etihist import Histogram
+
+log = logging.getLogger(__name__)
+
+
+NO_SEQ = 0xFFFFFFFF
+NO_CLORDID = 0xFFFFFFFFFFFFFFFF
+
+
+# i.e. the second component of a message is its request/response
+# header, if any, e.g. RequestHeader or ResponseHeaderME, whereas e.g.
+# a Heartbeat just consists of its message header
+def header(m):
+    layout = type(m).layout
+    return getattr(m, layout[1][0], None) if len(layout) > 1 else None
+
+def seq_num(m):
+    v = getattr(header(m), 'MsgSeqNum', NO_SEQ)
+    return None if v == NO_SEQ else v
+
+def cl_ord_id(m):
+    v = getattr(m, 'ClOrdID', NO_CLORDID)
+    return None if v == NO_CLORDID else v
+
+# i.e. flattens choices, cf. the None entries in request2response
+def expand(xs):
+    for T, cond, zs in xs:
+        if T is None:
+            yield from expand(zs)
+        else:
+            yield T, zs
+
+
+class Flow:
+
+    __slots__ = ('request', 'future', 'expected', 'responses', 'seq', 'cl_ord_id', 't', 'handle')
+
+    def __init__(self, request, future, expected):
+        self.request = request
+        self.future = future
+        self.expected = expected
+        self.responses = []
+        self.seq = None
+        self.cl_ord_id = None
+        self.t = None
+        self.handle = None
+
+
+# Tracks in-flight requests, such that many requests can be pipelined
+# on one session.
+#
+# request() returns a future that is resolved with the list of
+# response messages once the request's flow (as described by the
+# request2response table, e.g. a response followed by a notification)
+# is complete, or once a Reject is received. sent() must be called
+# after the request is packed, i.e. when its MsgSeqNum is final (cf.
+# SendScheduler.on_send). Each received message is passed to
+# response().
+#
+# The same message object may be submitted again before it's sent (e.g.
+# a reused template), thus, the queued flows of a message are kept in
+# FIFO order, i.e. in the order SendScheduler sends them, since they
+# have the same class and priority.
+#
+# Responses are matched via their MsgSeqNum and - if they don't have one,
+# e.g. broadcasts - via their ClOrdID. Responses that don't match an
+# in-flight request are counted and logged as unmatched, responses for
+# the last max_expired timed out requests as late. Notifications
+# without MsgSeqNum that don't match (e.g. the fill of a resting order)
+# are just counted as unsolicited.
+#
+# The round-trip latency (in ns, from sent() until the response is
+# received) is recorded into a histogram per response template, cf.
+# stats().
+class Correlator:
+
+    def __init__(self, request2response, timeout=None, clock=time.perf_counter_ns, max_expired=4096):
+        self.request2response = request2response
+        self.timeout = timeout
+        self.max_expired = max_expired
+        self.clock = clock
+        self.queued = {}
+        self.by_seq = {}
+        self.by_cl_ord_id = {}
+        self.expired = collections.OrderedDict()
+        self.latency = collections.defaultdict(Histogram)
+        self.unmatched = 0
+        self.unsolicited = 0
+        self.late = 0
+
+    def __len__(self):
+        return sum(len(q) for q in self.queued.values()) + len(self.by_seq)
+
+    # i.e. since a queued flow references its message, the id of the
+    # message isn't reused until the flow is sent
+    def request(self, m):
+        tid = m.MessageHeaderIn.TemplateID
+        f = asyncio.get_running_loop().create_future()
+        q = self.queued.setdefault(id(m), collections.deque())
+        q.append(Flow(m, f, self.request2response.get(tid, [])))
+        return f
+
+    def sent(self, m):
+        q = self.queued.get(id(m))
+        if q is None:
+            return
+        flow = q.popleft()
+        if not q:
+            del self.queued[id(m)]
+        flow.t = self.clock()
+        flow.seq = seq_num(m)
+        flow.cl_ord_id = cl_ord_id(m)
+        if flow.seq is not None:
+            self.by_seq[flow.seq] = flow
+        if flow.cl_ord_id is not None:
+            self.by_cl_ord_id[flow.cl_ord_id] = flow
+        if not any(expand(flow.expected)):
+            self.finish(flow)
+        elif self.timeout is not None:
+            flow.handle = flow.future.get_loop().call_later(self.timeout, self.expire, flow)
+
+    def find(self, m):
+        k = seq_num(m)
+        if k is not None:
+            return self.by_seq.get(k), ('seq', k)
+        k = cl_ord_id(m)
+        if k is not None:
+            return self.by_cl_ord_id.get(k), ('clordid', k)
+        return None, None
+
+    # i.e. returns the flow the message belongs to, or None
+    def response(self, m):
+        t = self.clock()
+        flow, k = self.find(m)
+        if flow is None:
+            if k in self.expired:
+                self.late += 1
+                log.warning(f'Late response: {type(m).__name__} ({k[0]}={k[1]})')
+            elif k is None or k[0] == 'clordid':
+                # i.e. a notification such as the fill of a resting order
+                # or a heartbeat
+                self.unsolicited += 1
+            else:
+                self.unmatched += 1
+                log.warning(f'Unmatched response: {type(m).__name__} ({k})')
+            return None
+        T = type(m)
+        name = T.__name__
+        if name == 'Reject':
+            zs = []
+        else:
+            zs = next((zs for U, zs in expand(flow.expected) if U is T), None)
+            if zs is None:
+                self.unmatched += 1
+                log.warning(f'Unexpected response: {name} for {type(flow.request).__name__}')
+                return None
+        self.latency[name].record(t - flow.t)
+        flow.responses.append(m)
+        flow.expected = zs
+        if not any(expand(zs)):
+            self.finish(flow)
+        return flow
+
+    def forget(self, flow):
+        if flow.handle is not None:
+            flow.handle.cancel()
+        if self.by_seq.get(flow.seq) is flow:
+            del self.by_seq[flow.seq]
+        if self.by_cl_ord_id.get(flow.cl_ord_id) is flow:
+            del self.by_cl_ord_id[flow.cl_ord_id]
+
+    def finish(self, flow):
+        self.forget(flow)
+        if not flow.future.done():
+            flow.future.set_result(flow.responses)
+
+    def expire(self, flow):
+        flow.handle = None
+        self.forget(flow)
+        if flow.seq is not None:
+            self.expired[('seq', flow.seq)] = None
+        if flow.cl_ord_id is not None:
+            self.expired[('clordid', flow.cl_ord_id)] = None
+        # i.e. the keys of the oldest timed out requests are forgotten,
+        # i.e. their late responses are counted as unmatched
+        while len(self.expired) > self.max_expired:
+            self.expired.popitem(last=False)
+        if not flow.future.done():
+            flow.future.set_exception(asyncio.TimeoutError(
+                f'{type(flow.request).__name__} (MsgSeqNum={flow.seq}) timed out'))
+
+    # i.e. fails all in-flight requests, e.g. when the connection is lost
+    def close(self, exc=None):
+        flows = [ flow for q in self.queued.values() for flow in q ] + list(self.by_seq.values()) + list(self.by_cl_ord_id.values())
+        self.queued.clear()
+        for flow in flows:
+            self.forget(flow)
+            if not flow.future.done():
+                flow.future.set_exception(exc or ConnectionError('session closed'))
+
+    # i.e. latency percentiles in microseconds, per response template
+    def stats(self):
+        return { k: h.summary((50, 90, 99)) for k, h in self.latency.items() }
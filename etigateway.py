@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+
+# Run many ETI sessions concurrently on one event loop
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+import eti_client
+from etihist import percentile
+from etistream import BufferPool
+
+
+log = logging.getLogger(__name__)
+
+
+# i.e. 'auto' uses uvloop if it's installed, returns the name of the
+# selected event loop implementation
+def set_loop_policy(name='auto'):
+    if name == 'asyncio':
+        asyncio.set_event_loop_policy(None)
+        return name
+    try:
+        import uvloop
+    except ImportError:
+        if name == 'uvloop':
+            raise
+        return 'asyncio'
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return 'uvloop'
+
+
+# Manages n logged-in sessions to the same gateway, where session i
+# logs on with the PartyIDSessionID session_id + i.
+#
+# Each session has its own sequence numbers, send scheduler and
+# correlator (cf. eti_client.py), whereas the send/receive buffers are
+# taken from a BufferPool shared by all sessions.
+class Gateway:
+
+    def __init__(self, host, port, n, buffered=True, session_id=471142, username=23):
+        self.host = host
+        self.port = port
+        self.n = n
+        self.buffered = buffered
+        self.session_id = session_id
+        self.username = username
+        self.pool = BufferPool()
+        self.sessions = []
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __getitem__(self, i):
+        return self.sessions[i]
+
+    async def open(self, i):
+        s = await eti_client.connect(self.host, self.port, self.buffered, self.pool)
+        if not await eti_client.logon(s, self.session_id + i, username=self.username + i):
+            await s.close()
+            raise RuntimeError(f'logon of session {i} failed')
+        return s
+
+    async def start(self):
+        self.sessions = await asyncio.gather(*[ self.open(i) for i in range(self.n) ])
+
+    async def stop(self):
+        for s in self.sessions:
+            await s.close()
+        await asyncio.gather(*[ s.reader for s in self.sessions ])
+        self.sessions = []
+
+    # i.e. aggregated over all sessions
+    def stats(self):
+        return {
+            'sessions'  : len(self.sessions),
+            'buffers'   : self.pool.allocated,
+            'depth'     : sum(len(s.sched) for s in self.sessions),
+            'in_flight' : sum(len(s.corr) for s in self.sessions),
+            'unmatched' : sum(s.corr.unmatched for s in self.sessions),
+        }
+
+
+async def drive(s, n, window, cl_ord_id, ts):
+    sem = asyncio.Semaphore(window)
+    async def order(i):
+        async with sem:
+            a = time.perf_counter_ns()
+            await s.request(eti_client.mk_ioc(cl_ord_id + i))
+            ts.append(time.perf_counter_ns() - a)
+    await asyncio.gather(*[ order(i) for i in range(n) ])
+
+# i.e. sends n orders on each session, with at most window orders in
+# flight per session, returns orders/s and the order latencies
+async def measure(host, port, sessions, n, window, buffered):
+    g = Gateway(host, port, sessions, buffered)
+    await g.start()
+    ts = []
+    a = time.perf_counter()
+    await asyncio.gather(*[ drive(s, n, window, i * n, ts) for i, s in enumerate(g) ])
+    b = time.perf_counter()
+    await g.stop()
+    return sessions * n / (b - a), ts
+
+def report(loop, k, rate, ts):
+    ts.sort()
+    print(f'{loop} sessions={k} orders/s={rate:.0f}', ' '.join(f'p{p:g}={percentile(ts, p) / 1000:.0f}us'
+        for p in (50, 99, 99.9)), f'max={ts[-1] / 1000:.0f}us')
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Benchmark many concurrent ETI sessions')
+    p.add_argument('host', help='address to connect to')
+    p.add_argument('port', type=int, help='port to connect to')
+    p.add_argument('--sessions', type=int, nargs='+', default=[1, 4, 16, 64],
+            help='session counts to measure (default: %(default)s)')
+    p.add_argument('-n', type=int, default=2000, help='orders per session (default: %(default)d)')
+    p.add_argument('--window', type=int, default=16,
+            help='maximum number of orders in flight per session (default: %(default)d)')
+    p.add_argument('--stream', dest='buffered', action='store_false',
+            help='use asyncio streams instead of the BufferedProtocol based transport')
+    p.add_argument('--loop', choices=['auto', 'asyncio', 'uvloop'], default='auto',
+            help='event loop implementation (default: %(default)s)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    loop = set_loop_policy(args.loop)
+    for k in args.sessions:
+        rate, ts = asyncio.run(measure(args.host, args.port, k, args.n, args.window, args.buffered))
+        report(loop, k, rate, ts)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+
+# HDR style histogram with logarithmic buckets, e.g. for recording
+# latencies in ns
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import array
+
+
+# i.e. nearest-rank on sorted input, e.g. of exactly recorded latencies,
+# as Histogram.percentile()
+def percentile(xs, p):
+    return xs[max(0, int(-(-len(xs) * p // 100)) - 1)]
+
+
+# Values below 2**bits are recorded exactly, larger values with a
+# relative error of less than 2**(1-bits), e.g. 0.8 % with the default
+# bits=8, i.e. the histogram has a constant size (per power of two)
+# regardless of the number of recorded values.
+class Histogram:
+
+    def __init__(self, bits=8):
+        self.bits = bits
+        self.half = 1 << (bits - 1)
+        self.counts = array.array('Q')
+        self.n = 0
+        self.min = None
+        self.max = None
+
+    def __len__(self):
+        return self.n
+
+    def index(self, v):
+        b = max(0, v.bit_length() - self.bits)
+        return b * self.half + (v >> b)
+
+    # i.e. the largest value that maps to the same bucket
+    def value(self, i):
+        if i < 2 * self.half:
+            return i
+        b = i // self.half - 1
+        return ((i - b * self.half + 1) << b) - 1
+
+    def record(self, v, k=1):
+        i = self.index(v)
+        if i >= len(self.counts):
+            self.counts.frombytes(bytes(8 * (i + 1 - len(self.counts))))
+        self.counts[i] += k
+        self.n += k
+        if self.min is None or v < self.min:
+            self.min = v
+        if self.max is None or v > self.max:
+            self.max = v
+
+    def __iadd__(self, o):
+        if len(o.counts) > len(self.counts):
+            self.counts.frombytes(bytes(8 * (len(o.counts) - len(self.counts))))
+        for i, k in enumerate(o.counts):
+            self.counts[i] += k
+        self.n += o.n
+        for v in (o.min, o.max):
+            if v is not None:
+                self.min = v if self.min is None else min(self.min, v)
+                self.max = v if self.max is None else max(self.max, v)
+        return self
+
+    def percentile(self, p):
+        if not self.n:
+            return None
+        k = max(1, -(-self.n * p // 100))
+        s = 0
+        for i, c in enumerate(self.counts):
+            s += c
+            if s >= k:
+                return min(self.value(i), self.max)
+        return self.max
+
+    # i.e. in microseconds, assuming ns values
+    def summary(self, ps=(50, 90, 99, 99.9)):
+        if not self.n:
+            return { 'n': 0 }
+        return { 'n': self.n, **{ f'p{p:g}': self.percentile(p) / 1000 for p in ps },
+                'max': self.max / 1000 }
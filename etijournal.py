@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+
+# Append-only binary journal of ETI sessions, e.g. instead of
+# pretty-printing each message while it's sent/received
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import bisect
+import datetime
+import importlib
+import itertools
+import mmap
+import os
+import struct
+import sys
+import time
+
+
+MAGIC = b'ETIJRNL1'
+
+# i.e. magic, monotonic and realtime clock (in ns) at creation, name
+# of the generated module for decoding the messages (e.g. eti.v13_0)
+file_st = struct.Struct('<8sqq32s')
+
+# i.e. monotonic time (in ns), length, session, direction
+rec_st = struct.Struct('<qIIB3x')
+
+# i.e. monotonic time (in ns) and file offset of a record
+idx_st = struct.Struct('<qq')
+
+IN  = 0
+OUT = 1
+
+
+# Records raw messages (or chunks of back-to-back messages) together
+# with a timestamp, a session number and the direction into a
+# memory-mapped file, i.e. recording a message costs a struct.pack and
+# a memcpy.
+#
+# The file is grown in size steps (zero filled) and truncated to the
+# used length on close(), i.e. a reader stops at the first record of
+# length 0. The length of a record is written last, thus, a journal of
+# a crashed process can be read up to the last complete record.
+#
+# Every index_every records the timestamp and offset of a record is
+# appended to a small index file (path + '.idx'), such that a reader
+# can seek to a point in time without scanning the whole journal.
+class Journal:
+
+    def __init__(self, path, module, size=64 * 1024 * 1024, index_every=1024):
+        self.path = path
+        self.step = size
+        self.index_every = index_every
+        self.f = open(path, 'w+b')
+        self.f.truncate(size)
+        self.size = size
+        self.mm = mmap.mmap(self.f.fileno(), size)
+        file_st.pack_into(self.mm, 0, MAGIC, time.monotonic_ns(), time.time_ns(),
+                module.encode())
+        self.end = file_st.size
+        self.count = 0
+        self.idx = open(path + '.idx', 'wb')
+
+    def __len__(self):
+        return self.count
+
+    def record(self, session, direction, bs):
+        n = len(bs)
+        i = self.end
+        j = i + rec_st.size + n
+        if j > self.size:
+            self.grow(j)
+        t = time.monotonic_ns()
+        self.mm[i + rec_st.size:j] = bs
+        rec_st.pack_into(self.mm, i, t, n, session, direction)
+        self.end = j
+        if self.count % self.index_every == 0:
+            self.idx.write(idx_st.pack(t, i))
+        self.count += 1
+
+    def grow(self, n):
+        k = self.size
+        while k < n:
+            k += self.step
+        self.mm.resize(k)
+        self.size = k
+
+    def flush(self):
+        self.mm.flush()
+        self.idx.flush()
+
+    def close(self):
+        if self.mm is None:
+            return
+        self.mm.flush()
+        self.mm.close()
+        self.f.truncate(self.end)
+        self.f.close()
+        self.idx.close()
+        self.mm = None
+
+
+# i.e. journals everything written to the transport, e.g. by a
+# MessageWriter, as outgoing messages of the session
+class JournalTransport:
+
+    def __init__(self, transport, journal, session):
+        self.transport = transport
+        self.journal = journal
+        self.session = session
+
+    def write(self, bs):
+        self.journal.record(self.session, OUT, bs)
+        self.transport.write(bs)
+
+    def __getattr__(self, name):
+        return getattr(self.transport, name)
+
+
+# Iterates over the records of a journal, i.e. yields (time, session,
+# direction, bytes) tuples where the time is in ns since the journal
+# was created. Only the yielded records are copied out of the mapping.
+class Reader:
+
+    def __init__(self, path):
+        self.f = open(path, 'rb')
+        self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.mono0, self.real0, module = file_st.unpack_from(self.mm)
+        if magic != MAGIC:
+            raise ValueError(f'{path}: not a journal')
+        self.module = module.rstrip(b'\0').decode()
+        self.index = []
+        if os.path.exists(path + '.idx'):
+            with open(path + '.idx', 'rb') as f:
+                self.index = list(idx_st.iter_unpack(f.read()))
+
+    # i.e. the offset of an indexed record at or before t (in ns since
+    # the start)
+    def seek(self, t):
+        i = bisect.bisect_right(self.index, (self.mono0 + t, 2**63 - 1))
+        return file_st.size if i == 0 else self.index[i - 1][1]
+
+    def __iter__(self):
+        return self.records()
+
+    def records(self, since=0):
+        i = self.seek(since) if since else file_st.size
+        end = len(self.mm)
+        while i + rec_st.size <= end:
+            t, n, session, direction = rec_st.unpack_from(self.mm, i)
+            if n == 0:
+                break
+            j = i + rec_st.size
+            i = j + n
+            if t - self.mono0 < since:
+                continue
+            yield t - self.mono0, session, direction, self.mm[j:i]
+
+    # i.e. converts a record time into a wall clock time
+    def realtime(self, t):
+        return datetime.datetime.fromtimestamp((self.real0 + t) / 1e9)
+
+    def close(self):
+        self.mm.close()
+        self.f.close()
+
+
+# i.e. a record might contain several back-to-back messages, e.g. all
+# the ones written with one flush of a MessageWriter
+def split(header_st, bs):
+    i = 0
+    while i + header_st.size <= len(bs):
+        n = header_st.unpack_from(bs, i)[0]
+        if n < header_st.size:
+            raise ValueError(f'invalid BodyLen: {n}')
+        yield bs[i:i + n]
+        i += n
+
+
+# i.e. yields (time, session, direction, message) tuples
+def messages(r, header_st, sessions=None, since=0):
+    for t, session, direction, bs in r.records(since):
+        if sessions and session not in sessions:
+            continue
+        for m in split(header_st, bs):
+            yield t, session, direction, m
+
+def dump(path, sessions=None, since=0, count=None, brief=False, module=None, o=sys.stdout):
+    r = Reader(path)
+    # NB: only imported when actually dumping
+    from dressup import pformat
+    eti = importlib.import_module(module or r.module)
+    k = 0
+    for t, session, direction, m in itertools.islice(
+            messages(r, eti.header_st, sessions, since), count):
+        k += 1
+        prefix = f'{r.realtime(t):%H:%M:%S.%f} {session:4} {"<>"[direction]}'
+        try:
+            x = eti.unpack_from(m, strip=True)
+        except eti.UnpackError as e:
+            print(f'{prefix} {e}', file=o)
+            continue
+        print(f'{prefix} {type(x).__name__} ({len(m)} bytes)', file=o)
+        if not brief:
+            print(pformat(x, width=45), file=o)
+    r.close()
+    return k
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description='ETI session journal tool')
+    ps = p.add_subparsers(dest='cmd', required=True)
+    q = ps.add_parser('dump', help='decode and pretty-print the messages of a journal')
+    q.add_argument('filename', help='journal file')
+    q.add_argument('--session', type=int, action='append',
+            help='only dump messages of that session (can be specified multiple times)')
+    q.add_argument('--since', type=float, default=0, metavar='SECONDS',
+            help='skip the messages of the first SECONDS after the journal was created')
+    q.add_argument('--count', '-n', type=int, help='dump at most that many messages')
+    q.add_argument('--brief', action='store_true', help='only print one line per message')
+    q.add_argument('--module', help='decode with that module instead of the recorded one (e.g. eti.v9_1)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    if args.cmd == 'dump':
+        dump(args.filename, args.session, int(args.since * 1e9), args.count, args.brief, args.module)
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        pass
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+
+
+# Open-loop ETI load generator, e.g. against eti_server.py
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import argparse
+import asyncio
+import functools
+import logging
+import random
+import sys
+import time
+
+import eti_client
+from eti_client import eti
+from etigateway import Gateway, set_loop_policy
+from etihist import Histogram
+
+
+log = logging.getLogger(__name__)
+
+
+TICK = 10**8 // 100
+MID = 100 * 10**8
+
+
+def parse_mix(s):
+    r = {}
+    for kv in s.split(','):
+        k, v = kv.split('=')
+        if k not in ('ioc', 'gtc', 'modify', 'cancel'):
+            raise argparse.ArgumentTypeError(f'unknown order type: {k}')
+        r[k] = float(v)
+    return r
+
+# i.e. the (non-short) modify/delete layouts of the exchange carry
+# SecurityID, other layouts SimpleSecurityID
+def security_field(T):
+    names = { k for k, _, _ in T.layout }
+    return 'SecurityID' if 'SecurityID' in names else 'SimpleSecurityID'
+
+
+# Generates orders for one session, where modify/cancel requests refer
+# to previously sent GTC orders of the same session.
+class OrderFlow:
+
+    def __init__(self, mix, seed, first_id, security_id=23):
+        self.kinds = list(mix)
+        self.weights = list(mix.values())
+        self.rnd = random.Random(seed)
+        self.ids = iter(range(first_id, first_id + 10**9))
+        self.security_id = security_id
+        self.live = []
+        self.security_fields = { T: security_field(T)
+                for T in (eti.ModifyOrderSingleRequest, eti.DeleteOrderSingleRequest) }
+
+    def next(self):
+        rnd = self.rnd
+        kind = rnd.choices(self.kinds, self.weights)[0]
+        if kind in ('modify', 'cancel') and not self.live:
+            kind = 'gtc'
+        side = rnd.choice((eti.Side.BUY, eti.Side.SELL))
+        sign = 1 if side == eti.Side.BUY else -1
+        if kind == 'ioc':
+            # i.e. crosses the resting GTC orders
+            x = eti_client.mk_ioc(next(self.ids))
+            x.Side = side
+            x.Price = MID + sign * 5 * TICK
+        elif kind == 'gtc':
+            x = eti_client.mk_ioc(next(self.ids))
+            x.Side = side
+            x.Price = MID - sign * rnd.randint(1, 5) * TICK
+            x.TimeInForce = eti.TimeInForce.GTC
+            x.ExecInst = eti.ExecInst.H
+            self.live.append((x.ClOrdID, side, x.Price))
+        else:
+            i = rnd.randrange(len(self.live))
+            orig, side, px = self.live[i]
+            self.live[i] = self.live[-1]
+            self.live.pop()
+            if kind == 'modify':
+                x = eti.ModifyOrderSingleRequest()
+                x.Side = side
+                x.Price = px + rnd.choice((-1, 1)) * TICK
+                x.OrderQty = 42 * 10**4
+                x.TimeInForce = eti.TimeInForce.GTC
+                x.ExecInst = eti.ExecInst.H
+            else:
+                x = eti.DeleteOrderSingleRequest()
+            x.RequestHeader.SenderSubID = 23
+            x.ClOrdID = next(self.ids)
+            x.OrigClOrdID = orig
+            setattr(x, self.security_fields[type(x)], self.security_id)
+            if kind == 'modify':
+                self.live.append((x.ClOrdID, side, x.Price))
+        return x
+
+
+class Stats:
+
+    def __init__(self):
+        self.hist = Histogram()
+        self.sent = 0
+        self.completed = 0
+        self.rejected = 0
+        self.failed = 0
+        self.lag = 0
+        self.last = 0
+
+    # i.e. the latency is measured from the scheduled send time, such
+    # that a stalled generator or server doesn't hide latency
+    # (coordinated omission)
+    def done(self, t, f):
+        now = time.perf_counter_ns()
+        if f.cancelled() or f.exception() is not None or not f.result():
+            # i.e. an empty result is a flow without any response
+            self.failed += 1
+            return
+        self.completed += 1
+        self.last = now
+        if type(f.result()[0]).__name__ == 'Reject':
+            self.rejected += 1
+        self.hist.record(now - t)
+
+
+# i.e. sends on a fixed schedule, independent of the responses, where
+# all requests that are due are sent at once
+async def run_session(s, flow, rate, duration, stats):
+    interval = 10**9 / rate
+    start = time.perf_counter_ns()
+    end = start + int(duration * 10**9)
+    i = 0
+    while True:
+        now = time.perf_counter_ns()
+        t = start + int(i * interval)
+        if t >= end:
+            break
+        stats.lag = max(stats.lag, now - t)
+        while t <= now and t < end:
+            x = flow.next()
+            f = s.corr.request(x)
+            f.add_done_callback(functools.partial(stats.done, t))
+            s.sched.submit(x)
+            stats.sent += 1
+            i += 1
+            t = start + int(i * interval)
+        await asyncio.sleep(max(0, t - time.perf_counter_ns()) / 10**9)
+
+async def measure(host, port, sessions, rate, duration, mix, buffered, seed=0):
+    g = Gateway(host, port, sessions, buffered)
+    await g.start()
+    stats = Stats()
+    start = time.perf_counter_ns()
+    await asyncio.gather(*[ run_session(s, OrderFlow(mix, seed + i, (i + 1) * 10**9),
+        rate / sessions, duration, stats) for i, s in enumerate(g) ])
+    # i.e. wait for the outstanding responses
+    for _ in range(100):
+        if not g.stats()['in_flight']:
+            break
+        await asyncio.sleep(0.05)
+    await g.stop()
+    return stats, (stats.last - start) / 10**9
+
+def report(k, rate, stats, elapsed):
+    h = stats.hist
+    print(f'sessions={k} rate={rate:.0f}/s sent={stats.sent} completed={stats.completed}'
+            f' rejected={stats.rejected} failed={stats.failed}'
+            f' throughput={stats.completed / elapsed if elapsed > 0 else 0:.0f}/s'
+            f' max_lag={stats.lag / 10**6:.1f}ms')
+    if h.n:
+        print('latency', ' '.join(f'p{p:g}={h.percentile(p) / 1000:.0f}us'
+            for p in (50, 99, 99.9)), f'max={h.max / 1000:.0f}us')
+
+def parse_args():
+    p = argparse.ArgumentParser(description='Open-loop ETI load generator')
+    p.add_argument('host', help='address to connect to')
+    p.add_argument('port', type=int, help='port to connect to')
+    p.add_argument('--rate', type=float, default=1000,
+            help='total orders per second, over all sessions (default: %(default)s)')
+    p.add_argument('--sessions', type=int, default=1, help='number of sessions (default: %(default)d)')
+    p.add_argument('--duration', type=float, default=10, help='seconds (default: %(default)s)')
+    p.add_argument('--mix', type=parse_mix, default='ioc=50,gtc=30,modify=10,cancel=10',
+            help='weights of the order types (default: %(default)s)')
+    p.add_argument('--seed', type=int, default=0, help='random seed of the order flow')
+    p.add_argument('--stream', dest='buffered', action='store_false',
+            help='use asyncio streams instead of the BufferedProtocol based transport')
+    p.add_argument('--loop', choices=['auto', 'asyncio', 'uvloop'], default='auto',
+            help='event loop implementation (default: %(default)s)')
+    args = p.parse_args()
+    return args
+
+def main():
+    args = parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    set_loop_policy(args.loop)
+    stats, elapsed = asyncio.run(measure(args.host, args.port, args.sessions, args.rate,
+        args.duration, args.mix, args.buffered, args.seed))
+    report(args.sessions, args.rate, stats, elapsed)
+    return 0 if stats.completed == stats.sent else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+
+# Simple in-memory price-time priority matching engine, e.g. for
+# generating realistic execution reports in a test server
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import array
+import collections
+import heapq
+import itertools
+import time
+
+from etihist import percentile
+
+
+BUY = 1
+SELL = 2
+
+
+class Order:
+
+    __slots__ = ('order_id', 'owner', 'cl_ord_id', 'security_id', 'side', 'price',
+            'qty', 'leaves', 'cum', 'alive')
+
+    def __init__(self, order_id, owner, cl_ord_id, security_id, side, price, qty):
+        self.order_id = order_id
+        self.owner = owner
+        self.cl_ord_id = cl_ord_id
+        self.security_id = security_id
+        self.side = side
+        self.price = price
+        self.qty = qty
+        self.leaves = qty
+        self.cum = 0
+        self.alive = True
+
+
+class Level:
+
+    __slots__ = ('orders', 'qty', 'dead')
+
+    def __init__(self):
+        self.orders = collections.deque()
+        self.qty = 0
+        self.dead = 0
+
+
+# i.e. one side of a book where the best price level is found via a
+# heap and price levels are removed lazily, i.e. when they show up at
+# the top of the heap after they became empty.
+#
+# Cancelled orders are marked as dead and skipped when matching. A level
+# is compacted once its dead orders outnumber its live ones, i.e. the
+# dead orders are bounded and a cancel is amortized O(1), the other
+# operations are O(1) or O(log #levels).
+class Side:
+
+    def __init__(self, side):
+        self.sign = -1 if side == BUY else 1
+        self.levels = {}
+        self.heap = []
+
+    def add(self, o):
+        lvl = self.levels.get(o.price)
+        if lvl is None:
+            lvl = self.levels[o.price] = Level()
+            if len(self.heap) > 2 * len(self.levels) + 64:
+                # i.e. drop the stale entries of removed levels
+                self.heap = [ self.sign * px for px in self.levels ]
+                heapq.heapify(self.heap)
+            else:
+                heapq.heappush(self.heap, self.sign * o.price)
+        lvl.orders.append(o)
+        lvl.qty += o.leaves
+
+    def best(self):
+        while self.heap:
+            px = self.sign * self.heap[0]
+            lvl = self.levels.get(px)
+            if lvl is not None and lvl.qty > 0:
+                return px, lvl
+            heapq.heappop(self.heap)
+            if lvl is not None:
+                del self.levels[px]
+        return None, None
+
+    # i.e. an empty level is removed including its dead orders, where
+    # reducing by all leaves removes the order
+    def reduce(self, o, qty):
+        lvl = self.levels[o.price]
+        lvl.qty -= qty
+        if lvl.qty == 0:
+            del self.levels[o.price]
+        elif qty == o.leaves:
+            lvl.dead += 1
+            if 2 * lvl.dead > len(lvl.orders):
+                lvl.orders = collections.deque(x for x in lvl.orders if x.alive and x is not o)
+                lvl.dead = 0
+
+
+class Book:
+
+    def __init__(self):
+        self.sides = { BUY: Side(BUY), SELL: Side(SELL) }
+
+
+# i.e. fill of the aggressive order against the resting (passive) order
+Fill = collections.namedtuple('Fill', ['match_id', 'passive', 'price', 'qty'])
+
+
+# Maintains one book per security. new(), modify() and delete() return
+# the affected order and the list of fills, if any, and record the
+# processing time (in ns), cf. stats().
+class Engine:
+
+    def __init__(self):
+        self.books = collections.defaultdict(Book)
+        self.orders = {}
+        self.by_cl_ord_id = {}
+        self.order_ids = itertools.count(1)
+        self.match_ids = itertools.count(1)
+        self.latency = array.array('q')
+
+    def __len__(self):
+        return len(self.orders)
+
+    # i.e. orders can only be found by their owner
+    def find(self, owner, order_id=None, cl_ord_id=None):
+        if order_id is None:
+            return self.by_cl_ord_id.get((owner, cl_ord_id))
+        o = self.orders.get(order_id)
+        return o if o is not None and o.owner is owner else None
+
+    def match(self, o):
+        fills = []
+        other = self.books[o.security_id].sides[SELL if o.side == BUY else BUY]
+        while o.leaves:
+            px, lvl = other.best()
+            if px is None or (px > o.price if o.side == BUY else px < o.price):
+                break
+            q = lvl.orders
+            while q and o.leaves:
+                p = q[0]
+                if not p.alive:
+                    q.popleft()
+                    lvl.dead -= 1
+                    continue
+                k = min(o.leaves, p.leaves)
+                for x in (o, p):
+                    x.leaves -= k
+                    x.cum += k
+                lvl.qty -= k
+                fills.append(Fill(next(self.match_ids), p, px, k))
+                if not p.leaves:
+                    q.popleft()
+                    self.forget(p)
+        return fills
+
+    def rest(self, o):
+        self.orders[o.order_id] = o
+        self.by_cl_ord_id[(o.owner, o.cl_ord_id)] = o
+        self.books[o.security_id].sides[o.side].add(o)
+
+    def forget(self, o):
+        o.alive = False
+        self.orders.pop(o.order_id, None)
+        if self.by_cl_ord_id.get((o.owner, o.cl_ord_id)) is o:
+            del self.by_cl_ord_id[(o.owner, o.cl_ord_id)]
+
+    # i.e. the unfilled part of an IOC order is cancelled, otherwise it's
+    # added to the book
+    def new(self, owner, cl_ord_id, security_id, side, price, qty, ioc=False):
+        t = time.perf_counter_ns()
+        o = Order(next(self.order_ids), owner, cl_ord_id, security_id, side, price, qty)
+        fills = self.match(o)
+        if o.leaves:
+            if ioc:
+                o.alive = False
+            else:
+                self.rest(o)
+        else:
+            o.alive = False
+        self.latency.append(time.perf_counter_ns() - t)
+        return o, fills
+
+    # i.e. returns None, None if the order is unknown
+    def delete(self, owner, order_id=None, cl_ord_id=None):
+        t = time.perf_counter_ns()
+        o = self.find(owner, order_id, cl_ord_id)
+        if o is None:
+            return None, None
+        self.books[o.security_id].sides[o.side].reduce(o, o.leaves)
+        self.forget(o)
+        self.latency.append(time.perf_counter_ns() - t)
+        return o, []
+
+    # i.e. a price change or quantity increase loses the time priority
+    # and might match, whereas a quantity decrease keeps it
+    def modify(self, owner, order_id, orig_cl_ord_id, cl_ord_id, price, qty):
+        t = time.perf_counter_ns()
+        o = self.find(owner, order_id, orig_cl_ord_id)
+        if o is None:
+            return None, None
+        side = self.books[o.security_id].sides[o.side]
+        leaves = max(0, qty - o.cum)
+        if price == o.price and leaves <= o.leaves:
+            side.reduce(o, o.leaves - leaves)
+            self.by_cl_ord_id.pop((owner, o.cl_ord_id), None)
+            o.cl_ord_id, o.qty, o.leaves = cl_ord_id, qty, leaves
+            self.by_cl_ord_id[(owner, cl_ord_id)] = o
+            fills = []
+            if not leaves:
+                self.forget(o)
+        else:
+            side.reduce(o, o.leaves)
+            self.forget(o)
+            n = Order(o.order_id, owner, cl_ord_id, o.security_id, o.side, price, qty)
+            n.cum = o.cum
+            n.leaves = leaves
+            o = n
+            fills = self.match(o)
+            if o.leaves:
+                self.rest(o)
+            else:
+                o.alive = False
+        self.latency.append(time.perf_counter_ns() - t)
+        return o, fills
+
+    # i.e. matching latency percentiles in microseconds
+    def stats(self):
+        xs = sorted(self.latency)
+        if not xs:
+            return {}
+        return { 'n': len(xs), 'orders': len(self.orders),
+            **{ f'p{p:g}': percentile(xs, p) / 1000 for p in (50, 99, 99.9) }, 'max': xs[-1] / 1000 }
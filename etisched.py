@@ -0,0 +1,176 @@
+
+# Throttle aware send scheduling for ETI sessions
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import asyncio
+import heapq
+import itertools
+import time
+
+
+# Refills rate tokens per second, up to burst tokens.
+class TokenBucket:
+
+    def __init__(self, rate, burst=None, clock=time.monotonic):
+        self.rate = rate
+        self.burst = rate if burst is None else burst
+        self.tokens = self.burst
+        self.clock = clock
+        self.t = clock()
+
+    # i.e. ETI throttles ThrottleNoMsgs per ThrottleTimeInterval milliseconds,
+    # returns None if the LogonResponse doesn't contain throttle parameters
+    @staticmethod
+    def from_logon(m, clock=time.monotonic):
+        k, ms = m.ThrottleNoMsgs, m.ThrottleTimeInterval
+        if not 0 < k < 0xFFFFFFFF or ms <= 0:
+            return None
+        return TokenBucket(k * 1000 / ms, k, clock)
+
+    def refill(self):
+        t = self.clock()
+        self.tokens = min(self.burst, self.tokens + (t - self.t) * self.rate)
+        self.t = t
+
+    # i.e. seconds until the next token is available
+    def delay(self):
+        self.refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def take(self):
+        self.tokens -= 1
+
+
+def classify(m):
+    n = type(m).__name__
+    if 'Quote' in n:
+        return 'quotes'
+    if 'Order' in n or 'Cross' in n:
+        return 'orders'
+    return 'admin'
+
+# i.e. lower values are sent first, thus cancels overtake new orders
+def priority(m):
+    n = type(m).__name__
+    if n.startswith('Delete') or n.startswith('Logout') or 'Cancel' in n:
+        return 0
+    if n.startswith('Modify') or n.startswith('Replace'):
+        return 1
+    if n.startswith('New'):
+        return 2
+    return 1
+
+
+# Queues messages between the packing code and the MessageWriter such
+# that neither the session bucket nor the bucket of the message class
+# (cf. classify()) is exceeded.
+#
+# Within a message class, messages are sent in priority order (cf.
+# priority()) and FIFO for equal priority. A class whose bucket is empty
+# doesn't block the other classes.
+#
+# Since queued messages may be reordered, the MsgSeqNum is assigned when
+# a message is actually packed, starting at seq (if seq isn't None).
+# Thus, a submitted message must not be modified until it's sent, i.e.
+# until it's dequeued.
+#
+# Queue depth and wait times are available via stats().
+#
+# The optional on_send callback is called with each message right after
+# it's packed, e.g. Correlator.sent().
+class SendScheduler:
+
+    def __init__(self, writer, bucket=None, buckets=None, seq=None,
+            classify=classify, priority=priority, clock=time.monotonic, on_send=None):
+        self.writer = writer
+        self.bucket = bucket
+        self.buckets = {} if buckets is None else buckets
+        self.seq = seq
+        self.classify = classify
+        self.priority = priority
+        self.clock = clock
+        self.on_send = on_send
+        self.queues = {}
+        self.order = itertools.count()
+        self.handle = None
+        self.sent = 0
+        self.wait_sum = 0.0
+        self.wait_max = 0.0
+
+    # i.e. queue depth
+    def __len__(self):
+        return sum(len(q) for q in self.queues.values())
+
+    def submit(self, m, cls=None, prio=None):
+        if cls is None:
+            cls = self.classify(m)
+        if prio is None:
+            prio = self.priority(m)
+        q = self.queues.setdefault(cls, [])
+        heapq.heappush(q, (prio, next(self.order), self.clock(), m))
+        self.pump()
+
+    def ready(self, cls):
+        b = self.buckets.get(cls)
+        return 0.0 if b is None else b.delay()
+
+    def pump(self):
+        self.close()
+        delay = None
+        while True:
+            if self.bucket is not None:
+                d = self.bucket.delay()
+                if d > 0:
+                    delay = d
+                    break
+            q = None
+            for cls, xs in self.queues.items():
+                if not xs:
+                    continue
+                d = self.ready(cls)
+                if d > 0:
+                    delay = d if delay is None else min(delay, d)
+                    continue
+                if q is None or xs[0][:2] < q[0][:2]:
+                    q, c = xs, cls
+            if q is None:
+                break
+            delay = None
+            _, _, t, m = heapq.heappop(q)
+            if self.bucket is not None:
+                self.bucket.take()
+            b = self.buckets.get(c)
+            if b is not None:
+                b.take()
+            self.send(m, self.clock() - t)
+        self.writer.flush()
+        if delay is not None and len(self):
+            self.handle = asyncio.get_running_loop().call_later(delay, self.pump)
+
+    def send(self, m, wait):
+        if self.seq is not None:
+            m.RequestHeader.MsgSeqNum = self.seq
+            self.seq += 1
+        self.writer.pack(m)
+        if self.on_send is not None:
+            self.on_send(m)
+        self.sent += 1
+        self.wait_sum += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def stats(self):
+        return {
+            'depth'    : len(self),
+            'queues'   : { k: len(q) for k, q in self.queues.items() },
+            'sent'     : self.sent,
+            'wait_avg' : self.wait_sum / self.sent if self.sent else 0.0,
+            'wait_max' : self.wait_max,
+        }
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
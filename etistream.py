@@ -0,0 +1,263 @@
+
+# Helpers for sending/receiving ETI messages over a stream
+#
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import asyncio
+import socket
+
+
+# Packs messages back-to-back into one arena and hands them to the
+# transport with a single write() call, e.g. a burst of orders.
+#
+# Flushes when max_bytes are pending or - if max_delay isn't None -
+# max_delay seconds after the first pending message (i.e. with
+# max_delay=0 all messages packed in the same event loop iteration are
+# coalesced), or on an explicit flush() call.
+#
+# The transport is anything with a write() method, e.g. an asyncio
+# transport or a blocking socket wrapped into a SocketTransport.
+class MessageWriter:
+
+    def __init__(self, transport, size=64 * 1024, max_bytes=None, max_delay=None, pool=None):
+        self.transport = transport
+        self.pool = pool
+        self.buf = bytearray(size) if pool is None else pool.get()
+        size = len(self.buf)
+        self.n = 0
+        self.max_bytes = size // 2 if max_bytes is None else max_bytes
+        self.max_delay = max_delay
+        self.handle = None
+        self.writes = 0
+
+    def __len__(self):
+        return self.n
+
+    def pack(self, m):
+        k = m.sizes[1]
+        if self.n + k > len(self.buf):
+            self.grow(self.n + k)
+        self.n = m.pack_into(self.buf, self.n)
+        return self.packed()
+
+    # i.e. appends already packed messages
+    def write(self, bs):
+        k = len(bs)
+        if self.n + k > len(self.buf):
+            self.grow(self.n + k)
+        self.buf[self.n:self.n + k] = bs
+        self.n += k
+        return self.packed()
+
+    def packed(self):
+        n = self.n
+        if n >= self.max_bytes:
+            self.flush()
+        elif self.max_delay is not None and self.handle is None:
+            loop = asyncio.get_running_loop()
+            if self.max_delay == 0:
+                self.handle = loop.call_soon(self.flush)
+            else:
+                self.handle = loop.call_later(self.max_delay, self.flush)
+        return n
+
+    def grow(self, n):
+        k = len(self.buf)
+        while k < n:
+            k *= 2
+        self.buf.extend(bytes(k - len(self.buf)))
+
+    def flush(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        n = self.n
+        if n == 0:
+            return 0
+        self.transport.write(memoryview(self.buf)[:n])
+        self.n = 0
+        self.writes += 1
+        f = getattr(self.transport, 'get_write_buffer_size', None)
+        if f is not None and f() > 0:
+            # i.e. the transport might keep a reference to the unsent
+            # part, thus we must not overwrite it
+            if self.pool is None:
+                self.buf = bytearray(len(self.buf))
+            else:
+                self.buf = self.pool.get()
+        return n
+
+    def release(self):
+        if self.pool is not None and self.buf is not None:
+            self.pool.put(self.buf)
+        self.buf = None
+
+
+# Recycles equally sized buffers, e.g. between the sessions of a
+# gateway, such that (re-)connecting sessions don't allocate new ones.
+class BufferPool:
+
+    def __init__(self, size=64 * 1024):
+        self.size = size
+        self.free = []
+        self.allocated = 0
+
+    def get(self):
+        if self.free:
+            return self.free.pop()
+        self.allocated += 1
+        return bytearray(self.size)
+
+    # i.e. the caller must not reference the buffer anymore
+    def put(self, buf):
+        if len(buf) == self.size:
+            self.free.append(buf)
+
+
+# i.e. for using a MessageWriter with a blocking socket
+class SocketTransport:
+
+    def __init__(self, sock):
+        self.sock = sock
+
+    def write(self, bs):
+        self.sock.sendall(bs)
+
+
+# Splits a stream of messages into memoryviews of complete messages,
+# using the BodyLen field, i.e. the first field of the header_st (e.g.
+# eti.header_st).
+#
+# Received data can be fed in arbitrary chunks via feed() or directly
+# read into the receive buffer (cf. get_buffer()/buffer_updated() which
+# match the asyncio.BufferedProtocol interface). Iterating over the
+# decoder yields all complete messages in the buffer, which are only
+# valid until the next feed()/get_buffer() call, since the remaining
+# incomplete message then is moved to the start of the buffer.
+class FrameDecoder:
+
+    def __init__(self, header_st, size=64 * 1024, pool=None):
+        self.header_st = header_st
+        self.pool = pool
+        self.buf = bytearray(size) if pool is None else pool.get()
+        self.mv = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+        self.need = 0
+
+    def __len__(self):
+        return self.end - self.start
+
+    def compact(self):
+        k = self.end - self.start
+        if k == 0:
+            self.start = self.end = 0
+        elif self.start > 0:
+            self.buf[:k] = self.buf[self.start:self.end]
+            self.start = 0
+            self.end = k
+
+    def grow(self, n):
+        k = self.end - self.start
+        buf = bytearray(max(n, 2 * len(self.buf)))
+        buf[:k] = self.mv[self.start:self.end]
+        self.mv.release()
+        if self.pool is not None:
+            self.pool.put(self.buf)
+        self.buf = buf
+        self.mv = memoryview(buf)
+        self.start = 0
+        self.end = k
+
+    # i.e. returns the free part of the buffer, which is at least
+    # sizehint bytes large and large enough for the next message
+    def get_buffer(self, sizehint=-1):
+        self.compact()
+        n = max(self.end + max(sizehint, 1), self.need)
+        if n > len(self.buf):
+            self.grow(n)
+        return self.mv[self.end:]
+
+    def buffer_updated(self, n):
+        self.end += n
+
+    def feed(self, bs):
+        n = len(bs)
+        self.get_buffer(n)[:n] = bs
+        self.end += n
+
+    def __iter__(self):
+        h = self.header_st.size
+        while self.end - self.start >= h:
+            n = self.header_st.unpack_from(self.buf, self.start)[0]
+            if n < h:
+                raise ValueError(f'invalid BodyLen: {n}')
+            i = self.start
+            if i + n > self.end:
+                self.need = n
+                return
+            self.need = 0
+            self.start += n
+            yield self.mv[i:i + n]
+
+    def release(self):
+        if self.buf is None:
+            return
+        self.mv.release()
+        if self.pool is not None:
+            self.pool.put(self.buf)
+        self.buf = self.mv = None
+
+
+def set_nodelay(transport):
+    sock = transport.get_extra_info('socket')
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+# ETI session transport where the event loop reads directly into the
+# receive buffer of a FrameDecoder and each complete message is passed
+# to message_received() right away, i.e. without a StreamReader and
+# without a task switch per message.
+#
+# Messages packed into the writer while handling received messages
+# are flushed with a single write once all of them are handled.
+#
+# Subclasses override message_received() and possibly
+# connection_made()/connection_lost().
+class SessionProtocol(asyncio.BufferedProtocol):
+
+    def __init__(self, header_st, size=64 * 1024, pool=None):
+        self.decoder = FrameDecoder(header_st, size, pool)
+        self.pool = pool
+        self.transport = None
+        self.writer = None
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        set_nodelay(transport)
+        self.writer = MessageWriter(transport, pool=self.pool)
+
+    def get_buffer(self, sizehint):
+        return self.decoder.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        self.decoder.buffer_updated(nbytes)
+        for bs in self.decoder:
+            if self.transport.is_closing():
+                break
+            self.message_received(bs)
+        self.writer.flush()
+
+    def message_received(self, bs):
+        pass
+
+    def connection_lost(self, exc):
+        self.decoder.release()
+        if self.writer is not None:
+            self.writer.release()
+        if not self.closed.done():
+            self.closed.set_result(exc)
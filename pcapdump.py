@@ -11,6 +11,7 @@ import argparse
 import dpkt
 from enum import IntEnum
 import importlib
+import itertools
 import socket
 import struct
 import sys
@@ -49,32 +50,22 @@ def m2str(a):
 def dump_eobi(bs, tos, dump_heartbeat, eth, ip, udp):
         n = len(bs)
 
-        ph = eobi.unpack_from(bs)
-        ph.rstrip()
-        assert ph.MessageHeader.TemplateID == eobi.TemplateID.PacketHeader
-
-        i    = ph.MessageHeader.BodyLen
-        tail = bs
-        k    = 0
-
-        if i < n:
-            m = eobi.unpack_from(tail[i:])
-            m.rstrip()
-            if (m.MessageHeader.TemplateID != eobi.TemplateID.Heartbeat
-                    or dump_heartbeat):
-                print(f'EOBI-Begin: {pformat(ph, width=45)}')
-                print(f'EOBI-Message: {pformat(m, width=45)}')
-            else:
-                return
-            i += m.MessageHeader.BodyLen
-            k += 1
-        else:
-            raise RuntimeError('EOBI PacketHeader without messages')
+        # i.e. the messages are only unpacked when they are dumped
+        it = eobi.iter_messages(bs)
+        tid, _, _ = next(it)
+        assert tid == eobi.TemplateID.PacketHeader
 
-        while i < n:
-            m = eobi.unpack_from(tail[i:])
-            m.rstrip()
-            i += m.MessageHeader.BodyLen
+        x = next(it, None)
+        if x is None:
+            raise RuntimeError('EOBI PacketHeader without messages')
+        tid, i, _ = x
+        if tid == eobi.TemplateID.Heartbeat and not dump_heartbeat:
+            return
+        ph = eobi.unpack_from(bs, strip=True)
+        print(f'EOBI-Begin: {pformat(ph, width=45)}')
+        k = 0
+        for tid, i, _ in itertools.chain((x,), it):
+            m = eobi.unpack_from(bs, i, strip=True)
             k += 1
             print(f'EOBI-Message: {pformat(m, width=45)}')
         if tos:
@@ -96,8 +87,7 @@ def dump_eti(bsP):
     xs = []
 
     while True:
-        m = eti.unpack_from(bs)
-        m.rstrip()
+        m = eti.unpack_from(bs, strip=True)
         t = ''
         if i > 0:
             t = f' ({i})'
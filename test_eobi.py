@@ -0,0 +1,380 @@
+
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import collections
+import itertools
+import os
+import queue
+import time
+
+import pytest
+
+import eobi.v13_0 as eobi
+
+from eobiarb import Arbiter
+from eobibook import BUY, SELL, BookBuilder, Side, SyntheticFeed
+from eobifeed import Feed, Ring
+from eobirecovery import Recovery
+
+
+def test_side():
+    s = Side(SELL)
+    s.add(1, 102, 10)
+    s.add(2, 101, 20)
+    s.add(3, 101, 5)
+    assert s.best() == (101, 25)
+    assert s.depth() == [ (101, 25, 2), (102, 10, 1) ]
+    assert s.reduce(2, 20)
+    assert s.best() == (101, 5)
+    assert s.remove(3) == (101, 5)
+    assert s.best() == (102, 10)
+    assert s.remove(3) is None
+    assert not s.update(3, 1)
+
+    s = Side(BUY)
+    s.add(1, 99, 10)
+    s.add(2, 98, 10)
+    assert s.best() == (99, 10)
+    s.remove(1)
+    assert s.best() == (98, 10)
+    # i.e. a duplicate replaces the order, even on another level
+    assert not s.add(3, 98, 5)
+    assert s.add(3, 98, 7)
+    assert s.depth() == [ (98, 17, 2) ]
+    assert s.add(3, 97, 7)
+    assert s.depth() == [ (98, 10, 1), (97, 7, 1) ]
+    assert len(s) == 2
+
+
+# i.e. cf. eti2py.py --slots, e.g. for retaining many order messages
+def test_slots():
+    m = pytest.importorskip('eobi.v9_0_slots')
+    x = m.OrderAdd()
+    x.SecurityID = 7
+    x.OrderDetails.Price = 404 * 10**8
+    y = m.OrderAdd.create_from(x.pack())
+    assert y == x
+    assert not hasattr(y, '__dict__')
+    with pytest.raises(AttributeError):
+        y.SecurityId = 8
+
+
+def packet(*xs):
+    return eobi.PacketHeader().pack() + b''.join(x.pack() for x in xs)
+
+def order(T, sec, prio, side, price, qty):
+    x = T()
+    x.SecurityID = sec
+    d = x.OrderDetails
+    d.TrdRegTSTimePriority = prio
+    d.Side = side
+    d.Price = price
+    d.DisplayQty = qty
+    return x
+
+
+def test_builder():
+    b = BookBuilder(eobi)
+    e = eobi.FullOrderExecution()
+    e.SecurityID = 7
+    e.Side = SELL
+    e.TrdRegTSTimePriority = 3
+    e.LastQty = 4
+    s = eobi.ExecutionSummary()
+    s.SecurityID = 7
+    s.LastPx = 101
+    s.LastQty = 4
+    m = order(eobi.OrderModify, 7, 5, BUY, 100, 8)
+    m.PrevPrice = 99
+    m.PrevDisplayQty = 6
+    b.packet(packet(
+        order(eobi.OrderAdd, 7, 1, BUY, 99, 6),
+        order(eobi.OrderAdd, 7, 2, BUY, 98, 3),
+        order(eobi.OrderAdd, 7, 3, SELL, 101, 4),
+        order(eobi.OrderAdd, 7, 4, SELL, 102, 5),
+        eobi.Heartbeat(),
+        s, e, m,
+        order(eobi.OrderModifySamePrio, 7, 4, SELL, 102, 2)))
+    assert b.messages == 8
+    assert b[7].top() == (100, 8, 102, 2)
+    assert (b[7].last_px, b[7].volume, b[7].trades) == (101, 4, 1)
+    assert len(b[7]) == 3
+
+    b.packet(packet(order(eobi.OrderDelete, 7, 1, BUY, 99, 6)))
+    assert b.unknown == 1
+    # i.e. without TrdRegTSPrevTimePriority, two orders match
+    m = order(eobi.OrderModify, 7, 7, SELL, 103, 2)
+    m.PrevPrice = 102
+    m.PrevDisplayQty = 2
+    b.packet(packet(order(eobi.OrderAdd, 7, 6, SELL, 102, 2), m))
+    assert b.ambiguous == 1
+    assert b[7].sides[SELL].depth() == [ (102, 2, 1), (103, 2, 1) ]
+    x = eobi.OrderMassDelete()
+    x.SecurityID = 7
+    b.packet(packet(x))
+    assert b[7].top() == (None, 0, None, 0)
+
+
+# i.e. the books match the order flow of the synthetic feed, level by level
+def check_books(f, b):
+    expected = collections.defaultdict(int)
+    for (sec, side, _), (price, qty) in f.live.items():
+        expected[sec, side, price] += qty
+    actual = {}
+    for sec, book in b.books.items():
+        for side in (BUY, SELL):
+            for price, qty, _ in book.sides[side].depth(10**6):
+                actual[sec, side, price] = qty
+    assert actual == expected
+    assert sum(len(x) for x in b.books.values()) == len(f.live)
+
+def test_synthetic_feed():
+    f = SyntheticFeed(eobi, securities=20, segments=4, seed=23)
+    b = BookBuilder(eobi)
+    for p in f.packets(3000):
+        b.packet(p)
+    assert b.unknown == 0
+    check_books(f, b)
+
+
+def seq_packet(seg, seq, reset=0, m=None):
+    h = eobi.PacketHeader()
+    h.MarketSegmentID = seg
+    h.ApplSeqNum = seq
+    h.ApplSeqResetIndicator = reset
+    return h.pack() + (m or eobi.OrderAdd()).pack()
+
+def arbitrate(arb, xs):
+    return [ (i, seq) for i, seg, seq in xs if arb.packet(i, seq_packet(seg, seq)) ]
+
+
+def test_arbiter():
+    gaps = []
+    arb = Arbiter(eobi, window=64, on_gap=lambda *x: gaps.append(x))
+    a = [ (0, 7, seq) for seq in range(1, 11) if seq not in (3, 4, 8) ]
+    b = [ (1, 7, seq) for seq in range(1, 11) if seq not in (5, 8) ]
+    b[4], b[5] = b[5], b[4]
+    xs = [ x for ab in zip(a, b) for x in ab ] + b[len(a):]
+    ys = arbitrate(arb, xs)
+    assert [ seq for _, seq in ys ] == [ 1, 2, 5, 3, 6, 4, 7, 9, 10 ]
+    assert gaps == [ (7, 8, 8) ]
+    assert arb.duplicates == len(xs) - len(ys)
+    st = arb.stats()
+    assert (st['A']['gaps'], st['A']['lost']) == (2, 3)
+    assert (st['B']['gaps'], st['B']['lost'], st['B']['reordered']) == (2, 3, 1)
+    assert (st['gaps'], st['missing']) == (1, 1)
+
+    # i.e. heartbeats aren't sequenced
+    assert not arb.packet(0, seq_packet(7, 10, m=eobi.Heartbeat()))
+    assert arb.feeds[0].heartbeats == 1
+
+    # i.e. after a reset, the old sequence of the other feed is stale
+    assert arb.packet(0, seq_packet(7, 1, reset=1))
+    assert not arb.packet(1, seq_packet(7, 11))
+    assert not arb.packet(1, seq_packet(7, 1, reset=1))
+    assert arb.packet(1, seq_packet(7, 2))
+    assert arb.stale == 1
+
+
+# i.e. feed B loses the packet with the reset, but its restarted
+# sequence still fills the holes of feed A
+def test_arbiter_lost_reset():
+    arb = Arbiter(eobi, window=64)
+    arbitrate(arb, [ (i, 7, seq) for seq in range(1, 21) for i in (0, 1) ])
+    assert arb.packet(0, seq_packet(7, 1, reset=1))
+    ys = arbitrate(arb, [ (1, 7, 2), (0, 7, 2), (0, 7, 3), (1, 7, 3), (1, 7, 4), (0, 7, 5), (1, 7, 5) ])
+    assert ys == [ (1, 2), (0, 3), (1, 4), (0, 5) ]
+    assert arb.stale == 0 and arb.gaps == 0
+    st = arb.stats()['B']
+    assert (st['resyncs'], st['reordered']) == (1, 0)
+
+
+# i.e. with a silent feed, a gap is declared once it leaves the window
+def test_arbiter_window():
+    gaps = []
+    arb = Arbiter(eobi, window=16, on_gap=lambda *x: gaps.append(x))
+    ys = arbitrate(arb, [ (0, 3, seq) for seq in range(100) if seq != 5 ])
+    assert len(ys) == 99
+    assert gaps == [ (3, 5, 5) ]
+    # i.e. a huge jump is reported as one gap, without walking it
+    assert arb.packet(0, seq_packet(3, 10**9))
+    assert gaps[-1] == (3, 100, 10**9 - 16)
+    assert arb.missing == 1 + (10**9 - 16 - 100 + 1)
+
+
+class Clock:
+
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        self.t += 1000
+        return self.t
+
+
+# i.e. the feed is joined late, all segments are recovered from
+# interleaved snapshot cycles while incremental packets keep arriving
+def test_recovery():
+    f = SyntheticFeed(eobi, securities=40, segments=4, seed=5)
+    g = f.packets(10**6)
+    r = Recovery(eobi, clock=Clock())
+    for _ in range(100):
+        next(g)
+    for _ in range(100):
+        r.incremental(next(g))
+    assert len(r.pending) == 4 and r.buffered > 0
+    cycles = [ f.snapshot(seg) for seg in range(4) ]
+    for ps in itertools.zip_longest(*cycles):
+        for p in ps:
+            if p is not None:
+                r.snapshot(p)
+        r.incremental(next(g))
+    assert not r.pending
+    assert (r.recoveries, r.buffered, r.gaps) == (4, 0, 0)
+    assert r.builder.unknown == 0
+    check_books(f, r.builder)
+
+    for p in f.snapshot(1):
+        r.snapshot(p)
+    assert r.recoveries == 4
+
+    # i.e. a lost packet
+    lost = next(g)
+    seg = eobi.PacketHeader.create_from(lost).MarketSegmentID
+    for _ in range(20):
+        r.incremental(next(g))
+    assert r.gaps == 1 and list(r.pending) == [ seg ]
+    # i.e. the first snapshot is aborted due to a lost packet, the
+    # incremental stream is ahead of the second one
+    ps = f.snapshot(seg)
+    for p in ps[:1] + ps[2:]:
+        r.snapshot(p)
+    ps = f.snapshot(seg)
+    for _ in range(20):
+        r.incremental(next(g))
+    for p in ps:
+        r.snapshot(p)
+    assert not r.pending and r.aborted == 1
+    assert r.stale == 0
+    check_books(f, r.builder)
+    st = r.stats()
+    assert st['recovery_us']['n'] == 5 and st['peak'] > 0
+
+
+# i.e. the buffer is too small, thus the first snapshot is too old
+def test_recovery_stale():
+    f = SyntheticFeed(eobi, securities=10, segments=1, seed=7)
+    g = f.packets(10**6)
+    r = Recovery(eobi, max_buffer=2000)
+    r.incremental(next(g))
+    ps = f.snapshot(0)
+    for _ in range(10):
+        r.incremental(next(g))
+    for p in ps:
+        r.snapshot(p)
+    assert r.stale == 1 and r.pending and r.dropped > 0
+    assert r.buffered <= 2000
+    for p in f.snapshot(0):
+        r.snapshot(p)
+    r.incremental(next(g))
+    assert not r.pending
+    check_books(f, r.builder)
+
+
+def test_ring():
+    r = Ring(256)
+    c = Ring(name=r.name)
+    xs = []
+    f = lambda x: xs.append(bytes(x))
+    for i in range(20):
+        bs = bytes([i]) * (i * 7 % 50 + 1)
+        while not r.push(bs, i):
+            assert c.drain(f, limit=2)[0] == 2
+        assert r.head - c.tail <= 256
+    n, t = c.drain(f)
+    assert t == 19
+    assert xs == [ bytes([i]) * (i * 7 % 50 + 1) for i in range(20) ]
+    assert c.stats()['backlog'] == 0 and r.stats()['pushed'] == 20
+    with pytest.raises(ValueError):
+        r.push(bytes(256), 0)
+    c.close()
+    r.close(unlink=True)
+
+
+# i.e. the sharded books match the books of a single builder
+def test_feed():
+    f = Feed(eobi, workers=3, ring_size=4096)
+    f.start()
+    ps = list(SyntheticFeed(eobi, securities=50, segments=7, seed=3).packets(2000))
+    b = BookBuilder(eobi)
+    for p in ps:
+        f.put(p)
+        b.packet(p)
+    rs = f.stop()
+    assert sum(x['messages'] for x in rs) == b.messages
+    tops = {}
+    for x in rs:
+        assert x['unknown'] == 0
+        tops.update(x['tops'])
+    assert tops == { sec: book.top() for sec, book in b.books.items() }
+    assert [ x['processed'] for x in f.final_stats ] == [ x['pushed'] for x in f.final_stats ]
+
+
+class Stuck:
+
+    def __init__(self, eobi):
+        self.messages = 0
+
+    def packet(self, bs):
+        time.sleep(3600)
+
+# i.e. hanging workers are terminated and the rings are unlinked
+def test_feed_stuck():
+    f = Feed(eobi, workers=2, ring_size=4096, handler=Stuck)
+    f.start()
+    for p in SyntheticFeed(eobi, securities=4, segments=2).packets(4):
+        f.put(p)
+    names = [ r.name for r in f.rings ]
+    with pytest.raises(queue.Empty):
+        f.stop(timeout=0.2)
+    assert not any(p.is_alive() for p in f.procs)
+    assert not any(os.path.exists(f'/dev/shm/{x}') for x in names)
+
+
+# i.e. a timeout in the middle of a snapshot cycle restarts the recovery
+# such that the next cycle completes it
+def test_recovery_timeout():
+    f = SyntheticFeed(eobi, securities=10, segments=1, seed=9)
+    g = f.packets(10**6)
+    for _ in range(200):
+        next(g)
+    clock = Clock()
+    r = Recovery(eobi, timeout=1e-3, clock=clock)
+    r.incremental(next(g))
+    ps = f.snapshot(0)
+    r.snapshot(ps[0])
+    assert r.pending[0].orders > 0
+    clock.t += 10**7
+    r.expire()
+    assert r.timeouts == 1 and r.buffered == 0
+    for p in f.snapshot(0):
+        r.snapshot(p)
+    assert not r.pending and r.aborted == 0
+    r.incremental(next(g))
+    check_books(f, r.builder)
+
+
+# i.e. a malformed cycle is aborted instead of raising
+def test_recovery_orphan_order():
+    f = SyntheticFeed(eobi, securities=10, segments=1, seed=11)
+    r = Recovery(eobi, clock=Clock())
+    h = eobi.PacketHeader()
+    h.MarketSegmentID = 0
+    h.ApplSeqNum = 1
+    r.snapshot(h.pack() + eobi.ProductSummary().pack() + eobi.SnapshotOrder().pack())
+    assert r.aborted == 1 and r.pending[0].books is None
+    for p in f.snapshot(0):
+        r.snapshot(p)
+    assert not r.pending
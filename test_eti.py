@@ -137,3 +137,243 @@ def test_unpack_factory():
 
     assert x == y
 
+def test_nested_roundtrip():
+    x = NewOrderNRResponse()
+    assert len(x.fmt) == 1
+    x.NRResponseHeaderME.MsgSeqNum = 42
+    x.OrderID = 4711
+    x.ClOrdID = 666
+
+    bs = x.pack()
+    assert len(bs) == x.MessageHeaderOut.BodyLen
+
+    y = NewOrderNRResponse.create_from(bs)
+    y.rstrip()
+
+    assert x == y
+    assert y.NRResponseHeaderME.MsgSeqNum == 42
+
+def test_view():
+    x = NewOrderSingleShortRequest()
+    x.RequestHeader.MsgSeqNum = 3
+    x.Side = Side.BUY
+    x.OrderQty = 42 * 10**4
+    x.SimpleSecurityID = 23
+    x.Price = 404 * 10**8
+    x.ClOrdID = 666
+
+    bs = x.pack()
+
+    v = view_from(memoryview(bs))
+    assert type(v) is NewOrderSingleShortRequestView
+    assert v.MessageHeaderIn.TemplateID == TemplateID.NewOrderSingleShortRequest
+    assert v.MessageHeaderIn.NetworkMsgID == bytes(8)
+    assert v.RequestHeader.MsgSeqNum == 3
+    assert v.Side == Side.BUY
+    assert v.Price == x.Price
+    assert v.ClOrdID == x.ClOrdID
+
+    y = v.unpack()
+    y.rstrip()
+    assert x == y
+
+
+def test_lazy():
+    import eti.v9_0 as m
+    assert 'NewOrderNRResponse' in dir(m)
+    assert 'NewOrderNRResponse' in m.__all__
+    with pytest.raises(AttributeError):
+        m.NoSuchMessage
+    m.warmup()
+    assert m.NewOrderNRResponse.__qualname__ == 'NewOrderNRResponse'
+    assert m.NewOrderNRResponse is NewOrderNRResponse
+
+def test_unpack_many():
+    np = pytest.importorskip('numpy')
+    bs = bytearray()
+    for i in range(3):
+        x = NewOrderSingleShortRequest()
+        x.RequestHeader.MsgSeqNum = i + 1
+        x.Side = Side.SELL
+        x.Price = -i * 10**8
+        bs += x.pack()
+
+    dt = NewOrderSingleShortRequest.dtype()
+    assert dt.itemsize == 96
+    assert dt.fields['Price'][1] == 24
+
+    r = unpack_many(bs, [0, 96, 192])
+    assert list(r.RequestHeader.MsgSeqNum) == [1, 2, 3]
+    assert list(r.Price) == [0, -10**8, -2 * 10**8]
+    assert (r.Side == Side.SELL).all()
+    assert (r.MessageHeaderIn.TemplateID == TemplateID.NewOrderSingleShortRequest).all()
+
+    bs += NewOrderNRResponse().pack()
+    with pytest.raises(UnpackError):
+        unpack_many(bs, [0, 288])
+
+def test_enums():
+    x = NewOrderSingleShortRequest()
+    x.Side = Side.SELL
+    x.TimeInForce = 42 # i.e. not a valid value
+    bs = x.pack()
+
+    y = unpack_from(bs)
+    assert type(y.Side) is Side
+    assert y.Side == Side.SELL
+    assert type(y.TimeInForce) is int
+    assert y.TimeInForce == 42
+
+    y = unpack_from(bs, enums=False)
+    assert type(y.Side) is int
+    assert y.Side == Side.SELL
+
+def test_strip():
+    x = Reject()
+    x.SessionRejectReason = SessionRejectReason.OTHER
+    x.VarText = b'Too many\0'
+    x.VarTextLen = len(x.VarText)
+    x.update_length()
+    bs = x.pack()
+
+    y = unpack_from(bs)
+    assert y.VarText == b'Too many\0'
+    y.rstrip()
+    assert y.VarText == b'Too many'
+
+    z = unpack_from(bs, strip=True)
+    assert z == y
+
+    u = NewOrderSingleShortRequest()
+    u.MessageHeaderIn.NetworkMsgID = b'abc'
+    v = unpack_from(u.pack(), strip=True)
+    assert v == u
+
+def mk_exec_response(n):
+    x = OrderExecResponse()
+    for i in range(n):
+        g = FillsGrpComp()
+        g.FillPx = 10**8 + i
+        g.FillQty = 10**4 * (i + 1)
+        x.FillsGrp.append(g)
+    x.NoFills = n
+    x.update_length()
+    return x
+
+def test_decoder():
+    d = Decoder(strip=True)
+    xs = [ mk_exec_response(n) for n in (3, 1, 2) ]
+
+    y = d.unpack_from(xs[0].pack())
+    assert y == xs[0]
+    gs = list(y.FillsGrp)
+
+    z = d.unpack_from(xs[1].pack())
+    assert z is y
+    assert z == xs[1]
+    assert z.FillsGrp[0] is gs[0]
+
+    z = d.unpack_from(xs[2].pack())
+    assert z == xs[2]
+    assert z.FillsGrp[1] is not gs[1]
+
+    d = Decoder(pool_size=2, strip=True)
+    a = d.unpack_from(xs[0].pack())
+    b = d.unpack_from(xs[1].pack())
+    assert a is not b
+    assert a == xs[0]
+    assert d.unpack_from(xs[2].pack()) is a
+
+def test_projection():
+    x = NewOrderSingleShortRequest()
+    x.RequestHeader.MsgSeqNum = 3
+    x.Price = 404 * 10**8
+    x.OrderQty = 42 * 10**4
+    x.ClOrdID = 666
+    bs = bytes(8) + x.pack()
+
+    assert peek_header(bs, 8) == (96, TemplateID.NewOrderSingleShortRequest)
+
+    f = compile_projection(TemplateID.NewOrderSingleShortRequest,
+                           ['ClOrdID', 'Price', 'RequestHeader.MsgSeqNum'])
+    assert f(bs, 8) == (666, 404 * 10**8, 3)
+
+    f = compile_projection(TemplateID.OrderExecResponse, ['ClOrdID'])
+    assert f(mk_exec_response(2).pack()) == (OrderExecResponse().ClOrdID,)
+
+    with pytest.raises(KeyError):
+        compile_projection(TemplateID.OrderExecResponse, ['FillsGrp'])
+    with pytest.raises(KeyError):
+        compile_projection(TemplateID.NewOrderSingleShortRequest, ['Price', 'Price'])
+
+def test_offset_setters():
+    x = NewOrderSingleShortRequest()
+    x.Price = 404 * 10**8
+    bs = bytearray(8) + x.pack()
+
+    NewOrderSingleShortRequest.set_Price(bs, 8, 405 * 10**8)
+    NewOrderSingleShortRequest.set_RequestHeader_MsgSeqNum(bs, 8, 23)
+    NewOrderSingleShortRequest.set_MessageHeaderIn_NetworkMsgID(bs, 8, b'xyz')
+    NewOrderSingleShortRequest.set_Side(bs, 8, Side.SELL)
+
+    y = unpack_from(bs, 8, strip=True)
+    x.Price = 405 * 10**8
+    x.RequestHeader.MsgSeqNum = 23
+    x.MessageHeaderIn.NetworkMsgID = b'xyz'
+    x.Side = Side.SELL
+    assert x == y
+
+def test_iter_messages():
+    x = NewOrderSingleShortRequest()
+    y = mk_exec_response(2)
+    bs = bytes(8) + x.pack() + y.pack()
+
+    assert tid2size[TemplateID.NewOrderSingleShortRequest - 10000] == 96
+    assert tid2size[TemplateID.OrderExecResponse - 10000] == 0
+    assert list(iter_messages(bs, 8)) == [
+            (TemplateID.NewOrderSingleShortRequest, 8, 96),
+            (TemplateID.OrderExecResponse, 104, len(bs) - 104) ]
+
+    with pytest.raises(UnpackError):
+        list(iter_messages(bs[:-1], 8))
+    bs = bytearray(x.pack())
+    NewOrderSingleShortRequest.set_MessageHeaderIn_BodyLen(bs, 0, 88)
+    with pytest.raises(UnpackError):
+        list(iter_messages(bs))
+
+    import eobi.v9_0 as eobi
+    bs = eobi.PacketHeader().pack() + eobi.Heartbeat().pack() + eobi.OrderAdd().pack()
+    assert [ tid for tid, _, _ in eobi.iter_messages(bs) ] == [
+            eobi.TemplateID.PacketHeader, eobi.TemplateID.Heartbeat, eobi.TemplateID.OrderAdd ]
+
+
+# i.e. a field after a repeating group doesn't have a fixed offset
+def test_view_after_group():
+    import io
+    import xml.etree.ElementTree as ET
+    import eti2py
+    d = ET.ElementTree(ET.fromstring('''<Model name="X" version="1.0" subVersion="A">
+  <DataTypes>
+    <DataType name="Count" type="int" rootType="int" size="1" minValue="0" noValue="0xFF" />
+    <DataType name="Qty" type="int" rootType="int" size="4" minValue="0" noValue="0xFFFFFFFF" />
+  </DataTypes>
+  <Structures>
+    <Structure name="GrpComp" type="Component">
+      <Member name="A" type="Qty" />
+    </Structure>
+    <Structure name="Msg" type="Message">
+      <Member name="N" type="Count" />
+      <Member name="B" type="Qty" />
+      <Member name="Grp" type="GrpComp" cardinality="5" minCardinality="0" counter="N" />
+      <Member name="C" type="Qty" />
+    </Structure>
+  </Structures>
+</Model>'''))
+    st, dt = eti2py.get_structs(d), eti2py.get_data_types(d)
+    o = io.StringIO()
+    eti2py.gen_view('Msg', st['Msg'], st, dt, eti2py.get_sizes(st, dt), o)
+    src = o.getvalue()
+    assert 'def B(self)' in src
+    assert 'self._off + 1)' in src
+    assert 'def Grp(self)' not in src
+    assert 'def C(self)' not in src
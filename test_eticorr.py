@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import asyncio
+
+import pytest
+
+import eti.v9_0 as eti
+from eticorr import *
+
+from test_etistream import mk_orders
+
+
+def mk_response(T, seq=None, cl_ord_id=None):
+    m = T()
+    if seq is not None:
+        header(m).MsgSeqNum = seq
+    if cl_ord_id is not None:
+        m.ClOrdID = cl_ord_id
+    return m
+
+async def run_pipelined():
+    c = Correlator(eti.request2response)
+    xs = mk_orders(3)
+    fs = [ c.request(x) for x in xs ]
+    for x in xs:
+        c.sent(x)
+    assert len(c) == 3
+
+    # i.e. out of order, including a trade with its broadcast
+    a = mk_response(eti.NewOrderNRResponse, 3)
+    b = mk_response(eti.OrderExecResponse, 1, 1000)
+    d = mk_response(eti.Reject, 2)
+    e = mk_response(eti.OrderExecReportBroadcast, cl_ord_id=1000)
+    for m in (a, b, d):
+        assert c.response(m) is not None
+    assert [ f.done() for f in fs ] == [ False, True, True ]
+    assert c.response(e) is not None
+    assert c.response(mk_response(eti.NewOrderNRResponse, 23)) is None
+    assert c.unmatched == 1
+    assert header(eti.Heartbeat()) is None
+    u = c.unsolicited
+    assert c.response(eti.Heartbeat()) is None
+    assert (c.unmatched, c.unsolicited) == (1, u + 1)
+    assert len(c) == 0
+    assert [ await f for f in fs ] == [ [b, e], [d], [a] ]
+    st = c.stats()
+    assert st['OrderExecReportBroadcast']['n'] == 1
+
+def test_pipelined():
+    asyncio.run(run_pipelined())
+
+async def run_timeout():
+    c = Correlator(eti.request2response, timeout=0.01)
+    x, = mk_orders(1)
+    f = c.request(x)
+    c.sent(x)
+    with pytest.raises(asyncio.TimeoutError):
+        await f
+    assert c.response(mk_response(eti.NewOrderNRResponse, 1)) is None
+    assert (c.late, c.unmatched) == (1, 0)
+
+def test_timeout():
+    asyncio.run(run_timeout())
+
+
+async def run_max_expired():
+    c = Correlator(eti.request2response, timeout=0.01, max_expired=2)
+    xs = mk_orders(2)
+    fs = [ c.request(x) for x in xs ]
+    for x in xs:
+        c.sent(x)
+    for f in fs:
+        with pytest.raises(asyncio.TimeoutError):
+            await f
+    assert list(c.expired) == [ ('seq', 2), ('clordid', 1001) ]
+    assert c.response(mk_response(eti.NewOrderNRResponse, 1)) is None
+    assert c.response(mk_response(eti.NewOrderNRResponse, 2)) is None
+    assert (c.late, c.unmatched) == (1, 1)
+
+def test_max_expired():
+    asyncio.run(run_max_expired())
+
+
+# i.e. a reused message object is submitted again before it's sent
+async def run_resubmit():
+    c = Correlator(eti.request2response)
+    x, = mk_orders(1)
+    fs = [ c.request(x), c.request(x) ]
+    assert len(c) == 2
+    for seq in (7, 8):
+        x.RequestHeader.MsgSeqNum = seq
+        x.ClOrdID = 2000 + seq
+        c.sent(x)
+    assert not c.queued
+    ms = [ mk_response(eti.NewOrderNRResponse, seq) for seq in (8, 7) ]
+    for m in ms:
+        assert c.response(m) is not None
+    assert [ await f for f in fs ] == [ ms[1:], ms[:1] ]
+
+def test_resubmit():
+    asyncio.run(run_resubmit())
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import asyncio
+
+import eti_client
+import eti_server
+from etigateway import Gateway
+
+
+async def run_gateway(buffered, responder=None):
+    eti_server.responder = responder
+    eti_server.reject_nth_logon = None
+    eti_server.logon_count = 0
+    loop = asyncio.get_running_loop()
+    s = await loop.create_server(eti_server.Session, '127.0.0.1', 0)
+    async with s:
+        port = s.sockets[0].getsockname()[1]
+        g = Gateway('127.0.0.1', port, 3, buffered)
+        for _ in range(2):
+            await g.start()
+            rs = await asyncio.gather(*[ x.request(eti_client.mk_ioc(i)) for i, x in enumerate(g) ])
+            assert [ r[0].ClOrdID for r in rs ] == [ 0, 1, 2 ]
+            assert [ x.sched.seq for x in g ] == [ 4, 4, 4 ]
+            assert g.stats()['in_flight'] == 0
+            await g.stop()
+        # i.e. the buffers of the first round are reused
+        assert g.pool.allocated == 6
+        assert len(g.pool.free) == 6
+    eti_server.responder = None
+    return rs
+
+def test_gateway():
+    asyncio.run(run_gateway(True))
+
+def test_gateway_stream():
+    asyncio.run(run_gateway(False))
+
+def test_gateway_perf():
+    r = eti_server.Responder({'OrderExecResponse'})
+    rs = asyncio.run(run_gateway(True, r))
+    assert [ [ type(m).__name__ for m in ms ] for ms in rs ] == [
+            [ 'OrderExecResponse', 'OrderExecReportBroadcast' ] ] * 3
+    assert (r.received, r.sent, r.unknown) == (2 * 3 * 3, 2 * 3 * 4, 0)
+
+# i.e. a response that just consists of its message header
+def test_responder_header_only(monkeypatch):
+    eti = eti_server.eti
+    monkeypatch.setitem(eti.request2response, eti.TemplateID.NewOrderSingleShortRequest,
+            [ (eti.Heartbeat, None, []) ])
+    r = eti_server.Responder()
+    assert r.replies[eti.TemplateID.NewOrderSingleShortRequest][2:] == ([], [], 1)
+
+def test_flow():
+    xs = eti_server.eti.request2response[eti_server.eti.TemplateID.NewOrderSingleShortRequest]
+    assert [ T.__name__ for T in eti_server.flow(xs) ] == [ 'NewOrderNRResponse' ]
+    assert [ T.__name__ for T in eti_server.flow(xs, { 'OrderExecReportBroadcast' }) ] == [
+            'OrderExecResponse', 'OrderExecReportBroadcast' ]
@@ -0,0 +1,49 @@
+
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import math
+import random
+
+from etihist import Histogram, percentile
+
+
+def test_histogram():
+    h = Histogram()
+    assert h.percentile(50) is None
+    for v in range(1, 101):
+        h.record(v)
+    assert len(h) == 100
+    assert h.percentile(50) == 50
+    assert h.percentile(99) == 99
+    assert h.percentile(100) == 100
+    assert h.summary((50,)) == { 'n': 100, 'p50': 0.05, 'max': 0.1 }
+    xs = list(range(1, 101))
+    for p in (0, 1, 50, 99, 99.9, 100):
+        assert percentile(xs, p) == h.percentile(p)
+
+
+def test_relative_error():
+    h = Histogram(bits=8)
+    rnd = random.Random(23)
+    xs = sorted(rnd.randrange(1, 10**9) for _ in range(10000))
+    for x in xs:
+        h.record(x)
+    for p in (50, 90, 99, 99.9):
+        v = xs[math.ceil(len(xs) * p / 100) - 1]
+        assert v <= h.percentile(p) <= v * (1 + 2**-7)
+    assert h.percentile(100) == xs[-1]
+
+
+def test_merge():
+    a = Histogram()
+    b = Histogram()
+    a.record(10, 3)
+    b.record(10**6)
+    a += b
+    assert len(a) == 4
+    assert a.min == 10
+    assert a.max == 10**6
+    assert a.percentile(75) == 10
+    assert a.percentile(100) == 10**6
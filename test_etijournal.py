@@ -0,0 +1,75 @@
+
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+
+import io
+
+import eti.v9_1 as eti
+
+import etijournal
+from etijournal import IN, OUT, Journal, JournalTransport, Reader
+from etistream import MessageWriter
+
+
+class Transport:
+
+    def __init__(self):
+        self.written = []
+
+    def write(self, bs):
+        self.written.append(bytes(bs))
+
+
+def mk_order(cl_ord_id):
+    x = eti.NewOrderSingleShortRequest()
+    x.ClOrdID = cl_ord_id
+    return x
+
+
+def test_journal(tmp_path):
+    p = str(tmp_path / 'a.jrn')
+    j = Journal(p, eti.__name__, size=256, index_every=2)
+    t = Transport()
+    w = MessageWriter(JournalTransport(t, j, 7))
+    for i in range(10):
+        j.record(3, IN, mk_order(i).pack())
+    w.pack(mk_order(23))
+    w.pack(mk_order(42))
+    w.flush()
+    assert len(j) == 11
+    assert j.size > 256
+    j.close()
+
+    r = Reader(p)
+    assert r.module == 'eti.v9_1'
+    assert len(r.index) == 6
+    xs = list(r)
+    assert [ (s, d) for _, s, d, _ in xs ] == [ (3, IN) ] * 10 + [ (7, OUT) ]
+    assert xs[-1][3] == t.written[0]
+    assert [ eti.unpack_from(m).ClOrdID for _, _, _, m in
+            etijournal.messages(r, eti.header_st, [7]) ] == [ 23, 42 ]
+    ts = [ x[0] for x in xs ]
+    assert ts == sorted(ts)
+    assert [ x[0] for x in r.records(ts[5]) ] == ts[5:]
+    r.close()
+
+    o = io.StringIO()
+    assert etijournal.dump(p, [7], brief=True, o=o) == 2
+    assert o.getvalue().count('> NewOrderSingleShortRequest (96 bytes)') == 2
+    o = io.StringIO()
+    assert etijournal.dump(p, count=1, o=o) == 1
+    assert 'ClOrdID=0' in o.getvalue()
+
+
+# i.e. the journal of a process that didn't close it is readable up to
+# the last record
+def test_unclosed(tmp_path):
+    p = str(tmp_path / 'a.jrn')
+    j = Journal(p, eti.__name__, size=4096)
+    j.record(0, IN, mk_order(1).pack())
+    j.flush()
+    r = Reader(p)
+    assert len(list(r)) == 1
+    r.close()
+    j.close()
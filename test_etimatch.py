@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import eti_server
+from etimatch import *
+from etistream import FrameDecoder, MessageWriter
+
+from test_etistream import Transport
+
+
+def test_priority():
+    e = Engine()
+    a, b = object(), object()
+    x, _ = e.new(a, 1, 23, SELL, 101, 10)
+    y, _ = e.new(a, 2, 23, SELL, 100, 10)
+    z, _ = e.new(b, 3, 23, SELL, 100, 10)
+    assert len(e) == 3
+
+    o, fills = e.new(b, 4, 23, BUY, 101, 25)
+    assert [ (f.passive, f.price, f.qty) for f in fills ] == [ (y, 100, 10), (z, 100, 10), (x, 101, 5) ]
+    assert (o.leaves, o.cum, o.alive) == (0, 25, False)
+    assert (x.leaves, x.cum, x.alive) == (5, 5, True)
+    assert len(e) == 1
+
+    # i.e. the remainder of an IOC isn't added to the book
+    o, fills = e.new(b, 5, 23, BUY, 99, 5, ioc=True)
+    assert (fills, o.alive) == ([], False)
+    assert len(e) == 1
+
+# i.e. cancelled orders don't accumulate on a level that doesn't trade
+def test_cancel_compaction():
+    e = Engine()
+    a = object()
+    x, _ = e.new(a, 1, 23, BUY, 100, 10)
+    for i in range(1000):
+        o, _ = e.new(a, 2 + i, 23, BUY, 100, 5)
+        if i % 2:
+            e.modify(a, o.order_id, None, 5000 + i, 100, 0)
+        else:
+            e.delete(a, o.order_id)
+    lvl = e.books[23].sides[BUY].levels[100]
+    assert len(lvl.orders) < 4 and lvl.qty == 10
+    o, fills = e.new(a, 9999, 23, SELL, 100, 10)
+    assert [ f.passive for f in fills ] == [ x ]
+
+def test_modify_delete():
+    e = Engine()
+    a, b = object(), object()
+    x, _ = e.new(a, 1, 23, BUY, 100, 10)
+    y, _ = e.new(a, 2, 23, BUY, 100, 10)
+    assert e.delete(b, x.order_id) == (None, None)
+
+    # i.e. a quantity decrease keeps the priority, a price change doesn't
+    x, _ = e.modify(a, x.order_id, None, 3, 100, 5)
+    o, fills = e.new(b, 4, 23, SELL, 100, 5)
+    assert [ f.passive.cl_ord_id for f in fills ] == [ 3 ]
+    x, _ = e.new(a, 5, 23, BUY, 100, 10)
+    y, _ = e.modify(a, None, 2, 6, 101, 10)
+    z, _ = e.modify(a, None, 6, 7, 100, 10)
+    o, fills = e.new(b, 8, 23, SELL, 100, 10)
+    assert [ f.passive.cl_ord_id for f in fills ] == [ 5 ]
+
+    o, _ = e.delete(a, None, 7)
+    assert o.leaves == 10
+    assert len(e) == 0
+    assert e.books[23].sides[BUY].best() == (None, None)
+
+def mk_order(cl_ord_id, side, qty, tif):
+    x = eti_server.eti.NewOrderSingleShortRequest()
+    x.RequestHeader.MsgSeqNum = cl_ord_id
+    x.ClOrdID = cl_ord_id
+    x.SimpleSecurityID = 23
+    x.Side = side
+    x.Price = 100 * 10**8
+    x.OrderQty = qty
+    x.TimeInForce = tif
+    return x.pack()
+
+def received(t):
+    d = FrameDecoder(eti_server.eti.header_st)
+    d.feed(b''.join(t.writes))
+    t.writes.clear()
+    return [ eti_server.eti.unpack_from(bs) for bs in d ]
+
+def test_matcher():
+    eti = eti_server.eti
+    m = eti_server.Matcher(legs=2)
+    ta, tb = Transport(), Transport()
+    a, b = MessageWriter(ta), MessageWriter(tb)
+
+    assert m.respond(a, mk_order(1, eti.Side.SELL, 30, eti.TimeInForce.DAY))
+    a.flush()
+    x, = received(ta)
+    assert (type(x), x.NRResponseHeaderME.MsgSeqNum, x.ClOrdID) == (eti.NewOrderNRResponse, 1, 1)
+
+    assert m.respond(b, mk_order(2, eti.Side.BUY, 50, eti.TimeInForce.IOC))
+    b.flush()
+    x, y = received(tb)
+    assert type(x) is eti.OrderExecResponse
+    assert (x.ResponseHeaderME.MsgSeqNum, x.ClOrdID, x.CumQty, x.CxlQty) == (2, 2, 30, 20)
+    assert x.OrdStatus == eti.OrdStatus.CANCELED
+    assert [ (g.FillPx, g.FillQty) for g in x.FillsGrp ] == [ (100 * 10**8, 30) ]
+    assert len(x.InstrmntLegExecGrp) == 2
+    assert x.MessageHeaderOut.BodyLen == x.sizes[0] + 24 + 2 * 32
+    assert type(y) is eti.OrderExecReportBroadcast
+
+    # i.e. the counterparty is notified on its session
+    z, = received(ta)
+    assert type(z) is eti.OrderExecReportBroadcast
+    assert (z.ClOrdID, z.LeavesQty, z.OrdStatus) == (1, 0, eti.OrdStatus.FILLED)
+    assert z.NoFills == 1
+
+    x = eti.DeleteOrderSingleRequest()
+    x.OrigClOrdID = 1
+    assert m.respond(a, x.pack())
+    a.flush()
+    x, = received(ta)
+    assert type(x) is eti.Reject
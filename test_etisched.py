@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import asyncio
+
+import eti.v9_0 as eti
+from etisched import *
+from etistream import FrameDecoder, MessageWriter
+
+from test_etistream import Transport, mk_orders
+
+
+class Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def sent(t):
+    d = FrameDecoder(eti.header_st)
+    d.feed(b''.join(t.writes))
+    return [ eti.unpack_from(bs) for bs in d ]
+
+async def run_throttled():
+    clock = Clock()
+    t = Transport()
+    s = SendScheduler(MessageWriter(t), buckets={'orders': TokenBucket(8, 2, clock)},
+            seq=1, clock=clock)
+    for x in mk_orders(4):
+        s.submit(x)
+    x = eti.DeleteOrderSingleRequest()
+    x.ClOrdID = 42
+    s.submit(x)
+    assert len(s) == 3
+    assert s.handle is not None
+
+    # i.e. other message classes aren't blocked
+    s.submit(eti.LogoutRequest())
+    assert len(s) == 3
+
+    clock.t = 0.125
+    s.pump()
+    assert len(s) == 2
+    clock.t = 0.375
+    s.pump()
+    assert len(s) == 0
+    assert s.handle is None
+    st = s.stats()
+    assert st['sent'] == 6
+    assert st['wait_max'] == 0.375
+    return sent(t)
+
+def test_scheduler():
+    ms = asyncio.run(run_throttled())
+    assert [ type(m).__name__ for m in ms ] == ['NewOrderSingleShortRequest'] * 2 + [
+            'LogoutRequest', 'DeleteOrderSingleRequest' ] + ['NewOrderSingleShortRequest'] * 2
+    assert [ m.ClOrdID for m in ms if hasattr(m, 'ClOrdID') ] == [ 1000, 1001, 42, 1002, 1003 ]
+    assert [ m.RequestHeader.MsgSeqNum for m in ms ] == list(range(1, 7))
+
+def test_from_logon():
+    m = eti.LogonResponse()
+    assert TokenBucket.from_logon(m) is None
+    m.ThrottleNoMsgs = 50
+    m.ThrottleTimeInterval = 1000
+    b = TokenBucket.from_logon(m)
+    assert (b.rate, b.burst) == (50, 50)
@@ -0,0 +1,143 @@
+
+# SPDX-FileCopyrightText: © 2021 Georg Sauthoff <mail@gms.tf>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import asyncio
+
+import eti.v9_0 as eti
+from etistream import *
+
+
+class Transport:
+    def __init__(self, pending=0):
+        self.writes = []
+        self.pending = pending
+
+    def write(self, bs):
+        self.writes.append(bytes(bs))
+
+    def get_write_buffer_size(self):
+        return self.pending
+
+    def is_closing(self):
+        return False
+
+
+def mk_orders(n):
+    xs = []
+    for i in range(n):
+        x = eti.NewOrderSingleShortRequest()
+        x.RequestHeader.MsgSeqNum = i + 1
+        x.ClOrdID = 1000 + i
+        xs.append(x)
+    return xs
+
+def test_writer():
+    t = Transport()
+    w = MessageWriter(t, size=256, max_bytes=10**6)
+    xs = mk_orders(5)
+    for x in xs:
+        w.pack(x)
+    assert t.writes == []
+    assert len(w) == 5 * 96
+    assert w.flush() == 5 * 96
+    assert t.writes == [ b''.join(x.pack() for x in xs) ]
+    assert w.flush() == 0
+
+    w = MessageWriter(t, max_bytes=2 * 96)
+    w.pack(xs[0])
+    assert len(t.writes) == 1
+    w.pack(xs[1])
+    assert len(t.writes) == 2
+    assert t.writes[1] == xs[0].pack() + xs[1].pack()
+
+def test_writer_raw():
+    t = Transport()
+    w = MessageWriter(t, size=128, max_bytes=10**6)
+    xs = [ x.pack() for x in mk_orders(3) ]
+    for x in xs:
+        w.write(x)
+    assert len(w.buf) == 512
+    w.flush()
+    assert t.writes == [ b''.join(xs) ]
+
+def test_writer_pending():
+    t = Transport(pending=1)
+    w = MessageWriter(t)
+    w.pack(mk_orders(1)[0])
+    b = w.buf
+    w.flush()
+    assert w.buf is not b
+
+def test_writer_delay():
+    async def f():
+        t = Transport()
+        w = MessageWriter(t, max_delay=0)
+        for x in mk_orders(3):
+            w.pack(x)
+        assert t.writes == []
+        await asyncio.sleep(0)
+        return t.writes
+    assert [ len(x) for x in asyncio.run(f()) ] == [ 3 * 96 ]
+
+def test_frame_decoder():
+    xs = [ x.pack() for x in mk_orders(3) ]
+    r = eti.Reject()
+    r.VarText = b'some text'
+    r.VarTextLen = len(r.VarText)
+    r.update_length()
+    xs.append(r.pack())
+    bs = b''.join(xs)
+
+    for k in (1, 7, 96, len(bs)):
+        d = FrameDecoder(eti.header_st, size=64)
+        ys = []
+        for i in range(0, len(bs), k):
+            d.feed(bs[i:i+k])
+            ys.extend(bytes(m) for m in d)
+        assert ys == xs
+        assert len(d) == 0
+
+def test_frame_decoder_buffer():
+    x = mk_orders(1)[0].pack()
+    d = FrameDecoder(eti.header_st, size=256)
+    b = d.get_buffer()
+    b[:50] = x[:50]
+    d.buffer_updated(50)
+    assert list(d) == []
+    b = d.get_buffer()
+    b[:96] = x[50:] + x[:50]
+    d.buffer_updated(96)
+    assert [ bytes(m) for m in d ] == [ x ]
+    assert len(d) == 50
+    d.get_buffer()
+    assert d.start == 0
+    assert bytes(d.buf[:50]) == x[:50]
+
+class Echo(SessionProtocol):
+    def __init__(self):
+        super().__init__(eti.header_st, size=64)
+
+    def message_received(self, bs):
+        m = eti.unpack_from(bs)
+        m.ClOrdID += 1
+        self.writer.pack(m)
+
+async def echo_orders(xs):
+    loop = asyncio.get_running_loop()
+    s = await loop.create_server(Echo, '127.0.0.1', 0)
+    async with s:
+        port = s.sockets[0].getsockname()[1]
+        rstream, wstream = await asyncio.open_connection('127.0.0.1', port)
+        wstream.write(b''.join(x.pack() for x in xs))
+        bs = await rstream.readexactly(96 * len(xs))
+        wstream.close()
+        await wstream.wait_closed()
+    return bs
+
+def test_session_protocol():
+    xs = mk_orders(10)
+    bs = asyncio.run(echo_orders(xs))
+    for x in xs:
+        x.ClOrdID += 1
+    assert bs == b''.join(x.pack() for x in xs)